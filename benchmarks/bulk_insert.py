@@ -0,0 +1,118 @@
+"""Benchmark: rows per second for the available bulk write paths.
+
+Compares, against the configured database:
+
+- orm-add:     ORM objects added to a session and flushed on commit.
+- core-insert: one multi-row Core INSERT per page (PostgresEventRepository.save_many).
+- executemany: Core insert() executed with a list of parameter sets.
+- copy:        CopyEventRepository (binary COPY on PostgreSQL, executemany on SQLite).
+
+Usage:
+    python -m benchmarks.bulk_insert [--rows 50000] [--database-url URL]
+
+Without --database-url (or DATABASE_URL) a temporary SQLite file is used.
+Benchmark rows use the "bench_" event type prefix and are deleted afterwards.
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+from sqlalchemy import delete, insert
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+from src.core.event import DomainEvent
+from src.infrastructure.postgres.copy_event_repository import CopyEventRepository
+from src.infrastructure.postgres.db_provider import SqlAlchemyDbProvider
+from src.infrastructure.postgres.event_repository import PostgresEventRepository
+from src.infrastructure.postgres.models.event import Event as DBEvent
+from src.infrastructure.postgres.models.event import events_table
+
+BENCH_TYPE_PREFIX = "bench_"
+
+Loader = Callable[[AsyncEngine, list[DomainEvent]], Awaitable[None]]
+
+
+async def orm_add(engine: AsyncEngine, events: list[DomainEvent]) -> None:
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_maker() as session:
+        session.add_all(
+            DBEvent(type=e.event_type, message=e.event_payload, created_at=e.created_at)
+            for e in events
+        )
+        await session.commit()
+
+
+async def core_insert(engine: AsyncEngine, events: list[DomainEvent]) -> None:
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_maker() as session:
+        await PostgresEventRepository(session).save_many(events)
+
+
+async def executemany(engine: AsyncEngine, events: list[DomainEvent]) -> None:
+    rows = [
+        {"type": e.event_type, "message": e.event_payload, "created_at": e.created_at}
+        for e in events
+    ]
+    async with engine.begin() as conn:
+        await conn.execute(insert(events_table), rows)
+
+
+async def copy(engine: AsyncEngine, events: list[DomainEvent]) -> None:
+    await CopyEventRepository(engine).copy_events(events)
+
+
+LOADERS: dict[str, Loader] = {
+    "orm-add": orm_add,
+    "core-insert": core_insert,
+    "executemany": executemany,
+    "copy": copy,
+}
+
+
+async def clear(engine: AsyncEngine) -> None:
+    async with engine.begin() as conn:
+        await conn.execute(delete(DBEvent).where(DBEvent.type.startswith(BENCH_TYPE_PREFIX)))
+
+
+async def run(database_url: str, rows: int, rounds: int) -> None:
+    events = [
+        DomainEvent.create(event_type=f"{BENCH_TYPE_PREFIX}{i % 10}", event_payload=f"payload {i}")
+        for i in range(rows)
+    ]
+    async with SqlAlchemyDbProvider(database_url) as provider:
+        engine = provider.engine
+        print(f"backend={engine.dialect.name}/{engine.dialect.driver} rows={rows} rounds={rounds}")
+        for name, loader in LOADERS.items():
+            best = float("inf")
+            for _ in range(rounds):
+                await clear(engine)
+                started = time.perf_counter()
+                await loader(engine, events)
+                best = min(best, time.perf_counter() - started)
+            print(f"{name:<12} {rows / best:>12,.0f} rows/s  ({best * 1000:.1f} ms)")
+        await clear(engine)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL"))
+    args = parser.parse_args()
+
+    if args.database_url:
+        asyncio.run(run(args.database_url, args.rows, args.rounds))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}"
+        asyncio.run(run(url, args.rows, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
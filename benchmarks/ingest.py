@@ -0,0 +1,366 @@
+"""Benchmark: end-to-end throughput and latency of the ingest routes.
+
+Drives the application built by create_app with concurrent clients, for
+every combination of the requested concurrency levels and payload sizes:
+
+- targets:  asgi     the app in-process, through httpx's ASGI transport
+                     (no network, no server: the cost of the app itself);
+            uvicorn  the app served by a uvicorn subprocess over TCP.
+- backends: sqlite   SqliteDbProvider on a temporary file;
+            memory   MemoryDbProvider, the columnar in-memory store (no database).
+- routes:   event    POST /event, one event per request;
+            batch    POST /event/batch, --batch-size events per request.
+
+Each run reports requests/s, events/s and p50/p95/p99/p99.9 latency, and
+can save the results as JSON. Two saved runs are compared with the
+compare command.
+
+Usage:
+    python -m benchmarks.ingest run [--targets asgi,uvicorn] [--backends sqlite,memory]
+        [--routes event] [--concurrency 1,16,64] [--payload-bytes 16,512]
+        [--requests 5000] [--output results.json]
+    python -m benchmarks.ingest compare BASELINE.json CANDIDATE.json
+
+Every profile starts from a fresh application and database, and sends
+--warmup requests first, which are not measured.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import httpx
+import uvicorn
+
+from src.infrastructure.memory.db_provider import MemoryDbProvider
+from src.infrastructure.sqlite.db_provider import SqliteDbProvider
+from src.presentation.fastapi.server import create_app
+
+TARGETS = ("asgi", "uvicorn")
+BACKENDS = ("sqlite", "memory")
+ROUTES = ("event", "batch")
+PERCENTILES = (("p50", 0.5), ("p95", 0.95), ("p99", 0.99), ("p99_9", 0.999))
+PROFILE_KEY = ("target", "backend", "route", "concurrency", "payload_bytes")
+SERVER_START_TIMEOUT_SECONDS = 15.0
+
+
+def make_provider(backend: str, directory: Path) -> Any:
+    if backend == "memory":
+        return MemoryDbProvider()
+    return SqliteDbProvider(f"sqlite+aiosqlite:///{directory / 'ingest.db'}")
+
+
+@dataclass
+class Profile:
+    target: str
+    backend: str
+    route: str
+    concurrency: int
+    payload_bytes: int
+    requests: int
+    batch_size: int
+
+
+@dataclass
+class Result:
+    target: str
+    backend: str
+    route: str
+    concurrency: int
+    payload_bytes: int
+    requests: int
+    errors: int
+    seconds: float
+    requests_per_second: float
+    events_per_second: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    p99_9_ms: float
+
+
+def percentile(sorted_values: list[float], quantile: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return math.nan
+    rank = max(1, math.ceil(quantile * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def make_body(profile: Profile, index: int) -> Any:
+    payload = f"{index:08d}".ljust(profile.payload_bytes, "x")[: profile.payload_bytes]
+    event = {"event_type": f"bench_{index % 10}", "event_payload": payload}
+    if profile.route == "event":
+        return event
+    return [event] * profile.batch_size
+
+
+async def drive(client: httpx.AsyncClient, profile: Profile, count: int) -> tuple[list[float], int]:
+    """Send count requests from profile.concurrency clients; return latencies and errors."""
+    path = "/event" if profile.route == "event" else "/event/batch"
+    ok_status = 201 if profile.route == "event" else 200
+    latencies: list[float] = []
+    errors = 0
+    next_index = 0
+
+    async def worker() -> None:
+        nonlocal next_index, errors
+        while next_index < count:
+            index = next_index
+            next_index += 1
+            body = make_body(profile, index)
+            started = time.perf_counter()
+            try:
+                response = await client.post(path, json=body)
+                failed = response.status_code != ok_status
+            except httpx.HTTPError:
+                failed = True
+            latencies.append(time.perf_counter() - started)
+            errors += failed
+
+    await asyncio.gather(*(worker() for _ in range(profile.concurrency)))
+    return latencies, errors
+
+
+async def measure(client: httpx.AsyncClient, profile: Profile, warmup: int) -> Result:
+    await drive(client, profile, warmup)
+    started = time.perf_counter()
+    latencies, errors = await drive(client, profile, profile.requests)
+    seconds = time.perf_counter() - started
+
+    latencies.sort()
+    events = profile.requests * (1 if profile.route == "event" else profile.batch_size)
+    quantiles = {name: percentile(latencies, q) * 1000 for name, q in PERCENTILES}
+    return Result(
+        target=profile.target,
+        backend=profile.backend,
+        route=profile.route,
+        concurrency=profile.concurrency,
+        payload_bytes=profile.payload_bytes,
+        requests=profile.requests,
+        errors=errors,
+        seconds=seconds,
+        requests_per_second=profile.requests / seconds,
+        events_per_second=events / seconds,
+        p50_ms=quantiles["p50"],
+        p95_ms=quantiles["p95"],
+        p99_ms=quantiles["p99"],
+        p99_9_ms=quantiles["p99_9"],
+    )
+
+
+def client_limits(concurrency: int) -> httpx.Limits:
+    return httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+
+async def run_asgi(profile: Profile, warmup: int) -> Result:
+    with tempfile.TemporaryDirectory() as tmp:
+        app = create_app(db_provider=make_provider(profile.backend, Path(tmp)))
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                return await measure(client, profile, warmup)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port: int = sock.getsockname()[1]
+        return port
+
+
+async def wait_until_ready(base_url: str, server: subprocess.Popen[bytes]) -> None:
+    deadline = time.monotonic() + SERVER_START_TIMEOUT_SECONDS
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while time.monotonic() < deadline:
+            if server.poll() is not None:
+                raise RuntimeError(f"Benchmark server exited with code {server.returncode}")
+            try:
+                if (await client.get("/health")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.1)
+    raise RuntimeError("Benchmark server did not become ready")
+
+
+async def run_uvicorn(profile: Profile, warmup: int) -> Result:
+    port = free_port()
+    with tempfile.TemporaryDirectory() as tmp:
+        server = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "benchmarks.ingest",
+                "serve",
+                "--backend",
+                profile.backend,
+                "--port",
+                str(port),
+                "--dir",
+                tmp,
+            ]
+        )
+        try:
+            base_url = f"http://127.0.0.1:{port}"
+            await wait_until_ready(base_url, server)
+            async with httpx.AsyncClient(
+                base_url=base_url, limits=client_limits(profile.concurrency)
+            ) as client:
+                return await measure(client, profile, warmup)
+        finally:
+            server.terminate()
+            server.wait()
+
+
+def print_result(result: Result) -> None:
+    label = (
+        f"{result.target}/{result.backend}/{result.route} "
+        f"c={result.concurrency} payload={result.payload_bytes}B"
+    )
+    print(
+        f"{label:<42} {result.requests_per_second:>10,.0f} req/s "
+        f"{result.events_per_second:>10,.0f} ev/s  p50={result.p50_ms:.2f} "
+        f"p95={result.p95_ms:.2f} p99={result.p99_ms:.2f} p99.9={result.p99_9_ms:.2f} ms"
+        + (f"  errors={result.errors}" if result.errors else "")
+    )
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+async def run(args: argparse.Namespace) -> list[Result]:
+    results = []
+    for target in args.targets:
+        for backend in args.backends:
+            for route in args.routes:
+                for concurrency in args.concurrency:
+                    for payload_bytes in args.payload_bytes:
+                        profile = Profile(
+                            target=target,
+                            backend=backend,
+                            route=route,
+                            concurrency=concurrency,
+                            payload_bytes=payload_bytes,
+                            requests=args.requests,
+                            batch_size=args.batch_size,
+                        )
+                        runner = run_asgi if target == "asgi" else run_uvicorn
+                        result = await runner(profile, args.warmup)
+                        print_result(result)
+                        results.append(result)
+    return results
+
+
+def save(path: Path, args: argparse.Namespace, results: list[Result]) -> None:
+    document = {
+        "meta": {
+            "created_at": datetime.now(UTC).isoformat(),
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "requests": args.requests,
+            "warmup": args.warmup,
+            "batch_size": args.batch_size,
+        },
+        "results": [asdict(result) for result in results],
+    }
+    path.write_text(json.dumps(document, indent=2) + "\n")
+    print(f"Results saved to {path}")
+
+
+def compare(baseline_path: Path, candidate_path: Path) -> None:
+    """Print the change of each metric for the profiles present in both files."""
+    baseline, candidate = (json.loads(path.read_text()) for path in (baseline_path, candidate_path))
+    print(f"baseline={baseline['meta']['revision']} candidate={candidate['meta']['revision']}")
+    before = {tuple(r[key] for key in PROFILE_KEY): r for r in baseline["results"]}
+    for after in candidate["results"]:
+        profile = tuple(after[key] for key in PROFILE_KEY)
+        if profile not in before:
+            continue
+        label = "{}/{}/{} c={} payload={}B".format(*profile)
+        changes = []
+        for metric in ("requests_per_second", "p50_ms", "p99_ms", "p99_9_ms"):
+            old, new = before[profile][metric], after[metric]
+            change = (new - old) / old * 100 if old else math.nan
+            changes.append(f"{metric}={new:,.2f} ({change:+.1f}%)")
+        print(f"{label:<42} " + "  ".join(changes))
+
+
+def serve(backend: str, port: int, directory: Path) -> None:
+    app = create_app(db_provider=make_provider(backend, directory))
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning", access_log=False)
+
+
+def int_list(value: str) -> list[int]:
+    return [int(part) for part in value.split(",")]
+
+
+def choice_list(choices: Sequence[str]) -> Any:
+    def parse(value: str) -> list[str]:
+        parts = value.split(",")
+        unknown = set(parts) - set(choices)
+        if unknown:
+            raise argparse.ArgumentTypeError(f"unknown values {sorted(unknown)}")
+        return parts
+
+    return parse
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmark profiles")
+    run_parser.add_argument("--targets", type=choice_list(TARGETS), default=["asgi"])
+    run_parser.add_argument("--backends", type=choice_list(BACKENDS), default=list(BACKENDS))
+    run_parser.add_argument("--routes", type=choice_list(ROUTES), default=["event"])
+    run_parser.add_argument("--concurrency", type=int_list, default=[1, 16, 64])
+    run_parser.add_argument("--payload-bytes", type=int_list, default=[16, 512])
+    run_parser.add_argument("--requests", type=int, default=5000)
+    run_parser.add_argument("--warmup", type=int, default=200)
+    run_parser.add_argument("--batch-size", type=int, default=100)
+    run_parser.add_argument("--output", type=Path, default=None)
+
+    compare_parser = commands.add_parser("compare", help="compare two saved runs")
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("candidate", type=Path)
+
+    serve_parser = commands.add_parser("serve", help="serve the app (used by the uvicorn target)")
+    serve_parser.add_argument("--backend", choices=BACKENDS, required=True)
+    serve_parser.add_argument("--port", type=int, required=True)
+    serve_parser.add_argument("--dir", type=Path, required=True)
+
+    args = parser.parse_args()
+    if args.command == "compare":
+        compare(args.baseline, args.candidate)
+    elif args.command == "serve":
+        serve(args.backend, args.port, args.dir)
+    else:
+        results = asyncio.run(run(args))
+        if args.output:
+            save(args.output, args, results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Benchmark: per-request CPU time of the regular and fast POST /event routes.
+
+Calls the application built by create_app directly through ASGI (no client,
+no server, no network), one request at a time, with the in-memory backend,
+so the time measured is the application's own: routing, dependencies, body
+decoding and validation, the use case, and the response. Reports process
+CPU time per request for each route:
+
+- regular: FastAPI body parsing into the Event model, EventResponse encoding.
+- fast:    FAST_INGEST_ENABLED, the body validated straight from JSON and a
+           pre-encoded response.
+
+Usage:
+    python -m benchmarks.ingest_cpu [--requests 20000] [--payload-bytes 16,512]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Any
+
+from fastapi import FastAPI
+
+from src.infrastructure.config.settings import AppSettings, FastIngestSettings
+from src.infrastructure.memory.db_provider import MemoryDbProvider
+from src.presentation.fastapi.server import create_app
+
+ROUTES = {"regular": False, "fast": True}
+
+
+def make_bodies(count: int, payload_bytes: int) -> list[bytes]:
+    return [
+        json.dumps(
+            {
+                "event_type": f"bench_{index % 10}",
+                "event_payload": f"{index:08d}".ljust(payload_bytes, "x")[:payload_bytes],
+            }
+        ).encode()
+        for index in range(count)
+    ]
+
+
+async def post(app: FastAPI, body: bytes) -> int:
+    """Send one POST /event straight to the ASGI app; return the status code."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/event",
+        "raw_path": b"/event",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+    status = 0
+
+    async def receive() -> dict[str, Any]:
+        return messages.pop() if messages else {"type": "http.disconnect"}
+
+    async def send(message: dict[str, Any]) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+async def measure(fast: bool, bodies: list[bytes], warmup: int) -> float:
+    settings = AppSettings(fast_ingest=FastIngestSettings(enabled=fast))
+    app = create_app(db_provider=MemoryDbProvider(), settings=settings)
+    async with app.router.lifespan_context(app):
+        for body in bodies[:warmup]:
+            await post(app, body)
+
+        started = time.process_time()
+        for body in bodies:
+            status = await post(app, body)
+            if status != 201:
+                raise RuntimeError(f"POST /event answered {status}")
+        elapsed = time.process_time() - started
+    return elapsed / len(bodies)
+
+
+async def run(count: int, payload_sizes: list[int], warmup: int) -> None:
+    print(f"requests={count}")
+    for payload_bytes in payload_sizes:
+        bodies = make_bodies(count, payload_bytes)
+        per_request = {route: await measure(fast, bodies, warmup) for route, fast in ROUTES.items()}
+        for route, seconds in per_request.items():
+            change = (seconds - per_request["regular"]) / per_request["regular"] * 100
+            print(
+                f"{route:<8} payload={payload_bytes}B {seconds * 1e6:>8.1f} us CPU/request "
+                f"({change:+.1f}%)"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--payload-bytes", default="16,512")
+    parser.add_argument("--warmup", type=int, default=500)
+    args = parser.parse_args()
+    payload_sizes = [int(part) for part in args.payload_bytes.split(",")]
+    asyncio.run(run(args.requests, payload_sizes, args.warmup))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Benchmark: per-event CPU time of the event repository implementations.
+
+Saves events one at a time through SqlAlchemyDbProvider.event_repository(),
+exactly as the POST /event route does, and reports process CPU time per event
+for each EVENT_REPOSITORY choice.
+
+Usage:
+    python -m benchmarks.repository_cpu [--events 5000] [--database-url URL]
+
+Without --database-url (or DATABASE_URL) a temporary SQLite file is used.
+Benchmark rows use the "bench_" event type prefix and are deleted afterwards.
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import get_args
+
+from sqlalchemy import delete
+
+from src.core.event import DomainEvent
+from src.infrastructure.config.settings import DatabaseSettings, RepositoryKind
+from src.infrastructure.postgres.db_provider import SqlAlchemyDbProvider
+from src.infrastructure.postgres.models.event import Event as DBEvent
+
+BENCH_TYPE_PREFIX = "bench_"
+
+
+async def measure(database_url: str, kind: RepositoryKind, events: list[DomainEvent]) -> float:
+    provider = SqlAlchemyDbProvider(database_url, settings=DatabaseSettings(repository=kind))
+    async with provider:
+        # Warm up pool, compiled cache and prepared statements
+        for event in events[:100]:
+            async with provider.event_repository() as repo:
+                await repo.save(event, returning=False)
+
+        started = time.process_time()
+        for event in events:
+            async with provider.event_repository() as repo:
+                await repo.save(event, returning=False)
+        elapsed = time.process_time() - started
+
+        async with provider.engine.begin() as conn:
+            await conn.execute(delete(DBEvent).where(DBEvent.type.startswith(BENCH_TYPE_PREFIX)))
+    return elapsed / len(events)
+
+
+async def run(database_url: str, count: int) -> None:
+    events = [
+        DomainEvent.create(event_type=f"{BENCH_TYPE_PREFIX}{i % 10}", event_payload=f"payload {i}")
+        for i in range(count)
+    ]
+    print(f"events={count}")
+    for kind in get_args(RepositoryKind):
+        per_event = await measure(database_url, kind, events)
+        print(f"{kind:<6} {per_event * 1e6:>8.1f} us CPU/event")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL"))
+    args = parser.parse_args()
+
+    if args.database_url:
+        asyncio.run(run(args.database_url, args.events))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(run(f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}", args.events))
+
+
+if __name__ == "__main__":
+    main()
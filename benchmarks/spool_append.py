@@ -0,0 +1,113 @@
+"""Benchmark: events per second through the local spool.
+
+Measures, on a temporary directory:
+
+- append:  concurrent writers spooling one event each, for several fsync
+           intervals (0 fsyncs as soon as the previous fsync completes).
+- replay:  draining the spooled events into a repository that discards them,
+           i.e. the cost of reading, decoding and checkpointing.
+
+Usage:
+    python -m benchmarks.spool_append [--events 20000] [--writers 64] [--dir PATH]
+
+Without --dir a temporary directory is used. Run it on the disk the spool
+will live on: append throughput is bounded by fsync latency.
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+from src.application.ports.event_repository import EventRepository
+from src.core.event import DomainEvent
+from src.infrastructure.spool.log import SpoolLog
+from src.infrastructure.spool.spool import EventSpool
+
+FSYNC_INTERVALS_MS = (0.0, 1.0, 2.0, 5.0)
+
+
+class DiscardingRepository(EventRepository):
+    async def save(self, event: DomainEvent, *, returning: bool = True) -> object:
+        return True
+
+    async def save_many(self, events: Sequence[DomainEvent]) -> list[bool]:
+        return [True] * len(events)
+
+
+@asynccontextmanager
+async def discarding_repository() -> AsyncIterator[EventRepository]:
+    yield DiscardingRepository()
+
+
+def make_spool(directory: Path, fsync_interval_ms: float, batch_size: int) -> EventSpool:
+    return EventSpool(
+        SpoolLog(
+            directory,
+            segment_bytes=64 * 1024 * 1024,
+            fsync_interval_seconds=fsync_interval_ms / 1000,
+        ),
+        repository_factory=discarding_repository,
+        replay_batch_size=batch_size,
+        retry_interval_seconds=1.0,
+    )
+
+
+async def append(spool: EventSpool, events: list[DomainEvent], writers: int) -> None:
+    queue = iter(events)
+
+    async def writer() -> None:
+        for event in queue:
+            await spool.append((event,))
+
+    await asyncio.gather(*(writer() for _ in range(writers)))
+
+
+async def run(directory: Path, events: list[DomainEvent], writers: int, batch: int) -> None:
+    print(f"dir={directory} events={len(events)} writers={writers}")
+    for interval_ms in FSYNC_INTERVALS_MS:
+        spool_dir = directory / f"append-{interval_ms:g}ms"
+        spool = make_spool(spool_dir, interval_ms, batch)
+        # Drive the log directly so the replayer does not compete with writers
+        async with spool._log:
+            started = time.perf_counter()
+            await append(spool, events, writers)
+            elapsed = time.perf_counter() - started
+        label = f"append fsync={interval_ms:g}ms"
+        print(f"{label:<22} {len(events) / elapsed:>12,.0f} events/s  ({elapsed * 1000:.1f} ms)")
+
+    spool = make_spool(spool_dir, 0, batch)
+    async with spool._log:
+        started = time.perf_counter()
+        while await spool.replay_once():
+            pass
+        elapsed = time.perf_counter() - started
+    label = f"replay batch={batch}"
+    print(f"{label:<22} {len(events) / elapsed:>12,.0f} events/s  ({elapsed * 1000:.1f} ms)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=20_000)
+    parser.add_argument("--writers", type=int, default=64)
+    parser.add_argument("--replay-batch", type=int, default=1000)
+    parser.add_argument("--dir", type=Path, default=None)
+    args = parser.parse_args()
+
+    events = [
+        DomainEvent.create(event_type=f"bench_{i % 10}", event_payload=f"payload {i}")
+        for i in range(args.events)
+    ]
+    if args.dir:
+        asyncio.run(run(args.dir, events, args.writers, args.replay_batch))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(run(Path(tmp), events, args.writers, args.replay_batch))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""Benchmark: service startup, import time and time to first ready.
+
+Reports separately:
+
+- import:  wall time of importing each module in a fresh interpreter (the
+           modules it pulls in included): src.main, which the server
+           process imports, and the modules each worker imports to build
+           the application and its database provider.
+- schema:  in-process time of init_db_tables on an existing database, with
+           the schema fingerprint checked (the default) or every table and
+           index checked by create_all (DB_SCHEMA_FINGERPRINT=false).
+- ready:   wall time from starting ``python -m src.main`` to the first
+           200 from GET /health, for a first boot on an empty database
+           (SQLite only) and for restarts with and without the fingerprint.
+
+Uses DATABASE_URL when set, and a temporary SQLite file otherwise. Each
+figure is the median of --repeat runs.
+
+Usage:
+    python -m benchmarks.startup [--repeat 5] [--sections import,schema,ready]
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+ROOT = Path(__file__).resolve().parent.parent
+SECTIONS = ("import", "schema", "ready")
+MODULES = (
+    "src.main",
+    "src.presentation.fastapi.server",
+    "src.infrastructure.sqlite.db_provider",
+    "src.infrastructure.postgres.db_provider",
+)
+SERVER_START_TIMEOUT_SECONDS = 30.0
+
+
+def median_ms(samples: list[float]) -> str:
+    return f"{statistics.median(samples) * 1000:>8.1f} ms"
+
+
+def import_seconds(module: str) -> float:
+    """Time importing module in a fresh interpreter."""
+    code = (
+        "import time; started = time.perf_counter(); "
+        f"import {module}; print(time.perf_counter() - started)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    return float(result.stdout)
+
+
+def bench_imports(repeat: int) -> None:
+    for module in MODULES:
+        samples = [import_seconds(module) for _ in range(repeat)]
+        print(f"import {module:<42} {median_ms(samples)}")
+
+
+async def init_seconds(database_url: str, check_fingerprint: bool) -> float:
+    from src.infrastructure.postgres.db import create_engine_and_session_maker, init_db_tables
+
+    engine, _ = create_engine_and_session_maker(database_url)
+    try:
+        # Create the tables first: only a restart on an existing schema is timed
+        await init_db_tables(engine)
+        started = time.perf_counter()
+        await init_db_tables(engine, check_fingerprint=check_fingerprint)
+        return time.perf_counter() - started
+    finally:
+        await engine.dispose()
+
+
+def bench_schema(database_url: str, repeat: int) -> None:
+    for label, check in (("create_all", False), ("fingerprint", True)):
+        samples = [asyncio.run(init_seconds(database_url, check)) for _ in range(repeat)]
+        print(f"schema {label:<42} {median_ms(samples)}")
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port: int = sock.getsockname()[1]
+        return port
+
+
+def ready_seconds(workdir: Path, env: dict[str, str]) -> float:
+    """Start the service; return the time until GET /health answers 200."""
+    port = free_port()
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "src.main"],
+        cwd=workdir,
+        env={**env, "APP_PORT": str(port)},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        with httpx.Client(base_url=f"http://127.0.0.1:{port}") as client:
+            while time.perf_counter() - started < SERVER_START_TIMEOUT_SECONDS:
+                if server.poll() is not None:
+                    raise RuntimeError(f"Service exited with code {server.returncode}")
+                try:
+                    if client.get("/health").status_code == 200:
+                        return time.perf_counter() - started
+                except httpx.TransportError:
+                    pass
+                time.sleep(0.005)
+        raise RuntimeError("Service did not become ready")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def bench_ready(repeat: int) -> None:
+    # The service resolves its SQLite file against the working directory
+    env = {**os.environ, "PYTHONPATH": str(ROOT), "LOG_LEVEL": "WARNING"}
+    restarts = {
+        "restart, create_all": {**env, "DB_SCHEMA_FINGERPRINT": "false"},
+        "restart, fingerprint": env,
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        if "DATABASE_URL" not in env:
+            first = []
+            for run in range(repeat):
+                fresh = workdir / f"first-{run}"
+                fresh.mkdir()
+                first.append(ready_seconds(fresh, env))
+            print(f"ready  {'first boot':<42} {median_ms(first)}")
+        # Tables are created by the first start, not timed
+        ready_seconds(workdir, env)
+        for label, restart_env in restarts.items():
+            samples = [ready_seconds(workdir, restart_env) for _ in range(repeat)]
+            print(f"ready  {label:<42} {median_ms(samples)}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--sections", default=",".join(SECTIONS))
+    args = parser.parse_args()
+    sections = args.sections.split(",")
+
+    database_url = os.environ.get("DATABASE_URL")
+    print(f"database={'DATABASE_URL' if database_url else 'temporary SQLite file'}")
+    if "import" in sections:
+        bench_imports(args.repeat)
+    if "schema" in sections:
+        if database_url:
+            bench_schema(database_url, args.repeat)
+        else:
+            with tempfile.TemporaryDirectory() as tmp:
+                bench_schema(f"sqlite+aiosqlite:///{Path(tmp) / 'startup.db'}", args.repeat)
+    if "ready" in sections:
+        bench_ready(args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""Adaptive admission control for database-bound requests."""
+
+import logging
+import math
+import time
+from collections.abc import Callable, Sequence
+
+from src.application.ports.event_repository import EventRepository
+from src.core.event import DomainEvent
+
+__all__ = ["AdmissionController", "AdmissionRejectedError", "AdmittedEventRepository"]
+
+logger = logging.getLogger(__name__)
+
+# Weight of the newest sample in the latency moving average
+_LATENCY_ALPHA = 0.2
+
+
+class AdmissionRejectedError(Exception):
+    """Raised when a request is shed because the in-flight limit is reached.
+
+    Attributes:
+        retry_after: Suggested delay before retrying, in seconds.
+    """
+
+    def __init__(self, retry_after: float) -> None:
+        super().__init__(f"Admission limit reached, retry after {retry_after:.3f}s")
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """Bound the requests in flight, adapting the bound to database latency.
+
+    Requests beyond the limit are rejected immediately rather than queued
+    for a pool checkout. The limit follows AIMD on the latency of database
+    writes (see observe): every write finishing within
+    ``target_latency_seconds`` raises it by ``1 / limit`` (about +1 per
+    limit's worth of writes), and a slower one cuts it by
+    ``backoff_ratio``, at most once per observed latency so a single slow
+    burst does not collapse it. The time spent receiving request bodies is
+    not sampled, so slow clients do not shrink the limit.
+
+    Not thread-safe; meant for a single event loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_limit: int,
+        min_limit: int,
+        max_limit: int,
+        target_latency_seconds: float,
+        backoff_ratio: float = 0.9,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the controller.
+
+        Args:
+            initial_limit: Requests allowed in flight at startup.
+            min_limit: Lowest the limit can go.
+            max_limit: Highest the limit can go.
+            target_latency_seconds: Write latency above which the limit is cut.
+            backoff_ratio: Factor applied to the limit on a slow write.
+            clock: Monotonic time source (seconds).
+        """
+        self._min_limit = max(1, min_limit)
+        self._max_limit = max(self._min_limit, max_limit)
+        self._limit = float(min(max(initial_limit, self._min_limit), self._max_limit))
+        self._target_latency_seconds = target_latency_seconds
+        self._backoff_ratio = backoff_ratio
+        self._clock = clock
+        self._in_flight = 0
+        self._latency_seconds = target_latency_seconds
+        self._last_decrease = -math.inf
+
+    @property
+    def limit(self) -> int:
+        """Requests currently allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Requests currently admitted."""
+        return self._in_flight
+
+    def acquire(self) -> None:
+        """Admit a request.
+
+        Raises:
+            AdmissionRejectedError: If the limit is reached.
+        """
+        if self._in_flight >= self.limit:
+            raise AdmissionRejectedError(self.retry_after())
+        self._in_flight += 1
+
+    def release(self) -> None:
+        """Mark an admitted request as finished."""
+        self._in_flight -= 1
+
+    def observe(self, latency: float) -> None:
+        """Adapt the limit to the latency of one database write.
+
+        Args:
+            latency: Seconds the write took, pool checkout and commit included.
+        """
+        now = self._clock()
+        self._latency_seconds += _LATENCY_ALPHA * (latency - self._latency_seconds)
+
+        if latency <= self._target_latency_seconds:
+            self._limit = min(self._max_limit, self._limit + 1 / self._limit)
+        elif now - self._last_decrease >= self._latency_seconds:
+            self._limit = max(self._min_limit, self._limit * self._backoff_ratio)
+            self._last_decrease = now
+            logger.debug(
+                "Admission limit decreased: limit=%s, latency=%.1fms", self.limit, latency * 1000
+            )
+
+    def retry_after(self) -> float:
+        """Estimate how long until a slot frees up.
+
+        Returns:
+            Seconds needed to work through the requests in flight at the
+            observed latency.
+        """
+        return self._latency_seconds * self._in_flight / max(self.limit, 1)
+
+
+class AdmittedEventRepository(EventRepository):
+    """EventRepository decorator feeding the latency of each write to admission control."""
+
+    def __init__(self, inner: EventRepository, controller: AdmissionController) -> None:
+        """Initialize with the repository to decorate.
+
+        Args:
+            inner: Repository that persists the events.
+            controller: Controller observing the write latencies.
+        """
+        self._inner = inner
+        self._controller = controller
+
+    async def save(self, event: DomainEvent, *, returning: bool = True) -> object:
+        """Persist an event and report how long it took.
+
+        Args:
+            event: Domain event to persist.
+            returning: Passed through to the inner repository.
+
+        Returns:
+            Whatever the inner repository returned.
+        """
+        started = time.perf_counter()
+        try:
+            return await self._inner.save(event, returning=returning)
+        finally:
+            self._controller.observe(time.perf_counter() - started)
+
+    async def save_many(self, events: Sequence[DomainEvent]) -> list[bool]:
+        """Persist events and report how long it took.
+
+        Args:
+            events: Domain events to persist.
+
+        Returns:
+            Whatever the inner repository returned.
+        """
+        started = time.perf_counter()
+        try:
+            return await self._inner.save_many(events)
+        finally:
+            self._controller.observe(time.perf_counter() - started)
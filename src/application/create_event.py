@@ -1,8 +1,12 @@
 """Use case: create and persist a domain event."""
 
 import logging
+import time
 
+from src.application.idempotency import IdempotencyCache
+from src.application.metrics import EVENT_VALIDATION_SECONDS
 from src.application.ports.event_repository import EventRepository
+from src.application.stage_timing import record_stage
 from src.core.event import DomainEvent
 
 __all__ = ["create_event_uc"]
@@ -14,21 +18,65 @@ async def create_event_uc(
     event_type: str,
     event_payload: str,
     repo: EventRepository,
-) -> None:
+    idempotency_key: str | None = None,
+    cache: IdempotencyCache | None = None,
+) -> bool:
     """Create and persist an event.
 
     Orchestrates domain logic (validation) with infrastructure (persistence).
+    A retry whose idempotency key is in the cache is answered without
+    touching the repository; other duplicates are skipped by the database
+    and reported the same way.
 
     Args:
         event_type: Event type.
         event_payload: Event content.
         repo: Event repository for persistence.
+        idempotency_key: Optional key identifying retries of the same event.
+        cache: Recently committed idempotency keys (None when disabled).
+
+    Returns:
+        True if the event was stored, False if it was a duplicate of a
+        cached or stored idempotency key.
 
     Raises:
         DomainValidationError: If event is invalid.
         Exception: If persistence fails.
     """
-    logger.debug(f"Creating domain event: type={event_type}")
-    event = DomainEvent.create(event_type=event_type, event_payload=event_payload)
-    await repo.save(event)
-    logger.debug(f"Event persisted: id={id(event)}, type={event.event_type}")
+    # Per-event records: lazy arguments, sampled per event type when configured
+    logger.debug("Creating domain event: type=%s", event_type, extra={"event_type": event_type})
+    started = time.perf_counter()
+    try:
+        event = DomainEvent.create(
+            event_type=event_type, event_payload=event_payload, idempotency_key=idempotency_key
+        )
+    finally:
+        elapsed = time.perf_counter() - started
+        EVENT_VALIDATION_SECONDS.observe(elapsed)
+        record_stage("create", elapsed)
+    if (
+        event.idempotency_key is not None
+        and cache is not None
+        and cache.seen(event.idempotency_key)
+    ):
+        logger.debug(
+            "Duplicate event skipped: key=%s",
+            event.idempotency_key,
+            extra={"event_type": event.event_type},
+        )
+        return False
+
+    if await repo.save(event, returning=False) is None:
+        logger.debug(
+            "Duplicate event skipped by the database: key=%s",
+            event.idempotency_key,
+            extra={"event_type": event.event_type},
+        )
+        return False
+    logger.debug(
+        "Event persisted: id=%d, type=%s",
+        id(event),
+        event.event_type,
+        extra={"event_type": event.event_type},
+    )
+    return True
@@ -0,0 +1,81 @@
+"""Use case: validate and persist a batch of domain events."""
+
+import logging
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Literal
+
+from src.application.metrics import EVENT_VALIDATION_SECONDS
+from src.application.ports.event_repository import EventRepository
+from src.application.stage_timing import record_stage
+from src.core.event import DomainEvent
+from src.core.exceptions import DomainValidationError
+
+__all__ = ["EventOutcome", "create_events_uc"]
+
+logger = logging.getLogger("usecase.create_events")
+
+
+@dataclass(frozen=True)
+class EventOutcome:
+    """What happened to one item of a batch.
+
+    Attributes:
+        status: "created" if inserted, "duplicate" if skipped because its
+            idempotency key is already stored, "rejected" if invalid.
+        detail: Validation error message (only for rejected items).
+    """
+
+    status: Literal["created", "duplicate", "rejected"]
+    detail: str | None = None
+
+
+async def create_events_uc(
+    items: Sequence[tuple[str, str]],
+    repo: EventRepository,
+    idempotency_keys: Sequence[str | None] | None = None,
+) -> list[EventOutcome]:
+    """Validate a batch of events and persist the valid ones together.
+
+    Items failing domain validation are reported back instead of failing
+    the whole batch; all valid items are persisted in one transaction.
+    Items whose idempotency key is already stored are skipped by the
+    database and reported as duplicates.
+
+    Args:
+        items: (event_type, event_payload) pairs.
+        repo: Event repository for persistence.
+        idempotency_keys: Optional key per item, in the same order as items.
+
+    Returns:
+        One outcome per item, in input order.
+
+    Raises:
+        Exception: If persistence fails (no item is persisted).
+    """
+    results: list[EventOutcome | None] = []
+    events: list[DomainEvent] = []
+    keys = idempotency_keys if idempotency_keys is not None else [None] * len(items)
+    for (event_type, event_payload), key in zip(items, keys, strict=True):
+        started = time.perf_counter()
+        try:
+            events.append(
+                DomainEvent.create(
+                    event_type=event_type, event_payload=event_payload, idempotency_key=key
+                )
+            )
+            results.append(None)
+        except DomainValidationError as exc:
+            results.append(EventOutcome("rejected", str(exc)))
+        elapsed = time.perf_counter() - started
+        EVENT_VALIDATION_SECONDS.observe(elapsed)
+        record_stage("create", elapsed)
+
+    inserted = iter(await repo.save_many(events) if events else ())
+    outcomes = [
+        result if result is not None else EventOutcome("created" if next(inserted) else "duplicate")
+        for result in results
+    ]
+    logger.debug("Batch persisted: valid=%s, rejected=%s", len(events), len(items) - len(events))
+    return outcomes
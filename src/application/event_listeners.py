@@ -0,0 +1,64 @@
+"""Fan committed events out to in-process listeners."""
+
+from collections.abc import Sequence
+
+from src.application.ports.event_listener import CommittedEventsListener
+from src.application.ports.event_repository import EventRepository
+from src.core.event import DomainEvent
+
+__all__ = ["ListeningEventRepository"]
+
+
+class ListeningEventRepository(EventRepository):
+    """EventRepository decorator that notifies listeners after each commit.
+
+    Listeners only hear about rows that were inserted: a failed write raises
+    before any listener is called, and events the inner repository skipped
+    as duplicates are left out.
+    """
+
+    def __init__(
+        self, inner: EventRepository, listeners: Sequence[CommittedEventsListener]
+    ) -> None:
+        """Initialize with the repository to decorate.
+
+        Args:
+            inner: Repository that persists the events.
+            listeners: Listeners to notify, in order.
+        """
+        self._inner = inner
+        self._listeners = tuple(listeners)
+
+    async def save(self, event: DomainEvent, *, returning: bool = True) -> object:
+        """Persist an event, then notify the listeners if it was inserted.
+
+        Args:
+            event: Domain event to persist.
+            returning: Passed through to the inner repository.
+
+        Returns:
+            Whatever the inner repository returned.
+        """
+        result = await self._inner.save(event, returning=returning)
+        if result is not None:
+            self._notify((event,))
+        return result
+
+    async def save_many(self, events: Sequence[DomainEvent]) -> list[bool]:
+        """Persist events, then notify the listeners of the inserted ones.
+
+        Args:
+            events: Domain events to persist.
+
+        Returns:
+            Whatever the inner repository returned.
+        """
+        inserted = await self._inner.save_many(events)
+        self._notify([event for event, stored in zip(events, inserted, strict=True) if stored])
+        return inserted
+
+    def _notify(self, events: Sequence[DomainEvent]) -> None:
+        if not events:
+            return
+        for listener in self._listeners:
+            listener.record(events)
@@ -0,0 +1,45 @@
+"""Use case: read per-type time-bucket statistics."""
+
+import logging
+from dataclasses import dataclass, replace
+
+from src.application.ports.rollup_repository import RollupBucket, RollupQuery, RollupRepository
+
+__all__ = ["EventStats", "event_stats_uc"]
+
+logger = logging.getLogger("usecase.event_stats")
+
+
+@dataclass(frozen=True)
+class EventStats:
+    """Rollup buckets answering a statistics query.
+
+    Attributes:
+        buckets: Buckets ordered by (bucket_start, event_type).
+        truncated: True if more buckets matched than the query limit.
+    """
+
+    buckets: list[RollupBucket]
+    truncated: bool
+
+
+async def event_stats_uc(query: RollupQuery, repo: RollupRepository) -> EventStats:
+    """Read rollup buckets for the query.
+
+    Reads only the pre-aggregated buckets, so the cost depends on the number
+    of buckets in the range, not on the number of events.
+
+    Args:
+        query: Resolution, filters and limit.
+        repo: Rollup repository.
+
+    Returns:
+        EventStats with at most `query.limit` buckets.
+
+    Raises:
+        Exception: If the read fails.
+    """
+    buckets = await repo.list_buckets(replace(query, limit=query.limit + 1))
+    truncated = len(buckets) > query.limit
+    logger.debug("Event stats read: buckets=%s", min(len(buckets), query.limit))
+    return EventStats(buckets=buckets[: query.limit], truncated=truncated)
@@ -0,0 +1,194 @@
+"""Group-commit stage: coalesce concurrent writes into shared transactions."""
+
+import asyncio
+import logging
+from collections import deque
+from collections.abc import Callable, Sequence
+from contextlib import AbstractAsyncContextManager, suppress
+from dataclasses import dataclass
+from types import TracebackType
+
+from src.application.ports.event_repository import EventRepository
+from src.core.event import DomainEvent
+
+__all__ = ["GroupCommitter", "GroupCommitEventRepository"]
+
+logger = logging.getLogger(__name__)
+
+RepositoryFactory = Callable[[], AbstractAsyncContextManager[EventRepository]]
+
+
+@dataclass
+class _PendingWrite:
+    events: Sequence[DomainEvent]
+    done: asyncio.Future[list[bool]]
+
+
+class GroupCommitter:
+    """Collect writes from concurrent callers and flush them together.
+
+    The first pending write opens a linger window; the batch is flushed when
+    the window closes or as soon as ``max_batch_size`` events are pending.
+    Each caller's ``submit`` only returns once its batch has been committed,
+    so callers keep the same durability guarantee as a direct save.
+
+    Use as an async context manager: entering starts the background flusher,
+    exiting stops accepting writes and drains everything still pending.
+    """
+
+    def __init__(
+        self,
+        repository_factory: RepositoryFactory,
+        linger_seconds: float,
+        max_batch_size: int,
+    ) -> None:
+        """Initialize the stage.
+
+        Args:
+            repository_factory: Opens a repository for one flush.
+            linger_seconds: Maximum time the first pending write waits.
+            max_batch_size: Event count that triggers an immediate flush.
+        """
+        self._repository_factory = repository_factory
+        self._linger_seconds = linger_seconds
+        self._max_batch_size = max(1, max_batch_size)
+        self._pending: deque[_PendingWrite] = deque()
+        self._pending_count = 0
+        self._has_pending = asyncio.Event()
+        self._batch_full = asyncio.Event()
+        self._closed = False
+        self._worker: asyncio.Task[None] | None = None
+
+    async def __aenter__(self) -> "GroupCommitter":
+        self._worker = asyncio.create_task(self._run(), name="group-commit")
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.drain()
+
+    async def submit(self, events: Sequence[DomainEvent]) -> list[bool]:
+        """Queue events and wait until they are committed.
+
+        Events submitted together are always committed in the same transaction.
+
+        Args:
+            events: Domain events to persist.
+
+        Returns:
+            One flag per event: True if inserted, False if skipped as a duplicate.
+
+        Raises:
+            RuntimeError: If the stage is draining or stopped.
+            Exception: Whatever the repository raised for the shared batch.
+        """
+        if self._closed:
+            raise RuntimeError("Group commit stage is closed")
+        if not events:
+            return []
+
+        done: asyncio.Future[list[bool]] = asyncio.get_running_loop().create_future()
+        self._pending.append(_PendingWrite(events=events, done=done))
+        self._pending_count += len(events)
+        self._has_pending.set()
+        if self._pending_count >= self._max_batch_size:
+            self._batch_full.set()
+        return await done
+
+    async def drain(self) -> None:
+        """Stop accepting writes and flush everything still pending."""
+        self._closed = True
+        self._has_pending.set()
+        self._batch_full.set()
+        if self._worker is not None:
+            await self._worker
+            self._worker = None
+
+    async def _run(self) -> None:
+        while True:
+            await self._has_pending.wait()
+            if not self._closed and self._pending_count < self._max_batch_size:
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(self._batch_full.wait(), self._linger_seconds)
+
+            if self._pending:
+                await self._flush(self._take_batch())
+
+            if self._pending_count < self._max_batch_size and not self._closed:
+                self._batch_full.clear()
+            if not self._pending:
+                if self._closed:
+                    return
+                self._has_pending.clear()
+
+    def _take_batch(self) -> list[_PendingWrite]:
+        batch = [self._pending.popleft()]
+        count = len(batch[0].events)
+        while self._pending and count + len(self._pending[0].events) <= self._max_batch_size:
+            write = self._pending.popleft()
+            batch.append(write)
+            count += len(write.events)
+        self._pending_count -= count
+        return batch
+
+    async def _flush(self, batch: list[_PendingWrite]) -> None:
+        events = [event for write in batch for event in write.events]
+        try:
+            async with self._repository_factory() as repo:
+                flags = await repo.save_many(events)
+        except Exception as exc:
+            logger.error("Group commit failed: writes=%s, events=%s", len(batch), len(events))
+            for write in batch:
+                if not write.done.done():
+                    write.done.set_exception(exc)
+            return
+
+        logger.debug("Group commit flushed: writes=%s, events=%s", len(batch), len(events))
+        start = 0
+        for write in batch:
+            end = start + len(write.events)
+            if not write.done.done():
+                write.done.set_result(flags[start:end])
+            start = end
+
+
+class GroupCommitEventRepository(EventRepository):
+    """EventRepository adapter that routes writes through a GroupCommitter."""
+
+    def __init__(self, committer: GroupCommitter) -> None:
+        """Initialize with the shared group-commit stage.
+
+        Args:
+            committer: Running GroupCommitter instance.
+        """
+        self._committer = committer
+
+    async def save(self, event: DomainEvent, *, returning: bool = True) -> bool | None:
+        """Persist an event as part of the next group commit.
+
+        Group commits never read rows back, only whether each was inserted.
+
+        Args:
+            event: Domain event to persist.
+            returning: Ignored.
+
+        Returns:
+            True if inserted, None if skipped as a duplicate.
+        """
+        (inserted,) = await self._committer.submit((event,))
+        return True if inserted else None
+
+    async def save_many(self, events: Sequence[DomainEvent]) -> list[bool]:
+        """Persist events atomically as part of the next group commit.
+
+        Args:
+            events: Domain events to persist.
+
+        Returns:
+            One flag per event: True if inserted, False if skipped.
+        """
+        return await self._committer.submit(events)
@@ -0,0 +1,164 @@
+"""Background database health checks, read by the readiness probe."""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from types import TracebackType
+
+from src.application.ports.db_provider import PoolUsage
+
+__all__ = ["HealthMonitor", "HealthStatus"]
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class HealthStatus:
+    """Result of the latest database health check.
+
+    Attributes:
+        ready: False while the database is unreachable or the pool has
+            stayed saturated for too long.
+        database_up: Whether the latest ping succeeded (None before the first check).
+        pool: Pool usage at the latest check (None without a pool).
+        saturated_seconds: How long the pool has been saturated (0 when it is not).
+        checked_at: When the latest check ran.
+        last_error: Error of the latest failed ping, if any.
+    """
+
+    ready: bool = True
+    database_up: bool | None = None
+    pool: PoolUsage | None = None
+    saturated_seconds: float = 0.0
+    checked_at: datetime | None = None
+    last_error: str | None = None
+
+
+class HealthMonitor:
+    """Check the database on an interval and keep the latest result.
+
+    Every ``interval_seconds`` the monitor reads the pool usage and pings
+    the database, giving up after ``timeout_seconds``. The probes read
+    ``status``, so they never touch the database themselves and answer in
+    constant time however often they are called.
+
+    The database is not ready when the latest ping failed, or when the pool
+    has been saturated (every connection in use) at each check for at least
+    ``saturation_seconds``. While the pool is saturated the ping is skipped:
+    it would wait for a connection, adding to the load it measures, and the
+    previous result is kept.
+
+    Use as an async context manager: entering runs the first check, then
+    starts the schedule; exiting stops it.
+    """
+
+    def __init__(
+        self,
+        ping: Callable[[], Awaitable[None]],
+        pool_usage: Callable[[], PoolUsage | None],
+        *,
+        interval_seconds: float,
+        timeout_seconds: float,
+        saturation_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the monitor.
+
+        Args:
+            ping: Runs a trivial query, raising if the database cannot be reached.
+            pool_usage: Returns the connection pool usage (None without a pool).
+            interval_seconds: Time between the starts of two checks.
+            timeout_seconds: Longest wait for a ping.
+            saturation_seconds: How long the pool may stay saturated while ready.
+            clock: Monotonic clock, in seconds.
+        """
+        self._ping = ping
+        self._pool_usage = pool_usage
+        self._interval_seconds = interval_seconds
+        self._timeout_seconds = timeout_seconds
+        self._saturation_seconds = saturation_seconds
+        self._clock = clock
+        self._saturated_since: float | None = None
+        self._status = HealthStatus()
+        self._stopping = asyncio.Event()
+        self._worker: asyncio.Task[None] | None = None
+
+    @property
+    def status(self) -> HealthStatus:
+        """Result of the latest check."""
+        return self._status
+
+    async def __aenter__(self) -> "HealthMonitor":
+        await self.check_once()
+        self._stopping.clear()
+        self._worker = asyncio.create_task(self._run(), name="health-monitor")
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self._stopping.set()
+        if self._worker is not None:
+            await self._worker
+            self._worker = None
+
+    async def check_once(self) -> HealthStatus:
+        """Run one check and update the status.
+
+        Returns:
+            The new status.
+        """
+        now = self._clock()
+        pool = self._pool_usage()
+        if pool is None or not pool.saturated:
+            self._saturated_since = None
+        elif self._saturated_since is None:
+            self._saturated_since = now
+        saturated_seconds = (
+            now - self._saturated_since if self._saturated_since is not None else 0.0
+        )
+
+        database_up, error = self._status.database_up, self._status.last_error
+        if self._saturated_since is None:
+            try:
+                await asyncio.wait_for(self._ping(), self._timeout_seconds)
+                database_up, error = True, None
+            except Exception as exc:
+                database_up, error = False, str(exc) or type(exc).__name__
+
+        ready = database_up is not False and (
+            self._saturated_since is None or saturated_seconds < self._saturation_seconds
+        )
+        if ready != self._status.ready:
+            if ready:
+                logger.info("Database ready again")
+            else:
+                logger.warning(
+                    "Database not ready: database_up=%s, saturated_seconds=%.1f, error=%s",
+                    database_up,
+                    saturated_seconds,
+                    error,
+                )
+        self._status = HealthStatus(
+            ready=ready,
+            database_up=database_up,
+            pool=pool,
+            saturated_seconds=saturated_seconds,
+            checked_at=datetime.now(UTC),
+            last_error=error,
+        )
+        return self._status
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._stopping.wait(), self._interval_seconds)
+            if not self._stopping.is_set():
+                await self.check_once()
@@ -0,0 +1,72 @@
+"""In-process cache of recently committed idempotency keys."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+
+from src.application.ports.event_listener import CommittedEventsListener
+from src.core.event import DomainEvent
+
+__all__ = ["IdempotencyCache"]
+
+
+class IdempotencyCache(CommittedEventsListener):
+    """Remember the idempotency keys of recently committed events.
+
+    Keys are recorded after commit and kept for ``ttl_seconds``, at most
+    ``max_keys`` of them (least recently seen evicted first). A retry whose
+    key is still cached is answered without a database round trip; older
+    retries fall through to the database, which skips them on the unique
+    key.
+    """
+
+    def __init__(
+        self,
+        max_keys: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_keys: Keys kept at most.
+            ttl_seconds: How long a key is remembered.
+            clock: Monotonic time source (seconds).
+        """
+        self._max_keys = max(1, max_keys)
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._expires: OrderedDict[str, float] = OrderedDict()
+
+    def record(self, events: Sequence[DomainEvent]) -> None:
+        """Remember the keys of committed events.
+
+        Args:
+            events: Committed domain events (events without a key are ignored).
+        """
+        expires_at = self._clock() + self._ttl_seconds
+        for event in events:
+            if event.idempotency_key is None:
+                continue
+            self._expires[event.idempotency_key] = expires_at
+            self._expires.move_to_end(event.idempotency_key)
+
+        while len(self._expires) > self._max_keys:
+            self._expires.popitem(last=False)
+
+    def seen(self, key: str) -> bool:
+        """Return whether an event with this key was committed recently.
+
+        Args:
+            key: Idempotency key.
+
+        Returns:
+            True if the key is cached and has not expired.
+        """
+        expires_at = self._expires.get(key)
+        if expires_at is None:
+            return False
+        if expires_at <= self._clock():
+            del self._expires[key]
+            return False
+        return True
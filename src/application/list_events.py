@@ -0,0 +1,54 @@
+"""Use case: read one page of persisted events."""
+
+import logging
+from dataclasses import dataclass, replace
+
+from src.application.ports.event_query_repository import (
+    EventKey,
+    EventQuery,
+    EventQueryRepository,
+    EventRecord,
+)
+
+__all__ = ["EventPage", "list_events_uc"]
+
+logger = logging.getLogger("usecase.list_events")
+
+
+@dataclass(frozen=True)
+class EventPage:
+    """One page of events.
+
+    Attributes:
+        items: Events on this page, in the requested order.
+        next_key: Key to resume after, or None if this is the last page.
+    """
+
+    items: list[EventRecord]
+    next_key: EventKey | None
+
+
+async def list_events_uc(query: EventQuery, repo: EventQueryRepository) -> EventPage:
+    """Read one page of events and work out where the next page starts.
+
+    One extra row is fetched to tell whether another page exists, so the
+    last page never points at an empty one.
+
+    Args:
+        query: Filters, sort order and position.
+        repo: Event query repository.
+
+    Returns:
+        EventPage with at most `query.limit` events.
+
+    Raises:
+        Exception: If the read fails.
+    """
+    rows = await repo.list_events(replace(query, limit=query.limit + 1))
+    items = rows[: query.limit]
+    next_key = None
+    if len(rows) > query.limit:
+        last = items[-1]
+        next_key = EventKey(created_at=last.created_at, id=last.id)
+    logger.debug("Events page read: items=%s, more=%s", len(items), next_key is not None)
+    return EventPage(items=items, next_key=next_key)
@@ -0,0 +1,375 @@
+"""In-process metrics: counters, gauges and histograms in Prometheus format."""
+
+import math
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Final, Literal, TypeVar
+
+from src.application.ports.event_repository import EventRepository
+from src.core.event import DomainEvent
+
+__all__ = [
+    "Counter",
+    "EVENT_VALIDATION_SECONDS",
+    "Gauge",
+    "Histogram",
+    "LATENCY_BUCKETS",
+    "LabelValues",
+    "MeasuredEventRepository",
+    "MetricsRegistry",
+    "REGISTRY",
+    "REPOSITORY_WRITE_SECONDS",
+    "Snapshot",
+    "merge_snapshots",
+    "render_prometheus",
+]
+
+MetricType = Literal["counter", "gauge", "histogram"]
+LabelValues = tuple[str, ...]
+
+# Seconds; fine-grained at the low end where most requests land
+LATENCY_BUCKETS: Final[tuple[float, ...]] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class _Metric:
+    type: MetricType
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+
+
+class _CounterChild:
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+
+class Counter(_Metric):
+    """Monotonically increasing count, optionally split by labels."""
+
+    type: MetricType = "counter"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, help_text, labelnames)
+        self._children: dict[LabelValues, _CounterChild] = {}
+
+    def labels(self, *values: str) -> _CounterChild:
+        """Return the counter for one combination of label values."""
+        child = self._children.get(values)
+        if child is None:
+            child = self._children[values] = _CounterChild()
+        return child
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increment the unlabelled counter."""
+        self.labels().inc(amount)
+
+    def samples(self) -> list[list[Any]]:
+        return [[list(values), child.value] for values, child in self._children.items()]
+
+
+class Gauge(_Metric):
+    """Current value read at collection time from a callback."""
+
+    type: MetricType = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        read: Callable[[], Mapping[LabelValues, float]],
+        labelnames: Sequence[str] = (),
+    ) -> None:
+        super().__init__(name, help_text, labelnames)
+        self._read = read
+
+    def samples(self) -> list[list[Any]]:
+        return [[list(values), value] for values, value in self._read().items()]
+
+
+class _HistogramChild:
+    __slots__ = ("buckets", "counts", "sum")
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+
+class Histogram(_Metric):
+    """Distribution of observed values over fixed buckets."""
+
+    type: MetricType = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._children: dict[LabelValues, _HistogramChild] = {}
+
+    def labels(self, *values: str) -> _HistogramChild:
+        """Return the histogram for one combination of label values."""
+        child = self._children.get(values)
+        if child is None:
+            child = self._children[values] = _HistogramChild(self.buckets)
+        return child
+
+    def observe(self, value: float) -> None:
+        """Record a value in the unlabelled histogram."""
+        self.labels().observe(value)
+
+    def samples(self) -> list[list[Any]]:
+        return [
+            [list(values), list(child.counts), child.sum]
+            for values, child in self._children.items()
+        ]
+
+
+_M = TypeVar("_M", Counter, Gauge, Histogram)
+
+
+@dataclass
+class Snapshot:
+    """Plain-data copy of a registry's values, mergeable across processes.
+
+    Attributes:
+        families: Metric name to {"type", "help", "labelnames", "buckets",
+            "samples"}; JSON-serializable.
+    """
+
+    families: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+
+class MetricsRegistry:
+    """Set of metrics of one process.
+
+    Recording is a dict lookup and an in-place update on the event loop
+    thread: no locks, no I/O. Processes are combined at scrape time by
+    merging their snapshots.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._metrics: dict[str, Counter | Gauge | Histogram] = {}
+
+    def register(self, metric: _M) -> _M:
+        """Add a metric, replacing one of the same name.
+
+        Args:
+            metric: Metric to add.
+
+        Returns:
+            The metric, for assignment at module level.
+        """
+        self._metrics[metric.name] = metric
+        return metric
+
+    def unregister(self, name: str) -> None:
+        """Remove a metric if present."""
+        self._metrics.pop(name, None)
+
+    def snapshot(self, *, gauges: bool = True) -> Snapshot:
+        """Copy the current values.
+
+        Args:
+            gauges: Include gauges (leave them out of a final snapshot
+                written by an exiting process).
+
+        Returns:
+            Snapshot of every metric.
+        """
+        families = {}
+        for metric in self._metrics.values():
+            if metric.type == "gauge" and not gauges:
+                continue
+            families[metric.name] = {
+                "type": metric.type,
+                "help": metric.help,
+                "labelnames": list(metric.labelnames),
+                "buckets": list(getattr(metric, "buckets", ())),
+                "samples": metric.samples(),
+            }
+        return Snapshot(families)
+
+
+def merge_snapshots(snapshots: Iterable[Snapshot]) -> Snapshot:
+    """Sum snapshots of several processes, sample by sample.
+
+    Args:
+        snapshots: Snapshots to combine.
+
+    Returns:
+        A snapshot holding, for every metric and label set, the sum of the
+        counters, gauges and histogram buckets of all inputs.
+    """
+    merged: dict[str, dict[str, Any]] = {}
+    values: dict[str, dict[tuple[str, ...], Any]] = {}
+    for snapshot in snapshots:
+        for name, family in snapshot.families.items():
+            if name not in merged:
+                merged[name] = {**family, "samples": []}
+                values[name] = {}
+            by_labels = values[name]
+            for sample in family["samples"]:
+                key = tuple(sample[0])
+                if family["type"] == "histogram":
+                    counts, total = sample[1], sample[2]
+                    if key in by_labels:
+                        previous = by_labels[key]
+                        counts = [a + b for a, b in zip(previous[0], counts, strict=True)]
+                        total += previous[1]
+                    by_labels[key] = (counts, total)
+                else:
+                    by_labels[key] = by_labels.get(key, 0.0) + sample[1]
+
+    for name, family in merged.items():
+        if family["type"] == "histogram":
+            family["samples"] = [
+                [list(key), counts, total] for key, (counts, total) in values[name].items()
+            ]
+        else:
+            family["samples"] = [[list(key), value] for key, value in values[name].items()]
+    return Snapshot(merged)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+def render_prometheus(snapshot: Snapshot) -> str:
+    """Render a snapshot in the Prometheus text exposition format (0.0.4).
+
+    Args:
+        snapshot: Values to render.
+
+    Returns:
+        Exposition text, ending with a newline.
+    """
+    lines: list[str] = []
+    for name, family in sorted(snapshot.families.items()):
+        lines.append(f"# HELP {name} {family['help']}")
+        lines.append(f"# TYPE {name} {family['type']}")
+        names = family["labelnames"]
+        for sample in sorted(family["samples"], key=lambda s: tuple(s[0])):
+            values = sample[0]
+            if family["type"] != "histogram":
+                lines.append(f"{name}{_labels(names, values)} {_number(sample[1])}")
+                continue
+            cumulative = 0
+            bounds = [*family["buckets"], math.inf]
+            for bound, count in zip(bounds, sample[1], strict=True):
+                cumulative += count
+                le = f'le="{_number(bound)}"'
+                lines.append(f"{name}_bucket{_labels(names, values, le)} {cumulative}")
+            lines.append(f"{name}_sum{_labels(names, values)} {_number(sample[2])}")
+            lines.append(f"{name}_count{_labels(names, values)} {cumulative}")
+    return "\n".join(lines) + "\n"
+
+
+REGISTRY: Final = MetricsRegistry()
+
+EVENT_VALIDATION_SECONDS: Final[Histogram] = REGISTRY.register(
+    Histogram(
+        "event_validation_seconds",
+        "Time spent in DomainEvent.create validating an event.",
+        buckets=(0.000005, 0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001),
+    )
+)
+
+REPOSITORY_WRITE_SECONDS: Final[Histogram] = REGISTRY.register(
+    Histogram(
+        "repository_write_seconds",
+        "Time until an event write is committed, by repository operation.",
+        ["operation"],
+    )
+)
+
+
+class MeasuredEventRepository(EventRepository):
+    """EventRepository decorator timing each write until it is committed."""
+
+    def __init__(self, inner: EventRepository) -> None:
+        """Initialize with the repository to decorate.
+
+        Args:
+            inner: Repository that persists the events.
+        """
+        self._inner = inner
+        self._save = REPOSITORY_WRITE_SECONDS.labels("save")
+        self._save_many = REPOSITORY_WRITE_SECONDS.labels("save_many")
+
+    async def save(self, event: DomainEvent, *, returning: bool = True) -> object:
+        """Persist an event and record how long it took.
+
+        Args:
+            event: Domain event to persist.
+            returning: Passed through to the inner repository.
+
+        Returns:
+            Whatever the inner repository returned.
+        """
+        started = time.perf_counter()
+        try:
+            return await self._inner.save(event, returning=returning)
+        finally:
+            self._save.observe(time.perf_counter() - started)
+
+    async def save_many(self, events: Sequence[DomainEvent]) -> list[bool]:
+        """Persist events and record how long it took.
+
+        Args:
+            events: Domain events to persist.
+
+        Returns:
+            Whatever the inner repository returned.
+        """
+        started = time.perf_counter()
+        try:
+            return await self._inner.save_many(events)
+        finally:
+            self._save_many.observe(time.perf_counter() - started)
@@ -1,8 +1,36 @@
 # src/application/ports/db.py
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass
 from typing import Protocol
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.application.ports.event_query_repository import EventQueryRepository
+from src.application.ports.event_repository import EventRepository
+from src.application.ports.retention_repository import RetentionRepository
+from src.application.ports.rollup_repository import RollupRepository
+
+
+@dataclass(frozen=True)
+class PoolUsage:
+    """Connection pool usage at one instant.
+
+    Attributes:
+        checked_out: Connections currently in use.
+        capacity: Most connections the pool hands out (None when unbounded).
+        waiting: Checkouts in progress, waiting for a free connection or
+            opening a new one.
+    """
+
+    checked_out: int
+    capacity: int | None
+    waiting: int = 0
+
+    @property
+    def saturated(self) -> bool:
+        """True when every connection the pool may open is in use."""
+        return self.capacity is not None and self.checked_out >= self.capacity
+
 
 class DbProvider(Protocol):
     """Port: async lifecycle + session factory."""
@@ -20,3 +48,27 @@ class DbProvider(Protocol):
 
     def __call__(self) -> AsyncSession:
         ...
+
+    async def ping(self) -> None:
+        """Run a trivial query; raise if the database cannot be reached."""
+        ...
+
+    def pool_usage(self) -> PoolUsage | None:
+        """Return the connection pool usage, or None when there is no pool."""
+        ...
+
+    def event_repository(self) -> AbstractAsyncContextManager[EventRepository]:
+        """Open an event repository backed by a fresh unit of work."""
+        ...
+
+    def event_query_repository(self) -> EventQueryRepository:
+        """Return the repository used to read events."""
+        ...
+
+    def rollup_repository(self) -> RollupRepository:
+        """Return the repository storing per-type time-bucket rollups."""
+        ...
+
+    def retention_repository(self) -> RetentionRepository:
+        """Return the repository deleting expired events."""
+        ...
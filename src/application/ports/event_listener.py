@@ -0,0 +1,24 @@
+"""Port definition for observers of committed events."""
+
+from collections.abc import Sequence
+from typing import Protocol
+
+from src.core.event import DomainEvent
+
+__all__ = ["CommittedEventsListener"]
+
+
+class CommittedEventsListener(Protocol):
+    """Interface for in-process consumers of committed events.
+
+    Called on the event loop right after a write commits, so implementations
+    must be fast and must not block or await.
+    """
+
+    def record(self, events: Sequence[DomainEvent]) -> None:
+        """Take note of events that have just been persisted.
+
+        Args:
+            events: Committed domain events.
+        """
+        ...
@@ -0,0 +1,82 @@
+"""Port definition for reading persisted events."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Literal, Protocol
+
+__all__ = ["EventKey", "EventQuery", "EventQueryRepository", "EventRecord", "SortOrder"]
+
+SortOrder = Literal["asc", "desc"]
+
+
+@dataclass(frozen=True)
+class EventRecord:
+    """A persisted event as read back from storage.
+
+    Attributes:
+        id: Storage-assigned identifier.
+        event_type: Event type/category.
+        event_payload: Event content.
+        created_at: Creation timestamp (UTC).
+    """
+
+    id: int
+    event_type: str
+    event_payload: str
+    created_at: datetime
+
+
+@dataclass(frozen=True)
+class EventKey:
+    """Position of an event in the (created_at, id) sort order.
+
+    Attributes:
+        created_at: Creation timestamp (UTC) of the last event seen.
+        id: Identifier of the last event seen (breaks timestamp ties).
+    """
+
+    created_at: datetime
+    id: int
+
+
+@dataclass(frozen=True)
+class EventQuery:
+    """Filters and position for one page of events.
+
+    Attributes:
+        limit: Maximum number of events to return.
+        event_type: Only events of this type (all types when None).
+        since: Only events created at or after this instant (inclusive).
+        until: Only events created before this instant (exclusive).
+        order: "asc" for oldest first, "desc" for newest first.
+        after: Return events strictly after this key in the sort order.
+    """
+
+    limit: int
+    event_type: str | None = None
+    since: datetime | None = None
+    until: datetime | None = None
+    order: SortOrder = "desc"
+    after: EventKey | None = None
+
+
+class EventQueryRepository(Protocol):
+    """Interface for reading persisted events.
+
+    Implementations must seek directly to `query.after` (keyset pagination)
+    so that every page costs the same regardless of its depth.
+    """
+
+    async def list_events(self, query: EventQuery) -> list[EventRecord]:
+        """Return up to `query.limit` events matching the query, in order.
+
+        Args:
+            query: Filters, sort order and position.
+
+        Returns:
+            Matching events ordered by (created_at, id) in `query.order`.
+
+        Raises:
+            Exception: If the read fails.
+        """
+        ...
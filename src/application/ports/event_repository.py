@@ -1,5 +1,6 @@
 """Port definition for event persistence."""
 
+from collections.abc import Sequence
 from typing import Protocol
 
 from src.core.event import DomainEvent
@@ -14,14 +15,35 @@ class EventRepository(Protocol):
     to this protocol.
     """
 
-    async def save(self, event: DomainEvent) -> object:
+    async def save(self, event: DomainEvent, *, returning: bool = True) -> object:
         """Persist a domain event.
 
         Args:
             event: The domain event to persist.
+            returning: Whether the caller needs the persisted object back.
+                Implementations may skip reading it when False.
 
         Returns:
-            The persisted object.
+            The persisted object, or True when returning is False; None if
+            the event was skipped as a duplicate of a stored idempotency key.
+
+        Raises:
+            Exception: If persistence fails.
+        """
+        ...
+
+    async def save_many(self, events: Sequence[DomainEvent]) -> list[bool]:
+        """Persist several domain events in a single transaction.
+
+        Either every event is persisted or none is, except for events
+        skipped as duplicates of a stored idempotency key.
+
+        Args:
+            events: The domain events to persist.
+
+        Returns:
+            One flag per event, in order: True if inserted, False if skipped
+            as a duplicate.
 
         Raises:
             Exception: If persistence fails.
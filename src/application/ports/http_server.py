@@ -10,3 +10,7 @@ class HttpServer:
     """DTO for http server"""
 
     port: int
+    workers: int = 1
+    loop: str = "auto"
+    http: str = "auto"
+    graceful_shutdown_seconds: int = 30
@@ -0,0 +1,57 @@
+"""Port definition for deleting expired events."""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Protocol
+
+from src.application.ports.event_query_repository import EventKey
+
+__all__ = ["ExpiredBatch", "RetentionRepository"]
+
+
+@dataclass(frozen=True)
+class ExpiredBatch:
+    """Outcome of deleting one batch of expired events.
+
+    Attributes:
+        deleted: Number of events deleted.
+        last_key: Key of the last deleted event (None if nothing was deleted).
+    """
+
+    deleted: int
+    last_key: EventKey | None
+
+
+class RetentionRepository(Protocol):
+    """Interface for deleting expired events in small batches."""
+
+    async def delete_expired(
+        self,
+        older_than: datetime,
+        limit: int,
+        *,
+        event_type: str | None = None,
+        exclude_types: Sequence[str] = (),
+        after: EventKey | None = None,
+    ) -> ExpiredBatch:
+        """Delete the oldest expired events, at most `limit` of them.
+
+        Events are taken in (created_at, id) order starting after `after`,
+        so consecutive batches seek past what was already deleted instead of
+        rescanning it. Each batch runs in its own short transaction.
+
+        Args:
+            older_than: Delete events created before this instant.
+            limit: Maximum number of events to delete.
+            event_type: Only events of this type (all types when None).
+            exclude_types: Skip events of these types.
+            after: Key of the last event deleted by the previous batch.
+
+        Returns:
+            ExpiredBatch with the count and the key to resume after.
+
+        Raises:
+            Exception: If the delete fails (nothing is deleted).
+        """
+        ...
@@ -0,0 +1,77 @@
+"""Port definition for per-type time-bucket rollups."""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Literal, Protocol
+
+__all__ = ["Resolution", "RollupBucket", "RollupQuery", "RollupRepository"]
+
+Resolution = Literal["minute", "hour"]
+
+
+@dataclass(frozen=True)
+class RollupBucket:
+    """Event counters for one type within one time bucket.
+
+    Attributes:
+        resolution: Bucket width.
+        event_type: Event type/category.
+        bucket_start: Start of the bucket (UTC).
+        count: Number of events.
+        total_payload_bytes: Sum of UTF-8 payload sizes.
+    """
+
+    resolution: Resolution
+    event_type: str
+    bucket_start: datetime
+    count: int
+    total_payload_bytes: int
+
+
+@dataclass(frozen=True)
+class RollupQuery:
+    """Filters for reading rollup buckets.
+
+    Attributes:
+        resolution: Bucket width to read.
+        limit: Maximum number of buckets to return.
+        event_type: Only buckets of this type (all types when None).
+        since: Only buckets starting at or after this instant (inclusive).
+        until: Only buckets starting before this instant (exclusive).
+    """
+
+    resolution: Resolution
+    limit: int
+    event_type: str | None = None
+    since: datetime | None = None
+    until: datetime | None = None
+
+
+class RollupRepository(Protocol):
+    """Interface for rollup storage."""
+
+    async def add(self, buckets: Sequence[RollupBucket]) -> None:
+        """Add counters to the stored buckets, creating missing ones.
+
+        Args:
+            buckets: Deltas to add; count and total_payload_bytes are increments.
+
+        Raises:
+            Exception: If the write fails (no delta is applied).
+        """
+        ...
+
+    async def list_buckets(self, query: RollupQuery) -> list[RollupBucket]:
+        """Return stored buckets matching the query.
+
+        Args:
+            query: Resolution, filters and limit.
+
+        Returns:
+            Buckets ordered by (bucket_start, event_type).
+
+        Raises:
+            Exception: If the read fails.
+        """
+        ...
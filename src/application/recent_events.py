@@ -0,0 +1,204 @@
+"""Bounded in-memory buffer of the most recent events per type."""
+
+import logging
+import sys
+from collections import OrderedDict, deque
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from itertools import islice
+from typing import Final, Literal
+
+from src.application.ports.event_listener import CommittedEventsListener
+from src.application.ports.event_query_repository import EventQuery, EventQueryRepository
+from src.core.event import DomainEvent
+
+__all__ = ["RecentEvents", "RecentEventsBuffer", "RecentEventsUsage", "recent_events_uc"]
+
+logger = logging.getLogger(__name__)
+
+# Approximate CPython footprint of one buffered entry besides its payload:
+# the deque slot, the (created_at, payload) tuple and the datetime.
+_ENTRY_OVERHEAD: Final[int] = 8 + sys.getsizeof((None, None)) + sys.getsizeof(datetime.now(UTC))
+# Footprint of an empty per-type buffer and its LRU slot (type string excluded)
+_TYPE_OVERHEAD: Final[int] = sys.getsizeof(deque(maxlen=1)) + 100
+
+_Entry = tuple[datetime, str]
+
+
+@dataclass(frozen=True)
+class RecentEventsUsage:
+    """Memory usage of a RecentEventsBuffer.
+
+    Attributes:
+        types: Event types currently buffered.
+        events: Events currently buffered.
+        bytes: Approximate memory held by the buffered events.
+        max_bytes: Memory cap.
+        evicted_types: Types evicted to stay under the cap since startup.
+    """
+
+    types: int
+    events: int
+    bytes: int
+    max_bytes: int
+    evicted_types: int
+
+
+class RecentEventsBuffer(CommittedEventsListener):
+    """Keep the last ``max_per_type`` committed events of each type in memory.
+
+    Each type has a fixed-size ring buffer of compact (created_at, payload)
+    tuples. Types are kept in least-recently-written order; when the
+    approximate footprint exceeds ``max_bytes``, whole types are evicted
+    starting from the one written longest ago. Reads walk the ring backwards,
+    so they cost O(N) in the number of events returned.
+    """
+
+    def __init__(self, max_per_type: int, max_bytes: int) -> None:
+        """Initialize an empty buffer.
+
+        Args:
+            max_per_type: Events kept per type.
+            max_bytes: Approximate memory cap across all types.
+        """
+        self._max_per_type = max(1, max_per_type)
+        self._max_bytes = max_bytes
+        self._rings: OrderedDict[str, deque[_Entry]] = OrderedDict()
+        self._bytes = 0
+        self._events = 0
+        self._evicted_types = 0
+
+    def record(self, events: Sequence[DomainEvent]) -> None:
+        """Append committed events to their type's ring.
+
+        Args:
+            events: Committed domain events.
+        """
+        for event in events:
+            ring = self._rings.get(event.event_type)
+            if ring is None:
+                ring = self._rings[event.event_type] = deque(maxlen=self._max_per_type)
+                self._bytes += _TYPE_OVERHEAD + sys.getsizeof(event.event_type)
+            else:
+                self._rings.move_to_end(event.event_type)
+
+            if len(ring) == self._max_per_type:
+                self._bytes -= _entry_size(ring[0])
+                self._events -= 1
+            entry = (event.created_at, event.event_payload)
+            ring.append(entry)
+            self._bytes += _entry_size(entry)
+            self._events += 1
+
+        self._enforce_cap()
+
+    def recent(self, event_type: str, limit: int) -> list[DomainEvent] | None:
+        """Return the newest events of a type, newest first.
+
+        Args:
+            event_type: Type to read.
+            limit: Maximum number of events.
+
+        Returns:
+            Up to `limit` events, or None if nothing is buffered for the type.
+        """
+        ring = self._rings.get(event_type)
+        if not ring:
+            return None
+        return [
+            DomainEvent(event_type=event_type, event_payload=payload, created_at=created_at)
+            for created_at, payload in islice(reversed(ring), limit)
+        ]
+
+    def usage(self) -> RecentEventsUsage:
+        """Report the current memory usage."""
+        return RecentEventsUsage(
+            types=len(self._rings),
+            events=self._events,
+            bytes=self._bytes,
+            max_bytes=self._max_bytes,
+            evicted_types=self._evicted_types,
+        )
+
+    def _enforce_cap(self) -> None:
+        while self._bytes > self._max_bytes and len(self._rings) > 1:
+            event_type, ring = self._rings.popitem(last=False)
+            self._drop_type(event_type, ring)
+            self._evicted_types += 1
+            logger.debug("Recent events evicted: type=%s", event_type)
+
+        # A single type larger than the cap keeps only its newest events
+        if self._bytes > self._max_bytes and self._rings:
+            event_type, ring = next(iter(self._rings.items()))
+            while ring and self._bytes > self._max_bytes:
+                self._bytes -= _entry_size(ring.popleft())
+                self._events -= 1
+            if not ring:
+                del self._rings[event_type]
+                self._drop_type(event_type, ring)
+
+    def _drop_type(self, event_type: str, ring: deque[_Entry]) -> None:
+        self._bytes -= _TYPE_OVERHEAD + sys.getsizeof(event_type)
+        self._bytes -= sum(_entry_size(entry) for entry in ring)
+        self._events -= len(ring)
+
+
+def _entry_size(entry: _Entry) -> int:
+    return _ENTRY_OVERHEAD + sys.getsizeof(entry[1])
+
+
+@dataclass(frozen=True)
+class RecentEvents:
+    """The newest events of one type.
+
+    Attributes:
+        items: Events, newest first.
+        source: "memory" if served from the buffer, "database" otherwise.
+    """
+
+    items: list[DomainEvent]
+    source: Literal["memory", "database"]
+
+
+async def recent_events_uc(
+    event_type: str,
+    limit: int,
+    buffer: RecentEventsBuffer | None,
+    repo: EventQueryRepository,
+) -> RecentEvents:
+    """Return the newest events of a type, from memory when possible.
+
+    The database is only queried when the buffer is disabled or holds
+    nothing for the type (e.g. after a restart or an eviction).
+
+    Args:
+        event_type: Type to read.
+        limit: Maximum number of events.
+        buffer: Recent events buffer (None when disabled).
+        repo: Event query repository for the fallback.
+
+    Returns:
+        RecentEvents, newest first.
+
+    Raises:
+        Exception: If the database fallback fails.
+    """
+    if buffer is not None:
+        items = buffer.recent(event_type, limit)
+        if items is not None:
+            return RecentEvents(items=items, source="memory")
+
+    records = await repo.list_events(EventQuery(limit=limit, event_type=event_type, order="desc"))
+    logger.debug("Recent events read from database: type=%s, items=%s", event_type, len(records))
+    return RecentEvents(
+        items=[
+            DomainEvent(
+                event_type=record.event_type,
+                event_payload=record.event_payload,
+                created_at=record.created_at,
+            )
+            for record in records
+        ],
+        source="database",
+    )
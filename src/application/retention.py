@@ -0,0 +1,215 @@
+"""Background retention: purge expired events in small, throttled batches."""
+
+import asyncio
+import logging
+import time
+from collections.abc import Mapping
+from contextlib import suppress
+from dataclasses import dataclass, field, replace
+from datetime import UTC, datetime, timedelta
+from types import TracebackType
+
+from src.application.ports.event_query_repository import EventKey
+from src.application.ports.retention_repository import RetentionRepository
+
+__all__ = ["RetentionJob", "RetentionProgress"]
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RetentionProgress:
+    """Progress counters of a RetentionJob.
+
+    Attributes:
+        running: True while a purge pass is in progress.
+        runs: Completed purge passes.
+        batches: Delete batches executed since startup.
+        deleted: Events deleted since startup.
+        deleted_by_type: Events deleted per rule ("*" for the default rule).
+        last_run_started_at: When the latest pass started.
+        last_run_finished_at: When the latest pass finished.
+        last_error: Error that ended the latest failed pass, if any.
+    """
+
+    running: bool = False
+    runs: int = 0
+    batches: int = 0
+    deleted: int = 0
+    deleted_by_type: dict[str, int] = field(default_factory=dict)
+    last_run_started_at: datetime | None = None
+    last_run_finished_at: datetime | None = None
+    last_error: str | None = None
+
+
+@dataclass(frozen=True)
+class _Rule:
+    label: str
+    max_age: timedelta
+    event_type: str | None = None
+    exclude_types: tuple[str, ...] = ()
+
+
+class RetentionJob:
+    """Delete events older than their type's maximum age.
+
+    Every ``interval_seconds`` a pass walks each rule (explicit types first,
+    then the default age for all other types) and deletes expired events
+    oldest first in batches of ``batch_size``. Each batch is its own short
+    transaction, and the job sleeps between batches for at least
+    ``batch_pause_seconds`` and long enough to stay under
+    ``max_rows_per_second``. Locks are held only briefly and WAL is
+    generated at a bounded rate, even during peak ingest.
+
+    Use as an async context manager: entering starts the schedule (the first
+    pass runs immediately), exiting stops after the current batch.
+    """
+
+    def __init__(
+        self,
+        repository: RetentionRepository,
+        *,
+        default_max_age: timedelta | None,
+        max_age_by_type: Mapping[str, timedelta | None],
+        batch_size: int,
+        batch_pause_seconds: float,
+        max_rows_per_second: float,
+        interval_seconds: float,
+    ) -> None:
+        """Initialize the job.
+
+        Args:
+            repository: Retention storage.
+            default_max_age: Maximum age of types without their own rule
+                (None keeps them forever).
+            max_age_by_type: Maximum age per event type (None keeps the
+                type forever, overriding the default).
+            batch_size: Events deleted per transaction.
+            batch_pause_seconds: Minimum sleep between batches.
+            max_rows_per_second: Deletion rate cap (0 disables the cap).
+            interval_seconds: Time between the starts of two passes.
+        """
+        self._repository = repository
+        self._rules = self._build_rules(default_max_age, max_age_by_type)
+        self._batch_size = max(1, batch_size)
+        self._batch_pause_seconds = batch_pause_seconds
+        self._max_rows_per_second = max_rows_per_second
+        self._interval_seconds = interval_seconds
+        self._progress = RetentionProgress()
+        self._stopping = asyncio.Event()
+        self._worker: asyncio.Task[None] | None = None
+
+    @staticmethod
+    def _build_rules(
+        default_max_age: timedelta | None, max_age_by_type: Mapping[str, timedelta | None]
+    ) -> list[_Rule]:
+        rules = [
+            _Rule(label=event_type, max_age=max_age, event_type=event_type)
+            for event_type, max_age in sorted(max_age_by_type.items())
+            if max_age is not None
+        ]
+        if default_max_age is not None:
+            rules.append(
+                _Rule(label="*", max_age=default_max_age, exclude_types=tuple(max_age_by_type))
+            )
+        return rules
+
+    @property
+    def progress(self) -> RetentionProgress:
+        """Snapshot of the progress counters."""
+        return replace(self._progress, deleted_by_type=dict(self._progress.deleted_by_type))
+
+    async def __aenter__(self) -> "RetentionJob":
+        if self._rules:
+            self._worker = asyncio.create_task(self._run(), name="retention")
+        else:
+            logger.info("Retention enabled without any maximum age; nothing to purge")
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self._stopping.set()
+        if self._worker is not None:
+            await self._worker
+            self._worker = None
+
+    async def run_once(self, now: datetime | None = None) -> int:
+        """Run one purge pass over every rule.
+
+        Args:
+            now: Reference time for the ages (defaults to the wall clock).
+
+        Returns:
+            Number of events deleted by this pass.
+        """
+        now = now or datetime.now(UTC)
+        self._progress = replace(self._progress, running=True, last_run_started_at=now)
+        deleted = 0
+        error = None
+        try:
+            for rule in self._rules:
+                deleted += await self._purge(rule, now - rule.max_age)
+                if self._stopping.is_set():
+                    break
+        except Exception as exc:
+            logger.error("Retention pass failed after deleting %s events: %s", deleted, exc)
+            error = str(exc)
+
+        self._progress = replace(
+            self._progress,
+            running=False,
+            runs=self._progress.runs + 1,
+            last_run_finished_at=datetime.now(UTC),
+            last_error=error,
+        )
+        if deleted:
+            logger.info("Retention pass deleted %s events", deleted)
+        return deleted
+
+    async def _purge(self, rule: _Rule, cutoff: datetime) -> int:
+        deleted = 0
+        after: EventKey | None = None
+        while not self._stopping.is_set():
+            started = time.monotonic()
+            batch = await self._repository.delete_expired(
+                cutoff,
+                self._batch_size,
+                event_type=rule.event_type,
+                exclude_types=rule.exclude_types,
+                after=after,
+            )
+            self._count(rule, batch.deleted)
+            deleted += batch.deleted
+            if batch.deleted < self._batch_size:
+                break
+            after = batch.last_key
+            await self._throttle(batch.deleted, time.monotonic() - started)
+        return deleted
+
+    def _count(self, rule: _Rule, deleted: int) -> None:
+        by_type = dict(self._progress.deleted_by_type)
+        by_type[rule.label] = by_type.get(rule.label, 0) + deleted
+        self._progress = replace(
+            self._progress,
+            batches=self._progress.batches + 1,
+            deleted=self._progress.deleted + deleted,
+            deleted_by_type=by_type,
+        )
+
+    async def _throttle(self, deleted: int, elapsed: float) -> None:
+        pause = self._batch_pause_seconds
+        if self._max_rows_per_second > 0:
+            pause = max(pause, deleted / self._max_rows_per_second - elapsed)
+        if pause > 0:
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._stopping.wait(), pause)
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            await self.run_once()
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._stopping.wait(), self._interval_seconds)
@@ -0,0 +1,136 @@
+"""Incremental per-type time-bucket rollups of ingested events."""
+
+import asyncio
+import logging
+from collections.abc import Sequence
+from contextlib import suppress
+from datetime import UTC, datetime, timedelta
+from types import TracebackType
+from typing import Final
+
+from src.application.ports.event_listener import CommittedEventsListener
+from src.application.ports.rollup_repository import Resolution, RollupBucket, RollupRepository
+from src.core.event import DomainEvent
+
+__all__ = ["RESOLUTIONS", "RollupAggregator", "bucket_start"]
+
+logger = logging.getLogger(__name__)
+
+RESOLUTIONS: Final[dict[Resolution, timedelta]] = {
+    "minute": timedelta(minutes=1),
+    "hour": timedelta(hours=1),
+}
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+_BucketKey = tuple[Resolution, str, datetime]
+
+
+def bucket_start(timestamp: datetime, resolution: Resolution) -> datetime:
+    """Return the start of the bucket containing timestamp.
+
+    Args:
+        timestamp: Instant to place (naive values are taken as UTC).
+        resolution: Bucket width.
+
+    Returns:
+        UTC bucket start.
+    """
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=UTC)
+    width = RESOLUTIONS[resolution]
+    return _EPOCH + ((timestamp - _EPOCH) // width) * width
+
+
+class RollupAggregator(CommittedEventsListener):
+    """Aggregate committed events in memory and flush them as upserts.
+
+    ``record`` only touches an in-memory dict; a background task adds the
+    accumulated counters to the rollup table every ``flush_interval_seconds``
+    in one transaction, so the write cost scales with the number of touched
+    buckets, not with the number of events. Counters from a failed flush are
+    kept and retried on the next one.
+
+    Use as an async context manager: entering starts the background flusher,
+    exiting stops it and flushes what is left.
+    """
+
+    def __init__(self, repository: RollupRepository, flush_interval_seconds: float) -> None:
+        """Initialize the aggregator.
+
+        Args:
+            repository: Rollup storage.
+            flush_interval_seconds: Time between flushes.
+        """
+        self._repository = repository
+        self._flush_interval_seconds = flush_interval_seconds
+        self._pending: dict[_BucketKey, list[int]] = {}
+        self._stopping = asyncio.Event()
+        self._worker: asyncio.Task[None] | None = None
+
+    async def __aenter__(self) -> "RollupAggregator":
+        self._worker = asyncio.create_task(self._run(), name="rollup-flush")
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self._stopping.set()
+        if self._worker is not None:
+            await self._worker
+            self._worker = None
+        await self.flush()
+
+    def record(self, events: Sequence[DomainEvent]) -> None:
+        """Count committed events into their buckets.
+
+        Args:
+            events: Events that have been persisted.
+        """
+        for event in events:
+            size = len(event.event_payload.encode())
+            for resolution in RESOLUTIONS:
+                key = (resolution, event.event_type, bucket_start(event.created_at, resolution))
+                counters = self._pending.get(key)
+                if counters is None:
+                    self._pending[key] = [1, size]
+                else:
+                    counters[0] += 1
+                    counters[1] += size
+
+    async def flush(self) -> None:
+        """Add the accumulated counters to storage."""
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, {}
+        buckets = [
+            RollupBucket(
+                resolution=resolution,
+                event_type=event_type,
+                bucket_start=start,
+                count=count,
+                total_payload_bytes=size,
+            )
+            for (resolution, event_type, start), (count, size) in pending.items()
+        ]
+        try:
+            await self._repository.add(buckets)
+        except Exception as exc:
+            logger.error("Rollup flush failed, retrying later: buckets=%s: %s", len(buckets), exc)
+            for key, (count, size) in pending.items():
+                counters = self._pending.setdefault(key, [0, 0])
+                counters[0] += count
+                counters[1] += size
+            return
+
+        logger.debug("Rollups flushed: buckets=%s", len(buckets))
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._stopping.wait(), self._flush_interval_seconds)
+            await self.flush()
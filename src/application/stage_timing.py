@@ -0,0 +1,122 @@
+"""Per-request stage timing, collected through a context variable."""
+
+import time
+from contextlib import AbstractContextManager, nullcontext
+from contextvars import ContextVar, Token
+from types import TracebackType
+from typing import Final
+
+__all__ = [
+    "StageTimings",
+    "current_timings",
+    "record_stage",
+    "stage",
+    "start_request_timing",
+    "stop_request_timing",
+]
+
+
+class StageTimings:
+    """Time spent in each named stage of one request.
+
+    Attributes:
+        stages: Stage name to seconds, in the order stages first ran. A
+            stage that runs several times (e.g. "create" in a batch)
+            accumulates.
+    """
+
+    __slots__ = ("stages",)
+
+    def __init__(self) -> None:
+        """Initialize with no stages."""
+        self.stages: dict[str, float] = {}
+
+    def add(self, name: str, seconds: float) -> None:
+        """Add time to a stage.
+
+        Args:
+            name: Stage name.
+            seconds: Time spent.
+        """
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+
+_current: ContextVar[StageTimings | None] = ContextVar("stage_timings", default=None)
+
+# Returned by stage() when no request is being timed: nothing is allocated
+_DISABLED: Final[AbstractContextManager[None]] = nullcontext()
+
+
+class _Stage:
+    __slots__ = ("_name", "_started", "_timings")
+
+    def __init__(self, timings: StageTimings, name: str) -> None:
+        self._timings = timings
+        self._name = name
+        self._started = 0.0
+
+    def __enter__(self) -> None:
+        self._started = time.perf_counter()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self._timings.add(self._name, time.perf_counter() - self._started)
+
+
+def current_timings() -> StageTimings | None:
+    """Return the timings of the current request, or None when not timed."""
+    return _current.get()
+
+
+def stage(name: str) -> AbstractContextManager[None]:
+    """Time a block as a stage of the current request.
+
+    Outside a timed request (or with timing disabled) this returns a shared
+    no-op context manager, so instrumented code costs one context variable
+    lookup.
+
+    Args:
+        name: Stage name.
+
+    Returns:
+        Context manager timing the block.
+    """
+    timings = _current.get()
+    if timings is None:
+        return _DISABLED
+    return _Stage(timings, name)
+
+
+def record_stage(name: str, seconds: float) -> None:
+    """Add time already measured to a stage of the current request.
+
+    Args:
+        name: Stage name.
+        seconds: Time spent.
+    """
+    timings = _current.get()
+    if timings is not None:
+        timings.add(name, seconds)
+
+
+def start_request_timing() -> tuple[StageTimings, Token[StageTimings | None]]:
+    """Start collecting stage timings for the current request.
+
+    Returns:
+        The timings being collected, and a token for stop_request_timing().
+    """
+    timings = StageTimings()
+    return timings, _current.set(timings)
+
+
+def stop_request_timing(token: Token[StageTimings | None]) -> None:
+    """Stop collecting stage timings.
+
+    Args:
+        token: Token returned by start_request_timing().
+    """
+    _current.reset(token)
@@ -5,10 +5,16 @@ from datetime import UTC, datetime
 
 from src.core.exceptions import DomainValidationError
 
-__all__ = ["DomainEvent", "MAX_EVENT_TYPE_LENGTH", "MAX_EVENT_PAYLOAD_LENGTH"]
+__all__ = [
+    "DomainEvent",
+    "MAX_EVENT_TYPE_LENGTH",
+    "MAX_EVENT_PAYLOAD_LENGTH",
+    "MAX_IDEMPOTENCY_KEY_LENGTH",
+]
 
 MAX_EVENT_TYPE_LENGTH = 100
 MAX_EVENT_PAYLOAD_LENGTH = 1000
+MAX_IDEMPOTENCY_KEY_LENGTH = 255
 
 
 @dataclass(frozen=True)
@@ -21,24 +27,31 @@ class DomainEvent:
         event_type: Event type/category.
         event_payload: Event content.
         created_at: Creation timestamp (always UTC).
+        idempotency_key: Client-supplied key identifying retries of the same
+            event (None when not supplied).
     """
 
     event_type: str
     event_payload: str
     created_at: datetime
+    idempotency_key: str | None = None
 
     @classmethod
-    def create(cls, event_type: str, event_payload: str) -> "DomainEvent":
+    def create(
+        cls, event_type: str, event_payload: str, idempotency_key: str | None = None
+    ) -> "DomainEvent":
         """Create and validate a domain event.
 
         Enforces:
         - Non-empty, non-whitespace event_type (1-100 chars).
         - Non-empty, non-whitespace event_payload (1-1000 chars).
+        - Optional non-empty, non-whitespace idempotency_key (1-255 chars).
         - UTC timestamp set to current time.
 
         Args:
             event_type: Event type (will be stripped).
             event_payload: Event content (will be stripped).
+            idempotency_key: Optional retry key (will be stripped).
 
         Returns:
             Valid DomainEvent instance.
@@ -65,8 +78,19 @@ class DomainEvent:
                 f"Event payload exceeds {MAX_EVENT_PAYLOAD_LENGTH} chars (got {len(event_payload)})"
             )
 
+        if idempotency_key is not None:
+            idempotency_key = idempotency_key.strip()
+            if not idempotency_key:
+                raise DomainValidationError("Idempotency key cannot be empty")
+            if len(idempotency_key) > MAX_IDEMPOTENCY_KEY_LENGTH:
+                raise DomainValidationError(
+                    f"Idempotency key exceeds {MAX_IDEMPOTENCY_KEY_LENGTH} chars "
+                    f"(got {len(idempotency_key)})"
+                )
+
         return cls(
             event_type=event_type,
             event_payload=event_payload,
             created_at=datetime.now(UTC),
+            idempotency_key=idempotency_key,
         )
@@ -1,15 +1,403 @@
 import logging
 import os
-from typing import Final
+from dataclasses import dataclass, field, replace
+from typing import Final, Literal, cast
 
 from dotenv import load_dotenv
 
-__all__ = ["load_params"]
+__all__ = [
+    "AdmissionSettings",
+    "AppSettings",
+    "BackendKind",
+    "DatabaseSettings",
+    "FastIngestSettings",
+    "GroupCommitSettings",
+    "HealthSettings",
+    "IdempotencySettings",
+    "LoggingSettings",
+    "MetricsSettings",
+    "PartitionInterval",
+    "RecentEventsSettings",
+    "RequestTimingSettings",
+    "RepositoryKind",
+    "RetentionSettings",
+    "RollupSettings",
+    "ServerSettings",
+    "SpoolSettings",
+    "load_app_settings",
+    "load_database_settings",
+    "load_logging_settings",
+    "load_params",
+    "load_server_settings",
+    "split_pool_budget",
+]
+
+BackendKind = Literal["sql", "memory"]
+BACKEND_KINDS: Final[tuple[str, ...]] = ("sql", "memory")
+RepositoryKind = Literal["orm", "core"]
+REPOSITORY_KINDS: Final[tuple[str, ...]] = ("orm", "core")
+PartitionInterval = Literal["day", "month"]
+PARTITION_INTERVALS: Final[tuple[str, ...]] = ("day", "month")
+LoopKind = Literal["auto", "asyncio", "uvloop"]
+LOOP_KINDS: Final[tuple[str, ...]] = ("auto", "asyncio", "uvloop")
+HttpKind = Literal["auto", "h11", "httptools"]
+HTTP_KINDS: Final[tuple[str, ...]] = ("auto", "h11", "httptools")
+LogLevel = Literal["DEBUG", "INFO", "WARNING", "ERROR"]
+LOG_LEVELS: Final[tuple[str, ...]] = ("DEBUG", "INFO", "WARNING", "ERROR")
+LogFormat = Literal["text", "json"]
+LOG_FORMATS: Final[tuple[str, ...]] = ("text", "json")
 
 load_dotenv()
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class DatabaseSettings:
+    """Database provider tunables.
+
+    Attributes:
+        backend: Storage backend: "sql" (the database in DATABASE_URL) or
+            "memory" (events kept in process memory, no database).
+        repository: Event repository implementation ("orm" or "core").
+        pool_size: Connections kept open in the pool.
+        max_overflow: Extra connections allowed under burst load.
+        pool_recycle: Replace connections older than this many seconds (-1 disables).
+        pool_timeout: Seconds to wait for a pool checkout before failing.
+        pool_pre_ping: Check connections are alive before handing them out.
+        pool_min_size: Connections opened and prepared at startup (0 disables warm-up).
+        schema_fingerprint: Skip table creation at startup when the schema
+            fingerprint stored in the database matches the models (False
+            checks every table and index on each start).
+        sqlite_mmap_size: SQLite memory-mapped I/O size in bytes.
+        sqlite_cache_size: SQLite page cache size (negative values are KiB).
+        sqlite_busy_timeout_ms: How long SQLite waits for a lock before failing.
+        sqlite_writer_linger_ms: How long the SQLite writer waits to batch writes.
+        sqlite_writer_max_batch: Events per SQLite writer transaction.
+        partitioning: Range-partition the events table on created_at (PostgreSQL
+            13 or later). Idempotency keys are then kept unique by a trigger
+            claiming them in the unpartitioned events_idempotency_keys table.
+        partition_interval: Time span of one partition ("day" or "month").
+        partition_premake: Future partitions kept created ahead of time.
+        partition_retention_days: Drop partitions older than this (0 keeps all).
+        partition_check_seconds: How often partitions are created and dropped.
+        partition_maintenance: Create and drop partitions in this process (False
+            in all server workers but the one holding the maintenance lock).
+        memory_capacity: Events kept by the memory backend (oldest evicted first).
+        memory_snapshot_path: File the memory backend is loaded from and saved to
+            (empty disables snapshots).
+        memory_snapshot_interval_seconds: How often the memory backend is
+            snapshotted while running (0 snapshots on shutdown only).
+    """
+
+    backend: BackendKind = "sql"
+    repository: RepositoryKind = "orm"
+    pool_size: int = 20
+    max_overflow: int = 10
+    pool_recycle: int = 1800
+    pool_timeout: float = 30.0
+    pool_pre_ping: bool = True
+    pool_min_size: int = 4
+    schema_fingerprint: bool = True
+    sqlite_mmap_size: int = 256 * 1024 * 1024
+    sqlite_cache_size: int = -64_000
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_writer_linger_ms: float = 2.0
+    sqlite_writer_max_batch: int = 500
+    partitioning: bool = False
+    partition_interval: PartitionInterval = "day"
+    partition_premake: int = 7
+    partition_retention_days: int = 0
+    partition_check_seconds: float = 3600.0
+    partition_maintenance: bool = True
+    memory_capacity: int = 1_000_000
+    memory_snapshot_path: str = ""
+    memory_snapshot_interval_seconds: float = 0.0
+
+
+@dataclass(frozen=True)
+class ServerSettings:
+    """HTTP server process model.
+
+    Attributes:
+        workers: Worker processes; each runs its own event loop and database pool.
+        loop: Event loop: "auto" (uvloop when installed), "asyncio" or "uvloop".
+        http: HTTP parser: "auto" (httptools when installed), "h11" or "httptools".
+        db_max_connections: Database connections allowed for the whole server,
+            split evenly across workers (0 leaves each worker's pool as configured).
+        graceful_shutdown_seconds: How long workers wait for in-flight requests
+            on shutdown before closing them.
+    """
+
+    workers: int = 1
+    loop: LoopKind = "auto"
+    http: HttpKind = "auto"
+    db_max_connections: int = 0
+    graceful_shutdown_seconds: int = 30
+
+
+@dataclass(frozen=True)
+class LoggingSettings:
+    """Application logging.
+
+    Attributes:
+        level: Level of the application (src) loggers.
+        format: "text" lines or one "json" object per line.
+        queue_size: Records waiting for the writer thread; further records
+            are dropped (and counted) rather than blocking the caller.
+        event_rate: Records about single events logged per second for each
+            message and event type; the rest are suppressed (0 logs them all).
+        access_log: Log every HTTP request (uvicorn access log).
+    """
+
+    level: LogLevel = "INFO"
+    format: LogFormat = "text"
+    queue_size: int = 10_000
+    event_rate: float = 10.0
+    access_log: bool = False
+
+
+@dataclass(frozen=True)
+class GroupCommitSettings:
+    """Group-commit stage for single-event writes.
+
+    Attributes:
+        enabled: Coalesce concurrent writes into shared transactions.
+        linger_ms: How long the first pending event waits for company.
+        max_batch_size: Flush immediately once this many events are pending.
+    """
+
+    enabled: bool = False
+    linger_ms: float = 2.0
+    max_batch_size: int = 500
+
+
+@dataclass(frozen=True)
+class RollupSettings:
+    """Incremental per-type time-bucket rollups.
+
+    Attributes:
+        enabled: Count ingested events into the rollup table.
+        flush_interval_ms: How often in-memory counters are upserted.
+    """
+
+    enabled: bool = False
+    flush_interval_ms: float = 1000.0
+
+
+@dataclass(frozen=True)
+class RecentEventsSettings:
+    """In-memory buffer of the most recent events per type.
+
+    Attributes:
+        enabled: Keep recently committed events in memory.
+        max_per_type: Events kept per type.
+        max_bytes: Approximate memory cap across all types.
+    """
+
+    enabled: bool = False
+    max_per_type: int = 100
+    max_bytes: int = 16 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class AdmissionSettings:
+    """Adaptive in-flight limit on the event write routes.
+
+    Attributes:
+        enabled: Shed requests beyond the limit with 503 and Retry-After.
+        initial_limit: Requests allowed in flight at startup.
+        min_limit: Lowest the adaptive limit can go.
+        max_limit: Highest the adaptive limit can go.
+        target_latency_ms: Database write latency above which the limit is cut.
+    """
+
+    enabled: bool = False
+    initial_limit: int = 64
+    min_limit: int = 4
+    max_limit: int = 512
+    target_latency_ms: float = 100.0
+
+
+@dataclass(frozen=True)
+class IdempotencySettings:
+    """In-process cache of recently committed idempotency keys.
+
+    Attributes:
+        cache_enabled: Answer retries with a cached key without a database round trip.
+        cache_max_keys: Keys kept at most.
+        cache_ttl_seconds: How long a key is remembered.
+    """
+
+    cache_enabled: bool = False
+    cache_max_keys: int = 100_000
+    cache_ttl_seconds: float = 3600.0
+
+
+@dataclass(frozen=True)
+class RetentionSettings:
+    """Background purge of expired events.
+
+    Attributes:
+        enabled: Run the retention job.
+        default_max_age_days: Maximum age of types without their own rule (0 keeps them).
+        max_age_days_by_type: Maximum age per event type (0 keeps the type forever).
+        batch_size: Events deleted per transaction.
+        batch_pause_ms: Minimum pause between batches.
+        max_rows_per_second: Deletion rate cap (0 disables the cap).
+        interval_seconds: How often a purge pass starts.
+    """
+
+    enabled: bool = False
+    default_max_age_days: float = 0.0
+    max_age_days_by_type: dict[str, float] = field(default_factory=dict)
+    batch_size: int = 500
+    batch_pause_ms: float = 50.0
+    max_rows_per_second: float = 2000.0
+    interval_seconds: float = 300.0
+
+
+@dataclass(frozen=True)
+class SpoolSettings:
+    """Local durable spool taking events while the database is unavailable.
+
+    Attributes:
+        enabled: Spool writes that fail because the database is unreachable.
+        directory: Directory holding the spool segments and checkpoint.
+        segment_bytes: Size at which a new segment file is started.
+        fsync_interval_ms: Extra wait for appends to share an fsync (0 still
+            shares one among appends arriving while an fsync is in progress).
+        replay_batch_size: Events per replay transaction.
+        retry_interval_seconds: Wait before retrying a failed replay.
+        worker_slots: Server workers spooling under directory, each in its own
+            subdirectory (set from SERVER_WORKERS).
+    """
+
+    enabled: bool = False
+    directory: str = "./spool"
+    segment_bytes: int = 64 * 1024 * 1024
+    fsync_interval_ms: float = 0.0
+    replay_batch_size: int = 1000
+    retry_interval_seconds: float = 1.0
+    worker_slots: int = 1
+
+
+@dataclass(frozen=True)
+class MetricsSettings:
+    """Prometheus metrics endpoint.
+
+    Attributes:
+        enabled: Record request, validation, write and pool metrics and serve /metrics.
+        multiprocess_dir: Directory where each worker publishes its metrics so any
+            worker can serve the merged values (empty for a single worker).
+        write_interval_seconds: How often a worker rewrites its metrics file.
+    """
+
+    enabled: bool = False
+    multiprocess_dir: str = ""
+    write_interval_seconds: float = 5.0
+
+
+@dataclass(frozen=True)
+class RequestTimingSettings:
+    """Per-request stage timing.
+
+    Attributes:
+        enabled: Time the stages of every request (parsing, validation, session,
+            domain creation, insert, commit, serialization).
+        server_timing_header: Send the breakdown in a Server-Timing response header.
+        slow_request_ms: Log requests taking at least this long with their stages.
+    """
+
+    enabled: bool = False
+    server_timing_header: bool = True
+    slow_request_ms: float = 500.0
+
+
+@dataclass(frozen=True)
+class FastIngestSettings:
+    """Fast path for POST /event.
+
+    Attributes:
+        enabled: Decode and validate the request body in one step, straight from
+            JSON, and answer with a pre-encoded body. The request and response
+            contract is unchanged.
+    """
+
+    enabled: bool = False
+
+
+@dataclass(frozen=True)
+class HealthSettings:
+    """Background database checks behind the readiness probe.
+
+    Attributes:
+        enabled: Ping the database and watch the pool on an interval; GET
+            /health/ready answers from the latest result (always ready when off).
+        interval_seconds: Time between two checks.
+        timeout_seconds: Longest wait for a ping before the database counts as down.
+        saturation_seconds: How long the pool may stay saturated before the
+            service is reported not ready.
+    """
+
+    enabled: bool = False
+    interval_seconds: float = 5.0
+    timeout_seconds: float = 2.0
+    saturation_seconds: float = 15.0
+
+
+@dataclass(frozen=True)
+class AppSettings:
+    """Tunables for optional application components.
+
+    Defaults keep every optional component disabled.
+    """
+
+    group_commit: GroupCommitSettings = field(default_factory=GroupCommitSettings)
+    rollups: RollupSettings = field(default_factory=RollupSettings)
+    recent_events: RecentEventsSettings = field(default_factory=RecentEventsSettings)
+    retention: RetentionSettings = field(default_factory=RetentionSettings)
+    idempotency: IdempotencySettings = field(default_factory=IdempotencySettings)
+    admission: AdmissionSettings = field(default_factory=AdmissionSettings)
+    spool: SpoolSettings = field(default_factory=SpoolSettings)
+    metrics: MetricsSettings = field(default_factory=MetricsSettings)
+    request_timing: RequestTimingSettings = field(default_factory=RequestTimingSettings)
+    fast_ingest: FastIngestSettings = field(default_factory=FastIngestSettings)
+    health: HealthSettings = field(default_factory=HealthSettings)
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    return raw.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _env_int(name: str, default: int) -> int:
+    return int(os.getenv(name, str(default)))
+
+
+def _env_float(name: str, default: float) -> float:
+    return float(os.getenv(name, str(default)))
+
+
+def _env_float_map(name: str) -> dict[str, float]:
+    """Parse a "key=value,key=value" variable into a dict of floats."""
+    result: dict[str, float] = {}
+    for item in os.getenv(name, "").split(","):
+        if not item.strip():
+            continue
+        key, sep, value = item.partition("=")
+        try:
+            if not sep or not key.strip():
+                raise ValueError(item)
+            result[key.strip()] = float(value)
+        except ValueError:
+            raise RuntimeError(
+                f"{name} must be a comma-separated list of key=number pairs (got {item!r})"
+            ) from None
+    return result
+
+
 def load_params() -> tuple[str, int]:
     app_port: int = int(os.getenv("APP_PORT", "8000"))
     in_memory_alternative_db = "sqlite+aiosqlite:///./events.db"
@@ -25,6 +413,280 @@ def load_params() -> tuple[str, int]:
 
     database_uri: Final[str] = _raw_database_uri
 
-    logger.info(f"Consumer configured: port={app_port}, db_uri={database_uri.split('@')[0]}...")
+    logger.info("Consumer configured: port=%s, db_uri=%s...", app_port, database_uri.split("@")[0])
 
     return (database_uri, app_port)
+
+
+def load_app_settings() -> AppSettings:
+    """Load optional component settings from the environment.
+
+    Returns:
+        AppSettings populated from environment variables.
+
+    Raises:
+        RuntimeError: If a setting has an unsupported value.
+    """
+    group_commit = GroupCommitSettings()
+    rollups = RollupSettings()
+    recent_events = RecentEventsSettings()
+    retention = RetentionSettings()
+    idempotency = IdempotencySettings()
+    admission = AdmissionSettings()
+    spool = SpoolSettings()
+    metrics = MetricsSettings()
+    request_timing = RequestTimingSettings()
+    fast_ingest = FastIngestSettings()
+    health = HealthSettings()
+    return AppSettings(
+        group_commit=GroupCommitSettings(
+            enabled=_env_bool("GROUP_COMMIT_ENABLED", group_commit.enabled),
+            linger_ms=_env_float("GROUP_COMMIT_LINGER_MS", group_commit.linger_ms),
+            max_batch_size=_env_int("GROUP_COMMIT_MAX_BATCH", group_commit.max_batch_size),
+        ),
+        rollups=RollupSettings(
+            enabled=_env_bool("ROLLUPS_ENABLED", rollups.enabled),
+            flush_interval_ms=_env_float("ROLLUPS_FLUSH_MS", rollups.flush_interval_ms),
+        ),
+        recent_events=RecentEventsSettings(
+            enabled=_env_bool("RECENT_EVENTS_ENABLED", recent_events.enabled),
+            max_per_type=_env_int("RECENT_EVENTS_PER_TYPE", recent_events.max_per_type),
+            max_bytes=_env_int("RECENT_EVENTS_MAX_BYTES", recent_events.max_bytes),
+        ),
+        retention=RetentionSettings(
+            enabled=_env_bool("RETENTION_ENABLED", retention.enabled),
+            default_max_age_days=_env_float(
+                "RETENTION_MAX_AGE_DAYS", retention.default_max_age_days
+            ),
+            max_age_days_by_type=_env_float_map("RETENTION_MAX_AGE_DAYS_BY_TYPE"),
+            batch_size=_env_int("RETENTION_BATCH_SIZE", retention.batch_size),
+            batch_pause_ms=_env_float("RETENTION_BATCH_PAUSE_MS", retention.batch_pause_ms),
+            max_rows_per_second=_env_float(
+                "RETENTION_MAX_ROWS_PER_SECOND", retention.max_rows_per_second
+            ),
+            interval_seconds=_env_float("RETENTION_INTERVAL_SECONDS", retention.interval_seconds),
+        ),
+        idempotency=IdempotencySettings(
+            cache_enabled=_env_bool("IDEMPOTENCY_CACHE_ENABLED", idempotency.cache_enabled),
+            cache_max_keys=_env_int("IDEMPOTENCY_CACHE_MAX_KEYS", idempotency.cache_max_keys),
+            cache_ttl_seconds=_env_float(
+                "IDEMPOTENCY_CACHE_TTL_SECONDS", idempotency.cache_ttl_seconds
+            ),
+        ),
+        admission=AdmissionSettings(
+            enabled=_env_bool("ADMISSION_ENABLED", admission.enabled),
+            initial_limit=_env_int("ADMISSION_INITIAL_LIMIT", admission.initial_limit),
+            min_limit=_env_int("ADMISSION_MIN_LIMIT", admission.min_limit),
+            max_limit=_env_int("ADMISSION_MAX_LIMIT", admission.max_limit),
+            target_latency_ms=_env_float(
+                "ADMISSION_TARGET_LATENCY_MS", admission.target_latency_ms
+            ),
+        ),
+        spool=SpoolSettings(
+            enabled=_env_bool("SPOOL_ENABLED", spool.enabled),
+            directory=os.getenv("SPOOL_DIR", spool.directory),
+            segment_bytes=_env_int("SPOOL_SEGMENT_BYTES", spool.segment_bytes),
+            fsync_interval_ms=_env_float("SPOOL_FSYNC_INTERVAL_MS", spool.fsync_interval_ms),
+            replay_batch_size=_env_int("SPOOL_REPLAY_BATCH", spool.replay_batch_size),
+            retry_interval_seconds=_env_float(
+                "SPOOL_RETRY_INTERVAL_SECONDS", spool.retry_interval_seconds
+            ),
+        ),
+        metrics=MetricsSettings(
+            enabled=_env_bool("METRICS_ENABLED", metrics.enabled),
+            multiprocess_dir=os.getenv("METRICS_MULTIPROCESS_DIR", metrics.multiprocess_dir),
+            write_interval_seconds=_env_float(
+                "METRICS_WRITE_INTERVAL_SECONDS", metrics.write_interval_seconds
+            ),
+        ),
+        request_timing=RequestTimingSettings(
+            enabled=_env_bool("REQUEST_TIMING_ENABLED", request_timing.enabled),
+            server_timing_header=_env_bool(
+                "REQUEST_TIMING_HEADER", request_timing.server_timing_header
+            ),
+            slow_request_ms=_env_float("SLOW_REQUEST_MS", request_timing.slow_request_ms),
+        ),
+        fast_ingest=FastIngestSettings(
+            enabled=_env_bool("FAST_INGEST_ENABLED", fast_ingest.enabled),
+        ),
+        health=HealthSettings(
+            enabled=_env_bool("HEALTH_CHECK_ENABLED", health.enabled),
+            interval_seconds=_env_float("HEALTH_CHECK_INTERVAL_SECONDS", health.interval_seconds),
+            timeout_seconds=_env_float("HEALTH_CHECK_TIMEOUT_SECONDS", health.timeout_seconds),
+            saturation_seconds=_env_float(
+                "HEALTH_POOL_SATURATION_SECONDS", health.saturation_seconds
+            ),
+        ),
+    )
+
+
+def load_database_settings() -> DatabaseSettings:
+    """Load database provider settings from the environment.
+
+    Returns:
+        DatabaseSettings populated from environment variables.
+
+    Raises:
+        RuntimeError: If a setting has an unsupported value.
+    """
+    defaults = DatabaseSettings()
+    backend = os.getenv("DB_BACKEND", defaults.backend).strip().lower()
+    if backend not in BACKEND_KINDS:
+        raise RuntimeError(
+            f"DB_BACKEND must be one of {', '.join(BACKEND_KINDS)} (got {backend!r})"
+        )
+
+    repository = os.getenv("EVENT_REPOSITORY", defaults.repository).strip().lower()
+    if repository not in REPOSITORY_KINDS:
+        raise RuntimeError(
+            f"EVENT_REPOSITORY must be one of {', '.join(REPOSITORY_KINDS)} (got {repository!r})"
+        )
+
+    partition_interval = (
+        os.getenv("EVENTS_PARTITION_INTERVAL", defaults.partition_interval).strip().lower()
+    )
+    if partition_interval not in PARTITION_INTERVALS:
+        raise RuntimeError(
+            f"EVENTS_PARTITION_INTERVAL must be one of {', '.join(PARTITION_INTERVALS)} "
+            f"(got {partition_interval!r})"
+        )
+
+    return DatabaseSettings(
+        backend=cast(BackendKind, backend),
+        repository=cast(RepositoryKind, repository),
+        pool_size=_env_int("DB_POOL_SIZE", defaults.pool_size),
+        max_overflow=_env_int("DB_MAX_OVERFLOW", defaults.max_overflow),
+        pool_recycle=_env_int("DB_POOL_RECYCLE", defaults.pool_recycle),
+        pool_timeout=_env_float("DB_POOL_TIMEOUT", defaults.pool_timeout),
+        pool_pre_ping=_env_bool("DB_POOL_PRE_PING", defaults.pool_pre_ping),
+        pool_min_size=_env_int("DB_POOL_MIN_SIZE", defaults.pool_min_size),
+        schema_fingerprint=_env_bool("DB_SCHEMA_FINGERPRINT", defaults.schema_fingerprint),
+        sqlite_mmap_size=_env_int("SQLITE_MMAP_SIZE", defaults.sqlite_mmap_size),
+        sqlite_cache_size=_env_int("SQLITE_CACHE_SIZE", defaults.sqlite_cache_size),
+        sqlite_busy_timeout_ms=_env_int("SQLITE_BUSY_TIMEOUT_MS", defaults.sqlite_busy_timeout_ms),
+        sqlite_writer_linger_ms=_env_float(
+            "SQLITE_WRITER_LINGER_MS", defaults.sqlite_writer_linger_ms
+        ),
+        sqlite_writer_max_batch=_env_int(
+            "SQLITE_WRITER_MAX_BATCH", defaults.sqlite_writer_max_batch
+        ),
+        partitioning=_env_bool("EVENTS_PARTITIONED", defaults.partitioning),
+        partition_interval=cast(PartitionInterval, partition_interval),
+        partition_premake=_env_int("EVENTS_PARTITION_PREMAKE", defaults.partition_premake),
+        partition_retention_days=_env_int(
+            "EVENTS_PARTITION_RETENTION_DAYS", defaults.partition_retention_days
+        ),
+        partition_check_seconds=_env_float(
+            "EVENTS_PARTITION_CHECK_SECONDS", defaults.partition_check_seconds
+        ),
+        memory_capacity=_env_int("MEMORY_CAPACITY", defaults.memory_capacity),
+        memory_snapshot_path=os.getenv("MEMORY_SNAPSHOT_PATH", defaults.memory_snapshot_path),
+        memory_snapshot_interval_seconds=_env_float(
+            "MEMORY_SNAPSHOT_INTERVAL_SECONDS", defaults.memory_snapshot_interval_seconds
+        ),
+    )
+
+
+def load_server_settings() -> ServerSettings:
+    """Load HTTP server settings from the environment.
+
+    Returns:
+        ServerSettings populated from environment variables.
+
+    Raises:
+        RuntimeError: If a setting has an unsupported value.
+    """
+    defaults = ServerSettings()
+    workers = _env_int("SERVER_WORKERS", defaults.workers)
+    if workers < 1:
+        raise RuntimeError(f"SERVER_WORKERS must be at least 1 (got {workers})")
+    loop = os.getenv("SERVER_LOOP", defaults.loop).strip().lower()
+    if loop not in LOOP_KINDS:
+        raise RuntimeError(f"SERVER_LOOP must be one of {', '.join(LOOP_KINDS)} (got {loop!r})")
+    http = os.getenv("SERVER_HTTP", defaults.http).strip().lower()
+    if http not in HTTP_KINDS:
+        raise RuntimeError(f"SERVER_HTTP must be one of {', '.join(HTTP_KINDS)} (got {http!r})")
+
+    return ServerSettings(
+        workers=workers,
+        loop=cast(LoopKind, loop),
+        http=cast(HttpKind, http),
+        db_max_connections=_env_int("DB_MAX_CONNECTIONS", defaults.db_max_connections),
+        graceful_shutdown_seconds=_env_int(
+            "SERVER_SHUTDOWN_TIMEOUT_SECONDS", defaults.graceful_shutdown_seconds
+        ),
+    )
+
+
+def load_logging_settings() -> LoggingSettings:
+    """Load logging settings from the environment.
+
+    Returns:
+        LoggingSettings populated from environment variables.
+
+    Raises:
+        RuntimeError: If a setting has an unsupported value.
+    """
+    defaults = LoggingSettings()
+    level = os.getenv("LOG_LEVEL", defaults.level).strip().upper()
+    if level not in LOG_LEVELS:
+        raise RuntimeError(f"LOG_LEVEL must be one of {', '.join(LOG_LEVELS)} (got {level!r})")
+    log_format = os.getenv("LOG_FORMAT", defaults.format).strip().lower()
+    if log_format not in LOG_FORMATS:
+        raise RuntimeError(
+            f"LOG_FORMAT must be one of {', '.join(LOG_FORMATS)} (got {log_format!r})"
+        )
+    queue_size = _env_int("LOG_QUEUE_SIZE", defaults.queue_size)
+    if queue_size < 1:
+        raise RuntimeError(f"LOG_QUEUE_SIZE must be at least 1 (got {queue_size})")
+
+    return LoggingSettings(
+        level=cast(LogLevel, level),
+        format=cast(LogFormat, log_format),
+        queue_size=queue_size,
+        event_rate=_env_float("LOG_EVENT_RATE", defaults.event_rate),
+        access_log=_env_bool("LOG_ACCESS", defaults.access_log),
+    )
+
+
+def split_pool_budget(
+    settings: DatabaseSettings, workers: int, max_connections: int
+) -> DatabaseSettings:
+    """Shrink one worker's pool to its share of the server's connection budget.
+
+    Each worker gets max_connections // workers connections, shared between
+    the pool and its overflow: the pool keeps up to that many open and the
+    overflow gets what is left, so workers x (pool_size + max_overflow)
+    never exceeds max_connections. An unlimited pool (pool_size 0) or
+    overflow (max_overflow -1) is bounded to the whole share.
+
+    Args:
+        settings: Pool settings as configured.
+        workers: Number of worker processes.
+        max_connections: Connections allowed for all workers (0 for no limit).
+
+    Returns:
+        The settings with pool_size, max_overflow and pool_min_size capped.
+
+    Raises:
+        RuntimeError: If the budget is less than one connection per worker.
+    """
+    if max_connections <= 0:
+        return settings
+    per_worker = max_connections // workers
+    if per_worker < 1:
+        raise RuntimeError(
+            f"DB_MAX_CONNECTIONS={max_connections} leaves no connection for each of "
+            f"{workers} workers"
+        )
+    pool_size = per_worker if settings.pool_size <= 0 else min(settings.pool_size, per_worker)
+    pool_size = max(1, pool_size)
+    overflow = per_worker - pool_size
+    if settings.max_overflow >= 0:
+        overflow = min(settings.max_overflow, overflow)
+    return replace(
+        settings,
+        pool_size=pool_size,
+        max_overflow=max(0, overflow),
+        pool_min_size=min(settings.pool_min_size, pool_size),
+    )
@@ -1,25 +1,206 @@
-"""Structured logging setup for the application."""
+"""Structured logging setup for the application.
 
+Records are handed to a bounded queue and written by a background thread,
+so logging never waits on the output stream: the calling thread (usually
+the event loop) only checks the filters and enqueues the record. Messages
+are formatted by the writer thread, so log calls should pass their values
+as arguments (``logger.info("Event created: type=%s", event_type)``) rather
+than pre-formatting them.
+
+Records about single events carry their type in ``extra={"event_type": ...}``
+and are rate-limited per message and event type by EventLogSampler.
+"""
+
+import atexit
+import json
 import logging
+import queue
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Final
+
+from src.infrastructure.config.settings import LoggingSettings
+
+__all__ = [
+    "EventLogSampler",
+    "JsonFormatter",
+    "NonBlockingQueueHandler",
+    "configure_logs",
+    "shutdown_logs",
+]
+
+LOG_FORMAT: Final = "%(asctime)s [%(levelname)s] %(name)s:%(lineno)d - %(message)s"
+DATE_FORMAT: Final = "%d/%m/%y %H:%M:%S"
+
+# Sampled (logger, message, event type) combinations tracked before starting over
+MAX_SAMPLED_KEYS: Final = 10_000
+
+_listener: QueueListener | None = None
+_handler: logging.Handler | None = None
+
+
+class _Bucket:
+    __slots__ = ("suppressed", "tokens", "updated")
+
+    def __init__(self, tokens: float, updated: float) -> None:
+        self.tokens = tokens
+        self.updated = updated
+        self.suppressed = 0
+
 
-__all__ = ["configure_logs"]
+class EventLogSampler(logging.Filter):
+    """Rate-limit records about single events, per message and event type.
 
+    Applies to records logged with ``extra={"event_type": ...}``; other
+    records always pass. Each (logger, message template, event type) gets a
+    token bucket refilled at ``rate`` records per second (burst of one
+    second), so a busy event type cannot flood the log nor crowd out the
+    others. The first record let through after some were suppressed carries
+    their count in its ``suppressed`` attribute.
 
-def configure_logs() -> None:
-    """Configure console logging.
+    The buckets are reset once MAX_SAMPLED_KEYS combinations are tracked,
+    since event types come from clients.
+    """
+
+    def __init__(self, rate: float, *, clock: Callable[[], float] = time.monotonic) -> None:
+        """Initialize the sampler.
+
+        Args:
+            rate: Records per second let through for each combination (0 lets all through).
+            clock: Monotonic clock, in seconds.
+        """
+        super().__init__()
+        self._rate = rate
+        self._burst = max(rate, 1.0)
+        self._clock = clock
+        self._buckets: dict[tuple[str, Any, str], _Bucket] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        event_type = getattr(record, "event_type", None)
+        if event_type is None or self._rate <= 0:
+            return True
+
+        now = self._clock()
+        key = (record.name, record.msg, event_type)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= MAX_SAMPLED_KEYS:
+                self._buckets.clear()
+            bucket = self._buckets[key] = _Bucket(self._burst, now)
+        else:
+            bucket.tokens = min(self._burst, bucket.tokens + (now - bucket.updated) * self._rate)
+            bucket.updated = now
+
+        if bucket.tokens < 1:
+            bucket.suppressed += 1
+            return False
+        bucket.tokens -= 1
+        if bucket.suppressed:
+            record.suppressed = bucket.suppressed
+            bucket.suppressed = 0
+        return True
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """Queue handler that drops records instead of waiting for room.
+
+    Records are enqueued as they are: the message is formatted by the
+    listener thread, not by the caller. When the queue is full the record
+    is dropped and counted; the count is logged as a warning once the
+    queue has room again.
+    """
+
+    def __init__(self, records: "queue.Queue[logging.LogRecord]") -> None:
+        """Initialize the handler.
+
+        Args:
+            records: Bounded queue read by a QueueListener.
+        """
+        super().__init__(records)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            if self.dropped:
+                self.queue.put_nowait(
+                    logging.makeLogRecord(
+                        {
+                            "name": __name__,
+                            "levelno": logging.WARNING,
+                            "levelname": "WARNING",
+                            "msg": "Log queue full: dropped=%d",
+                            "args": (self.dropped,),
+                        }
+                    )
+                )
+                self.dropped = 0
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _TextFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        text = super().format(record)
+        suppressed = getattr(record, "suppressed", 0)
+        return f"{text} (+{suppressed} suppressed)" if suppressed else text
+
+
+class JsonFormatter(logging.Formatter):
+    """Format each record as one JSON object.
+
+    Keys: time (ISO 8601, UTC), level, logger, line and message, plus
+    event_type, suppressed and exception when the record has them.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict[str, Any] = {
+            "time": datetime.fromtimestamp(record.created, UTC).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "line": record.lineno,
+            "message": record.getMessage(),
+        }
+        for attribute in ("event_type", "suppressed"):
+            value = getattr(record, attribute, None)
+            if value is not None:
+                entry[attribute] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def configure_logs(settings: LoggingSettings | None = None) -> None:
+    """Configure console logging through a background writer thread.
 
     Sets up:
-    - Root logger at WARNING level.
+    - Root logger at WARNING level, writing to stderr through the queue.
     - Framework loggers (SQLAlchemy, FastAPI, Uvicorn) at appropriate levels.
-    - Application loggers (src) at DEBUG level.
-    - Structured format with timestamp, level, module, and line number.
+    - Application loggers (src) at the configured level.
+    - Text format with timestamp, level, module, and line number, or JSON.
+
+    Does nothing if logging is already configured in this process.
+
+    Args:
+        settings: Logging settings (defaults when omitted).
     """
-    log_format = "%(asctime)s [%(levelname)s] %(name)s:%(lineno)d - %(message)s"
-    date_format = "%d/%m/%y %H:%M:%S"
+    global _listener, _handler
+    if _listener is not None:
+        return
+    settings = settings or LoggingSettings()
 
-    formatter = logging.Formatter(log_format, date_format)
-    handler = logging.StreamHandler()
-    handler.setFormatter(formatter)
+    stream = logging.StreamHandler()
+    stream.setFormatter(
+        JsonFormatter() if settings.format == "json" else _TextFormatter(LOG_FORMAT, DATE_FORMAT)
+    )
+    records: queue.Queue[logging.LogRecord] = queue.Queue(settings.queue_size)
+    handler = NonBlockingQueueHandler(records)
+    handler.addFilter(EventLogSampler(settings.event_rate))
 
     # Root logger
     root = logging.getLogger()
@@ -30,10 +211,30 @@ def configure_logs() -> None:
     logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
     logging.getLogger("sqlalchemy.pool").setLevel(logging.WARNING)
     logging.getLogger("sqlalchemy.dialects").setLevel(logging.WARNING)
-    logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
+    logging.getLogger("uvicorn.access").setLevel(
+        logging.INFO if settings.access_log else logging.WARNING
+    )
 
     # Application loggers
     logging.getLogger("uvicorn").setLevel(logging.INFO)
     logging.getLogger("uvicorn.error").setLevel(logging.INFO)
     logging.getLogger("fastapi").setLevel(logging.INFO)
-    logging.getLogger("src").setLevel(logging.DEBUG)
+    logging.getLogger("src").setLevel(settings.level)
+
+    _handler = handler
+    _listener = QueueListener(records, stream)
+    _listener.start()
+    atexit.register(shutdown_logs)
+
+
+def shutdown_logs() -> None:
+    """Write the queued records and stop the writer thread.
+
+    Runs at interpreter exit; does nothing if logging is not configured.
+    """
+    global _listener, _handler
+    if _listener is None or _handler is None:
+        return
+    logging.getLogger().removeHandler(_handler)
+    _listener.stop()
+    _listener = _handler = None
@@ -0,0 +1 @@
+"""In-memory persistence adapters (no database)."""
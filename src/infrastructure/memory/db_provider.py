@@ -0,0 +1,151 @@
+"""Database provider keeping events in memory instead of a database."""
+
+import asyncio
+import logging
+import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+from pathlib import Path
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.ports.db_provider import PoolUsage
+from src.application.ports.event_query_repository import EventQueryRepository
+from src.application.ports.event_repository import EventRepository
+from src.application.ports.retention_repository import RetentionRepository
+from src.application.ports.rollup_repository import RollupRepository
+from src.infrastructure.config.settings import DatabaseSettings
+from src.infrastructure.memory.repositories import (
+    MemoryEventQueryRepository,
+    MemoryEventRepository,
+    MemoryRetentionRepository,
+    MemoryRollupRepository,
+)
+from src.infrastructure.memory.store import ColumnarEventStore
+
+__all__ = ["MemoryDbProvider"]
+
+logger = logging.getLogger(__name__)
+
+
+def _write_snapshot(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with tmp.open("wb") as file:
+        file.write(data)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(tmp, path)
+
+
+class MemoryDbProvider:
+    """Provider storing events in a bounded ColumnarEventStore.
+
+    For benchmarks (the application's cost without a database), tests and
+    deployments that do not need durable storage. With a snapshot path,
+    the store is loaded from it on startup and written back on shutdown
+    and, optionally, periodically; events stored after the last snapshot
+    are lost on a crash. Rollups are kept in memory only.
+
+    There are no SQL sessions: calling the provider raises RuntimeError.
+    """
+
+    def __init__(self, settings: DatabaseSettings | None = None) -> None:
+        """Initialize the provider (nothing is loaded until entered).
+
+        Args:
+            settings: Capacity and snapshot settings.
+        """
+        self._settings = settings or DatabaseSettings()
+        self._store = ColumnarEventStore(self._settings.memory_capacity)
+        self._snapshot_path = (
+            Path(self._settings.memory_snapshot_path)
+            if self._settings.memory_snapshot_path
+            else None
+        )
+        self._event_repository = MemoryEventRepository(self._store)
+        self._query_repository = MemoryEventQueryRepository(self._store)
+        self._rollup_repository = MemoryRollupRepository()
+        self._retention_repository = MemoryRetentionRepository(self._store)
+        self._stopping = asyncio.Event()
+        self._worker: asyncio.Task[None] | None = None
+
+    @property
+    def store(self) -> ColumnarEventStore:
+        return self._store
+
+    async def __aenter__(self) -> "MemoryDbProvider":
+        if self._snapshot_path is not None and self._snapshot_path.exists():
+            self._store.load(await asyncio.to_thread(self._snapshot_path.read_bytes))
+            logger.info(
+                "Event store loaded: path=%s, events=%s", self._snapshot_path, len(self._store)
+            )
+        interval = self._settings.memory_snapshot_interval_seconds
+        if self._snapshot_path is not None and interval > 0:
+            self._stopping.clear()
+            self._worker = asyncio.create_task(self._run(interval), name="memory-snapshots")
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: BaseException | None,
+    ) -> None:
+        self._stopping.set()
+        if self._worker is not None:
+            await self._worker
+            self._worker = None
+        if self._snapshot_path is not None:
+            await self.snapshot()
+
+    def __call__(self) -> AsyncSession:
+        raise RuntimeError("The memory backend has no SQL sessions")
+
+    async def ping(self) -> None:
+        # The store lives in this process: it is reachable while the process runs
+        return None
+
+    def pool_usage(self) -> PoolUsage | None:
+        return None
+
+    async def snapshot(self) -> None:
+        """Write the store to the snapshot path (no-op without one).
+
+        The store is copied on the event loop, then written from a thread,
+        so writes continue while the file is being written.
+
+        Raises:
+            OSError: If the file cannot be written.
+        """
+        if self._snapshot_path is None:
+            return
+        data = self._store.dump()
+        await asyncio.to_thread(_write_snapshot, self._snapshot_path, data)
+        logger.debug(
+            "Event store snapshot written: events=%s, bytes=%s", len(self._store), len(data)
+        )
+
+    async def _run(self, interval: float) -> None:
+        while not self._stopping.is_set():
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._stopping.wait(), interval)
+            if self._stopping.is_set():
+                return
+            try:
+                await self.snapshot()
+            except OSError as exc:
+                logger.warning("Could not write event store snapshot: %s", exc)
+
+    @asynccontextmanager
+    async def event_repository(self) -> AsyncIterator[EventRepository]:
+        yield self._event_repository
+
+    def event_query_repository(self) -> EventQueryRepository:
+        return self._query_repository
+
+    def rollup_repository(self) -> RollupRepository:
+        return self._rollup_repository
+
+    def retention_repository(self) -> RetentionRepository:
+        return self._retention_repository
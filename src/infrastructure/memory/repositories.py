@@ -0,0 +1,184 @@
+"""Repositories backed by the in-memory columnar event store."""
+
+from collections import defaultdict
+from collections.abc import Sequence
+from datetime import UTC, datetime
+
+from src.application.ports.event_query_repository import (
+    EventKey,
+    EventQuery,
+    EventQueryRepository,
+    EventRecord,
+)
+from src.application.ports.event_repository import EventRepository
+from src.application.ports.retention_repository import ExpiredBatch, RetentionRepository
+from src.application.ports.rollup_repository import (
+    Resolution,
+    RollupBucket,
+    RollupQuery,
+    RollupRepository,
+)
+from src.core.event import DomainEvent
+from src.infrastructure.memory.store import ColumnarEventStore
+
+__all__ = [
+    "MemoryEventQueryRepository",
+    "MemoryEventRepository",
+    "MemoryRetentionRepository",
+    "MemoryRollupRepository",
+]
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value.astimezone(UTC)
+
+
+class MemoryEventRepository(EventRepository):
+    """Persist events to a ColumnarEventStore."""
+
+    def __init__(self, store: ColumnarEventStore) -> None:
+        """Initialize with the store.
+
+        Args:
+            store: Store holding the events.
+        """
+        self._store = store
+
+    async def save(self, event: DomainEvent, *, returning: bool = True) -> EventRecord | None:
+        """Store an event; one whose idempotency key is already stored is skipped.
+
+        Args:
+            event: Domain event to persist.
+            returning: Unused; the stored record costs nothing to return.
+
+        Returns:
+            The stored EventRecord, or None when the event was a duplicate.
+        """
+        return self._store.append(event)
+
+    async def save_many(self, events: Sequence[DomainEvent]) -> list[bool]:
+        """Store several events; those whose idempotency key is stored are skipped.
+
+        Args:
+            events: Domain events to persist.
+
+        Returns:
+            One flag per event: True if stored, False if skipped.
+        """
+        return self._store.extend(events)
+
+
+class MemoryEventQueryRepository(EventQueryRepository):
+    """Read events from a ColumnarEventStore.
+
+    Pages are found by scanning the store rather than seeking an index.
+    """
+
+    def __init__(self, store: ColumnarEventStore) -> None:
+        """Initialize with the store.
+
+        Args:
+            store: Store holding the events.
+        """
+        self._store = store
+
+    async def list_events(self, query: EventQuery) -> list[EventRecord]:
+        """Return up to `query.limit` events matching the query, in order.
+
+        Args:
+            query: Filters, sort order and position.
+
+        Returns:
+            Matching events ordered by (created_at, id) in `query.order`.
+        """
+        return self._store.select(query)
+
+
+class MemoryRetentionRepository(RetentionRepository):
+    """Delete expired events from a ColumnarEventStore."""
+
+    def __init__(self, store: ColumnarEventStore) -> None:
+        """Initialize with the store.
+
+        Args:
+            store: Store holding the events.
+        """
+        self._store = store
+
+    async def delete_expired(
+        self,
+        older_than: datetime,
+        limit: int,
+        *,
+        event_type: str | None = None,
+        exclude_types: Sequence[str] = (),
+        after: EventKey | None = None,
+    ) -> ExpiredBatch:
+        """Delete the oldest expired events, at most `limit` of them.
+
+        Args:
+            older_than: Delete events created before this instant.
+            limit: Maximum number of events to delete.
+            event_type: Only events of this type (all types when None).
+            exclude_types: Skip events of these types.
+            after: Key of the last event deleted by the previous batch.
+
+        Returns:
+            ExpiredBatch with the count and the key to resume after.
+        """
+        return self._store.delete_expired(
+            older_than, limit, event_type=event_type, exclude_types=exclude_types, after=after
+        )
+
+
+class MemoryRollupRepository(RollupRepository):
+    """Keep rollup buckets in a dict (not bounded, not snapshotted)."""
+
+    def __init__(self) -> None:
+        """Initialize with no buckets."""
+        self._buckets: defaultdict[tuple[Resolution, str, datetime], list[int]] = defaultdict(
+            lambda: [0, 0]
+        )
+
+    async def add(self, buckets: Sequence[RollupBucket]) -> None:
+        """Add counters to the stored buckets, creating missing ones.
+
+        Args:
+            buckets: Deltas to add.
+        """
+        for bucket in buckets:
+            totals = self._buckets[
+                (bucket.resolution, bucket.event_type, _as_utc(bucket.bucket_start))
+            ]
+            totals[0] += bucket.count
+            totals[1] += bucket.total_payload_bytes
+
+    async def list_buckets(self, query: RollupQuery) -> list[RollupBucket]:
+        """Return stored buckets matching the query.
+
+        Args:
+            query: Resolution, filters and limit.
+
+        Returns:
+            Buckets ordered by (bucket_start, event_type).
+        """
+        since = _as_utc(query.since) if query.since is not None else None
+        until = _as_utc(query.until) if query.until is not None else None
+        matching = sorted(
+            (start, event_type, totals)
+            for (resolution, event_type, start), totals in self._buckets.items()
+            if resolution == query.resolution
+            and (query.event_type is None or event_type == query.event_type)
+            and (since is None or start >= since)
+            and (until is None or start < until)
+        )
+        return [
+            RollupBucket(
+                resolution=query.resolution,
+                event_type=event_type,
+                bucket_start=start,
+                count=count,
+                total_payload_bytes=total_payload_bytes,
+            )
+            for start, event_type, (count, total_payload_bytes) in matching[: query.limit]
+        ]
@@ -0,0 +1,362 @@
+"""Bounded, column-oriented in-memory event store."""
+
+import heapq
+import json
+from array import array
+from collections import deque
+from collections.abc import Iterator, Sequence
+from datetime import UTC, datetime, timedelta
+from typing import Final
+
+from src.application.ports.event_query_repository import EventKey, EventQuery, EventRecord
+from src.application.ports.retention_repository import ExpiredBatch
+from src.core.event import DomainEvent
+
+__all__ = ["ColumnarEventStore"]
+
+_EPOCH: Final = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND: Final = timedelta(microseconds=1)
+_SNAPSHOT_MAGIC: Final = b"EVCOLS1\n"
+
+
+def _as_utc(value: datetime) -> datetime:
+    # Naive values are taken as UTC, as in the SQL repositories
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value.astimezone(UTC)
+
+
+def _to_us(value: datetime) -> int:
+    return (_as_utc(value) - _EPOCH) // _MICROSECOND
+
+
+def _from_us(value: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=value)
+
+
+class _Chunk:
+    """Columns of up to chunk_size consecutive events."""
+
+    __slots__ = (
+        "created_us",
+        "deleted",
+        "ids",
+        "keys",
+        "live",
+        "payload_ends",
+        "payloads",
+        "types",
+    )
+
+    def __init__(self) -> None:
+        self.ids = array("q")
+        self.types = array("I")
+        self.created_us = array("q")
+        # Payloads are UTF-8 bytes end to end; row i ends at payload_ends[i]
+        self.payload_ends = array("Q")
+        self.payloads = bytearray()
+        self.deleted = bytearray()
+        # Idempotency keys are rare: row -> key for the rows that have one
+        self.keys: dict[int, str] = {}
+        self.live = 0
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def append(self, event_id: int, type_code: int, created_us: int, payload: bytes) -> None:
+        self.ids.append(event_id)
+        self.types.append(type_code)
+        self.created_us.append(created_us)
+        self.payloads += payload
+        self.payload_ends.append(len(self.payloads))
+        self.deleted.append(0)
+        self.live += 1
+
+    def payload(self, row: int) -> str:
+        start = self.payload_ends[row - 1] if row else 0
+        return self.payloads[start : self.payload_ends[row]].decode()
+
+
+class ColumnarEventStore:
+    """Events kept in typed arrays, in bounded memory.
+
+    Each column is a compact array rather than a list of objects: ids and
+    timestamps (microseconds since the epoch) are 64-bit integers, event
+    types are indexes into an interned type table, and payloads are UTF-8
+    bytes laid end to end in one buffer per chunk. Rows are grouped in
+    chunks of ``chunk_size`` events; appending is O(1) amortized.
+
+    The store holds at most ``capacity`` events, rounded up to whole chunks.
+    Once full, appending drops the oldest chunk, so the oldest events are
+    evicted first (counted in ``evicted``). Deleted events are tombstoned
+    and their chunk is freed once it holds no live event and is the oldest.
+
+    Reads scan the columns. The store is meant for write-heavy benchmarks,
+    tests and deployments without a database, not for large queries.
+
+    All methods run on the event loop thread; none of them awaits, so each
+    call is atomic with respect to other tasks.
+    """
+
+    def __init__(self, capacity: int, chunk_size: int = 4096) -> None:
+        """Initialize an empty store.
+
+        Args:
+            capacity: Maximum number of events kept.
+            chunk_size: Events per chunk (the eviction unit).
+        """
+        if capacity <= 0 or chunk_size <= 0:
+            raise ValueError("capacity and chunk_size must be positive")
+        self._chunk_size = min(chunk_size, capacity)
+        self._max_chunks = -(-capacity // self._chunk_size)
+        self._chunks: deque[_Chunk] = deque()
+        self._type_names: list[str] = []
+        self._type_codes: dict[str, int] = {}
+        self._keys: set[str] = set()
+        self._next_id = 1
+        self._live = 0
+        self.evicted = 0
+
+    def __len__(self) -> int:
+        return self._live
+
+    def _type_code(self, event_type: str) -> int:
+        code = self._type_codes.get(event_type)
+        if code is None:
+            code = self._type_codes[event_type] = len(self._type_names)
+            self._type_names.append(event_type)
+        return code
+
+    def _writable_chunk(self) -> _Chunk:
+        if self._chunks and len(self._chunks[-1]) < self._chunk_size:
+            return self._chunks[-1]
+        if len(self._chunks) == self._max_chunks:
+            self._drop(self._chunks.popleft(), evicted=True)
+        chunk = _Chunk()
+        self._chunks.append(chunk)
+        return chunk
+
+    def _drop(self, chunk: _Chunk, *, evicted: bool) -> None:
+        self._keys.difference_update(chunk.keys.values())
+        self._live -= chunk.live
+        if evicted:
+            self.evicted += chunk.live
+
+    def append(self, event: DomainEvent) -> EventRecord | None:
+        """Store an event.
+
+        Args:
+            event: Event to store.
+
+        Returns:
+            The stored event with its assigned id, or None if its
+            idempotency key is already stored (the event is skipped).
+        """
+        key = event.idempotency_key
+        if key is not None:
+            if key in self._keys:
+                return None
+            self._keys.add(key)
+
+        chunk = self._writable_chunk()
+        event_id = self._next_id
+        self._next_id += 1
+        created_us = _to_us(event.created_at)
+        if key is not None:
+            chunk.keys[len(chunk)] = key
+        chunk.append(
+            event_id, self._type_code(event.event_type), created_us, event.event_payload.encode()
+        )
+        self._live += 1
+        return EventRecord(
+            id=event_id,
+            event_type=event.event_type,
+            event_payload=event.event_payload,
+            created_at=_from_us(created_us),
+        )
+
+    def extend(self, events: Sequence[DomainEvent]) -> list[bool]:
+        """Store several events, skipping those whose idempotency key is stored.
+
+        Args:
+            events: Events to store, in order.
+
+        Returns:
+            One flag per event: True if stored, False if skipped.
+        """
+        return [self.append(event) is not None for event in events]
+
+    def _rows(
+        self,
+        *,
+        event_type: str | None,
+        exclude_types: Sequence[str] = (),
+        since_us: int | None = None,
+        until_us: int | None = None,
+    ) -> Iterator[tuple[int, int, _Chunk, int]]:
+        """Yield (created_us, id, chunk, row) of the live rows matching the filters."""
+        type_code: int | None = None
+        if event_type is not None:
+            if event_type not in self._type_codes:
+                return
+            type_code = self._type_codes[event_type]
+        excluded = {self._type_codes[name] for name in exclude_types if name in self._type_codes}
+
+        for chunk in self._chunks:
+            ids, types, created, deleted = chunk.ids, chunk.types, chunk.created_us, chunk.deleted
+            for row in range(len(ids)):
+                if deleted[row]:
+                    continue
+                code = types[row]
+                if (type_code is not None and code != type_code) or code in excluded:
+                    continue
+                at = created[row]
+                if (since_us is not None and at < since_us) or (
+                    until_us is not None and at >= until_us
+                ):
+                    continue
+                yield at, ids[row], chunk, row
+
+    def _record(self, chunk: _Chunk, row: int) -> EventRecord:
+        return EventRecord(
+            id=chunk.ids[row],
+            event_type=self._type_names[chunk.types[row]],
+            event_payload=chunk.payload(row),
+            created_at=_from_us(chunk.created_us[row]),
+        )
+
+    def select(self, query: EventQuery) -> list[EventRecord]:
+        """Return one page of events, as EventQueryRepository.list_events does.
+
+        Args:
+            query: Filters, sort order and position.
+
+        Returns:
+            Matching events ordered by (created_at, id) in query.order.
+        """
+        rows = self._rows(
+            event_type=query.event_type,
+            since_us=_to_us(query.since) if query.since is not None else None,
+            until_us=_to_us(query.until) if query.until is not None else None,
+        )
+        if query.after is not None:
+            after = (_to_us(query.after.created_at), query.after.id)
+            if query.order == "desc":
+                rows = (r for r in rows if (r[0], r[1]) < after)
+            else:
+                rows = (r for r in rows if (r[0], r[1]) > after)
+
+        pick = heapq.nlargest if query.order == "desc" else heapq.nsmallest
+        page = pick(query.limit, rows, key=lambda r: (r[0], r[1]))
+        return [self._record(chunk, row) for _, _, chunk, row in page]
+
+    def delete_expired(
+        self,
+        older_than: datetime,
+        limit: int,
+        *,
+        event_type: str | None = None,
+        exclude_types: Sequence[str] = (),
+        after: EventKey | None = None,
+    ) -> ExpiredBatch:
+        """Delete the oldest expired events, as RetentionRepository.delete_expired does.
+
+        Args:
+            older_than: Delete events created before this instant.
+            limit: Maximum number of events to delete.
+            event_type: Only events of this type (all types when None).
+            exclude_types: Skip events of these types.
+            after: Key of the last event deleted by the previous batch.
+
+        Returns:
+            ExpiredBatch with the count and the key to resume after.
+        """
+        rows = self._rows(
+            event_type=event_type, exclude_types=exclude_types, until_us=_to_us(older_than)
+        )
+        if after is not None:
+            start = (_to_us(after.created_at), after.id)
+            rows = (r for r in rows if (r[0], r[1]) > start)
+        batch = heapq.nsmallest(limit, rows, key=lambda r: (r[0], r[1]))
+        if not batch:
+            return ExpiredBatch(deleted=0, last_key=None)
+
+        for _, _, chunk, row in batch:
+            chunk.deleted[row] = 1
+            chunk.live -= 1
+            key = chunk.keys.pop(row, None)
+            if key is not None:
+                self._keys.discard(key)
+        self._live -= len(batch)
+        # Free leading chunks with no live event left (never the one being written)
+        while len(self._chunks) > 1 and self._chunks[0].live == 0:
+            self._drop(self._chunks.popleft(), evicted=False)
+
+        last_us, last_id, _, _ = batch[-1]
+        return ExpiredBatch(
+            deleted=len(batch), last_key=EventKey(created_at=_from_us(last_us), id=last_id)
+        )
+
+    def dump(self) -> bytes:
+        """Serialize the store (e.g. to snapshot it while the loop keeps running).
+
+        Returns:
+            Snapshot bytes, read back by load().
+        """
+        header = {
+            "next_id": self._next_id,
+            "evicted": self.evicted,
+            "types": self._type_names,
+            "chunks": [
+                {"rows": len(chunk), "payload_bytes": len(chunk.payloads), "keys": chunk.keys}
+                for chunk in self._chunks
+            ],
+        }
+        parts = [_SNAPSHOT_MAGIC, json.dumps(header).encode(), b"\n"]
+        for chunk in self._chunks:
+            for column in (chunk.ids, chunk.types, chunk.created_us, chunk.payload_ends):
+                parts.append(column.tobytes())
+            parts.append(bytes(chunk.deleted))
+            parts.append(bytes(chunk.payloads))
+        return b"".join(parts)
+
+    def load(self, data: bytes) -> None:
+        """Replace the contents with a snapshot taken by dump().
+
+        Chunks beyond this store's capacity are dropped, oldest first.
+
+        Args:
+            data: Snapshot bytes.
+
+        Raises:
+            ValueError: If the data is not a snapshot.
+        """
+        if not data.startswith(_SNAPSHOT_MAGIC):
+            raise ValueError("Not an event store snapshot")
+        header_end = data.index(b"\n", len(_SNAPSHOT_MAGIC))
+        header = json.loads(data[len(_SNAPSHOT_MAGIC) : header_end])
+        view = memoryview(data)[header_end + 1 :]
+
+        chunks: deque[_Chunk] = deque()
+        for meta in header["chunks"]:
+            chunk = _Chunk()
+            rows = meta["rows"]
+            for column in (chunk.ids, chunk.types, chunk.created_us, chunk.payload_ends):
+                size = rows * column.itemsize
+                column.frombytes(view[:size])
+                view = view[size:]
+            chunk.deleted = bytearray(view[:rows])
+            view = view[rows:]
+            chunk.payloads = bytearray(view[: meta["payload_bytes"]])
+            view = view[meta["payload_bytes"] :]
+            chunk.keys = {int(row): key for row, key in meta["keys"].items()}
+            chunk.live = rows - sum(chunk.deleted)
+            chunks.append(chunk)
+
+        self._chunks = chunks
+        self._type_names = list(header["types"])
+        self._type_codes = {name: code for code, name in enumerate(self._type_names)}
+        self._keys = {key for chunk in chunks for key in chunk.keys.values()}
+        self._live = sum(chunk.live for chunk in chunks)
+        self._next_id = header["next_id"]
+        self.evicted = header["evicted"]
+        while len(self._chunks) > self._max_chunks:
+            self._drop(self._chunks.popleft(), evicted=True)
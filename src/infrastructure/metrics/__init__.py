@@ -0,0 +1 @@
+"""Sharing metrics between worker processes."""
@@ -0,0 +1,109 @@
+"""Per-worker metrics snapshot files merged at scrape time."""
+
+import asyncio
+import json
+import logging
+import os
+from contextlib import suppress
+from pathlib import Path
+from types import TracebackType
+
+from src.application.metrics import MetricsRegistry, Snapshot, merge_snapshots
+
+__all__ = ["WorkerMetricsFiles"]
+
+logger = logging.getLogger(__name__)
+
+
+class WorkerMetricsFiles:
+    """Publish this worker's metrics to a shared directory and merge all workers.
+
+    Every ``interval_seconds`` the worker writes a snapshot of its registry
+    to ``worker-<pid>.json`` (atomically, via a temporary file). A scrape
+    served by any worker merges its own live values with the latest files
+    of all other workers, so /metrics reports the whole server whichever
+    worker answers. Recording stays in-process and lock-free; only the
+    periodic snapshot touches the disk.
+
+    On exit the worker writes a final snapshot without gauges: its counters
+    and histograms keep counting towards the totals, its current values do
+    not. Empty the directory with clear() before the server starts.
+
+    Use as an async context manager.
+    """
+
+    def __init__(self, registry: MetricsRegistry, directory: str | Path, interval_seconds: float):
+        """Initialize the publisher.
+
+        Args:
+            registry: This worker's metrics.
+            directory: Directory shared by all workers.
+            interval_seconds: How often the snapshot file is rewritten.
+        """
+        self._registry = registry
+        self._directory = Path(directory)
+        self._interval_seconds = interval_seconds
+        self._path = self._directory / f"worker-{os.getpid()}.json"
+        self._stopping = asyncio.Event()
+        self._worker: asyncio.Task[None] | None = None
+
+    @staticmethod
+    def clear(directory: str | Path) -> None:
+        """Delete the files of previous workers (call before workers start).
+
+        Args:
+            directory: Directory shared by all workers.
+        """
+        for path in Path(directory).glob("worker-*.json"):
+            path.unlink(missing_ok=True)
+
+    async def __aenter__(self) -> "WorkerMetricsFiles":
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._worker = asyncio.create_task(self._run(), name="metrics-files")
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self._stopping.set()
+        if self._worker is not None:
+            await self._worker
+            self._worker = None
+        await asyncio.to_thread(self._write, self._registry.snapshot(gauges=False))
+
+    async def collect(self) -> Snapshot:
+        """Merge this worker's live values with the other workers' files.
+
+        Returns:
+            Snapshot of the whole server.
+        """
+        others = await asyncio.to_thread(self._read_others)
+        return merge_snapshots([self._registry.snapshot(), *others])
+
+    def _read_others(self) -> list[Snapshot]:
+        snapshots = []
+        for path in self._directory.glob("worker-*.json"):
+            if path == self._path:
+                continue
+            try:
+                snapshots.append(Snapshot(json.loads(path.read_text())))
+            except (OSError, ValueError) as exc:
+                logger.warning("Skipping unreadable metrics file %s: %s", path.name, exc)
+        return snapshots
+
+    def _write(self, snapshot: Snapshot) -> None:
+        tmp = self._path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(snapshot.families, separators=(",", ":")))
+        os.replace(tmp, self._path)
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                await asyncio.to_thread(self._write, self._registry.snapshot())
+            except OSError as exc:
+                logger.warning("Could not write metrics file %s: %s", self._path, exc)
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._stopping.wait(), self._interval_seconds)
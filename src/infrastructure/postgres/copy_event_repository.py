@@ -0,0 +1,159 @@
+"""Bulk-load implementation of EventRepository using PostgreSQL COPY."""
+
+import logging
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Sequence
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from src.application.ports.event_repository import EventRepository
+from src.core.event import DomainEvent
+from src.infrastructure.postgres.models.event import events_table
+
+__all__ = ["CopyEventRepository"]
+
+logger = logging.getLogger(__name__)
+
+COPY_COLUMNS = ("type", "message", "created_at", "idempotency_key")
+DEFAULT_CHUNK_SIZE = 5000
+
+
+async def _as_async(
+    events: Iterable[DomainEvent] | AsyncIterable[DomainEvent],
+) -> AsyncIterator[DomainEvent]:
+    if isinstance(events, AsyncIterable):
+        async for event in events:
+            yield event
+    else:
+        for event in events:
+            yield event
+
+
+class CopyEventRepository(EventRepository):
+    """Persist events in bulk with the COPY protocol.
+
+    On PostgreSQL (asyncpg) records are streamed into the events table with
+    asyncpg's binary COPY, reached through the SQLAlchemy engine's raw
+    connection. Other backends (the SQLite development database) fall back to
+    a DBAPI executemany per chunk.
+
+    Intended for backfills and large batches; a single-event save pays the
+    full COPY setup cost. COPY cannot skip conflicts, so a duplicate
+    idempotency key fails the whole load.
+    """
+
+    def __init__(self, engine: AsyncEngine, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        """Initialize with an engine.
+
+        Args:
+            engine: SQLAlchemy AsyncEngine (e.g. SqlAlchemyDbProvider.engine).
+            chunk_size: Rows per executemany call on non-PostgreSQL backends.
+        """
+        self._engine = engine
+        self._chunk_size = chunk_size
+
+    async def save(self, event: DomainEvent, *, returning: bool = True) -> bool:
+        """Persist a single event.
+
+        COPY does not return rows and cannot skip duplicates, so True is
+        returned whenever the load succeeds.
+
+        Args:
+            event: Domain event to persist.
+            returning: Ignored.
+
+        Returns:
+            True.
+        """
+        await self.copy_events((event,))
+        return True
+
+    async def save_many(self, events: Sequence[DomainEvent]) -> list[bool]:
+        """Persist events in one transaction.
+
+        Args:
+            events: Domain events to persist.
+
+        Returns:
+            True for every event (a duplicate fails the whole load instead).
+        """
+        if events:
+            await self.copy_events(events)
+        return [True] * len(events)
+
+    async def copy_events(self, events: Iterable[DomainEvent] | AsyncIterable[DomainEvent]) -> int:
+        """Stream events into the events table in one transaction.
+
+        Events are consumed lazily, so arbitrarily large (async) iterables
+        can be loaded without materializing them.
+
+        Args:
+            events: Domain events to persist.
+
+        Returns:
+            Number of rows written.
+
+        Raises:
+            Exception: If the load fails (no row is persisted).
+        """
+        async with self._engine.connect() as conn:
+            if conn.dialect.driver == "asyncpg":
+                count = await self._copy_asyncpg(conn, events)
+            else:
+                count = await self._executemany(conn, events)
+        logger.debug("Events bulk loaded: count=%s", count)
+        return count
+
+    async def _copy_asyncpg(
+        self,
+        conn: AsyncConnection,
+        events: Iterable[DomainEvent] | AsyncIterable[DomainEvent],
+    ) -> int:
+        count = 0
+
+        async def records() -> AsyncIterator[tuple[object, ...]]:
+            nonlocal count
+            async for event in _as_async(events):
+                count += 1
+                yield (
+                    event.event_type,
+                    event.event_payload,
+                    event.created_at,
+                    event.idempotency_key,
+                )
+
+        raw = await conn.get_raw_connection()
+        driver_conn: Any = raw.driver_connection
+        async with driver_conn.transaction():
+            await driver_conn.copy_records_to_table(
+                events_table.name, records=records(), columns=COPY_COLUMNS
+            )
+        return count
+
+    async def _executemany(
+        self,
+        conn: AsyncConnection,
+        events: Iterable[DomainEvent] | AsyncIterable[DomainEvent],
+    ) -> int:
+        stmt = insert(events_table)
+        count = 0
+        chunk: list[dict[str, object]] = []
+        async with conn.begin():
+            async for event in _as_async(events):
+                chunk.append(
+                    {
+                        "type": event.event_type,
+                        "message": event.event_payload,
+                        "created_at": event.created_at,
+                        "idempotency_key": event.idempotency_key,
+                    }
+                )
+                if len(chunk) >= self._chunk_size:
+                    await conn.execute(stmt, chunk)
+                    count += len(chunk)
+                    chunk = []
+            if chunk:
+                await conn.execute(stmt, chunk)
+                count += len(chunk)
+        return count
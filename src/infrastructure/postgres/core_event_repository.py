@@ -0,0 +1,121 @@
+"""ORM-free implementation of EventRepository using SQLAlchemy Core."""
+
+import logging
+from collections.abc import Sequence
+
+from sqlalchemy import Row
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.application.ports.event_repository import EventRepository
+from src.application.stage_timing import stage
+from src.core.event import DomainEvent
+from src.infrastructure.postgres.inserts import event_inserts, inserted_flags
+
+__all__ = ["CoreEventRepository"]
+
+logger = logging.getLogger(__name__)
+
+
+class CoreEventRepository(EventRepository):
+    """Persist events with Core INSERTs on a pooled connection.
+
+    Skips the ORM entirely (no mapped instances, unit of work or identity
+    map), which suits the append-only events table. Stateless, so a single
+    instance can be shared by all requests.
+    """
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        """Initialize with an engine.
+
+        Args:
+            engine: SQLAlchemy AsyncEngine whose pool provides connections.
+        """
+        self._engine = engine
+        self._inserts = event_inserts(engine.dialect.name)
+
+    async def save(
+        self, event: DomainEvent, *, returning: bool = True
+    ) -> Row[tuple[int, object]] | bool | None:
+        """Persist an event in its own transaction.
+
+        An event whose idempotency key is already stored is skipped.
+
+        Args:
+            event: Domain event to persist.
+            returning: Read back the generated id and created_at.
+
+        Returns:
+            Row with (id, created_at) (True when returning is False), or None
+            if the event was a duplicate.
+
+        Raises:
+            IntegrityError: If database constraints are violated.
+            Exception: For other database errors.
+        """
+        params = {
+            "type": event.event_type,
+            "message": event.event_payload,
+            "created_at": event.created_at,
+            "idempotency_key": event.idempotency_key,
+        }
+        try:
+            async with self._engine.connect() as conn:
+                with stage("insert"):
+                    row: Row[tuple[int, object]] | bool | None
+                    if returning:
+                        row = (await conn.execute(self._inserts.returning, params)).one_or_none()
+                    else:
+                        result = await conn.execute(self._inserts.single, params)
+                        row = True if result.scalar_one_or_none() is not None else None
+                with stage("commit"):
+                    await conn.commit()
+                return row
+        except IntegrityError as exc:
+            logger.warning("Constraint violation: %s", exc)
+            raise
+        except Exception as exc:
+            logger.error("Error persisting event", exc_info=exc)
+            raise
+
+    async def save_many(self, events: Sequence[DomainEvent]) -> list[bool]:
+        """Persist several events with multi-row INSERTs in one transaction.
+
+        Events whose idempotency key is already stored are skipped.
+
+        Args:
+            events: Domain events to persist.
+
+        Returns:
+            One flag per event: True if inserted, False if skipped.
+
+        Raises:
+            IntegrityError: If database constraints are violated.
+            Exception: For other database errors.
+        """
+        if not events:
+            return []
+
+        rows = [
+            {
+                "type": event.event_type,
+                "message": event.event_payload,
+                "created_at": event.created_at,
+                "idempotency_key": event.idempotency_key,
+            }
+            for event in events
+        ]
+        try:
+            async with self._engine.connect() as conn:
+                with stage("insert"):
+                    result = await conn.execute(self._inserts.many, rows)
+                    flags = inserted_flags(events, result.scalars())
+                with stage("commit"):
+                    await conn.commit()
+                return flags
+        except IntegrityError as exc:
+            logger.warning("Constraint violation: %s", exc)
+            raise
+        except Exception as exc:
+            logger.error("Error persisting events", exc_info=exc)
+            raise
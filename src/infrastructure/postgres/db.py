@@ -1,35 +1,144 @@
 """SQLAlchemy engine and session creation."""
 
+import asyncio
+import logging
+import time
+import weakref
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Final
+
+from sqlalchemy import make_url, text
 from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
 
+from src.application.metrics import REGISTRY, Gauge, Histogram, LabelValues
+from src.application.stage_timing import record_stage
+from src.infrastructure.config.settings import DatabaseSettings
+from src.infrastructure.postgres.inserts import event_inserts
 from src.infrastructure.postgres.models.event import Base
+from src.infrastructure.postgres.schema import (
+    migrate_schema,
+    read_schema_fingerprint,
+    schema_fingerprint,
+    write_schema_fingerprint,
+)
+
+__all__ = [
+    "InstrumentedQueuePool",
+    "create_engine_and_session_maker",
+    "init_db_tables",
+    "warm_pool",
+]
+
+logger = logging.getLogger(__name__)
+
+POOL_CHECKOUT_SECONDS: Final = REGISTRY.register(
+    Histogram(
+        "db_pool_checkout_seconds",
+        "Time to check a connection out of the pool, including waits and new connections.",
+    )
+)
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that records checkout wait and reports its usage.
+
+    ``waiting`` counts the checkouts in progress: waiting for a connection
+    to be returned, or opening a new one.
+    """
+
+    # Live pools, read when metrics are collected
+    instances: "weakref.WeakSet[InstrumentedQueuePool]" = weakref.WeakSet()
+
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        super().__init__(*args, **kwargs)  # type: ignore[arg-type]
+        self.waiting = 0
+        InstrumentedQueuePool.instances.add(self)
+
+    def connect(self) -> PoolProxiedConnection:
+        started = time.perf_counter()
+        self.waiting += 1
+        try:
+            return super().connect()
+        finally:
+            self.waiting -= 1
+            elapsed = time.perf_counter() - started
+            POOL_CHECKOUT_SECONDS.observe(elapsed)
+            record_stage("connect", elapsed)
+
+
+def _pool_total(read: Callable[[InstrumentedQueuePool], int]) -> dict[LabelValues, float]:
+    pools = list(InstrumentedQueuePool.instances)
+    return {(): float(sum(read(pool) for pool in pools))} if pools else {}
+
+
+REGISTRY.register(
+    Gauge(
+        "db_pool_size",
+        "Connections the pool keeps open.",
+        lambda: _pool_total(lambda pool: pool.size()),
+    )
+)
+REGISTRY.register(
+    Gauge(
+        "db_pool_checked_out",
+        "Pooled connections currently in use.",
+        lambda: _pool_total(lambda pool: pool.checkedout()),
+    )
+)
+REGISTRY.register(
+    Gauge(
+        "db_pool_overflow",
+        "Connections open beyond the pool size.",
+        # overflow() counts up from -size while the base connections are opened
+        lambda: _pool_total(lambda pool: max(0, pool.overflow())),
+    )
+)
 
-__all__ = ["create_engine_and_session_maker", "init_db_tables"]
+
+def _uses_queue_pool(database_uri: str) -> bool:
+    # In-memory SQLite runs on a single static connection without pool sizing
+    url = make_url(database_uri)
+    return not (url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"))
 
 
 def create_engine_and_session_maker(
     database_uri: str,
+    settings: DatabaseSettings | None = None,
 ) -> tuple[AsyncEngine, async_sessionmaker[AsyncSession]]:
     """Create SQLAlchemy engine and session maker.
 
     Args:
-        database_uri: Async PostgreSQL connection URI.
+        database_uri: Async PostgreSQL (or SQLite) connection URI.
+        settings: Pool settings (defaults when omitted).
 
     Returns:
         Tuple of (AsyncEngine, async_sessionmaker).
     """
+    settings = settings or DatabaseSettings()
+    pool_options: dict[str, object] = {}
+    if _uses_queue_pool(database_uri):
+        pool_options = {
+            "poolclass": InstrumentedQueuePool,
+            "pool_size": settings.pool_size,  #  Connections kept open
+            "max_overflow": settings.max_overflow,  #  Extra connections allowed temporarily
+            "pool_recycle": settings.pool_recycle,  #  Replace connections older than this (s)
+            "pool_timeout": settings.pool_timeout,  #  Max wait for a checkout (s)
+            "pool_pre_ping": settings.pool_pre_ping,  #  Check connections are alive before using
+        }
+
     engine = create_async_engine(
         database_uri,
         echo=False,  # Don't log all SQL statements
         future=True,  #  Use SQLAlchemy 2.0 behavior now
-        pool_size=20,  #  Keep 20 connections ready
-        max_overflow=10,  #  Allow up to 10 extra connections temporarily
-        pool_pre_ping=True,  #  Check connections are alive before using
+        **pool_options,
     )
     session_maker = async_sessionmaker(
         engine,
@@ -39,11 +148,89 @@ def create_engine_and_session_maker(
     return engine, session_maker
 
 
-async def init_db_tables(engine: AsyncEngine) -> None:
-    """Create all tables defined in models.
+async def init_db_tables(engine: AsyncEngine, *, check_fingerprint: bool = True) -> bool:
+    """Create and upgrade the tables defined in models, unless the schema is current.
+
+    Missing tables are created, then tables created by earlier versions are
+    migrated (see migrate_schema), and the fingerprint of the models is
+    stored. This looks up every table and index in the catalog; when the
+    fingerprint stored by the previous start matches the models, it is
+    skipped and startup costs one query instead.
 
     Args:
         engine: SQLAlchemy AsyncEngine to use.
+        check_fingerprint: Skip creation when the stored fingerprint matches.
+
+    Returns:
+        True if create_all ran, False if it was skipped.
     """
+    fingerprint = schema_fingerprint(Base.metadata, engine.dialect)
+    if check_fingerprint and await read_schema_fingerprint(engine) == fingerprint:
+        logger.info("Schema current, table creation skipped: fingerprint=%s", fingerprint[:12])
+        return False
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(migrate_schema)
+        await write_schema_fingerprint(conn, fingerprint)
+    logger.info("Schema created: fingerprint=%s", fingerprint[:12])
+    return True
+
+
+async def _prepare_insert(conn: AsyncConnection) -> None:
+    # Executing inside a rolled-back transaction fills the compiled cache and
+    # the driver's per-connection prepared statement cache without writing.
+    # The connection has already autobegun a transaction with its first query.
+    # Multi-row inserts render a different statement per batch size and are
+    # left cold.
+    row = {
+        "type": "__warmup__",
+        "message": "__warmup__",
+        "created_at": datetime.now(UTC),
+        "idempotency_key": None,
+    }
+    try:
+        await conn.execute(event_inserts(conn.dialect.name).single, row)
+    finally:
+        await conn.rollback()
+
+
+async def warm_pool(engine: AsyncEngine, connections: int) -> None:
+    """Open pooled connections ahead of traffic and prepare the insert statement.
+
+    Connection setup (TCP, TLS, authentication) and statement preparation
+    then happen at startup instead of on the first requests. Failures are
+    logged and ignored: warm-up is an optimization, not a requirement.
+
+    Args:
+        engine: SQLAlchemy AsyncEngine to warm.
+        connections: Number of connections to open (capped at the pool size).
+    """
+    pool_size = getattr(engine.pool, "size", None)
+    count = min(connections, pool_size()) if callable(pool_size) else min(connections, 1)
+    if count <= 0:
+        return
+
+    async def open_connection() -> AsyncConnection:
+        conn = await engine.connect()
+        await conn.execute(text("SELECT 1"))
+        return conn
+
+    results = await asyncio.gather(
+        *(open_connection() for _ in range(count)), return_exceptions=True
+    )
+    conns = [result for result in results if isinstance(result, AsyncConnection)]
+    try:
+        for conn in conns:
+            await _prepare_insert(conn)
+    except Exception as exc:
+        logger.warning("Pool warm-up could not prepare statements: %s", exc)
+    finally:
+        for conn in conns:
+            await conn.close()
+
+    failures = [result for result in results if isinstance(result, BaseException)]
+    if failures:
+        logger.warning("Pool warm-up opened %s/%s connections: %s", len(conns), count, failures[0])
+    else:
+        logger.info("Pool warmed: connections=%s", len(conns))
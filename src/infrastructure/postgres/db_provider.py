@@ -1,22 +1,58 @@
-from sqlalchemy.ext.asyncio import (
-    AsyncEngine,
-    AsyncSession,
-    async_sessionmaker,
-    create_async_engine,
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from src.application.ports.db_provider import PoolUsage
+from src.application.ports.event_query_repository import EventQueryRepository
+from src.application.ports.event_repository import EventRepository
+from src.application.ports.retention_repository import RetentionRepository
+from src.application.ports.rollup_repository import RollupRepository
+from src.application.stage_timing import stage
+from src.infrastructure.config.settings import DatabaseSettings
+from src.infrastructure.postgres.core_event_repository import CoreEventRepository
+from src.infrastructure.postgres.db import (
+    InstrumentedQueuePool,
+    create_engine_and_session_maker,
+    init_db_tables,
+    warm_pool,
 )
+from src.infrastructure.postgres.event_query_repository import SqlEventQueryRepository
+from src.infrastructure.postgres.event_repository import PostgresEventRepository
+from src.infrastructure.postgres.partitions import PartitionManager
+from src.infrastructure.postgres.retention_repository import SqlRetentionRepository
+from src.infrastructure.postgres.rollup_repository import SqlRollupRepository
 
-from src.infrastructure.postgres.models.event import Base
+logger = logging.getLogger(__name__)
 
 
 class SqlAlchemyDbProvider:
-    def __init__(self, database_uri: str) -> None:
-        self._engine: AsyncEngine = create_async_engine(database_uri, echo=False, future=True)
-        self._session_maker = async_sessionmaker(self._engine, expire_on_commit=False)
+    def __init__(self, database_uri: str, settings: DatabaseSettings | None = None) -> None:
+        self._settings = settings or DatabaseSettings()
+        self._engine: AsyncEngine
+        self._engine, self._session_maker = create_engine_and_session_maker(
+            database_uri, self._settings
+        )
+        self._core_repository = CoreEventRepository(self._engine)
+        self._query_repository = SqlEventQueryRepository(self._engine)
+        self._rollup_repository = SqlRollupRepository(self._engine)
+        self._retention_repository = SqlRetentionRepository(self._engine)
+        self._partitions: PartitionManager | None = None
+        if self._settings.partitioning:
+            if self._engine.dialect.name != "postgresql":
+                logger.warning("EVENTS_PARTITIONED is PostgreSQL-only; using the plain table")
+            elif self._settings.partition_maintenance:
+                self._partitions = PartitionManager(self._engine, self._settings)
 
     async def __aenter__(self) -> "SqlAlchemyDbProvider":
+        # The partitioned events table must exist before create_all skips it
+        if self._partitions is not None:
+            await self._partitions.__aenter__()
         # init DB (works for Postgres or SQLite depending on URI)
-        async with self._engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
+        await init_db_tables(self._engine, check_fingerprint=self._settings.schema_fingerprint)
+        await warm_pool(self._engine, self._settings.pool_min_size)
         return self
 
     async def __aexit__(
@@ -25,7 +61,52 @@ class SqlAlchemyDbProvider:
         exc: BaseException | None,
         tb: BaseException | None,
     ) -> None:
+        if self._partitions is not None:
+            await self._partitions.__aexit__(exc_type, exc, None)
         await self._engine.dispose()
 
+    @property
+    def engine(self) -> AsyncEngine:
+        return self._engine
+
     def __call__(self) -> AsyncSession:
         return self._session_maker()
+
+    async def ping(self) -> None:
+        async with self._engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    def pool_usage(self) -> PoolUsage | None:
+        pool = self._engine.pool
+        if not isinstance(pool, InstrumentedQueuePool):
+            return None
+        # A negative max_overflow lets the pool open connections without limit
+        max_overflow = self._settings.max_overflow
+        return PoolUsage(
+            checked_out=pool.checkedout(),
+            capacity=pool.size() + max_overflow if max_overflow >= 0 else None,
+            waiting=pool.waiting,
+        )
+
+    @asynccontextmanager
+    async def event_repository(self) -> AsyncIterator[EventRepository]:
+        if self._settings.repository == "core":
+            # Checks out a pooled connection per statement, no session needed
+            yield self._core_repository
+            return
+
+        with stage("session"):
+            session = self._session_maker()
+        try:
+            yield PostgresEventRepository(session)
+        finally:
+            await session.close()
+
+    def event_query_repository(self) -> EventQueryRepository:
+        return self._query_repository
+
+    def rollup_repository(self) -> RollupRepository:
+        return self._rollup_repository
+
+    def retention_repository(self) -> RetentionRepository:
+        return self._retention_repository
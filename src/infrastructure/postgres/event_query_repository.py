@@ -0,0 +1,115 @@
+"""Keyset-paginated event reads using SQLAlchemy Core."""
+
+from datetime import UTC, datetime
+
+from sqlalchemy import Select, or_, select
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.application.ports.event_query_repository import (
+    EventQuery,
+    EventQueryRepository,
+    EventRecord,
+)
+from src.infrastructure.postgres.models.event import events_table
+
+__all__ = ["SqlEventQueryRepository"]
+
+_COLUMNS = (
+    events_table.c.id,
+    events_table.c.type,
+    events_table.c.message,
+    events_table.c.created_at,
+)
+
+
+def _as_utc(value: datetime) -> datetime:
+    # Naive values are taken as UTC, which is how events are stored
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value.astimezone(UTC)
+
+
+def build_page_query(query: EventQuery) -> Select[tuple[int, str, str, datetime]]:
+    """Build the SELECT for one page of events.
+
+    Filters on `type` and `created_at` and orders by (created_at, id), so the
+    `idx_type_created_at` index (or the `created_at` index when no type is
+    given) serves both the filter and the order. The position is applied as
+    a seek predicate rather than OFFSET:
+
+        created_at >= :c AND (created_at > :c OR id > :id)
+
+    The redundant first term is a plain range condition on the indexed
+    column, so the index scan starts at the cursor instead of the first row.
+
+    Args:
+        query: Filters, sort order and position.
+
+    Returns:
+        SELECT statement returning (id, type, message, created_at).
+    """
+    created_at, event_id = events_table.c.created_at, events_table.c.id
+    descending = query.order == "desc"
+
+    stmt = select(*_COLUMNS)
+    if query.event_type is not None:
+        stmt = stmt.where(events_table.c.type == query.event_type)
+    if query.since is not None:
+        stmt = stmt.where(created_at >= _as_utc(query.since))
+    if query.until is not None:
+        stmt = stmt.where(created_at < _as_utc(query.until))
+    if query.after is not None:
+        after_at = _as_utc(query.after.created_at)
+        if descending:
+            stmt = stmt.where(
+                created_at <= after_at,
+                or_(created_at < after_at, event_id < query.after.id),
+            )
+        else:
+            stmt = stmt.where(
+                created_at >= after_at,
+                or_(created_at > after_at, event_id > query.after.id),
+            )
+
+    if descending:
+        stmt = stmt.order_by(created_at.desc(), event_id.desc())
+    else:
+        stmt = stmt.order_by(created_at.asc(), event_id.asc())
+    return stmt.limit(query.limit)
+
+
+class SqlEventQueryRepository(EventQueryRepository):
+    """Read events with keyset pagination on a pooled connection.
+
+    Stateless, so a single instance can be shared by all requests.
+    """
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        """Initialize with an engine.
+
+        Args:
+            engine: SQLAlchemy AsyncEngine whose pool provides connections.
+        """
+        self._engine = engine
+
+    async def list_events(self, query: EventQuery) -> list[EventRecord]:
+        """Return up to `query.limit` events matching the query, in order.
+
+        Args:
+            query: Filters, sort order and position.
+
+        Returns:
+            Matching events ordered by (created_at, id) in `query.order`.
+
+        Raises:
+            Exception: If the read fails.
+        """
+        async with self._engine.connect() as conn:
+            result = await conn.execute(build_page_query(query))
+            return [
+                EventRecord(
+                    id=row.id,
+                    event_type=row.type,
+                    event_payload=row.message,
+                    created_at=_as_utc(row.created_at),
+                )
+                for row in result
+            ]
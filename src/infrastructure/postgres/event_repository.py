@@ -1,12 +1,15 @@
 """PostgreSQL implementation of EventRepository port."""
 
 import logging
+from collections.abc import Sequence
 
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.ports.event_repository import EventRepository
+from src.application.stage_timing import stage
 from src.core.event import DomainEvent
+from src.infrastructure.postgres.inserts import dialect_insert, event_inserts, inserted_flags
 from src.infrastructure.postgres.models.event import Event as DBEvent
 
 __all__ = ["PostgresEventRepository"]
@@ -27,36 +30,109 @@ class PostgresEventRepository(EventRepository):
             session: Active AsyncSession instance.
         """
         self._session = session
+        dialect_name = session.get_bind().dialect.name
+        self._insert = dialect_insert(dialect_name)
+        self._inserts = event_inserts(dialect_name)
 
-    async def save(self, event: DomainEvent) -> DBEvent:
+    async def save(self, event: DomainEvent, *, returning: bool = True) -> DBEvent | bool | None:
         """Persist an event to database.
 
+        Database-assigned values are read back with INSERT ... RETURNING in
+        the same statement, so no extra SELECT is issued after the commit.
+        An event whose idempotency key is already stored is skipped; no row
+        comes back from RETURNING then.
+
         Args:
             event: Domain event to persist.
+            returning: Read back the persisted row. Pass False to return only
+                the generated id.
 
         Returns:
-            Persisted DBEvent object with database-assigned values.
+            Persisted DBEvent object with database-assigned values (True when
+            returning is False), or None if the event was a duplicate.
 
         Raises:
             IntegrityError: If database constraints are violated.
             Exception: For other database errors.
         """
-        db_obj = DBEvent(
-            type=event.event_type,
-            message=event.event_payload,
-            created_at=event.created_at,
-        )
-        self._session.add(db_obj)
+        params = {
+            "type": event.event_type,
+            "message": event.event_payload,
+            "created_at": event.created_at,
+            "idempotency_key": event.idempotency_key,
+        }
         try:
-            await self._session.commit()
-            await self._session.refresh(db_obj)
-            logger.debug(f"Event persisted: id={db_obj.id}, type={event.event_type}")
+            with stage("insert"):
+                if returning:
+                    db_obj: DBEvent | bool | None = await self._session.scalar(
+                        self._insert(DBEvent)
+                        .values(params)
+                        .on_conflict_do_nothing()
+                        .returning(DBEvent)
+                    )
+                else:
+                    inserted = await self._session.scalar(self._inserts.single, params)
+                    db_obj = True if inserted is not None else None
+            with stage("commit"):
+                await self._session.commit()
+            logger.debug(
+                "Event persisted: type=%s, inserted=%s",
+                event.event_type,
+                db_obj is not None,
+                extra={"event_type": event.event_type},
+            )
             return db_obj
         except IntegrityError as exc:
-            logger.warning(f"Constraint violation: {exc}")
+            logger.warning("Constraint violation: %s", exc)
             await self._session.rollback()
             raise
         except Exception as exc:
             logger.error("Error persisting event", exc_info=exc)
             await self._session.rollback()
             raise
+
+    async def save_many(self, events: Sequence[DomainEvent]) -> list[bool]:
+        """Persist several events with multi-row INSERTs in one transaction.
+
+        Events whose idempotency key is already stored are skipped.
+
+        Args:
+            events: Domain events to persist.
+
+        Returns:
+            One flag per event: True if inserted, False if skipped.
+
+        Raises:
+            IntegrityError: If database constraints are violated.
+            Exception: For other database errors.
+        """
+        if not events:
+            return []
+
+        rows = [
+            {
+                "type": event.event_type,
+                "message": event.event_payload,
+                "created_at": event.created_at,
+                "idempotency_key": event.idempotency_key,
+            }
+            for event in events
+        ]
+        try:
+            with stage("insert"):
+                result = await self._session.execute(self._inserts.many, rows)
+                flags = inserted_flags(events, result.scalars())
+            with stage("commit"):
+                await self._session.commit()
+            logger.debug(
+                "Events persisted: count=%d, skipped=%d", sum(flags), len(flags) - sum(flags)
+            )
+            return flags
+        except IntegrityError as exc:
+            logger.warning("Constraint violation: %s", exc)
+            await self._session.rollback()
+            raise
+        except Exception as exc:
+            logger.error("Error persisting events", exc_info=exc)
+            await self._session.rollback()
+            raise
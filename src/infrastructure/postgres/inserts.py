@@ -0,0 +1,101 @@
+"""Helpers shared by the INSERT ... ON CONFLICT DO NOTHING repositories."""
+
+from collections import Counter
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from functools import cache
+from typing import Any
+
+from sqlalchemy import Insert
+from sqlalchemy.dialects import postgresql, sqlite
+
+from src.core.event import DomainEvent
+from src.infrastructure.postgres.models.event import events_table
+
+__all__ = ["EventInserts", "dialect_insert", "event_inserts", "inserted_flags"]
+
+
+def dialect_insert(dialect_name: str) -> Callable[[Any], postgresql.Insert | sqlite.Insert]:
+    """Return the insert() construct supporting ON CONFLICT on the dialect.
+
+    Args:
+        dialect_name: SQLAlchemy dialect name (``postgresql`` or ``sqlite``).
+
+    Returns:
+        ``postgresql.insert`` or ``sqlite.insert``.
+    """
+    return postgresql.insert if dialect_name == "postgresql" else sqlite.insert
+
+
+@dataclass(frozen=True)
+class EventInserts:
+    """INSERT ... ON CONFLICT DO NOTHING statements on the events table.
+
+    Every statement RETURNs something, so a duplicate skipped by the
+    database (no row back) can be told from an insert.
+
+    Attributes:
+        single: Single-event insert RETURNING the id (the POST /event path).
+            Pool warm-up prepares this exact statement.
+        returning: Single-event insert RETURNING id and created_at.
+        many: Executemany insert RETURNING the idempotency key. SQLAlchemy
+            renders it as cached multi-row "insertmanyvalues" INSERTs, paged
+            to the dialect's parameter limits.
+    """
+
+    single: Insert
+    returning: Insert
+    many: Insert
+
+
+@cache
+def event_inserts(dialect_name: str) -> EventInserts:
+    """Build the event inserts for a dialect, once per dialect.
+
+    SQLAlchemy caches the compiled form of each statement and the asyncpg
+    dialect keeps a prepared statement per pooled connection, so the same
+    objects are reused rather than rebuilt per call.
+
+    Args:
+        dialect_name: SQLAlchemy dialect name.
+
+    Returns:
+        Statements for the dialect.
+    """
+    stmt = dialect_insert(dialect_name)(events_table).on_conflict_do_nothing()
+    return EventInserts(
+        single=stmt.returning(events_table.c.id),
+        returning=stmt.returning(events_table.c.id, events_table.c.created_at),
+        many=stmt.returning(events_table.c.idempotency_key),
+    )
+
+
+def inserted_flags(
+    events: Sequence[DomainEvent], inserted_keys: Iterable[str | None]
+) -> list[bool]:
+    """Match the keys returned by INSERT ... RETURNING back to the events.
+
+    Rows skipped by ON CONFLICT DO NOTHING are absent from RETURNING, and
+    only events with an idempotency key can conflict. RETURNING order is
+    not guaranteed, so keys are matched as a multiset: the first event with
+    a key is the inserted one when the batch repeats it.
+
+    Args:
+        events: Events passed to the INSERT, in order.
+        inserted_keys: idempotency_key of every returned row.
+
+    Returns:
+        One flag per event: True if inserted, False if skipped as a duplicate.
+    """
+    remaining = Counter(key for key in inserted_keys if key is not None)
+    flags: list[bool] = []
+    for event in events:
+        key = event.idempotency_key
+        if key is None:
+            flags.append(True)
+        elif remaining[key] > 0:
+            remaining[key] -= 1
+            flags.append(True)
+        else:
+            flags.append(False)
+    return flags
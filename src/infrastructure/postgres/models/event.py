@@ -1,12 +1,16 @@
 """SQLAlchemy ORM models for events."""
 
-from sqlalchemy import Column, DateTime, Index, Integer, String, func
+from typing import cast
+
+from sqlalchemy import BigInteger, Column, DateTime, Index, Integer, String, Table, func
 from sqlalchemy.orm import DeclarativeBase
 
-__all__ = ["Base", "Event"]
+__all__ = ["Base", "Event", "EventRollup", "event_rollups_table", "events_table"]
 
 MAX_EVENT_TYPE_LENGTH = 100
 MAX_EVENT_PAYLOAD_LENGTH = 1000
+MAX_IDEMPOTENCY_KEY_LENGTH = 255
+MAX_ROLLUP_RESOLUTION_LENGTH = 16
 
 
 class Base(DeclarativeBase):
@@ -21,6 +25,7 @@ class Event(Base):
         type: Event type/category (indexed for queries).
         message: Event payload content.
         created_at: Timestamp in UTC (indexed, server default).
+        idempotency_key: Optional client retry key (unique when set).
     """
 
     __tablename__ = "events"
@@ -31,9 +36,53 @@ class Event(Base):
     created_at = Column(
         DateTime(timezone=True), nullable=False, server_default=func.now(), index=True
     )
+    idempotency_key = Column(String(MAX_IDEMPOTENCY_KEY_LENGTH), nullable=True)
 
-    __table_args__ = (Index("idx_type_created_at", "type", "created_at"),)
+    # NULL keys never conflict, so events without a key are unaffected
+    __table_args__ = (
+        Index("idx_type_created_at", "type", "created_at"),
+        Index("uq_events_idempotency_key", "idempotency_key", unique=True),
+    )
 
     def __repr__(self) -> str:
         """Return string representation."""
         return f"Event(id={self.id}, type={self.type}, created_at={self.created_at})"
+
+
+# Core table for statements that bypass the ORM unit of work
+events_table = cast(Table, Event.__table__)
+
+
+class EventRollup(Base):
+    """ORM model for per-type time-bucket counters.
+
+    Maintained incrementally from the ingest path, so statistics are read
+    from a handful of bucket rows instead of aggregating the events table.
+
+    Attributes:
+        resolution: Bucket width ("minute" or "hour").
+        type: Event type/category.
+        bucket_start: Start of the bucket in UTC.
+        count: Number of events in the bucket.
+        total_payload_bytes: Sum of UTF-8 payload sizes in the bucket.
+    """
+
+    __tablename__ = "event_rollups"
+
+    resolution = Column(String(MAX_ROLLUP_RESOLUTION_LENGTH), primary_key=True)
+    type = Column(String(MAX_EVENT_TYPE_LENGTH), primary_key=True)
+    bucket_start = Column(DateTime(timezone=True), primary_key=True)
+    count = Column(BigInteger, nullable=False, default=0)
+    total_payload_bytes = Column(BigInteger, nullable=False, default=0)
+
+    __table_args__ = (Index("idx_rollup_resolution_bucket", "resolution", "bucket_start"),)
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return (
+            f"EventRollup(resolution={self.resolution}, type={self.type}, "
+            f"bucket_start={self.bucket_start}, count={self.count})"
+        )
+
+
+event_rollups_table = cast(Table, EventRollup.__table__)
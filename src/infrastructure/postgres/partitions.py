@@ -0,0 +1,311 @@
+"""Declarative range partitioning of the events table (PostgreSQL only)."""
+
+import asyncio
+import logging
+import re
+from contextlib import suppress
+from datetime import UTC, datetime, timedelta
+from types import TracebackType
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from src.infrastructure.config.settings import DatabaseSettings, PartitionInterval
+from src.infrastructure.postgres.models.event import (
+    MAX_EVENT_PAYLOAD_LENGTH,
+    MAX_EVENT_TYPE_LENGTH,
+    MAX_IDEMPOTENCY_KEY_LENGTH,
+    events_table,
+)
+
+__all__ = [
+    "PartitionManager",
+    "next_partition_start",
+    "partition_name",
+    "partition_start",
+]
+
+logger = logging.getLogger(__name__)
+
+_TABLE = events_table.name
+_DEFAULT_PARTITION = f"{_TABLE}_default"
+_NAME_FORMATS: dict[PartitionInterval, str] = {"day": "%Y%m%d", "month": "%Y%m"}
+
+# Same columns and names as the ORM model, but the primary key has to include
+# the partition key. The single-column `type` index is left out: the
+# (type, created_at) index already serves lookups by type. Unique indexes
+# must include created_at too, so the idempotency key index only catches
+# replays that keep created_at; keys are claimed in _KEYS_TABLE below.
+_CREATE_PARENT = (
+    f"CREATE TABLE IF NOT EXISTS {_TABLE} ("
+    " id SERIAL NOT NULL,"
+    f" type VARCHAR({MAX_EVENT_TYPE_LENGTH}) NOT NULL,"
+    f" message VARCHAR({MAX_EVENT_PAYLOAD_LENGTH}) NOT NULL,"
+    " created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),"
+    f" idempotency_key VARCHAR({MAX_IDEMPOTENCY_KEY_LENGTH}),"
+    " PRIMARY KEY (id, created_at)"
+    ") PARTITION BY RANGE (created_at)"
+)
+_CREATE_INDEXES = (
+    f"CREATE INDEX IF NOT EXISTS ix_{_TABLE}_created_at ON {_TABLE} (created_at)",
+    f"CREATE INDEX IF NOT EXISTS idx_type_created_at ON {_TABLE} (type, created_at)",
+    f"CREATE UNIQUE INDEX IF NOT EXISTS uq_{_TABLE}_idempotency_key_created_at"
+    f" ON {_TABLE} (idempotency_key, created_at)",
+)
+# Catches rows outside every pre-created range so writes never fail
+_CREATE_DEFAULT = f"CREATE TABLE IF NOT EXISTS {_DEFAULT_PARTITION} PARTITION OF {_TABLE} DEFAULT"
+_TABLE_KIND = text("SELECT c.relkind FROM pg_class c WHERE c.oid = to_regclass(:name)")
+
+# Client retries are stamped with a new created_at, so no index of the
+# partitioned table can tell them apart from new events. A BEFORE INSERT
+# trigger claims each key in a plain table first and skips the row (RETURN
+# NULL) when the key is taken; INSERT ... RETURNING and COPY see the row as
+# skipped, like ON CONFLICT DO NOTHING. Keys of existing rows are copied in.
+_KEYS_TABLE = f"{_TABLE}_idempotency_keys"
+_CLAIM_KEY = f"{_TABLE}_claim_idempotency_key"
+_CREATE_KEY_CLAIMS = (
+    f"CREATE TABLE IF NOT EXISTS {_KEYS_TABLE} ("
+    f" idempotency_key VARCHAR({MAX_IDEMPOTENCY_KEY_LENGTH}) PRIMARY KEY,"
+    " created_at TIMESTAMP WITH TIME ZONE NOT NULL"
+    ")",
+    f"CREATE INDEX IF NOT EXISTS ix_{_KEYS_TABLE}_created_at ON {_KEYS_TABLE} (created_at)",
+    f"INSERT INTO {_KEYS_TABLE} (idempotency_key, created_at)"
+    f" SELECT idempotency_key, min(created_at) FROM {_TABLE}"
+    " WHERE idempotency_key IS NOT NULL GROUP BY idempotency_key"
+    " ON CONFLICT DO NOTHING",
+    f"CREATE OR REPLACE FUNCTION {_CLAIM_KEY}() RETURNS trigger LANGUAGE plpgsql AS $$"
+    " BEGIN"
+    " IF NEW.idempotency_key IS NULL THEN RETURN NEW; END IF;"
+    f" INSERT INTO {_KEYS_TABLE} (idempotency_key, created_at)"
+    " VALUES (NEW.idempotency_key, NEW.created_at) ON CONFLICT DO NOTHING;"
+    " IF FOUND THEN RETURN NEW; END IF;"
+    " RETURN NULL;"
+    " END $$",
+    f"CREATE TRIGGER {_CLAIM_KEY} BEFORE INSERT ON {_TABLE}"
+    f" FOR EACH ROW EXECUTE FUNCTION {_CLAIM_KEY}()",
+)
+_TRIGGER_EXISTS = text(
+    "SELECT 1 FROM pg_trigger WHERE tgrelid = to_regclass(:name) AND tgname = :trigger"
+)
+_LIST_PARTITIONS = text(
+    "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid"
+    " WHERE i.inhparent = to_regclass(:name)"
+)
+
+
+def partition_start(timestamp: datetime, interval: PartitionInterval) -> datetime:
+    """Return the start of the partition containing timestamp.
+
+    Args:
+        timestamp: Instant to place (naive values are taken as UTC).
+        interval: Partition span.
+
+    Returns:
+        UTC midnight of the day, or of the first day of the month.
+    """
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=UTC)
+    day = timestamp.astimezone(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+    return day if interval == "day" else day.replace(day=1)
+
+
+def next_partition_start(start: datetime, interval: PartitionInterval) -> datetime:
+    """Return the start of the partition following the one starting at start.
+
+    Args:
+        start: Partition start (as returned by partition_start).
+        interval: Partition span.
+
+    Returns:
+        Start of the next partition.
+    """
+    if interval == "day":
+        return start + timedelta(days=1)
+    if start.month == 12:
+        return start.replace(year=start.year + 1, month=1)
+    return start.replace(month=start.month + 1)
+
+
+def partition_name(start: datetime, interval: PartitionInterval) -> str:
+    """Return the table name of the partition starting at start.
+
+    Args:
+        start: Partition start.
+        interval: Partition span.
+
+    Returns:
+        Name such as events_p20250131 (day) or events_p202501 (month).
+    """
+    return f"{_TABLE}_p{start.strftime(_NAME_FORMATS[interval])}"
+
+
+def _parse_partition_name(name: str, interval: PartitionInterval) -> datetime | None:
+    match = re.fullmatch(rf"{_TABLE}_p(\d+)", name)
+    if match is None:
+        return None
+    try:
+        return datetime.strptime(match.group(1), _NAME_FORMATS[interval]).replace(tzinfo=UTC)
+    except ValueError:
+        return None
+
+
+class PartitionManager:
+    """Keep the events table range-partitioned on created_at.
+
+    On startup the partitioned parent table is created if missing (an
+    existing unpartitioned table is left alone), together with the table
+    and trigger that keep idempotency keys unique across partitions; a
+    dropped partition takes its keys along. Then, at startup and every
+    ``partition_check_seconds``, partitions are pre-created from the current
+    interval up to ``partition_premake`` intervals ahead, and, when
+    ``partition_retention_days`` is set, partitions entirely older than the
+    retention are detached and dropped, which avoids DELETE, vacuum and index
+    bloat.
+
+    Use as an async context manager around the engine's lifetime.
+    """
+
+    def __init__(self, engine: AsyncEngine, settings: DatabaseSettings) -> None:
+        """Initialize the manager.
+
+        Args:
+            engine: PostgreSQL AsyncEngine.
+            settings: Partitioning settings.
+        """
+        self._engine = engine
+        self._interval = settings.partition_interval
+        self._premake = max(0, settings.partition_premake)
+        self._retention = (
+            timedelta(days=settings.partition_retention_days)
+            if settings.partition_retention_days > 0
+            else None
+        )
+        self._check_seconds = settings.partition_check_seconds
+        self._stopping = asyncio.Event()
+        self._worker: asyncio.Task[None] | None = None
+
+    async def __aenter__(self) -> "PartitionManager":
+        if await self.prepare():
+            await self.maintain()
+            self._worker = asyncio.create_task(self._run(), name="partition-manager")
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self._stopping.set()
+        if self._worker is not None:
+            await self._worker
+            self._worker = None
+
+    async def prepare(self) -> bool:
+        """Create the partitioned parent table if the events table is missing.
+
+        The idempotency key table and trigger are added to a partitioned
+        table that lacks them, including one created by an earlier version.
+
+        Returns:
+            True if the events table is partitioned and can be managed.
+        """
+        async with self._engine.begin() as conn:
+            kind = await conn.scalar(_TABLE_KIND, {"name": _TABLE})
+            if kind is None:
+                await conn.exec_driver_sql(_CREATE_PARENT)
+                for statement in _CREATE_INDEXES:
+                    await conn.exec_driver_sql(statement)
+                await conn.exec_driver_sql(_CREATE_DEFAULT)
+                logger.info("Created partitioned table %s (interval=%s)", _TABLE, self._interval)
+                kind = "p"
+            if kind == "p" and not await conn.scalar(
+                _TRIGGER_EXISTS, {"name": _TABLE, "trigger": _CLAIM_KEY}
+            ):
+                for statement in _CREATE_KEY_CLAIMS:
+                    await conn.exec_driver_sql(statement)
+                logger.info("Idempotency keys of %s are claimed in %s", _TABLE, _KEYS_TABLE)
+
+        if kind != "p":
+            logger.warning(
+                "Table %s exists and is not partitioned; partitioning is disabled", _TABLE
+            )
+            return False
+        return True
+
+    async def maintain(self, now: datetime | None = None) -> None:
+        """Pre-create upcoming partitions and drop expired ones.
+
+        Failures are logged and retried on the next run.
+
+        Args:
+            now: Current time (defaults to the wall clock).
+        """
+        now = now or datetime.now(UTC)
+        try:
+            async with self._engine.begin() as conn:
+                existing = set((await conn.execute(_LIST_PARTITIONS, {"name": _TABLE})).scalars())
+                created = await self._create_upcoming(conn, now, existing)
+                dropped = await self._drop_expired(conn, now, existing)
+        except Exception as exc:
+            logger.error("Partition maintenance failed: %s", exc)
+            return
+
+        if created or dropped:
+            logger.info("Partitions maintained: created=%s, dropped=%s", created, dropped)
+
+    async def _create_upcoming(
+        self, conn: AsyncConnection, now: datetime, existing: set[str]
+    ) -> list[str]:
+        created = []
+        start = partition_start(now, self._interval)
+        for _ in range(self._premake + 1):
+            end = next_partition_start(start, self._interval)
+            name = partition_name(start, self._interval)
+            if name not in existing:
+                # Fails if the default partition already holds rows of this
+                # range; the savepoint keeps the other partitions going.
+                try:
+                    async with conn.begin_nested():
+                        await conn.exec_driver_sql(
+                            f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {_TABLE} "
+                            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+                        )
+                    created.append(name)
+                except Exception as exc:
+                    logger.warning("Could not create partition %s: %s", name, exc)
+            start = end
+        return created
+
+    async def _drop_expired(
+        self, conn: AsyncConnection, now: datetime, existing: set[str]
+    ) -> list[str]:
+        if self._retention is None:
+            return []
+
+        cutoff = now - self._retention
+        dropped = []
+        dropped_until: datetime | None = None
+        for name in sorted(existing):
+            start = _parse_partition_name(name, self._interval)
+            if start is None:
+                continue
+            end = next_partition_start(start, self._interval)
+            if end > cutoff:
+                continue
+            await conn.exec_driver_sql(f"ALTER TABLE {_TABLE} DETACH PARTITION {name}")
+            await conn.exec_driver_sql(f"DROP TABLE {name}")
+            dropped.append(name)
+            dropped_until = max(end, dropped_until or end)
+        if dropped_until is not None:
+            await conn.exec_driver_sql(
+                f"DELETE FROM {_KEYS_TABLE} WHERE created_at < '{dropped_until.isoformat()}'"
+            )
+        return dropped
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._stopping.wait(), self._check_seconds)
+            if not self._stopping.is_set():
+                await self.maintain()
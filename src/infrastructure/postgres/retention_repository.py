@@ -0,0 +1,92 @@
+"""Batched deletion of expired events using SQLAlchemy Core."""
+
+from collections.abc import Callable, Sequence
+from contextlib import AbstractAsyncContextManager
+from datetime import UTC, datetime
+
+from sqlalchemy import delete, or_, select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from src.application.ports.event_query_repository import EventKey
+from src.application.ports.retention_repository import ExpiredBatch, RetentionRepository
+from src.infrastructure.postgres.models.event import events_table
+
+__all__ = ["SqlRetentionRepository"]
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value.astimezone(UTC)
+
+
+class SqlRetentionRepository(RetentionRepository):
+    """Delete expired events in keyset-ordered batches on PostgreSQL or SQLite.
+
+    Each batch selects the next ids in (created_at, id) order, seeking past
+    the previous batch, then deletes them by id, all in one short
+    transaction. Stateless, so a single instance can be shared.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        *,
+        write_transaction: Callable[[], AbstractAsyncContextManager[AsyncConnection]] | None = None,
+    ) -> None:
+        """Initialize with an engine.
+
+        Args:
+            engine: SQLAlchemy AsyncEngine whose pool provides connections.
+            write_transaction: Opens the transaction writes run in (defaults
+                to ``engine.begin``); lets a provider serialize writes.
+        """
+        self._engine = engine
+        self._write_transaction = write_transaction or engine.begin
+
+    async def delete_expired(
+        self,
+        older_than: datetime,
+        limit: int,
+        *,
+        event_type: str | None = None,
+        exclude_types: Sequence[str] = (),
+        after: EventKey | None = None,
+    ) -> ExpiredBatch:
+        """Delete the oldest expired events, at most `limit` of them.
+
+        Args:
+            older_than: Delete events created before this instant.
+            limit: Maximum number of events to delete.
+            event_type: Only events of this type (all types when None).
+            exclude_types: Skip events of these types.
+            after: Key of the last event deleted by the previous batch.
+
+        Returns:
+            ExpiredBatch with the count and the key to resume after.
+
+        Raises:
+            Exception: If the delete fails (nothing is deleted).
+        """
+        created_at, event_id = events_table.c.created_at, events_table.c.id
+        stmt = select(event_id, created_at).where(created_at < _as_utc(older_than))
+        if event_type is not None:
+            stmt = stmt.where(events_table.c.type == event_type)
+        if exclude_types:
+            stmt = stmt.where(events_table.c.type.not_in(list(exclude_types)))
+        if after is not None:
+            after_at = _as_utc(after.created_at)
+            stmt = stmt.where(
+                created_at >= after_at, or_(created_at > after_at, event_id > after.id)
+            )
+        stmt = stmt.order_by(created_at, event_id).limit(limit)
+
+        async with self._write_transaction() as conn:
+            rows = (await conn.execute(stmt)).all()
+            if not rows:
+                return ExpiredBatch(deleted=0, last_key=None)
+            await conn.execute(delete(events_table).where(event_id.in_([row.id for row in rows])))
+
+        last = rows[-1]
+        return ExpiredBatch(
+            deleted=len(rows),
+            last_key=EventKey(created_at=_as_utc(last.created_at), id=last.id),
+        )
@@ -0,0 +1,131 @@
+"""Rollup storage with dialect-native upserts."""
+
+from collections.abc import Callable, Sequence
+from contextlib import AbstractAsyncContextManager
+from datetime import UTC, datetime
+
+from sqlalchemy import Insert, select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from src.application.ports.rollup_repository import RollupBucket, RollupQuery, RollupRepository
+from src.infrastructure.postgres.inserts import dialect_insert
+from src.infrastructure.postgres.models.event import event_rollups_table
+
+__all__ = ["SqlRollupRepository"]
+
+_KEY_COLUMNS = (
+    event_rollups_table.c.resolution,
+    event_rollups_table.c.type,
+    event_rollups_table.c.bucket_start,
+)
+
+
+def _build_upsert(dialect_name: str) -> Insert:
+    # INSERT ... ON CONFLICT DO UPDATE has the same shape on both dialects
+    stmt = dialect_insert(dialect_name)(event_rollups_table)
+    return stmt.on_conflict_do_update(
+        index_elements=list(_KEY_COLUMNS),
+        set_={
+            "count": event_rollups_table.c["count"] + stmt.excluded["count"],
+            "total_payload_bytes": (
+                event_rollups_table.c["total_payload_bytes"] + stmt.excluded["total_payload_bytes"]
+            ),
+        },
+    )
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value.astimezone(UTC)
+
+
+class SqlRollupRepository(RollupRepository):
+    """Store rollup buckets on PostgreSQL or SQLite.
+
+    Deltas are applied with INSERT ... ON CONFLICT DO UPDATE, so concurrent
+    workers can add to the same bucket without reading it first. Stateless,
+    so a single instance can be shared by all requests.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        *,
+        write_transaction: Callable[[], AbstractAsyncContextManager[AsyncConnection]] | None = None,
+    ) -> None:
+        """Initialize with an engine.
+
+        Args:
+            engine: SQLAlchemy AsyncEngine whose pool provides connections.
+            write_transaction: Opens the transaction writes run in (defaults
+                to ``engine.begin``); lets a provider serialize writes.
+        """
+        self._engine = engine
+        self._write_transaction = write_transaction or engine.begin
+        self._upsert = _build_upsert(engine.dialect.name)
+
+    async def add(self, buckets: Sequence[RollupBucket]) -> None:
+        """Add counters to the stored buckets in one transaction.
+
+        Rows are written in key order so concurrent flushes lock buckets in
+        the same order and cannot deadlock.
+
+        Args:
+            buckets: Deltas to add.
+
+        Raises:
+            Exception: If the write fails (no delta is applied).
+        """
+        if not buckets:
+            return
+
+        rows = sorted(
+            (
+                {
+                    "resolution": bucket.resolution,
+                    "type": bucket.event_type,
+                    "bucket_start": _as_utc(bucket.bucket_start),
+                    "count": bucket.count,
+                    "total_payload_bytes": bucket.total_payload_bytes,
+                }
+                for bucket in buckets
+            ),
+            key=lambda row: (row["resolution"], row["type"], row["bucket_start"]),
+        )
+        async with self._write_transaction() as conn:
+            await conn.execute(self._upsert, rows)
+
+    async def list_buckets(self, query: RollupQuery) -> list[RollupBucket]:
+        """Return stored buckets matching the query.
+
+        Args:
+            query: Resolution, filters and limit.
+
+        Returns:
+            Buckets ordered by (bucket_start, event_type).
+
+        Raises:
+            Exception: If the read fails.
+        """
+        table = event_rollups_table
+        stmt = select(table).where(table.c.resolution == query.resolution)
+        if query.event_type is not None:
+            stmt = stmt.where(table.c.type == query.event_type)
+        if query.since is not None:
+            stmt = stmt.where(table.c.bucket_start >= _as_utc(query.since))
+        if query.until is not None:
+            stmt = stmt.where(table.c.bucket_start < _as_utc(query.until))
+        stmt = stmt.order_by(table.c.bucket_start, table.c.type).limit(query.limit)
+
+        async with self._engine.connect() as conn:
+            result = await conn.execute(stmt)
+            # Mappings, since Row.count is the tuple method
+            return [
+                RollupBucket(
+                    resolution=query.resolution,
+                    event_type=row["type"],
+                    bucket_start=_as_utc(row["bucket_start"]),
+                    count=row["count"],
+                    total_payload_bytes=row["total_payload_bytes"],
+                )
+                for row in result.mappings()
+            ]
@@ -0,0 +1,174 @@
+"""Schema upgrades of existing tables, and the fingerprint of the current schema."""
+
+import hashlib
+import logging
+from datetime import UTC, datetime
+
+from sqlalchemy import (
+    Column,
+    Connection,
+    DateTime,
+    MetaData,
+    String,
+    Table,
+    delete,
+    insert,
+    inspect,
+    select,
+    text,
+)
+from sqlalchemy.engine import Dialect
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from src.infrastructure.postgres.models.event import MAX_IDEMPOTENCY_KEY_LENGTH, events_table
+
+__all__ = [
+    "migrate_schema",
+    "read_schema_fingerprint",
+    "schema_fingerprint",
+    "schema_fingerprint_table",
+    "write_schema_fingerprint",
+]
+
+logger = logging.getLogger(__name__)
+
+_TABLE = events_table.name
+_ADD_IDEMPOTENCY_KEY = text(
+    f"ALTER TABLE {_TABLE} ADD COLUMN idempotency_key VARCHAR({MAX_IDEMPOTENCY_KEY_LENGTH})"
+)
+# (name, DDL): same names as the model's index and the partitioned table's index
+_IDEMPOTENCY_INDEX = (
+    f"uq_{_TABLE}_idempotency_key",
+    f"CREATE UNIQUE INDEX IF NOT EXISTS uq_{_TABLE}_idempotency_key ON {_TABLE} (idempotency_key)",
+)
+_PARTITIONED_IDEMPOTENCY_INDEX = (
+    f"uq_{_TABLE}_idempotency_key_created_at",
+    f"CREATE UNIQUE INDEX IF NOT EXISTS uq_{_TABLE}_idempotency_key_created_at"
+    f" ON {_TABLE} (idempotency_key, created_at)",
+)
+# Non-unique index of earlier partitioned tables, replaced by the one above
+_DROP_PARTITIONED_KEY_INDEX = (
+    f"ix_{_TABLE}_idempotency_key",
+    f"DROP INDEX IF EXISTS ix_{_TABLE}_idempotency_key",
+)
+_MIGRATIONS = (
+    str(_ADD_IDEMPOTENCY_KEY),
+    _IDEMPOTENCY_INDEX[1],
+    _PARTITIONED_IDEMPOTENCY_INDEX[1],
+    _DROP_PARTITIONED_KEY_INDEX[1],
+)
+_TABLE_KIND = text("SELECT c.relkind FROM pg_class c WHERE c.oid = to_regclass(:name)")
+
+# Kept out of the models' metadata, so it is not part of the fingerprint itself
+_metadata = MetaData()
+
+schema_fingerprint_table = Table(
+    "schema_fingerprint",
+    _metadata,
+    Column("fingerprint", String(64), primary_key=True),
+    Column("applied_at", DateTime(timezone=True), nullable=False),
+)
+
+
+def schema_fingerprint(metadata: MetaData, dialect: Dialect) -> str:
+    """Hash the DDL that creates the tables and indexes of a metadata.
+
+    Compiling the DDL is local and fast, unlike create_all, which queries
+    the catalog for every table and index. Any change to a table, column,
+    type, default or index, or to the migrations of migrate_schema, changes
+    the fingerprint.
+
+    Args:
+        metadata: Tables to fingerprint.
+        dialect: Dialect the DDL is compiled for.
+
+    Returns:
+        Hex SHA-256 digest.
+    """
+    digest = hashlib.sha256()
+    for table in metadata.sorted_tables:
+        digest.update(str(CreateTable(table).compile(dialect=dialect)).encode())
+        for index in sorted(table.indexes, key=lambda index: index.name or ""):
+            digest.update(str(CreateIndex(index).compile(dialect=dialect)).encode())
+    for migration in _MIGRATIONS:
+        digest.update(migration.encode())
+    return digest.hexdigest()
+
+
+def migrate_schema(conn: Connection) -> list[str]:
+    """Bring tables created by earlier versions up to the models.
+
+    create_all creates missing tables but never alters existing ones, so
+    columns and indexes added to an existing table are added here. Every
+    step checks the catalog first and can run any number of times.
+
+    Args:
+        conn: Synchronous connection, in the transaction creating the schema
+            (run through ``AsyncConnection.run_sync``).
+
+    Returns:
+        Descriptions of the steps applied (empty when the schema was current).
+    """
+    inspector = inspect(conn)
+    if not inspector.has_table(_TABLE):
+        return []
+
+    applied = []
+    if "idempotency_key" not in {column["name"] for column in inspector.get_columns(_TABLE)}:
+        conn.execute(_ADD_IDEMPOTENCY_KEY)
+        applied.append(f"added column {_TABLE}.idempotency_key")
+
+    # Unique indexes of a partitioned table must include the partition key
+    partitioned = (
+        conn.dialect.name == "postgresql" and conn.scalar(_TABLE_KIND, {"name": _TABLE}) == "p"
+    )
+    indexes = {index["name"] for index in inspector.get_indexes(_TABLE)}
+    name, ddl = _PARTITIONED_IDEMPOTENCY_INDEX if partitioned else _IDEMPOTENCY_INDEX
+    if name not in indexes:
+        conn.execute(text(ddl))
+        applied.append(f"created index {name}")
+    old_name, drop = _DROP_PARTITIONED_KEY_INDEX
+    if partitioned and old_name in indexes:
+        conn.execute(text(drop))
+        applied.append(f"dropped index {old_name}")
+    for step in applied:
+        logger.info("Schema migrated: %s", step)
+    return applied
+
+
+async def read_schema_fingerprint(engine: AsyncEngine) -> str | None:
+    """Return the fingerprint stored in the database.
+
+    Args:
+        engine: SQLAlchemy AsyncEngine to query.
+
+    Returns:
+        The stored fingerprint, or None if none is stored yet.
+    """
+    try:
+        async with engine.connect() as conn:
+            fingerprint: str | None = await conn.scalar(
+                select(schema_fingerprint_table.c.fingerprint)
+            )
+            return fingerprint
+    except DBAPIError:
+        # No fingerprint table yet (first start)
+        return None
+
+
+async def write_schema_fingerprint(conn: AsyncConnection, fingerprint: str) -> None:
+    """Store the fingerprint of the schema just created, replacing the previous one.
+
+    Args:
+        conn: Connection in the transaction that created the schema.
+        fingerprint: Fingerprint to store.
+    """
+    await conn.run_sync(_metadata.create_all)
+    await conn.execute(delete(schema_fingerprint_table))
+    await conn.execute(
+        insert(schema_fingerprint_table).values(
+            fingerprint=fingerprint, applied_at=datetime.now(UTC)
+        )
+    )
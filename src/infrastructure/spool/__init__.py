@@ -0,0 +1 @@
+"""Local durable spool for events the database cannot take."""
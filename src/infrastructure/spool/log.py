@@ -0,0 +1,407 @@
+"""Append-only, length-prefixed segment log with batched fsync."""
+
+import asyncio
+import errno
+import fcntl
+import logging
+import os
+import struct
+import sys
+import uuid
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+from typing import BinaryIO, Final
+
+__all__ = ["SpoolLog", "SpoolPosition"]
+
+logger = logging.getLogger(__name__)
+
+# Record frame: payload length and CRC32 (big-endian), then the payload
+_HEADER: Final = struct.Struct(">II")
+_SEGMENT_SUFFIX: Final = ".seg"
+_CHECKPOINT_FILE: Final = "checkpoint"
+_ID_FILE: Final = "spool.id"
+_LOCK_FILE: Final = "lock"
+_WORKER_PREFIX: Final = "worker-"
+
+
+@dataclass(frozen=True, order=True)
+class SpoolPosition:
+    """Location of a record in the log.
+
+    Attributes:
+        segment: Segment number.
+        offset: Byte offset within the segment.
+    """
+
+    segment: int
+    offset: int
+
+
+def _segment_path(directory: Path, segment: int) -> Path:
+    return directory / f"{segment:020d}{_SEGMENT_SUFFIX}"
+
+
+def _list_segments(directory: Path) -> list[int]:
+    return sorted(
+        int(path.stem) for path in directory.glob(f"*{_SEGMENT_SUFFIX}") if path.stem.isdigit()
+    )
+
+
+def _scan(
+    file: BinaryIO, start: int, limit: int, max_records: int
+) -> tuple[list[tuple[int, bytes]], int]:
+    """Decode up to max_records complete, valid records between start and limit.
+
+    Only the frames decoded are read from the file. Returns them and where
+    they end.
+    """
+    records: list[tuple[int, bytes]] = []
+    offset = start
+    file.seek(start)
+    while len(records) < max_records and offset + _HEADER.size <= limit:
+        length, crc = _HEADER.unpack(file.read(_HEADER.size))
+        end = offset + _HEADER.size + length
+        if end > limit:
+            break
+        payload = file.read(length)
+        if zlib.crc32(payload) != crc:
+            break
+        records.append((offset, payload))
+        offset = end
+    return records, offset
+
+
+def _fsync_directory(directory: Path) -> None:
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class SpoolLog:
+    """Durable local log of opaque records, split into numbered segments.
+
+    Appends write whole frames with os.write on the event loop thread (a
+    page-cache copy) and then wait for an fsync. Concurrent appends share
+    fsyncs: one fsync at a time runs in a worker thread and covers
+    everything written before it started, so appends arriving meanwhile
+    are covered together by the next one. ``fsync_interval_seconds`` adds
+    a wait before each fsync to gather more appends.
+
+    A checkpoint file records the position up to which records have been
+    consumed; it is replaced atomically, and fully consumed segments are
+    deleted. A torn record at the end of the newest segment, left by a
+    crash mid-write, is truncated on open.
+
+    A directory is used by one process at a time: opening takes an
+    exclusive lock on it. With ``worker_slots`` above one (one per server
+    worker), each process takes the first free directory among the given
+    one and its ``worker-1`` ... ``worker-<slots - 1>`` subdirectories, so
+    workers never share segments, checkpoints or spool ids. Opening fails
+    if every directory is locked.
+
+    Use as an async context manager.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        segment_bytes: int,
+        fsync_interval_seconds: float,
+        worker_slots: int = 1,
+    ):
+        """Initialize the log (nothing is opened until entered).
+
+        Args:
+            directory: Directory holding segments and the checkpoint.
+            segment_bytes: Start a new segment once the current one is this large.
+            fsync_interval_seconds: How long an append waits to share an fsync.
+            worker_slots: Processes that may spool under directory at once.
+        """
+        self._root = Path(directory)
+        self._directory = self._root
+        self._worker_slots = max(1, worker_slots)
+        self._segment_bytes = segment_bytes
+        self._fsync_interval_seconds = fsync_interval_seconds
+        self._id = ""
+        self._lock_fd = -1
+        self._fd = -1
+        self._segment = 0
+        self._size = 0
+        self._checkpoint = SpoolPosition(0, 0)
+        self._retired_fds: list[int] = []
+        self._new_segment = False
+        self._written = 0
+        self._synced = 0
+        self._sync_task: asyncio.Task[None] | None = None
+
+    @property
+    def directory(self) -> Path:
+        """Directory taken by this process (known once entered)."""
+        return self._directory
+
+    @property
+    def spool_id(self) -> str:
+        """Random identifier of this spool directory, stable across restarts."""
+        return self._id
+
+    @property
+    def checkpoint(self) -> SpoolPosition:
+        """Position up to which records have been consumed."""
+        return self._checkpoint
+
+    @property
+    def end(self) -> SpoolPosition:
+        """Position after the last appended record."""
+        return SpoolPosition(self._segment, self._size)
+
+    def has_backlog(self) -> bool:
+        """Return whether appended records have not been consumed yet."""
+        return self._checkpoint < self.end
+
+    async def __aenter__(self) -> "SpoolLog":
+        await asyncio.to_thread(self._open)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if self._sync_task is not None:
+            await asyncio.shield(self._sync_task)
+        await asyncio.to_thread(self._sync_and_close)
+
+    def _open(self) -> None:
+        self._directory, self._lock_fd = self._claim_directory()
+        try:
+            self._open_segments()
+        except BaseException:
+            os.close(self._lock_fd)
+            self._lock_fd = -1
+            raise
+
+    def _open_segments(self) -> None:
+        id_path = self._directory / _ID_FILE
+        if not id_path.exists():
+            id_path.write_text(uuid.uuid4().hex)
+        self._id = id_path.read_text().strip()
+
+        segments = _list_segments(self._directory)
+        self._checkpoint = self._read_checkpoint(segments)
+        if segments:
+            self._segment = segments[-1]
+            self._size = self._recover_tail(_segment_path(self._directory, self._segment))
+        else:
+            self._segment = self._checkpoint.segment
+            self._size = 0
+            self._new_segment = True
+        self._fd = os.open(
+            _segment_path(self._directory, self._segment),
+            os.O_WRONLY | os.O_CREAT | os.O_APPEND,
+            0o644,
+        )
+        logger.info(
+            "Spool opened: dir=%s, segments=%s, checkpoint=%s, end=%s",
+            self._directory,
+            len(segments),
+            self._checkpoint,
+            self.end,
+        )
+
+    def _claim_directory(self) -> tuple[Path, int]:
+        candidates = [self._root] + [
+            self._root / f"{_WORKER_PREFIX}{slot}" for slot in range(1, self._worker_slots)
+        ]
+        for directory in candidates:
+            directory.mkdir(parents=True, exist_ok=True)
+            fd = os.open(directory / _LOCK_FILE, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                os.close(fd)
+                continue
+            if directory == self._root:
+                self._warn_unclaimed()
+            return directory, fd
+        raise RuntimeError(
+            f"Spool directory {self._root} is locked by other processes "
+            f"(directories={len(candidates)}); use one spool per worker"
+        )
+
+    def _warn_unclaimed(self) -> None:
+        # Left by a run with more workers: no process takes them any more
+        for directory in self._root.glob(f"{_WORKER_PREFIX}*"):
+            slot = directory.name.removeprefix(_WORKER_PREFIX)
+            if slot.isdigit() and int(slot) >= self._worker_slots and _list_segments(directory):
+                logger.warning(
+                    "Spool directory %s is not replayed with %s worker(s); raise SERVER_WORKERS to drain it",
+                    directory,
+                    self._worker_slots,
+                )
+
+    def _read_checkpoint(self, segments: list[int]) -> SpoolPosition:
+        path = self._directory / _CHECKPOINT_FILE
+        if path.exists():
+            segment, offset = (int(part) for part in path.read_text().split())
+            return SpoolPosition(segment, offset)
+        return SpoolPosition(segments[0] if segments else 0, 0)
+
+    @staticmethod
+    def _recover_tail(path: Path) -> int:
+        with path.open("r+b") as file:
+            size = os.fstat(file.fileno()).st_size
+            _, valid_end = _scan(file, 0, size, sys.maxsize)
+            if valid_end < size:
+                logger.warning(
+                    "Spool truncating torn tail: %s, bytes=%s", path.name, size - valid_end
+                )
+                file.truncate(valid_end)
+                os.fsync(file.fileno())
+        return valid_end
+
+    async def append(self, payloads: list[bytes]) -> SpoolPosition:
+        """Append records and wait until they are fsynced.
+
+        Args:
+            payloads: Record payloads, appended in order.
+
+        Returns:
+            Position after the last appended record.
+
+        Raises:
+            OSError: If writing or syncing fails.
+        """
+        data = b"".join(_HEADER.pack(len(p), zlib.crc32(p)) + p for p in payloads)
+        if self._size and self._size + len(data) > self._segment_bytes:
+            self._rotate()
+        if os.write(self._fd, data) != len(data):
+            os.ftruncate(self._fd, self._size)
+            raise OSError(errno.ENOSPC, "Short write to spool segment")
+        self._size += len(data)
+        self._written += 1
+        end = self.end
+
+        target = self._written
+        while self._synced < target:
+            if self._sync_task is None:
+                self._sync_task = asyncio.create_task(self._sync())
+            await asyncio.shield(self._sync_task)
+        return end
+
+    def _rotate(self) -> None:
+        # The old descriptor is fsynced and closed by the next sync
+        self._retired_fds.append(self._fd)
+        self._segment += 1
+        self._size = 0
+        self._fd = os.open(
+            _segment_path(self._directory, self._segment),
+            os.O_WRONLY | os.O_CREAT | os.O_APPEND,
+            0o644,
+        )
+        self._new_segment = True
+
+    async def _sync(self) -> None:
+        try:
+            if self._fsync_interval_seconds > 0:
+                await asyncio.sleep(self._fsync_interval_seconds)
+            written = self._written
+            retired, self._retired_fds = self._retired_fds, []
+            new_segment, self._new_segment = self._new_segment, False
+            await asyncio.to_thread(self._fsync, self._fd, retired, new_segment)
+            self._synced = written
+        finally:
+            self._sync_task = None
+
+    def _fsync(self, fd: int, retired: list[int], new_segment: bool) -> None:
+        for old_fd in retired:
+            os.fsync(old_fd)
+            os.close(old_fd)
+        os.fsync(fd)
+        if new_segment:
+            _fsync_directory(self._directory)
+
+    def _sync_and_close(self) -> None:
+        if self._fd >= 0:
+            self._fsync(self._fd, self._retired_fds, self._new_segment)
+            self._retired_fds = []
+            os.close(self._fd)
+            self._fd = -1
+        if self._lock_fd >= 0:
+            # Closing the descriptor releases the lock
+            os.close(self._lock_fd)
+            self._lock_fd = -1
+
+    async def read(
+        self, start: SpoolPosition, max_records: int
+    ) -> tuple[list[tuple[SpoolPosition, bytes]], SpoolPosition]:
+        """Read records from a position.
+
+        Args:
+            start: Position to read from (e.g. the checkpoint).
+            max_records: Maximum number of records.
+
+        Returns:
+            (position, payload) pairs, and the position to resume from.
+        """
+        return await asyncio.to_thread(self._read, start, max_records, self.end)
+
+    def _read(
+        self, start: SpoolPosition, max_records: int, end: SpoolPosition
+    ) -> tuple[list[tuple[SpoolPosition, bytes]], SpoolPosition]:
+        records: list[tuple[SpoolPosition, bytes]] = []
+        position = start
+        while position < end and len(records) < max_records:
+            path = _segment_path(self._directory, position.segment)
+            found: list[tuple[int, bytes]] = []
+            stop = size = position.offset
+            if path.exists():
+                with path.open("rb") as file:
+                    size = os.fstat(file.fileno()).st_size
+                    limit = end.offset if position.segment == end.segment else size
+                    found, stop = _scan(file, position.offset, limit, max_records - len(records))
+            records.extend(
+                (SpoolPosition(position.segment, offset), payload) for offset, payload in found
+            )
+            # A batch ending exactly with a finished segment resumes at the next one
+            if position.segment == end.segment or (len(records) == max_records and stop < size):
+                position = SpoolPosition(position.segment, stop)
+                break
+            if stop < size:
+                logger.error(
+                    "Spool segment %s is corrupt at offset %s; skipping %s bytes",
+                    path.name,
+                    stop,
+                    size - stop,
+                )
+            position = SpoolPosition(position.segment + 1, 0)
+        return records, position
+
+    async def commit(self, position: SpoolPosition) -> None:
+        """Record records before position as consumed and drop finished segments.
+
+        Args:
+            position: Position returned by read().
+        """
+        await asyncio.to_thread(self._commit, position)
+        self._checkpoint = position
+
+    def _commit(self, position: SpoolPosition) -> None:
+        path = self._directory / _CHECKPOINT_FILE
+        tmp = path.with_suffix(".tmp")
+        with tmp.open("w") as file:
+            file.write(f"{position.segment} {position.offset}\n")
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp, path)
+        _fsync_directory(self._directory)
+
+        for segment in _list_segments(self._directory):
+            if segment >= position.segment:
+                break
+            _segment_path(self._directory, segment).unlink()
@@ -0,0 +1,82 @@
+"""Event repository that falls back to the local spool."""
+
+import logging
+from collections.abc import Sequence
+from typing import Final
+
+from sqlalchemy import exc as sa_exc
+
+from src.application.ports.event_repository import EventRepository
+from src.core.event import DomainEvent
+from src.infrastructure.spool.spool import EventSpool
+
+__all__ = ["SpoolingEventRepository"]
+
+logger = logging.getLogger(__name__)
+
+# Errors meaning the database could not be reached in time, as opposed to
+# errors about the write itself (constraint violations, bad data)
+UNAVAILABLE_ERRORS: Final[tuple[type[BaseException], ...]] = (
+    TimeoutError,
+    OSError,
+    sa_exc.TimeoutError,
+    sa_exc.OperationalError,
+    sa_exc.InterfaceError,
+)
+
+
+class SpoolingEventRepository(EventRepository):
+    """EventRepository decorator that spools writes the database cannot take.
+
+    While the spool holds a backlog, writes go straight to it so events
+    keep their arrival order. Otherwise they go to the inner repository,
+    and are spooled instead if it fails because the database is
+    unavailable. Either way the caller is answered once the events are
+    durable.
+    """
+
+    def __init__(self, inner: EventRepository, spool: EventSpool) -> None:
+        """Initialize with the repository to decorate.
+
+        Args:
+            inner: Repository used while the database is healthy.
+            spool: Spool taking writes the database cannot.
+        """
+        self._inner = inner
+        self._spool = spool
+
+    async def save(self, event: DomainEvent, *, returning: bool = True) -> object:
+        """Persist an event, or spool it.
+
+        Args:
+            event: Domain event to persist.
+            returning: Passed through to the inner repository.
+
+        Returns:
+            Whatever the inner repository returned, or True when spooled
+            (duplicates are skipped when the spool is replayed).
+        """
+        if not self._spool.active:
+            try:
+                return await self._inner.save(event, returning=returning)
+            except UNAVAILABLE_ERRORS as exc:
+                logger.warning("Database unavailable, spooling event: %r", exc)
+        await self._spool.append((event,))
+        return True
+
+    async def save_many(self, events: Sequence[DomainEvent]) -> list[bool]:
+        """Persist events in one transaction, or spool them together.
+
+        Args:
+            events: Domain events to persist.
+
+        Returns:
+            Whatever the inner repository returned, or all True when spooled.
+        """
+        if not self._spool.active:
+            try:
+                return await self._inner.save_many(events)
+            except UNAVAILABLE_ERRORS as exc:
+                logger.warning("Database unavailable, spooling %s events: %r", len(events), exc)
+        await self._spool.append(events)
+        return [True] * len(events)
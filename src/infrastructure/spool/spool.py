@@ -0,0 +1,182 @@
+"""Local event spool and its background replayer."""
+
+import asyncio
+import json
+import logging
+from collections.abc import Callable, Sequence
+from contextlib import AbstractAsyncContextManager, suppress
+from datetime import datetime
+from types import TracebackType
+
+from src.application.ports.event_repository import EventRepository
+from src.core.event import DomainEvent
+from src.infrastructure.spool.log import SpoolLog, SpoolPosition
+
+__all__ = ["EventSpool"]
+
+logger = logging.getLogger(__name__)
+
+RepositoryFactory = Callable[[], AbstractAsyncContextManager[EventRepository]]
+
+
+def _encode(event: DomainEvent) -> bytes:
+    return json.dumps(
+        {
+            "t": event.event_type,
+            "p": event.event_payload,
+            "c": event.created_at.isoformat(),
+            "k": event.idempotency_key,
+        },
+        separators=(",", ":"),
+    ).encode()
+
+
+class EventSpool:
+    """Durably accept events while the database is unavailable.
+
+    Spooled events are appended to a local SpoolLog and acknowledged once
+    fsynced. A background replayer drains the log into the database in
+    batches of ``replay_batch_size`` (one transaction each) and checkpoints
+    the log after every committed batch, retrying every
+    ``retry_interval_seconds`` while the database keeps failing.
+
+    Events spooled without an idempotency key are replayed under one
+    derived from their log position, so a batch replayed again after a
+    crash between commit and checkpoint is skipped by the database's
+    unique key instead of being duplicated.
+
+    Use as an async context manager: entering opens the log and resumes any
+    backlog left by a previous run, exiting stops the replayer (the
+    remaining backlog stays on disk).
+    """
+
+    def __init__(
+        self,
+        log: SpoolLog,
+        repository_factory: RepositoryFactory,
+        replay_batch_size: int,
+        retry_interval_seconds: float,
+    ) -> None:
+        """Initialize the spool.
+
+        Args:
+            log: Log holding spooled events.
+            repository_factory: Opens a repository for one replayed batch.
+            replay_batch_size: Events per replay transaction.
+            retry_interval_seconds: Wait before retrying a failed replay.
+        """
+        self._log = log
+        self._repository_factory = repository_factory
+        self._replay_batch_size = max(1, replay_batch_size)
+        self._retry_interval_seconds = retry_interval_seconds
+        self._has_backlog = asyncio.Event()
+        self._stopping = asyncio.Event()
+        self._worker: asyncio.Task[None] | None = None
+        self._spooled = 0
+        self._replayed = 0
+
+    @property
+    def active(self) -> bool:
+        """True while spooled events wait for replay.
+
+        New writes should then be spooled too, so they reach the database
+        after the events accepted before them.
+        """
+        return self._log.has_backlog()
+
+    @property
+    def spooled(self) -> int:
+        """Events spooled since startup."""
+        return self._spooled
+
+    @property
+    def replayed(self) -> int:
+        """Events replayed into the database since startup."""
+        return self._replayed
+
+    async def __aenter__(self) -> "EventSpool":
+        await self._log.__aenter__()
+        if self._log.has_backlog():
+            logger.warning("Spool has a backlog from a previous run: from=%s", self._log.checkpoint)
+            self._has_backlog.set()
+        self._worker = asyncio.create_task(self._run(), name="spool-replay")
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self._stopping.set()
+        self._has_backlog.set()
+        if self._worker is not None:
+            await self._worker
+            self._worker = None
+        await self._log.__aexit__(exc_type, exc, tb)
+
+    async def append(self, events: Sequence[DomainEvent]) -> None:
+        """Spool events and wait until they are on disk.
+
+        Args:
+            events: Domain events to spool, in order.
+
+        Raises:
+            OSError: If the spool cannot be written.
+        """
+        if not events:
+            return
+        await self._log.append([_encode(event) for event in events])
+        self._spooled += len(events)
+        self._has_backlog.set()
+
+    async def replay_once(self) -> int:
+        """Replay one batch from the checkpoint and advance it.
+
+        Returns:
+            Number of events replayed.
+
+        Raises:
+            Exception: Whatever the repository raised (the checkpoint is kept).
+        """
+        start = self._log.checkpoint
+        records, next_position = await self._log.read(start, self._replay_batch_size)
+        events = [self._decode(position, payload) for position, payload in records]
+        if events:
+            async with self._repository_factory() as repo:
+                await repo.save_many(events)
+        if next_position != start:
+            await self._log.commit(next_position)
+        self._replayed += len(events)
+        return len(events)
+
+    def _decode(self, position: SpoolPosition, payload: bytes) -> DomainEvent:
+        record = json.loads(payload)
+        return DomainEvent(
+            event_type=record["t"],
+            event_payload=record["p"],
+            created_at=datetime.fromisoformat(record["c"]),
+            idempotency_key=record["k"]
+            or f"spool:{self._log.spool_id}:{position.segment}:{position.offset}",
+        )
+
+    async def _run(self) -> None:
+        while True:
+            await self._has_backlog.wait()
+            if self._stopping.is_set():
+                return
+
+            try:
+                replayed = await self.replay_once()
+            except Exception as exc:
+                logger.warning(
+                    "Spool replay failed, retrying in %ss: %s", self._retry_interval_seconds, exc
+                )
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(self._stopping.wait(), self._retry_interval_seconds)
+                continue
+
+            if replayed:
+                logger.info("Spool replayed: events=%s, backlog=%s", replayed, self.active)
+            if not self._stopping.is_set() and (not replayed or not self._log.has_backlog()):
+                self._has_backlog.clear()
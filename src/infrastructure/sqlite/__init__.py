@@ -0,0 +1 @@
+"""SQLite persistence adapters."""
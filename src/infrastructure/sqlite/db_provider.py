@@ -0,0 +1,117 @@
+"""SQLite database provider tuned for concurrent ingestion."""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from src.application.group_commit import GroupCommitEventRepository, GroupCommitter
+from src.application.ports.event_repository import EventRepository
+from src.application.stage_timing import stage
+from src.infrastructure.config.settings import DatabaseSettings
+from src.infrastructure.postgres.db_provider import SqlAlchemyDbProvider
+from src.infrastructure.postgres.event_repository import PostgresEventRepository
+from src.infrastructure.postgres.retention_repository import SqlRetentionRepository
+from src.infrastructure.postgres.rollup_repository import SqlRollupRepository
+
+__all__ = ["SqliteDbProvider"]
+
+logger = logging.getLogger(__name__)
+
+
+class SqliteDbProvider(SqlAlchemyDbProvider):
+    """SQLite provider with WAL, tuned pragmas and a single writer.
+
+    Every pooled connection is configured on connect (WAL journal,
+    synchronous=NORMAL, mmap and page cache sizes, busy timeout). All
+    runtime writes use one dedicated writer connection, one transaction at
+    a time, so writers never compete for the database lock: event writes
+    are queued and committed in batches, and rollup upserts and retention
+    deletes wait for their turn. Reads use the other pooled connections
+    and, thanks to WAL, never block the writer.
+
+    Event writes always use the ORM repository on the writer connection;
+    EVENT_REPOSITORY=core, which checks out a pooled connection per write,
+    is not supported and is ignored with a warning.
+    """
+
+    def __init__(self, database_uri: str, settings: DatabaseSettings | None = None) -> None:
+        super().__init__(database_uri, settings)
+        event.listen(self._engine.sync_engine, "connect", self._configure_connection)
+        if self._settings.repository != "orm":
+            logger.warning(
+                "EVENT_REPOSITORY=%s is not supported on SQLite; events are written by the single writer",
+                self._settings.repository,
+            )
+        self._writer_conn: AsyncConnection | None = None
+        self._writer_lock = asyncio.Lock()
+        self._rollup_repository = SqlRollupRepository(
+            self._engine, write_transaction=self._writer_transaction
+        )
+        self._retention_repository = SqlRetentionRepository(
+            self._engine, write_transaction=self._writer_transaction
+        )
+        self._writer = GroupCommitter(
+            repository_factory=self._writer_repository,
+            linger_seconds=self._settings.sqlite_writer_linger_ms / 1000,
+            max_batch_size=self._settings.sqlite_writer_max_batch,
+        )
+
+    def _configure_connection(self, dbapi_connection: Any, connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute(f"PRAGMA mmap_size={int(self._settings.sqlite_mmap_size)}")
+            cursor.execute(f"PRAGMA cache_size={int(self._settings.sqlite_cache_size)}")
+            cursor.execute(f"PRAGMA busy_timeout={int(self._settings.sqlite_busy_timeout_ms)}")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+        finally:
+            cursor.close()
+
+    async def __aenter__(self) -> "SqliteDbProvider":
+        await super().__aenter__()
+        self._writer_conn = await self._engine.connect()
+        await self._writer.__aenter__()
+        logger.info("SQLite writer started")
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: BaseException | None,
+    ) -> None:
+        await self._writer.drain()
+        if self._writer_conn is not None:
+            await self._writer_conn.close()
+            self._writer_conn = None
+        await super().__aexit__(exc_type, exc, tb)
+
+    @asynccontextmanager
+    async def _writer_repository(self) -> AsyncIterator[EventRepository]:
+        async with self._writer_lock:
+            if self._writer_conn is None:
+                raise RuntimeError("SQLite writer is not running")
+            with stage("session"):
+                session = AsyncSession(bind=self._writer_conn, expire_on_commit=False)
+            try:
+                yield PostgresEventRepository(session)
+            finally:
+                await session.close()
+
+    @asynccontextmanager
+    async def _writer_transaction(self) -> AsyncIterator[AsyncConnection]:
+        async with self._writer_lock:
+            if self._writer_conn is None:
+                raise RuntimeError("SQLite writer is not running")
+            async with self._writer_conn.begin():
+                yield self._writer_conn
+
+    @asynccontextmanager
+    async def event_repository(self) -> AsyncIterator[EventRepository]:
+        yield GroupCommitEventRepository(self._writer)
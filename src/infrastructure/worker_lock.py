@@ -0,0 +1,71 @@
+"""Host-wide lock electing the worker that runs database-wide background jobs."""
+
+import fcntl
+import hashlib
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+__all__ = ["WorkerLock", "maintenance_lock_path"]
+
+logger = logging.getLogger(__name__)
+
+
+def maintenance_lock_path(database_uri: str) -> Path:
+    """Return the lock file shared by every worker using the same database.
+
+    Args:
+        database_uri: Database URL (hashed into the file name).
+
+    Returns:
+        Path in the system temporary directory.
+    """
+    digest = hashlib.sha256(database_uri.encode()).hexdigest()[:16]
+    return Path(tempfile.gettempdir()) / f"event-consumer-maintenance-{digest}.lock"
+
+
+class WorkerLock:
+    """Exclusive, non-blocking lock on a file, held by one process at a time.
+
+    The operating system releases the lock when the holder exits, so a
+    worker restarted by the server can take over from one that died.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the lock (not acquired yet).
+
+        Args:
+            path: Lock file, created if missing.
+        """
+        self._path = path
+        self._fd = -1
+
+    @property
+    def held(self) -> bool:
+        """True while this process holds the lock."""
+        return self._fd >= 0
+
+    def acquire(self) -> bool:
+        """Try to take the lock without waiting.
+
+        Returns:
+            True if this process now holds the lock, False if another does.
+        """
+        if self.held:
+            return True
+        fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+        self._fd = fd
+        logger.info("Worker lock acquired: path=%s, pid=%d", self._path, os.getpid())
+        return True
+
+    def release(self) -> None:
+        """Release the lock if held."""
+        if self.held:
+            os.close(self._fd)
+            self._fd = -1
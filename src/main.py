@@ -1,25 +1,144 @@
 """Application entrypoint."""
 
+import asyncio
 import logging
+from dataclasses import replace
+from typing import TYPE_CHECKING
 
-import src.infrastructure.logging  # noqa: F401
 from src.application.ports.http_server import HttpServer
-from src.infrastructure.config.settings import load_params
-from src.infrastructure.postgres.db_provider import SqlAlchemyDbProvider
-from src.presentation.fastapi.server import start_fast_api_server
+from src.infrastructure.config.settings import (
+    DatabaseSettings,
+    load_app_settings,
+    load_database_settings,
+    load_logging_settings,
+    load_params,
+    load_server_settings,
+    split_pool_budget,
+)
+from src.infrastructure.logging.logger import configure_logs
+from src.infrastructure.metrics.worker_files import WorkerMetricsFiles
+from src.infrastructure.worker_lock import WorkerLock, maintenance_lock_path
+from src.presentation.fastapi.runner import start_fast_api_server
 
-__all__ = ["main"]
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+
+    from src.application.ports.db_provider import DbProvider
+
+__all__ = ["create_application", "create_db_provider", "main", "prepare_database"]
 
 logger = logging.getLogger(__name__)
 
+APP_FACTORY = "src.main:create_application"
+
+
+def create_db_provider(database_uri: str, settings: DatabaseSettings) -> "DbProvider":
+    """Select the database provider for the configured backend.
+
+    Only the selected backend's driver is imported.
+
+    Args:
+        database_uri: Database URL (ignored by the memory backend).
+        settings: Database provider settings.
+
+    Returns:
+        Provider for the memory backend, SQLite or PostgreSQL.
+    """
+    if settings.backend == "memory":
+        from src.infrastructure.memory.db_provider import MemoryDbProvider
+
+        logger.info("Storing events in memory (DB_BACKEND=memory)")
+        return MemoryDbProvider(settings=settings)
+    if database_uri.startswith("sqlite"):
+        from src.infrastructure.sqlite.db_provider import SqliteDbProvider
+
+        return SqliteDbProvider(database_uri=database_uri, settings=settings)
+    from src.infrastructure.postgres.db_provider import SqlAlchemyDbProvider
+
+    return SqlAlchemyDbProvider(database_uri=database_uri, settings=settings)
+
+
+def prepare_database(database_uri: str, settings: DatabaseSettings) -> None:
+    """Create and migrate the schema once, before the server workers start.
+
+    Workers starting together would otherwise all create the tables and
+    store the schema fingerprint at the same time. Once this has run, each
+    worker finds the fingerprint current and skips the step.
+
+    Args:
+        database_uri: Database URL.
+        settings: Database provider settings.
+    """
+
+    async def prepare() -> None:
+        async with create_db_provider(database_uri, replace(settings, pool_min_size=0)):
+            pass
+
+    asyncio.run(prepare())
+
+
+def create_application() -> "FastAPI":
+    """Build the application from the environment.
+
+    Called by every server worker: each worker opens its own database
+    provider, with its share of the DB_MAX_CONNECTIONS budget, and takes
+    its own spool directory. With several workers sharing a database, only
+    the worker holding the maintenance lock runs the retention job and
+    partition maintenance. FastAPI and
+    the routes are imported here rather than at module level, so that the
+    process supervising the workers never loads them.
+
+    Returns:
+        Configured FastAPI application instance.
+    """
+    from src.presentation.fastapi.server import create_app
+
+    configure_logs(load_logging_settings())
+    database_uri, _ = load_params()
+    server = load_server_settings()
+    db_settings = split_pool_budget(
+        load_database_settings(), server.workers, server.db_max_connections
+    )
+    settings = load_app_settings()
+    settings = replace(settings, spool=replace(settings.spool, worker_slots=server.workers))
+    lock = None
+    if server.workers > 1 and db_settings.backend != "memory":
+        lock = WorkerLock(maintenance_lock_path(database_uri))
+        if not lock.acquire():
+            logger.info("Retention and partition maintenance run in another worker")
+            db_settings = replace(db_settings, partition_maintenance=False)
+            settings = replace(settings, retention=replace(settings.retention, enabled=False))
+    app = create_app(db_provider=create_db_provider(database_uri, db_settings), settings=settings)
+    # Held for the worker's lifetime; the lock is released when it exits
+    app.state.maintenance_lock = lock
+    return app
+
 
 def main() -> None:
     """Start the Event Consumer service."""
+    configure_logs(load_logging_settings())
     logger.info("Starting Event Consumer service...")
     database_uri, app_port = load_params()
+    server = load_server_settings()
+    db_settings = load_database_settings()
+    if server.workers > 1 and db_settings.backend == "memory":
+        logger.warning("DB_BACKEND=memory with several workers: each worker keeps its own events")
+    elif server.workers > 1:
+        prepare_database(database_uri, db_settings)
+
+    metrics = load_app_settings().metrics
+    if metrics.enabled and metrics.multiprocess_dir:
+        WorkerMetricsFiles.clear(metrics.multiprocess_dir)
+
     start_fast_api_server(
-        params=HttpServer(port=app_port),
-        db_provider=SqlAlchemyDbProvider(database_uri=database_uri),
+        params=HttpServer(
+            port=app_port,
+            workers=server.workers,
+            loop=server.loop,
+            http=server.http,
+            graceful_shutdown_seconds=server.graceful_shutdown_seconds,
+        ),
+        app_factory=APP_FACTORY,
     )
 
 
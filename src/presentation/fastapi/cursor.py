@@ -0,0 +1,61 @@
+"""Opaque pagination cursors for event listing."""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from src.application.ports.event_query_repository import EventKey, SortOrder
+
+__all__ = ["InvalidCursorError", "decode_cursor", "encode_cursor"]
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a cursor is malformed or was issued for another query."""
+
+
+def encode_cursor(key: EventKey, event_type: str | None, order: SortOrder) -> str:
+    """Encode a page position as an opaque URL-safe string.
+
+    The type filter and sort order are embedded so a cursor cannot be
+    replayed against a different query.
+
+    Args:
+        key: Position of the last event on the page.
+        event_type: Type filter of the query (None for all types).
+        order: Sort order of the query.
+
+    Returns:
+        Unpadded URL-safe base64 cursor.
+    """
+    payload = {"c": key.created_at.isoformat(), "i": key.id, "t": event_type, "o": order}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, event_type: str | None, order: SortOrder) -> EventKey:
+    """Decode a cursor produced by encode_cursor for the same query.
+
+    Args:
+        cursor: Cursor from a previous page.
+        event_type: Type filter of the current query.
+        order: Sort order of the current query.
+
+    Returns:
+        Position to resume after.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or belongs to a query
+            with a different type filter or sort order.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        key = EventKey(created_at=datetime.fromisoformat(payload["c"]), id=int(payload["i"]))
+        issued_for = (payload["t"], payload["o"])
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError, KeyError) as exc:
+        raise InvalidCursorError("Malformed cursor") from exc
+
+    if issued_for != (event_type, order):
+        raise InvalidCursorError("Cursor does not match the query filters")
+    return key
@@ -1,14 +1,44 @@
 """FastAPI dependency injection for database access."""
 
+import math
 from collections.abc import AsyncGenerator
 
-from fastapi import Depends, Request
+from fastapi import Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.datastructures import State
 
+from src.application.admission import (
+    AdmissionController,
+    AdmissionRejectedError,
+    AdmittedEventRepository,
+)
+from src.application.event_listeners import ListeningEventRepository
+from src.application.group_commit import GroupCommitEventRepository
+from src.application.health import HealthMonitor
+from src.application.idempotency import IdempotencyCache
+from src.application.metrics import MeasuredEventRepository
+from src.application.ports.event_listener import CommittedEventsListener
+from src.application.ports.event_query_repository import EventQueryRepository
 from src.application.ports.event_repository import EventRepository
-from src.infrastructure.postgres.event_repository import PostgresEventRepository
+from src.application.ports.rollup_repository import RollupRepository
+from src.application.recent_events import RecentEventsBuffer
+from src.application.retention import RetentionJob
+from src.infrastructure.metrics.worker_files import WorkerMetricsFiles
+from src.infrastructure.spool.repository import SpoolingEventRepository
+from src.infrastructure.spool.spool import EventSpool
 
-__all__ = ["get_db_session"]
+__all__ = [
+    "admission_guard",
+    "get_db_session",
+    "get_event_query_repository",
+    "get_event_repository",
+    "get_health_monitor",
+    "get_idempotency_cache",
+    "get_metrics_files",
+    "get_recent_events_buffer",
+    "get_retention_job",
+    "get_rollup_repository",
+]
 
 
 async def get_db_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
@@ -20,15 +50,188 @@ async def get_db_session(request: Request) -> AsyncGenerator[AsyncSession, None]
         await session.close()
 
 
-def get_event_repository(
-    session: AsyncSession = Depends(get_db_session),  # noqa: B008
+async def admission_guard(request: Request) -> AsyncGenerator[AdmissionController | None, None]:
+    """Admit the request under the adaptive in-flight limit.
+
+    A dependency of get_event_repository, so only the routes writing events
+    are guarded, and they are admitted before a repository takes a pool
+    connection.
+
+    Args:
+        request: Current request (auto-injected).
+
+    Yields:
+        The AdmissionController while the request is admitted, or None when
+        admission control is disabled.
+
+    Raises:
+        HTTPException 503: The limit is reached (with a Retry-After header).
+    """
+    controller: AdmissionController | None = request.app.state.admission
+    if controller is None:
+        yield None
+        return
+
+    try:
+        controller.acquire()
+    except AdmissionRejectedError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server is overloaded, retry later",
+            headers={"Retry-After": str(max(1, math.ceil(exc.retry_after)))},
+        ) from exc
+
+    try:
+        yield controller
+    finally:
+        controller.release()
+
+
+async def get_event_repository(
+    request: Request,
+    admission: AdmissionController | None = Depends(admission_guard),  # noqa: B008
+) -> AsyncGenerator[EventRepository, None]:
+    """Yield the event repository implementation.
+
+    Writes go through the group-commit stage when it is enabled, otherwise
+    straight to a repository opened by the database provider. With
+    admission control enabled, the latency of each write (including the
+    wait for a pool connection or for the group commit) adapts the
+    in-flight limit. When the spool is enabled, writes the database cannot
+    take are spooled instead. With metrics enabled, the time until each
+    write commits is recorded. Committed events are then passed to the
+    enabled in-process listeners (rollups, recent events buffer,
+    idempotency cache).
+
+    Args:
+        request: Current request (auto-injected).
+        admission: Controller that admitted the request (injected, None when disabled).
+
+    Yields:
+        An EventRepository instance.
+    """
+    state = request.app.state
+    listeners = [
+        listener
+        for listener in (state.rollups, state.recent_events, state.idempotency)
+        if listener is not None
+    ]
+    if state.group_commit is not None:
+        repo = GroupCommitEventRepository(state.group_commit)
+        yield _decorate(repo, state, listeners, admission)
+        return
+
+    async with state.db_provider.event_repository() as repo:
+        yield _decorate(repo, state, listeners, admission)
+
+
+def _decorate(
+    repo: EventRepository,
+    state: State,
+    listeners: list[CommittedEventsListener],
+    admission: AdmissionController | None,
 ) -> EventRepository:
-    """Return the event repository implementation.
+    if admission is not None:
+        repo = AdmittedEventRepository(repo, admission)
+    if state.metrics_enabled:
+        repo = MeasuredEventRepository(repo)
+    spool: EventSpool | None = state.spool
+    if spool is not None:
+        repo = SpoolingEventRepository(repo, spool)
+    return ListeningEventRepository(repo, listeners) if listeners else repo
+
+
+def get_event_query_repository(request: Request) -> EventQueryRepository:
+    """Return the repository used to read events.
 
     Args:
-        session: Database session (auto-injected).
+        request: Current request (auto-injected).
 
     Returns:
-        An EventRepository instance.
+        An EventQueryRepository instance.
+    """
+    query_repository: EventQueryRepository = request.app.state.db_provider.event_query_repository()
+    return query_repository
+
+
+def get_rollup_repository(request: Request) -> RollupRepository:
+    """Return the repository storing per-type time-bucket rollups.
+
+    Args:
+        request: Current request (auto-injected).
+
+    Returns:
+        A RollupRepository instance.
+    """
+    rollup_repository: RollupRepository = request.app.state.db_provider.rollup_repository()
+    return rollup_repository
+
+
+def get_recent_events_buffer(request: Request) -> RecentEventsBuffer | None:
+    """Return the recent events buffer.
+
+    Args:
+        request: Current request (auto-injected).
+
+    Returns:
+        The RecentEventsBuffer, or None when it is disabled.
+    """
+    buffer: RecentEventsBuffer | None = request.app.state.recent_events
+    return buffer
+
+
+async def get_health_monitor(request: Request) -> HealthMonitor | None:
+    """Return the database health monitor.
+
+    Async, so the probes are answered without a threadpool hop.
+
+    Args:
+        request: Current request (auto-injected).
+
+    Returns:
+        The HealthMonitor, or None when health checks are disabled.
+    """
+    monitor: HealthMonitor | None = request.app.state.health
+    return monitor
+
+
+def get_retention_job(request: Request) -> RetentionJob | None:
+    """Return the retention job.
+
+    Args:
+        request: Current request (auto-injected).
+
+    Returns:
+        The RetentionJob, or None when it is disabled.
+    """
+    job: RetentionJob | None = request.app.state.retention
+    return job
+
+
+async def get_idempotency_cache(request: Request) -> IdempotencyCache | None:
+    """Return the cache of recently committed idempotency keys.
+
+    Async so that FastAPI calls it on the event loop: POST /event depends on
+    it, and a sync dependency costs a thread pool round trip per request.
+
+    Args:
+        request: Current request (auto-injected).
+
+    Returns:
+        The IdempotencyCache, or None when it is disabled.
+    """
+    cache: IdempotencyCache | None = request.app.state.idempotency
+    return cache
+
+
+def get_metrics_files(request: Request) -> WorkerMetricsFiles | None:
+    """Return the per-worker metrics files.
+
+    Args:
+        request: Current request (auto-injected).
+
+    Returns:
+        The WorkerMetricsFiles, or None when metrics are not shared between workers.
     """
-    return PostgresEventRepository(session)
+    files: WorkerMetricsFiles | None = request.app.state.metrics_files
+    return files
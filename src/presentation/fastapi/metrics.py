@@ -0,0 +1,70 @@
+"""HTTP metrics: request latency middleware and route error counters."""
+
+import time
+from typing import Final
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.application.metrics import REGISTRY, Counter, Histogram
+
+__all__ = ["EVENT_ROUTE_ERRORS", "HTTP_REQUEST_SECONDS", "MetricsMiddleware"]
+
+HTTP_REQUEST_SECONDS: Final = REGISTRY.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "HTTP request latency until the response is sent, by route and status.",
+        ["method", "route", "status"],
+    )
+)
+
+EVENT_ROUTE_ERRORS: Final = REGISTRY.register(
+    Counter(
+        "event_route_errors_total",
+        "Errors handled by the event routes, by route and error class.",
+        ["route", "error"],
+    )
+)
+
+# Label for requests no route matched, so unknown paths do not add series
+UNMATCHED_ROUTE: Final = "unmatched"
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording the latency of every HTTP request.
+
+    A plain ASGI middleware (not BaseHTTPMiddleware), so it adds no task or
+    stream wrapping to the request; the route label is the matched path
+    template, e.g. ``/events/{event_id}``.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap an ASGI application.
+
+        Args:
+            app: Application to measure.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            HTTP_REQUEST_SECONDS.labels(
+                scope["method"],
+                route.path if route is not None else UNMATCHED_ROUTE,
+                str(status),
+            ).observe(time.perf_counter() - started)
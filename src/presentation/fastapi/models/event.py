@@ -1,26 +1,106 @@
 """Pydantic models for HTTP requests and responses."""
 
-from pydantic import BaseModel, ConfigDict, Field
+from datetime import datetime
+from typing import Literal
 
-__all__ = ["Event", "EventResponse", "MAX_EVENT_TYPE_LENGTH", "MAX_EVENT_PAYLOAD_LENGTH"]
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+
+__all__ = [
+    "Event",
+    "EventBody",
+    "EventResponse",
+    "CREATED_RESPONSE_BODY",
+    "EventBatchItemResult",
+    "EventBatchResponse",
+    "EventStreamReject",
+    "EventStreamResponse",
+    "EventOut",
+    "EventPageResponse",
+    "EventStatsBucket",
+    "EventStatsResponse",
+    "RecentEvent",
+    "RecentEventsResponse",
+    "RecentEventsMemoryResponse",
+    "RetentionProgressResponse",
+    "ReadinessResponse",
+    "MAX_EVENT_TYPE_LENGTH",
+    "MAX_EVENT_PAYLOAD_LENGTH",
+    "MAX_IDEMPOTENCY_KEY_LENGTH",
+    "MAX_EVENT_BATCH_SIZE",
+    "MAX_NDJSON_LINE_BYTES",
+    "MAX_REPORTED_REJECTS",
+    "STREAM_CHUNK_SIZE",
+    "DEFAULT_PAGE_SIZE",
+    "MAX_PAGE_SIZE",
+    "DEFAULT_STATS_BUCKETS",
+    "MAX_STATS_BUCKETS",
+    "DEFAULT_RECENT_EVENTS",
+    "MAX_RECENT_EVENTS",
+    "describe_validation_error",
+]
 
 MAX_EVENT_TYPE_LENGTH = 100
 MAX_EVENT_PAYLOAD_LENGTH = 1000
+MAX_IDEMPOTENCY_KEY_LENGTH = 255
+MAX_EVENT_BATCH_SIZE = 1000
+MAX_NDJSON_LINE_BYTES = 64 * 1024
+MAX_REPORTED_REJECTS = 100
+STREAM_CHUNK_SIZE = 500
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+DEFAULT_STATS_BUCKETS = 1000
+MAX_STATS_BUCKETS = 10_000
+DEFAULT_RECENT_EVENTS = 20
+MAX_RECENT_EVENTS = 1000
 
+# EventResponse(status="created") as FastAPI encodes it
+CREATED_RESPONSE_BODY = b'{"status":"created"}'
 
-class Event(BaseModel):
-    """Request model for creating an event.
+
+def describe_validation_error(exc: ValidationError) -> str:
+    """Describe the first error of a failed validation, for per-item results.
+
+    Args:
+        exc: Validation error of one item.
+
+    Returns:
+        The error message, prefixed with its location when it has one.
+    """
+    error = exc.errors()[0]
+    location = ".".join(str(part) for part in error["loc"])
+    return f"{location}: {error['msg']}" if location else error["msg"]
+
+
+class EventBody(BaseModel):
+    """Fields and rules of an event in a request body.
+
+    Validated straight from the JSON bytes (model_validate_json) by the fast
+    ingest path; it has no Python-level validator, so the whole validation
+    runs in pydantic-core.
 
     Attributes:
         event_type: Type/category of the event (1-100 chars).
         event_payload: Event content (1-1000 chars).
+        idempotency_key: Optional key identifying retries of the same event (1-255 chars).
     """
 
     event_type: str = Field(..., min_length=1, max_length=MAX_EVENT_TYPE_LENGTH)
     event_payload: str = Field(..., min_length=1, max_length=MAX_EVENT_PAYLOAD_LENGTH)
+    idempotency_key: str | None = Field(None, min_length=1, max_length=MAX_IDEMPOTENCY_KEY_LENGTH)
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class Event(EventBody):
+    """Request model for creating an event.
+
+    Attributes:
+        event_type: Type/category of the event (1-100 chars).
+        event_payload: Event content (1-1000 chars).
+        idempotency_key: Optional key identifying retries of the same event (1-255 chars).
+    """
 
     model_config = ConfigDict(
-        extra="forbid",
         json_schema_extra={
             "example": {
                 "event_type": "user_joined",
@@ -46,3 +126,295 @@ class EventResponse(BaseModel):
             }
         },
     )
+
+
+class EventBatchItemResult(BaseModel):
+    """Outcome of a single item in a batch request.
+
+    Attributes:
+        index: Position of the item in the request body.
+        status: "created" if persisted, "duplicate" if skipped because its
+            idempotency_key is already stored, "rejected" if validation failed.
+        detail: Rejection reason (only for rejected items).
+    """
+
+    index: int
+    status: Literal["created", "duplicate", "rejected"]
+    detail: str | None = None
+
+
+class EventBatchResponse(BaseModel):
+    """Response model for batch event creation.
+
+    Attributes:
+        accepted: Number of persisted events.
+        duplicates: Number of events skipped as already stored.
+        rejected: Number of events that failed validation.
+        results: Per-item outcomes, in request order.
+    """
+
+    accepted: int
+    duplicates: int
+    rejected: int
+    results: list[EventBatchItemResult]
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "accepted": 1,
+                "duplicates": 0,
+                "rejected": 1,
+                "results": [
+                    {"index": 0, "status": "created", "detail": None},
+                    {"index": 1, "status": "rejected", "detail": "Event type cannot be empty"},
+                ],
+            }
+        },
+    )
+
+
+class EventStreamReject(BaseModel):
+    """A rejected line of an NDJSON upload.
+
+    Attributes:
+        line: 1-based line number in the upload.
+        detail: Rejection reason.
+    """
+
+    line: int
+    detail: str
+
+
+class EventStreamResponse(BaseModel):
+    """Response model for streaming NDJSON ingestion.
+
+    Attributes:
+        accepted: Number of persisted events.
+        duplicates: Number of events skipped as already stored.
+        rejected: Number of rejected lines.
+        rejects: First rejected lines with reasons (at most 100).
+        rejects_truncated: True if more lines were rejected than reported.
+    """
+
+    accepted: int
+    duplicates: int
+    rejected: int
+    rejects: list[EventStreamReject]
+    rejects_truncated: bool
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "accepted": 2,
+                "duplicates": 0,
+                "rejected": 1,
+                "rejects": [{"line": 2, "detail": "Event type cannot be empty"}],
+                "rejects_truncated": False,
+            }
+        },
+    )
+
+
+class EventOut(BaseModel):
+    """A persisted event.
+
+    Attributes:
+        id: Storage-assigned identifier.
+        event_type: Type/category of the event.
+        event_payload: Event content.
+        created_at: Creation timestamp (UTC).
+    """
+
+    id: int
+    event_type: str
+    event_payload: str
+    created_at: datetime
+
+
+class EventPageResponse(BaseModel):
+    """Response model for one page of events.
+
+    Attributes:
+        items: Events on this page.
+        next_cursor: Opaque cursor for the next page (None on the last page).
+    """
+
+    items: list[EventOut]
+    next_cursor: str | None
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "items": [
+                    {
+                        "id": 42,
+                        "event_type": "user_joined",
+                        "event_payload": "Alice",
+                        "created_at": "2025-01-01T12:00:00Z",
+                    }
+                ],
+                "next_cursor": "eyJjIjoiMjAyNS0wMS0wMVQxMjowMDowMCswMDowMCIsImkiOjQyfQ",
+            }
+        },
+    )
+
+
+class EventStatsBucket(BaseModel):
+    """Event counters for one type within one time bucket.
+
+    Attributes:
+        event_type: Type/category of the events.
+        bucket_start: Start of the bucket (UTC).
+        count: Number of events.
+        total_payload_bytes: Sum of UTF-8 payload sizes.
+    """
+
+    event_type: str
+    bucket_start: datetime
+    count: int
+    total_payload_bytes: int
+
+
+class EventStatsResponse(BaseModel):
+    """Response model for per-type time-bucket statistics.
+
+    Attributes:
+        resolution: Bucket width ("minute" or "hour").
+        buckets: Buckets ordered by (bucket_start, event_type).
+        truncated: True if more buckets matched than the requested limit.
+    """
+
+    resolution: Literal["minute", "hour"]
+    buckets: list[EventStatsBucket]
+    truncated: bool
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "resolution": "minute",
+                "buckets": [
+                    {
+                        "event_type": "user_joined",
+                        "bucket_start": "2025-01-01T12:00:00Z",
+                        "count": 42,
+                        "total_payload_bytes": 210,
+                    }
+                ],
+                "truncated": False,
+            }
+        },
+    )
+
+
+class RecentEvent(BaseModel):
+    """A recently committed event.
+
+    Attributes:
+        event_type: Type/category of the event.
+        event_payload: Event content.
+        created_at: Creation timestamp (UTC).
+    """
+
+    event_type: str
+    event_payload: str
+    created_at: datetime
+
+
+class RecentEventsResponse(BaseModel):
+    """Response model for the newest events of one type.
+
+    Attributes:
+        source: "memory" if served from the buffer, "database" otherwise.
+        items: Events, newest first.
+    """
+
+    source: Literal["memory", "database"]
+    items: list[RecentEvent]
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "source": "memory",
+                "items": [
+                    {
+                        "event_type": "user_joined",
+                        "event_payload": "Alice",
+                        "created_at": "2025-01-01T12:00:00Z",
+                    }
+                ],
+            }
+        },
+    )
+
+
+class RecentEventsMemoryResponse(BaseModel):
+    """Response model for the recent events buffer memory usage.
+
+    Attributes:
+        enabled: Whether the buffer is enabled.
+        types: Event types currently buffered.
+        events: Events currently buffered.
+        bytes: Approximate memory held by the buffered events.
+        max_bytes: Memory cap.
+        evicted_types: Types evicted to stay under the cap since startup.
+    """
+
+    enabled: bool
+    types: int = 0
+    events: int = 0
+    bytes: int = 0
+    max_bytes: int = 0
+    evicted_types: int = 0
+
+
+class RetentionProgressResponse(BaseModel):
+    """Response model for the retention job progress.
+
+    Attributes:
+        enabled: Whether the retention job is enabled.
+        running: True while a purge pass is in progress.
+        runs: Completed purge passes.
+        batches: Delete batches executed since startup.
+        deleted: Events deleted since startup.
+        deleted_by_type: Events deleted per rule ("*" for the default rule).
+        last_run_started_at: When the latest pass started.
+        last_run_finished_at: When the latest pass finished.
+        last_error: Error that ended the latest failed pass, if any.
+    """
+
+    enabled: bool
+    running: bool = False
+    runs: int = 0
+    batches: int = 0
+    deleted: int = 0
+    deleted_by_type: dict[str, int] = Field(default_factory=dict)
+    last_run_started_at: datetime | None = None
+    last_run_finished_at: datetime | None = None
+    last_error: str | None = None
+
+
+class ReadinessResponse(BaseModel):
+    """Response model for the readiness probe.
+
+    Attributes:
+        ready: Whether the service should receive traffic.
+        checked: Whether background database checks are enabled (when
+            not, the service is always reported ready).
+        database_up: Whether the latest ping succeeded.
+        pool_checked_out: Pooled connections in use at the latest check.
+        pool_capacity: Most connections the pool hands out (None when unbounded).
+        pool_waiting: Checkouts in progress at the latest check.
+        saturated_seconds: How long the pool has been saturated.
+        checked_at: When the latest check ran.
+        last_error: Error of the latest failed ping, if any.
+    """
+
+    ready: bool
+    checked: bool
+    database_up: bool | None = None
+    pool_checked_out: int | None = None
+    pool_capacity: int | None = None
+    pool_waiting: int | None = None
+    saturated_seconds: float = 0.0
+    checked_at: datetime | None = None
+    last_error: str | None = None
@@ -0,0 +1,52 @@
+"""Incremental newline-delimited JSON (NDJSON) line splitting."""
+
+from collections.abc import AsyncIterable, AsyncIterator
+
+__all__ = ["iter_ndjson_lines"]
+
+
+async def iter_ndjson_lines(
+    chunks: AsyncIterable[bytes],
+    max_line_bytes: int,
+) -> AsyncIterator[tuple[int, bytes | None]]:
+    """Split a byte stream into lines as chunks arrive.
+
+    Only the current partial line is buffered, so memory stays bounded by
+    max_line_bytes regardless of the stream size. Lines longer than the limit
+    are discarded while reading and reported as None.
+
+    Args:
+        chunks: Raw body chunks (e.g. Request.stream()).
+        max_line_bytes: Maximum accepted line length, excluding the newline.
+
+    Yields:
+        (line_number, line) tuples with 1-based line numbers; line is None
+        when it exceeded max_line_bytes. A trailing carriage return is stripped.
+    """
+    buffer = bytearray()
+    overflow = False
+    line_number = 0
+
+    async for chunk in chunks:
+        start = 0
+        while True:
+            end = chunk.find(b"\n", start)
+            if end == -1:
+                if not overflow:
+                    buffer += chunk[start:]
+                    if len(buffer) > max_line_bytes:
+                        overflow = True
+                        buffer.clear()
+                break
+
+            line_number += 1
+            if not overflow:
+                buffer += chunk[start:end]
+                overflow = len(buffer) > max_line_bytes
+            yield line_number, None if overflow else bytes(buffer).rstrip(b"\r")
+            buffer.clear()
+            overflow = False
+            start = end + 1
+
+    if buffer or overflow:
+        yield line_number + 1, None if overflow else bytes(buffer).rstrip(b"\r")
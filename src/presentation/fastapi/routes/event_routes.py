@@ -1,75 +1,268 @@
 """HTTP route handlers for event creation."""
 
 import logging
+from collections import Counter
+from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.exc import IntegrityError
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Request, Response, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
 
 from src.application.create_event import create_event_uc
+from src.application.create_events import EventOutcome, create_events_uc
+from src.application.idempotency import IdempotencyCache
 from src.application.ports.event_repository import EventRepository
+from src.application.stage_timing import stage
 from src.core.exceptions import DomainValidationError
-from src.presentation.fastapi.dependencies import get_event_repository
-from src.presentation.fastapi.models.event import Event, EventResponse
+from src.presentation.fastapi.dependencies import get_event_repository, get_idempotency_cache
+from src.presentation.fastapi.metrics import EVENT_ROUTE_ERRORS
+from src.presentation.fastapi.models.event import (
+    CREATED_RESPONSE_BODY,
+    MAX_EVENT_BATCH_SIZE,
+    MAX_IDEMPOTENCY_KEY_LENGTH,
+    Event,
+    EventBatchItemResult,
+    EventBatchResponse,
+    EventBody,
+    EventResponse,
+    describe_validation_error,
+)
+from src.presentation.fastapi.stage_timing import TimedRoute
 
-__all__ = ["event_router"]
+__all__ = ["event_router", "fast_event_router"]
 
-event_router = APIRouter(prefix="/event", tags=["Events"])
+event_router = APIRouter(prefix="/event", tags=["Events"], route_class=TimedRoute)
+# Included before event_router when enabled, so its POST /event is matched first
+fast_event_router = APIRouter(prefix="/event", tags=["Events"], route_class=TimedRoute)
 logger = logging.getLogger(__name__)
 
+REPLAYED_HEADER = "Idempotent-Replayed"
+
 
 @event_router.post("", response_model=EventResponse, status_code=201)
 async def create_event_route(
     event: Event,
+    response: Response,
+    idempotency_key: str
+    | None = Header(  # noqa: B008
+        None, alias="Idempotency-Key", min_length=1, max_length=MAX_IDEMPOTENCY_KEY_LENGTH
+    ),
     repo: EventRepository = Depends(get_event_repository),  # noqa: B008
+    cache: IdempotencyCache | None = Depends(get_idempotency_cache),  # noqa: B008
 ) -> EventResponse:
     """Create and persist an event.
 
+    The idempotency key comes from the Idempotency-Key header or the
+    idempotency_key field. A retry of an event that was already stored gets
+    the original response; when answered from the in-process cache, the
+    Idempotent-Replayed header is set and the database is not touched.
+
     Args:
         event: Event request payload.
+        response: Outgoing response (for the replay header).
+        idempotency_key: Idempotency-Key header.
         repo: Event repository (injected).
+        cache: Recently committed idempotency keys (injected, None when disabled).
 
     Returns:
         EventResponse with status "created".
 
     Raises:
-        HTTPException 422: Domain validation failed.
-        HTTPException 409: Database constraint violated.
+        HTTPException 422: Domain validation failed, or the header and the
+            field carry different keys.
         HTTPException 503: Database timeout.
         HTTPException 500: Unexpected error.
     """
+    created = await _store_event(event, idempotency_key, repo, cache)
+    if not created:
+        response.headers[REPLAYED_HEADER] = "true"
+    return EventResponse(status="created")
+
+
+@fast_event_router.post("", status_code=201, include_in_schema=False)
+async def create_event_fast_route(
+    request: Request,
+    idempotency_key: str
+    | None = Header(  # noqa: B008
+        None, alias="Idempotency-Key", min_length=1, max_length=MAX_IDEMPOTENCY_KEY_LENGTH
+    ),
+    repo: EventRepository = Depends(get_event_repository),  # noqa: B008
+    cache: IdempotencyCache | None = Depends(get_idempotency_cache),  # noqa: B008
+) -> Response:
+    """Create and persist an event, bypassing FastAPI's body and response handling.
+
+    Same contract as create_event_route, which it replaces when the fast
+    ingest path is enabled (and which documents it in the OpenAPI schema).
+    The body is decoded and validated in one step by pydantic-core, with
+    the rules of EventBody; the response body is pre-encoded. When timed,
+    decoding and validation count as the "validate" stage.
+
+    Args:
+        request: Incoming request (its body is read directly).
+        idempotency_key: Idempotency-Key header.
+        repo: Event repository (injected).
+        cache: Recently committed idempotency keys (injected, None when disabled).
+
+    Returns:
+        201 response with the EventResponse body.
+
+    Raises:
+        RequestValidationError: The body is not valid JSON or not a valid event (422).
+        HTTPException 422: Domain validation failed, or the header and the
+            field carry different keys.
+        HTTPException 503: Database timeout.
+        HTTPException 500: Unexpected error.
+    """
+    body = await request.body()
+    try:
+        with stage("validate"):
+            event = EventBody.model_validate_json(body)
+    except ValidationError as exc:
+        # Same error shape as FastAPI's own body validation
+        errors = [{**error, "loc": ("body", *error["loc"])} for error in exc.errors()]
+        raise RequestValidationError(errors, body=body) from exc
+
+    created = await _store_event(event, idempotency_key, repo, cache)
+    return Response(
+        content=CREATED_RESPONSE_BODY,
+        status_code=status.HTTP_201_CREATED,
+        headers=None if created else {REPLAYED_HEADER: "true"},
+        media_type="application/json",
+    )
+
+
+async def _store_event(
+    event: EventBody,
+    idempotency_key: str | None,
+    repo: EventRepository,
+    cache: IdempotencyCache | None,
+) -> bool:
+    """Run the create event use case for POST /event, mapping errors to HTTP.
+
+    Returns:
+        True if the event was stored, False if it was a replayed duplicate.
+    """
+    if idempotency_key and event.idempotency_key and idempotency_key != event.idempotency_key:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Idempotency-Key header and idempotency_key field differ",
+        )
+
     try:
-        await create_event_uc(
+        created = await create_event_uc(
             event_type=event.event_type,
             event_payload=event.event_payload,
             repo=repo,
+            idempotency_key=idempotency_key or event.idempotency_key,
+            cache=cache,
         )
-        logger.info(f"Event created: type={event.event_type}")
-        return EventResponse(status="created")
+        # Per-event records: lazy arguments, sampled per event type when configured
+        extra = {"event_type": event.event_type}
+        if created:
+            logger.info("Event created: type=%s", event.event_type, extra=extra)
+        else:
+            logger.info("Duplicate event replayed: type=%s", event.event_type, extra=extra)
+        return created
 
     except DomainValidationError as exc:
-        logger.warning(f"Domain validation error: {exc}")
+        EVENT_ROUTE_ERRORS.labels("create_event", "validation").inc()
+        logger.warning("Domain validation error: %s", exc)
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail=str(exc),
         ) from exc
 
-    except IntegrityError as exc:
-        logger.warning(f"Constraint violation: {exc}")
+    except TimeoutError as exc:
+        EVENT_ROUTE_ERRORS.labels("create_event", "timeout").inc()
+        logger.error("Database timeout: %s", exc)
         raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="Event already exists or violates database constraints",
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Database operation timed out",
+        ) from exc
+
+    except Exception as exc:
+        EVENT_ROUTE_ERRORS.labels("create_event", "unexpected").inc()
+        logger.error("Unexpected error in create_event_route", exc_info=exc)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error",
         ) from exc
 
+
+@event_router.post("/batch", response_model=EventBatchResponse, status_code=200)
+async def create_events_batch_route(
+    events: list[dict[str, Any]] = Body(  # noqa: B008
+        ..., min_length=1, max_length=MAX_EVENT_BATCH_SIZE
+    ),
+    repo: EventRepository = Depends(get_event_repository),  # noqa: B008
+) -> EventBatchResponse:
+    """Create and persist a batch of events in a single transaction.
+
+    Each item is validated on its own: items failing field or domain
+    validation are reported as rejected, and the remaining items are still
+    persisted. Items whose idempotency_key is already stored are skipped by
+    the database and reported as duplicates.
+
+    Args:
+        events: Event request payloads, each validated as an EventBody.
+        repo: Event repository (injected).
+
+    Returns:
+        EventBatchResponse with per-item results.
+
+    Raises:
+        HTTPException 503: Database timeout.
+        HTTPException 500: Unexpected error.
+    """
+    outcomes: list[EventOutcome | None] = [None] * len(events)
+    valid: list[tuple[int, EventBody]] = []
+    with stage("validate"):
+        for index, item in enumerate(events):
+            try:
+                valid.append((index, EventBody.model_validate(item)))
+            except ValidationError as exc:
+                outcomes[index] = EventOutcome("rejected", describe_validation_error(exc))
+
+    try:
+        stored = await create_events_uc(
+            items=[(event.event_type, event.event_payload) for _, event in valid],
+            repo=repo,
+            idempotency_keys=[event.idempotency_key for _, event in valid],
+        )
+        for (index, _), outcome in zip(valid, stored, strict=True):
+            outcomes[index] = outcome
+
     except TimeoutError as exc:
-        logger.error(f"Database timeout: {exc}")
+        EVENT_ROUTE_ERRORS.labels("create_events_batch", "timeout").inc()
+        logger.error("Database timeout: %s", exc)
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Database operation timed out",
         ) from exc
 
     except Exception as exc:
-        logger.error("Unexpected error in create_event_route", exc_info=exc)
+        EVENT_ROUTE_ERRORS.labels("create_events_batch", "unexpected").inc()
+        logger.error("Unexpected error in create_events_batch_route", exc_info=exc)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error",
         ) from exc
+
+    results = [
+        EventBatchItemResult(index=index, status=outcome.status, detail=outcome.detail)
+        for index, outcome in enumerate(outcomes)
+        if outcome is not None
+    ]
+    counts = Counter(result.status for result in results)
+    logger.info(
+        "Event batch processed: accepted=%s, duplicates=%s, rejected=%s",
+        counts["created"],
+        counts["duplicate"],
+        counts["rejected"],
+    )
+    return EventBatchResponse(
+        accepted=counts["created"],
+        duplicates=counts["duplicate"],
+        rejected=counts["rejected"],
+        results=results,
+    )
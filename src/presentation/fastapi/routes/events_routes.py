@@ -0,0 +1,431 @@
+"""HTTP route handlers for event collections (listing and streaming ingestion)."""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from pydantic import ValidationError
+
+from src.application.create_events import create_events_uc
+from src.application.event_stats import event_stats_uc
+from src.application.list_events import list_events_uc
+from src.application.ports.event_query_repository import (
+    EventQuery,
+    EventQueryRepository,
+    SortOrder,
+)
+from src.application.ports.event_repository import EventRepository
+from src.application.ports.rollup_repository import Resolution, RollupQuery, RollupRepository
+from src.application.recent_events import RecentEventsBuffer, recent_events_uc
+from src.application.retention import RetentionJob
+from src.application.stage_timing import stage
+from src.presentation.fastapi.cursor import InvalidCursorError, decode_cursor, encode_cursor
+from src.presentation.fastapi.dependencies import (
+    get_event_query_repository,
+    get_event_repository,
+    get_recent_events_buffer,
+    get_retention_job,
+    get_rollup_repository,
+)
+from src.presentation.fastapi.models.event import (
+    DEFAULT_PAGE_SIZE,
+    DEFAULT_RECENT_EVENTS,
+    DEFAULT_STATS_BUCKETS,
+    MAX_EVENT_TYPE_LENGTH,
+    MAX_NDJSON_LINE_BYTES,
+    MAX_PAGE_SIZE,
+    MAX_RECENT_EVENTS,
+    MAX_REPORTED_REJECTS,
+    MAX_STATS_BUCKETS,
+    STREAM_CHUNK_SIZE,
+    Event,
+    EventOut,
+    EventPageResponse,
+    EventStatsBucket,
+    EventStatsResponse,
+    EventStreamReject,
+    EventStreamResponse,
+    RecentEvent,
+    RecentEventsMemoryResponse,
+    RecentEventsResponse,
+    RetentionProgressResponse,
+    describe_validation_error,
+)
+from src.presentation.fastapi.ndjson import iter_ndjson_lines
+from src.presentation.fastapi.stage_timing import TimedRoute
+
+__all__ = ["events_router"]
+
+events_router = APIRouter(prefix="/events", tags=["Events"], route_class=TimedRoute)
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _StreamSummary:
+    accepted: int = 0
+    duplicates: int = 0
+    rejected: int = 0
+    rejects: list[EventStreamReject] = field(default_factory=list)
+
+    def reject(self, line: int, detail: str) -> None:
+        self.rejected += 1
+        if len(self.rejects) < MAX_REPORTED_REJECTS:
+            self.rejects.append(EventStreamReject(line=line, detail=detail))
+
+
+async def _flush(
+    chunk: list[tuple[int, Event]], repo: EventRepository, summary: _StreamSummary
+) -> None:
+    outcomes = await create_events_uc(
+        items=[(event.event_type, event.event_payload) for _, event in chunk],
+        repo=repo,
+        idempotency_keys=[event.idempotency_key for _, event in chunk],
+    )
+    for (line, _), outcome in zip(chunk, outcomes, strict=True):
+        if outcome.status == "created":
+            summary.accepted += 1
+        elif outcome.status == "duplicate":
+            summary.duplicates += 1
+        else:
+            summary.reject(line, outcome.detail or "")
+    chunk.clear()
+
+
+@events_router.get("", response_model=EventPageResponse, status_code=200)
+async def list_events_route(
+    event_type: str
+    | None = Query(  # noqa: B008
+        None, alias="type", min_length=1, max_length=MAX_EVENT_TYPE_LENGTH
+    ),
+    since: datetime | None = None,
+    until: datetime | None = None,
+    order: SortOrder = "desc",
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),  # noqa: B008
+    cursor: str | None = None,
+    repo: EventQueryRepository = Depends(get_event_query_repository),  # noqa: B008
+) -> EventPageResponse:
+    """List events, optionally filtered by type and creation time.
+
+    Results are ordered by (created_at, id) and paginated with an opaque
+    cursor: pass `next_cursor` from one response as `cursor` to get the next
+    page, keeping the other filters unchanged. Pages are read by seeking to
+    the cursor position on the index, so deep pages cost the same as the
+    first one.
+
+    Args:
+        event_type: Only events of this type (query parameter `type`).
+        since: Only events created at or after this instant (naive = UTC).
+        until: Only events created before this instant (naive = UTC).
+        order: "desc" for newest first (default), "asc" for oldest first.
+        limit: Page size (1-1000).
+        cursor: Cursor from a previous page.
+        repo: Event query repository (injected).
+
+    Returns:
+        EventPageResponse with the page and the cursor for the next one.
+
+    Raises:
+        HTTPException 400: Malformed cursor or cursor from a different query.
+        HTTPException 503: Database timeout.
+        HTTPException 500: Unexpected error.
+    """
+    try:
+        after = decode_cursor(cursor, event_type, order) if cursor is not None else None
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+    query = EventQuery(
+        limit=limit, event_type=event_type, since=since, until=until, order=order, after=after
+    )
+    try:
+        page = await list_events_uc(query=query, repo=repo)
+
+    except TimeoutError as exc:
+        logger.error("Database timeout: %s", exc)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Database operation timed out",
+        ) from exc
+
+    except Exception as exc:
+        logger.error("Unexpected error in list_events_route", exc_info=exc)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error",
+        ) from exc
+
+    return EventPageResponse(
+        items=[
+            EventOut(
+                id=item.id,
+                event_type=item.event_type,
+                event_payload=item.event_payload,
+                created_at=item.created_at,
+            )
+            for item in page.items
+        ],
+        next_cursor=(
+            encode_cursor(page.next_key, event_type, order) if page.next_key is not None else None
+        ),
+    )
+
+
+@events_router.get("/stats", response_model=EventStatsResponse, status_code=200)
+async def event_stats_route(
+    event_type: str
+    | None = Query(  # noqa: B008
+        None, alias="type", min_length=1, max_length=MAX_EVENT_TYPE_LENGTH
+    ),
+    resolution: Resolution = "minute",
+    since: datetime | None = None,
+    until: datetime | None = None,
+    limit: int = Query(DEFAULT_STATS_BUCKETS, ge=1, le=MAX_STATS_BUCKETS),  # noqa: B008
+    repo: RollupRepository = Depends(get_rollup_repository),  # noqa: B008
+) -> EventStatsResponse:
+    """Return events per type per minute or hour.
+
+    Served from the incrementally maintained rollup table, so the cost
+    depends on the number of buckets in the range, not on the number of
+    events. Counts lag ingestion by at most the rollup flush interval.
+
+    Args:
+        event_type: Only this type (query parameter `type`).
+        resolution: Bucket width, "minute" (default) or "hour".
+        since: Only buckets starting at or after this instant (naive = UTC).
+        until: Only buckets starting before this instant (naive = UTC).
+        limit: Maximum number of buckets (1-10000).
+        repo: Rollup repository (injected).
+
+    Returns:
+        EventStatsResponse with buckets ordered by (bucket_start, event_type).
+
+    Raises:
+        HTTPException 503: Database timeout.
+        HTTPException 500: Unexpected error.
+    """
+    query = RollupQuery(
+        resolution=resolution, limit=limit, event_type=event_type, since=since, until=until
+    )
+    try:
+        stats = await event_stats_uc(query=query, repo=repo)
+
+    except TimeoutError as exc:
+        logger.error("Database timeout: %s", exc)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Database operation timed out",
+        ) from exc
+
+    except Exception as exc:
+        logger.error("Unexpected error in event_stats_route", exc_info=exc)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error",
+        ) from exc
+
+    return EventStatsResponse(
+        resolution=resolution,
+        buckets=[
+            EventStatsBucket(
+                event_type=bucket.event_type,
+                bucket_start=bucket.bucket_start,
+                count=bucket.count,
+                total_payload_bytes=bucket.total_payload_bytes,
+            )
+            for bucket in stats.buckets
+        ],
+        truncated=stats.truncated,
+    )
+
+
+@events_router.get("/recent", response_model=RecentEventsResponse, status_code=200)
+async def recent_events_route(
+    event_type: str = Query(  # noqa: B008
+        ..., alias="type", min_length=1, max_length=MAX_EVENT_TYPE_LENGTH
+    ),
+    limit: int = Query(DEFAULT_RECENT_EVENTS, ge=1, le=MAX_RECENT_EVENTS),  # noqa: B008
+    buffer: RecentEventsBuffer | None = Depends(get_recent_events_buffer),  # noqa: B008
+    repo: EventQueryRepository = Depends(get_event_query_repository),  # noqa: B008
+) -> RecentEventsResponse:
+    """Return the newest events of a type.
+
+    Served from the in-memory recent events buffer when it holds events of
+    the type, without touching the database; otherwise read from the
+    database. The buffer keeps at most RECENT_EVENTS_PER_TYPE events per
+    type, so a larger limit only gets that many from memory.
+
+    Args:
+        event_type: Type to read (query parameter `type`).
+        limit: Maximum number of events (1-1000).
+        buffer: Recent events buffer (injected, None when disabled).
+        repo: Event query repository (injected).
+
+    Returns:
+        RecentEventsResponse with events newest first and where they came from.
+
+    Raises:
+        HTTPException 503: Database timeout.
+        HTTPException 500: Unexpected error.
+    """
+    try:
+        recent = await recent_events_uc(
+            event_type=event_type, limit=limit, buffer=buffer, repo=repo
+        )
+
+    except TimeoutError as exc:
+        logger.error("Database timeout: %s", exc)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Database operation timed out",
+        ) from exc
+
+    except Exception as exc:
+        logger.error("Unexpected error in recent_events_route", exc_info=exc)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error",
+        ) from exc
+
+    return RecentEventsResponse(
+        source=recent.source,
+        items=[
+            RecentEvent(
+                event_type=item.event_type,
+                event_payload=item.event_payload,
+                created_at=item.created_at,
+            )
+            for item in recent.items
+        ],
+    )
+
+
+@events_router.get("/recent/memory", response_model=RecentEventsMemoryResponse, status_code=200)
+async def recent_events_memory_route(
+    buffer: RecentEventsBuffer | None = Depends(get_recent_events_buffer),  # noqa: B008
+) -> RecentEventsMemoryResponse:
+    """Report the memory used by the recent events buffer.
+
+    Args:
+        buffer: Recent events buffer (injected, None when disabled).
+
+    Returns:
+        RecentEventsMemoryResponse with approximate usage and the cap.
+    """
+    if buffer is None:
+        return RecentEventsMemoryResponse(enabled=False)
+
+    usage = buffer.usage()
+    return RecentEventsMemoryResponse(
+        enabled=True,
+        types=usage.types,
+        events=usage.events,
+        bytes=usage.bytes,
+        max_bytes=usage.max_bytes,
+        evicted_types=usage.evicted_types,
+    )
+
+
+@events_router.get("/retention", response_model=RetentionProgressResponse, status_code=200)
+async def retention_progress_route(
+    job: RetentionJob | None = Depends(get_retention_job),  # noqa: B008
+) -> RetentionProgressResponse:
+    """Report the progress of the retention job.
+
+    Args:
+        job: Retention job (injected, None when disabled).
+
+    Returns:
+        RetentionProgressResponse with the job's counters.
+    """
+    if job is None:
+        return RetentionProgressResponse(enabled=False)
+
+    progress = job.progress
+    return RetentionProgressResponse(
+        enabled=True,
+        running=progress.running,
+        runs=progress.runs,
+        batches=progress.batches,
+        deleted=progress.deleted,
+        deleted_by_type=progress.deleted_by_type,
+        last_run_started_at=progress.last_run_started_at,
+        last_run_finished_at=progress.last_run_finished_at,
+        last_error=progress.last_error,
+    )
+
+
+@events_router.post("/stream", response_model=EventStreamResponse, status_code=200)
+async def stream_events_route(
+    request: Request,
+    repo: EventRepository = Depends(get_event_repository),  # noqa: B008
+) -> EventStreamResponse:
+    """Ingest newline-delimited JSON events as the body streams in.
+
+    Each line is one Event object. Lines are parsed as they arrive and
+    persisted in chunks of STREAM_CHUNK_SIZE, so memory stays flat regardless
+    of upload size. Invalid lines are rejected individually; chunks committed
+    before a database failure stay committed. Events whose idempotency_key
+    is already stored are skipped and counted as duplicates.
+
+    Args:
+        request: Incoming request (body read as a stream).
+        repo: Event repository (injected).
+
+    Returns:
+        EventStreamResponse with accepted/rejected counts and rejected lines.
+
+    Raises:
+        HTTPException 503: Database timeout.
+        HTTPException 500: Unexpected error.
+    """
+    summary = _StreamSummary()
+    chunk: list[tuple[int, Event]] = []
+    try:
+        async for line_number, line in iter_ndjson_lines(request.stream(), MAX_NDJSON_LINE_BYTES):
+            if line is None:
+                summary.reject(line_number, f"Line exceeds {MAX_NDJSON_LINE_BYTES} bytes")
+                continue
+            if not line.strip():
+                continue
+            try:
+                with stage("validate"):
+                    event = Event.model_validate_json(line)
+            except ValidationError as exc:
+                summary.reject(line_number, describe_validation_error(exc))
+                continue
+
+            chunk.append((line_number, event))
+            if len(chunk) >= STREAM_CHUNK_SIZE:
+                await _flush(chunk, repo, summary)
+
+        if chunk:
+            await _flush(chunk, repo, summary)
+
+    except TimeoutError as exc:
+        logger.error("Database timeout: %s", exc)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Database operation timed out",
+        ) from exc
+
+    except Exception as exc:
+        logger.error("Unexpected error in stream_events_route", exc_info=exc)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error",
+        ) from exc
+
+    logger.info(
+        "Event stream processed: accepted=%s, duplicates=%s, rejected=%s",
+        summary.accepted,
+        summary.duplicates,
+        summary.rejected,
+    )
+    return EventStreamResponse(
+        accepted=summary.accepted,
+        duplicates=summary.duplicates,
+        rejected=summary.rejected,
+        rejects=summary.rejects,
+        rejects_truncated=summary.rejected > len(summary.rejects),
+    )
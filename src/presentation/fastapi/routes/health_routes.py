@@ -2,7 +2,11 @@
 
 import logging
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, Response, status
+
+from src.application.health import HealthMonitor
+from src.presentation.fastapi.dependencies import get_health_monitor
+from src.presentation.fastapi.models.event import ReadinessResponse
 
 __all__ = ["health_router"]
 
@@ -18,3 +22,58 @@ async def health_check() -> dict[str, str]:
         Status dictionary.
     """
     return {"status": "healthy"}
+
+
+@health_router.get("/live", response_model=dict)
+async def liveness_probe() -> dict[str, str]:
+    """Liveness probe: the process is running and its event loop answers.
+
+    Does not depend on the database, so an outage does not get the
+    service restarted.
+
+    Returns:
+        Status dictionary.
+    """
+    return {"status": "alive"}
+
+
+@health_router.get(
+    "/ready",
+    response_model=ReadinessResponse,
+    responses={status.HTTP_503_SERVICE_UNAVAILABLE: {"model": ReadinessResponse}},
+)
+async def readiness_probe(
+    response: Response,
+    monitor: HealthMonitor | None = Depends(get_health_monitor),  # noqa: B008
+) -> ReadinessResponse:
+    """Readiness probe: whether the service should receive traffic.
+
+    Answers from the latest background check (HEALTH_CHECK_ENABLED); the
+    database is not queried here. Not ready (503) while the database is
+    unreachable or the connection pool stays saturated.
+
+    Args:
+        response: Outgoing response (status set to 503 when not ready).
+        monitor: Health monitor (injected, None when disabled).
+
+    Returns:
+        ReadinessResponse with the latest check.
+    """
+    if monitor is None:
+        return ReadinessResponse(ready=True, checked=False)
+
+    health = monitor.status
+    if not health.ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    pool = health.pool
+    return ReadinessResponse(
+        ready=health.ready,
+        checked=True,
+        database_up=health.database_up,
+        pool_checked_out=pool.checked_out if pool is not None else None,
+        pool_capacity=pool.capacity if pool is not None else None,
+        pool_waiting=pool.waiting if pool is not None else None,
+        saturated_seconds=health.saturated_seconds,
+        checked_at=health.checked_at,
+        last_error=health.last_error,
+    )
@@ -0,0 +1,33 @@
+"""HTTP route handler exposing metrics to Prometheus."""
+
+from typing import Final
+
+from fastapi import APIRouter, Depends, Response
+
+from src.application.metrics import REGISTRY, render_prometheus
+from src.infrastructure.metrics.worker_files import WorkerMetricsFiles
+from src.presentation.fastapi.dependencies import get_metrics_files
+
+__all__ = ["metrics_router"]
+
+metrics_router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+PROMETHEUS_CONTENT_TYPE: Final = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@metrics_router.get("", include_in_schema=False)
+async def metrics_route(
+    files: WorkerMetricsFiles | None = Depends(get_metrics_files),  # noqa: B008
+) -> Response:
+    """Return the metrics in the Prometheus text format.
+
+    With several workers, the values of all workers are merged.
+
+    Args:
+        files: Shared per-worker metrics files (injected, None for a single worker).
+
+    Returns:
+        Exposition text.
+    """
+    snapshot = REGISTRY.snapshot() if files is None else await files.collect()
+    return Response(render_prometheus(snapshot), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,52 @@
+"""Server startup.
+
+Kept apart from the application factory: the process starting the server
+imports only uvicorn, while FastAPI, the routes and the database drivers
+are imported by the worker processes that build the application.
+"""
+
+import logging
+
+import uvicorn
+
+from src.application.ports.http_server import HttpServer
+
+__all__ = ["start_fast_api_server"]
+
+logger = logging.getLogger(__name__)
+
+
+def start_fast_api_server(params: HttpServer, app_factory: str) -> None:
+    """Start the FastAPI server.
+
+    Every worker process imports and calls the app factory, so each one
+    builds its own application, database pool and optional components.
+    On SIGTERM/SIGINT each worker stops accepting connections, waits up to
+    graceful_shutdown_seconds for in-flight requests, then runs the
+    application's shutdown (draining group commit, spool and metrics).
+
+    Args:
+        params: Port, worker count, event loop, HTTP parser and shutdown timeout.
+        app_factory: Import string ("module:function") of a function
+            returning the application.
+    """
+    logger.info(
+        "Starting FastAPI server: port=%s, workers=%s, loop=%s, http=%s",
+        params.port,
+        params.workers,
+        params.loop,
+        params.http,
+    )
+    uvicorn.run(
+        app_factory,
+        factory=True,
+        host="0.0.0.0",
+        port=params.port,
+        workers=params.workers,
+        loop=params.loop,
+        http=params.http,
+        timeout_graceful_shutdown=params.graceful_shutdown_seconds,
+        access_log=True,
+        # Logging is set up by configure_logs, so uvicorn's records go through its queue
+        log_config=None,
+    )
@@ -1,44 +1,149 @@
-"""FastAPI application factory and server startup."""
+"""FastAPI application factory."""
 
 import logging
 from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
+from contextlib import AsyncExitStack, asynccontextmanager
+from datetime import timedelta
 
-import uvicorn
 from fastapi import FastAPI
 from fastapi.responses import RedirectResponse
 
+from src.application.admission import AdmissionController
+from src.application.group_commit import GroupCommitter
+from src.application.health import HealthMonitor
+from src.application.idempotency import IdempotencyCache
+from src.application.metrics import REGISTRY
 from src.application.ports.db_provider import DbProvider
-from src.application.ports.http_server import HttpServer
-from src.presentation.fastapi.routes.event_routes import event_router
+from src.application.recent_events import RecentEventsBuffer
+from src.application.retention import RetentionJob
+from src.application.rollups import RollupAggregator
+from src.infrastructure.config.settings import (
+    AppSettings,
+    RetentionSettings,
+    SpoolSettings,
+)
+from src.infrastructure.metrics.worker_files import WorkerMetricsFiles
+from src.infrastructure.spool.log import SpoolLog
+from src.infrastructure.spool.spool import EventSpool
+from src.presentation.fastapi.metrics import MetricsMiddleware
+from src.presentation.fastapi.routes.event_routes import event_router, fast_event_router
+from src.presentation.fastapi.routes.events_routes import events_router
 from src.presentation.fastapi.routes.health_routes import health_router
+from src.presentation.fastapi.routes.metrics_routes import metrics_router
+from src.presentation.fastapi.stage_timing import StageTimingMiddleware
 
-__all__ = ["create_app", "start_fast_api_server"]
+__all__ = ["create_app"]
 
 logger = logging.getLogger(__name__)
 
 
 def create_app(
     db_provider: DbProvider,
+    settings: AppSettings | None = None,
 ) -> FastAPI:
     """Create and configure FastAPI application.
 
     Wires infrastructure (database, routes, error handlers).
 
+    Args:
+        db_provider: Database provider.
+        settings: Optional component settings (all disabled when omitted).
+
     Returns:
         Configured FastAPI application instance.
     """
+    settings = settings or AppSettings()
 
     @asynccontextmanager
     async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         """Manage application lifecycle (startup/shutdown).
 
-        Startup: Initialize database engine and session maker.
-        Shutdown: Dispose of connections.
+        Startup: Initialize database engine, session maker and optional components.
+        Shutdown: Drain optional components, then dispose of connections.
         """
         logger.info("Starting up application...")
-        async with db_provider:
+        async with db_provider, AsyncExitStack() as stack:
             app.state.db_provider = db_provider
+            app.state.metrics_enabled = settings.metrics.enabled
+
+            app.state.metrics_files = None
+            if settings.metrics.enabled and settings.metrics.multiprocess_dir:
+                app.state.metrics_files = await stack.enter_async_context(
+                    WorkerMetricsFiles(
+                        REGISTRY,
+                        settings.metrics.multiprocess_dir,
+                        interval_seconds=settings.metrics.write_interval_seconds,
+                    )
+                )
+
+            app.state.recent_events = None
+            if settings.recent_events.enabled:
+                app.state.recent_events = RecentEventsBuffer(
+                    max_per_type=settings.recent_events.max_per_type,
+                    max_bytes=settings.recent_events.max_bytes,
+                )
+
+            app.state.admission = None
+            if settings.admission.enabled:
+                app.state.admission = AdmissionController(
+                    initial_limit=settings.admission.initial_limit,
+                    min_limit=settings.admission.min_limit,
+                    max_limit=settings.admission.max_limit,
+                    target_latency_seconds=settings.admission.target_latency_ms / 1000,
+                )
+
+            app.state.idempotency = None
+            if settings.idempotency.cache_enabled:
+                app.state.idempotency = IdempotencyCache(
+                    max_keys=settings.idempotency.cache_max_keys,
+                    ttl_seconds=settings.idempotency.cache_ttl_seconds,
+                )
+
+            # Entered first so it exits last, after group commit has drained
+            app.state.rollups = None
+            if settings.rollups.enabled:
+                app.state.rollups = await stack.enter_async_context(
+                    RollupAggregator(
+                        repository=db_provider.rollup_repository(),
+                        flush_interval_seconds=settings.rollups.flush_interval_ms / 1000,
+                    )
+                )
+
+            # Entered before group commit so it can still take the final drain
+            app.state.spool = None
+            if settings.spool.enabled:
+                app.state.spool = await stack.enter_async_context(
+                    _create_spool(db_provider, settings.spool)
+                )
+
+            app.state.group_commit = None
+            if settings.group_commit.enabled:
+                app.state.group_commit = await stack.enter_async_context(
+                    GroupCommitter(
+                        repository_factory=db_provider.event_repository,
+                        linger_seconds=settings.group_commit.linger_ms / 1000,
+                        max_batch_size=settings.group_commit.max_batch_size,
+                    )
+                )
+
+            app.state.retention = None
+            if settings.retention.enabled:
+                app.state.retention = await stack.enter_async_context(
+                    _create_retention_job(db_provider, settings.retention)
+                )
+
+            app.state.health = None
+            if settings.health.enabled:
+                app.state.health = await stack.enter_async_context(
+                    HealthMonitor(
+                        db_provider.ping,
+                        db_provider.pool_usage,
+                        interval_seconds=settings.health.interval_seconds,
+                        timeout_seconds=settings.health.timeout_seconds,
+                        saturation_seconds=settings.health.saturation_seconds,
+                    )
+                )
+
             yield
         logger.info("Shutting down application...")
 
@@ -49,8 +154,20 @@ def create_app(
         lifespan=lifespan,
     )
 
+    if settings.fast_ingest.enabled:
+        app.include_router(fast_event_router)
     app.include_router(event_router)
+    app.include_router(events_router)
     app.include_router(health_router)
+    if settings.metrics.enabled:
+        app.include_router(metrics_router)
+        app.add_middleware(MetricsMiddleware)
+    if settings.request_timing.enabled:
+        app.add_middleware(
+            StageTimingMiddleware,
+            header=settings.request_timing.server_timing_header,
+            slow_request_seconds=settings.request_timing.slow_request_ms / 1000,
+        )
 
     @app.get("/", include_in_schema=False)
     async def _() -> RedirectResponse:
@@ -60,12 +177,32 @@ def create_app(
     return app
 
 
-def start_fast_api_server(params: HttpServer, db_provider: DbProvider) -> None:
-    """Start the FastAPI server.
+def _create_retention_job(db_provider: DbProvider, settings: RetentionSettings) -> RetentionJob:
+    def max_age(days: float) -> timedelta | None:
+        return timedelta(days=days) if days > 0 else None
+
+    return RetentionJob(
+        repository=db_provider.retention_repository(),
+        default_max_age=max_age(settings.default_max_age_days),
+        max_age_by_type={
+            event_type: max_age(days) for event_type, days in settings.max_age_days_by_type.items()
+        },
+        batch_size=settings.batch_size,
+        batch_pause_seconds=settings.batch_pause_ms / 1000,
+        max_rows_per_second=settings.max_rows_per_second,
+        interval_seconds=settings.interval_seconds,
+    )
+
 
-    Args:
-        port: Port number to bind to.
-    """
-    logger.info(f"Starting FastAPI server on port {params.port}...")
-    app = create_app(db_provider=db_provider)
-    uvicorn.run(app, host="0.0.0.0", port=params.port, access_log=True)
+def _create_spool(db_provider: DbProvider, settings: SpoolSettings) -> EventSpool:
+    return EventSpool(
+        log=SpoolLog(
+            settings.directory,
+            segment_bytes=settings.segment_bytes,
+            fsync_interval_seconds=settings.fsync_interval_ms / 1000,
+            worker_slots=settings.worker_slots,
+        ),
+        repository_factory=db_provider.event_repository,
+        replay_batch_size=settings.replay_batch_size,
+        retry_interval_seconds=settings.retry_interval_seconds,
+    )
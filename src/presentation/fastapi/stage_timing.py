@@ -0,0 +1,173 @@
+"""Per-request stage timing: Server-Timing header and slow-request log."""
+
+import asyncio
+import functools
+import json
+import logging
+import time
+from collections.abc import Callable, Coroutine
+from contextvars import ContextVar
+from typing import Any
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.application.stage_timing import (
+    StageTimings,
+    current_timings,
+    record_stage,
+    stage,
+    start_request_timing,
+    stop_request_timing,
+)
+
+__all__ = ["StageTimingMiddleware", "TimedRoute"]
+
+logger = logging.getLogger(__name__)
+
+# When the endpoint of the current request returned, for the "serialize" stage
+_endpoint_end: ContextVar[float | None] = ContextVar("endpoint_end", default=None)
+
+
+def _format_server_timing(timings: StageTimings, total_seconds: float) -> str:
+    entries = [f"{name};dur={seconds * 1000:.3f}" for name, seconds in timings.stages.items()]
+    entries.append(f"total;dur={total_seconds * 1000:.3f}")
+    return ", ".join(entries)
+
+
+def _format_stages(timings: StageTimings) -> str:
+    return ",".join(f"{name}:{seconds * 1000:.3f}" for name, seconds in timings.stages.items())
+
+
+class StageTimingMiddleware:
+    """ASGI middleware collecting the stage timings of every HTTP request.
+
+    Stages are recorded by the instrumented code through
+    src.application.stage_timing while the request runs. The breakdown is
+    sent in a Server-Timing header (durations in milliseconds, plus the
+    total until the response started), and a request whose total exceeds
+    the threshold is logged with its stages.
+
+    Only stages run by the request's own task are attributed: a
+    group-commit flush runs in the flusher task, so the request's wait for
+    it counts towards the total but not towards any stage.
+    """
+
+    def __init__(self, app: ASGIApp, *, header: bool, slow_request_seconds: float) -> None:
+        """Wrap an ASGI application.
+
+        Args:
+            app: Application to time.
+            header: Send the Server-Timing header.
+            slow_request_seconds: Log requests taking at least this long.
+        """
+        self.app = app
+        self._header = header
+        self._slow_request_seconds = slow_request_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+        timings, token = start_request_timing()
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if self._header:
+                    value = _format_server_timing(timings, time.perf_counter() - started)
+                    message["headers"] = [
+                        *message.get("headers", ()),
+                        (b"server-timing", value.encode("latin-1")),
+                    ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            stop_request_timing(token)
+            total = time.perf_counter() - started
+            if total >= self._slow_request_seconds:
+                logger.warning(
+                    "Slow request: method=%s, path=%s, status=%s, total_ms=%.3f, stages=%s",
+                    scope["method"],
+                    scope["path"],
+                    status,
+                    total * 1000,
+                    _format_stages(timings),
+                )
+
+
+class _TimedRequest(Request):
+    """Request timing how long the body takes to arrive and to decode."""
+
+    async def body(self) -> bytes:
+        if not hasattr(self, "_body"):
+            with stage("receive"):
+                return await super().body()
+        return self._body
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            body = await self.body()
+            with stage("parse"):
+                self._json = json.loads(body)
+        return self._json
+
+
+class TimedRoute(APIRoute):
+    """Route class adding the HTTP-side stages to a timed request.
+
+    - receive: reading the request body.
+    - parse: decoding the JSON body.
+    - validate: validating the body parameters against their models.
+    - serialize: validating and encoding the response after the endpoint
+      returned.
+
+    Outside a timed request the handler runs unchanged.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        endpoint = self.dependant.call
+        if endpoint is not None and asyncio.iscoroutinefunction(endpoint):
+            self.dependant.call = _mark_end(endpoint)
+        for field in self.dependant.body_params:
+            field.validate = _timed_validate(field.validate)  # type: ignore[method-assign]
+        handler = super().get_route_handler()
+
+        async def timed_handler(request: Request) -> Response:
+            if current_timings() is None:
+                return await handler(request)
+            _endpoint_end.set(None)
+            response = await handler(_TimedRequest(request.scope, request.receive))
+            endpoint_end = _endpoint_end.get()
+            if endpoint_end is not None:
+                record_stage("serialize", time.perf_counter() - endpoint_end)
+            return response
+
+        return timed_handler
+
+
+def _timed_validate(validate: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(validate)
+    def timed(*args: Any, **kwargs: Any) -> Any:
+        with stage("validate"):
+            return validate(*args, **kwargs)
+
+    return timed
+
+
+def _mark_end(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(endpoint)
+    async def timed_endpoint(*args: Any, **kwargs: Any) -> Any:
+        try:
+            return await endpoint(*args, **kwargs)
+        finally:
+            _endpoint_end.set(time.perf_counter())
+
+    return timed_endpoint
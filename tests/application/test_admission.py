@@ -0,0 +1,146 @@
+"""Tests for adaptive admission control."""
+
+from collections.abc import Sequence
+
+import pytest
+
+from src.application.admission import (
+    AdmissionController,
+    AdmissionRejectedError,
+    AdmittedEventRepository,
+)
+from src.core.event import DomainEvent
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+def make_controller(clock: FakeClock, **overrides: float) -> AdmissionController:
+    options: dict[str, float] = {
+        "initial_limit": 4,
+        "min_limit": 2,
+        "max_limit": 6,
+        "target_latency_seconds": 0.1,
+    }
+    options.update(overrides)
+    return AdmissionController(clock=clock, **options)  # type: ignore[arg-type]
+
+
+def run(controller: AdmissionController, clock: FakeClock, latency: float) -> None:
+    controller.acquire()
+    clock.now += latency
+    controller.observe(latency)
+    controller.release()
+
+
+def test_rejects_beyond_the_limit() -> None:
+    """Requests beyond the limit should be rejected with a retry estimate."""
+    clock = FakeClock()
+    controller = make_controller(clock, initial_limit=2)
+
+    controller.acquire()
+    controller.acquire()
+    with pytest.raises(AdmissionRejectedError) as exc:
+        controller.acquire()
+
+    assert controller.in_flight == 2
+    # Two in flight at the 100 ms target latency, two slots
+    assert exc.value.retry_after == pytest.approx(0.1)
+
+
+def test_fast_writes_raise_the_limit_additively() -> None:
+    """Each fast write should add 1/limit, up to max_limit."""
+    clock = FakeClock()
+    controller = make_controller(clock)
+
+    for _ in range(4):
+        run(controller, clock, 0.01)
+    # Four steps of about 1/4 each stay just under 5
+    assert controller.limit == 4
+
+    for _ in range(100):
+        run(controller, clock, 0.01)
+    assert controller.limit == 6
+    assert controller.in_flight == 0
+
+
+def test_slow_writes_cut_the_limit_once_per_latency_window() -> None:
+    """A burst of slow writes should cut the limit once, not once per write."""
+    clock = FakeClock()
+    controller = make_controller(clock, initial_limit=6, backoff_ratio=0.5)
+
+    for _ in range(3):
+        controller.acquire()
+    clock.now += 1.0
+    for _ in range(3):
+        controller.observe(1.0)
+        controller.release()
+    assert controller.limit == 3
+
+    clock.now += 10
+    run(controller, clock, 1.0)
+    assert controller.limit == 2  # floored at min_limit
+
+
+def test_limits_are_clamped() -> None:
+    """The initial limit should be clamped into [min_limit, max_limit]."""
+    clock = FakeClock()
+
+    assert make_controller(clock, initial_limit=100).limit == 6
+    assert make_controller(clock, initial_limit=0).limit == 2
+    assert make_controller(clock, min_limit=0, max_limit=0, initial_limit=0).limit == 1
+
+
+def test_requests_without_writes_leave_the_limit() -> None:
+    """Admitting and releasing a request should not sample its duration."""
+    clock = FakeClock()
+    controller = make_controller(clock, backoff_ratio=0.5)
+
+    controller.acquire()
+    clock.now += 10  # e.g. a slow client sending its body
+    controller.release()
+
+    assert (controller.limit, controller.in_flight) == (4, 0)
+
+
+class RecordingRepo:
+    """Repository recording saved events."""
+
+    def __init__(self) -> None:
+        self.saved: list[DomainEvent] = []
+
+    async def save(self, event: DomainEvent, *, returning: bool = True) -> object:
+        """Record the event."""
+        self.saved.append(event)
+        return True
+
+    async def save_many(self, events: Sequence[DomainEvent]) -> list[bool]:
+        """Record the events."""
+        self.saved.extend(events)
+        return [True] * len(events)
+
+
+@pytest.mark.asyncio
+async def test_admitted_repository_reports_write_latency() -> None:
+    """Every write should be passed on and its latency observed."""
+    samples: list[float] = []
+    controller = make_controller(FakeClock())
+    controller.observe = samples.append  # type: ignore[method-assign]
+    inner = RecordingRepo()
+    repo = AdmittedEventRepository(inner, controller)
+    event = DomainEvent.create(event_type="msg", event_payload="hello")
+
+    await repo.save(event)
+    await repo.save_many([event, event])
+
+    assert len(inner.saved) == 3
+    assert len(samples) == 2
+    assert all(sample >= 0 for sample in samples)
@@ -3,6 +3,7 @@
 import pytest
 
 from src.application.create_event import create_event_uc
+from src.application.idempotency import IdempotencyCache
 from src.application.ports.event_repository import EventRepository
 from src.core.event import DomainEvent
 from src.core.exceptions import DomainValidationError
@@ -13,24 +14,27 @@ class InMemoryEventRepository(EventRepository):
 
     def __init__(self) -> None:
         self.saved_events: list[DomainEvent] = []
+        self.returning_flags: list[bool] = []
 
-    async def save(self, event: DomainEvent) -> DomainEvent:
+    async def save(self, event: DomainEvent, *, returning: bool = True) -> DomainEvent:
         """Save event to memory.
 
         Args:
             event: Domain event to save.
+            returning: Recorded for assertions.
 
         Returns:
             The saved event.
         """
         self.saved_events.append(event)
+        self.returning_flags.append(returning)
         return event
 
 
 class FailingEventRepository(EventRepository):
     """Repository that always fails for error testing."""
 
-    async def save(self, event: DomainEvent) -> None:
+    async def save(self, event: DomainEvent, *, returning: bool = True) -> None:
         """Raise error on save attempt.
 
         Args:
@@ -57,6 +61,8 @@ async def test_create_event_uc_saves_event() -> None:
     saved = repo.saved_events[0]
     assert saved.event_type == "user_joined"
     assert saved.event_payload == "Alice"
+    # The use case discards the persisted row, so it should not ask for it
+    assert repo.returning_flags == [False]
 
 
 @pytest.mark.asyncio
@@ -86,3 +92,18 @@ async def test_create_event_uc_propagates_repository_error() -> None:
             event_payload="hello",
             repo=repo,
         )
+
+
+@pytest.mark.asyncio
+async def test_create_event_uc_skips_cached_duplicates() -> None:
+    """A key already in the cache should be answered without saving."""
+    repo = InMemoryEventRepository()
+    cache = IdempotencyCache(max_keys=10, ttl_seconds=60)
+
+    assert await create_event_uc("message", "hello", repo, idempotency_key="k1", cache=cache)
+    cache.record(repo.saved_events)
+    assert not await create_event_uc("message", "hello", repo, idempotency_key=" k1", cache=cache)
+    assert await create_event_uc("message", "hello", repo, idempotency_key="k2", cache=cache)
+    assert await create_event_uc("message", "hello", repo, idempotency_key="k1")
+
+    assert [e.idempotency_key for e in repo.saved_events] == ["k1", "k2", "k1"]
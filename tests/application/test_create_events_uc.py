@@ -0,0 +1,99 @@
+"""Tests for create_events (batch) use case."""
+
+from collections.abc import Sequence
+
+import pytest
+
+from src.application.create_events import EventOutcome, create_events_uc
+from src.application.ports.event_repository import EventRepository
+from src.core.event import DomainEvent
+
+
+class InMemoryBatchRepository(EventRepository):
+    """In-memory repository recording each save_many call."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[DomainEvent]] = []
+
+    async def save(self, event: DomainEvent, *, returning: bool = True) -> DomainEvent:
+        """Save a single event to memory."""
+        self.batches.append([event])
+        return event
+
+    async def save_many(self, events: Sequence[DomainEvent]) -> list[bool]:
+        """Save events to memory as one batch; events keyed "dup" count as skipped."""
+        self.batches.append(list(events))
+        return [event.idempotency_key != "dup" for event in events]
+
+
+@pytest.mark.asyncio
+async def test_create_events_uc_persists_valid_items_in_one_batch() -> None:
+    """Valid items should be persisted with a single save_many call."""
+    repo = InMemoryBatchRepository()
+
+    outcomes = await create_events_uc(
+        items=[("user_joined", "Alice"), ("user_left", "Bob")],
+        repo=repo,
+    )
+
+    assert outcomes == [EventOutcome("created"), EventOutcome("created")]
+    assert len(repo.batches) == 1
+    assert [e.event_payload for e in repo.batches[0]] == ["Alice", "Bob"]
+
+
+@pytest.mark.asyncio
+async def test_create_events_uc_reports_invalid_items() -> None:
+    """Invalid items should be reported without failing the batch."""
+    repo = InMemoryBatchRepository()
+
+    outcomes = await create_events_uc(
+        items=[("   ", "Alice"), ("message", "hello"), ("message", " ")],
+        repo=repo,
+    )
+
+    assert outcomes == [
+        EventOutcome("rejected", "Event type cannot be empty"),
+        EventOutcome("created"),
+        EventOutcome("rejected", "Event payload cannot be empty"),
+    ]
+    assert [e.event_payload for e in repo.batches[0]] == ["hello"]
+
+
+@pytest.mark.asyncio
+async def test_create_events_uc_skips_repository_when_nothing_valid() -> None:
+    """Repository should not be called when every item is rejected."""
+    repo = InMemoryBatchRepository()
+
+    outcomes = await create_events_uc(items=[("", "x")], repo=repo)
+
+    assert outcomes == [EventOutcome("rejected", "Event type cannot be empty")]
+    assert repo.batches == []
+
+
+@pytest.mark.asyncio
+async def test_create_events_uc_passes_idempotency_keys() -> None:
+    """Idempotency keys should be attached to their items."""
+    repo = InMemoryBatchRepository()
+
+    outcomes = await create_events_uc(
+        items=[("user_joined", "Alice"), ("user_left", "Bob"), ("user_left", "Eve")],
+        repo=repo,
+        idempotency_keys=["k1", None, " "],
+    )
+
+    assert [outcome.status for outcome in outcomes] == ["created", "created", "rejected"]
+    assert [e.idempotency_key for e in repo.batches[0]] == ["k1", None]
+
+
+@pytest.mark.asyncio
+async def test_create_events_uc_reports_skipped_duplicates() -> None:
+    """Items skipped by the repository should be reported as duplicates."""
+    repo = InMemoryBatchRepository()
+
+    outcomes = await create_events_uc(
+        items=[("a", "x"), ("", "y"), ("b", "z")],
+        repo=repo,
+        idempotency_keys=["dup", "k2", "k3"],
+    )
+
+    assert [outcome.status for outcome in outcomes] == ["duplicate", "rejected", "created"]
@@ -0,0 +1,87 @@
+"""Tests for the committed-events listener decorator."""
+
+from collections.abc import Sequence
+from datetime import UTC, datetime
+
+import pytest
+
+from src.application.event_listeners import ListeningEventRepository
+from src.application.ports.event_listener import CommittedEventsListener
+from src.application.ports.event_repository import EventRepository
+from src.core.event import DomainEvent
+
+
+class NullRepository(EventRepository):
+    """Repository accepting every write (or failing them all).
+
+    Events whose payload is "dup" are skipped as duplicates.
+    """
+
+    def __init__(self, fail: bool = False) -> None:
+        self._fail = fail
+
+    async def save(self, event: DomainEvent, *, returning: bool = True) -> str | None:
+        """Accept a single event."""
+        (inserted,) = await self.save_many([event])
+        return "saved" if inserted else None
+
+    async def save_many(self, events: Sequence[DomainEvent]) -> list[bool]:
+        """Accept the events (or fail)."""
+        if self._fail:
+            raise RuntimeError("DB down")
+        return [event.event_payload != "dup" for event in events]
+
+
+class RecordingListener(CommittedEventsListener):
+    """Listener recording every notification."""
+
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    def record(self, events: Sequence[DomainEvent]) -> None:
+        """Record the payloads."""
+        self.calls.append([event.event_payload for event in events])
+
+
+def event(payload: str) -> DomainEvent:
+    return DomainEvent(event_type="msg", event_payload=payload, created_at=datetime.now(UTC))
+
+
+@pytest.mark.asyncio
+async def test_listeners_hear_committed_writes() -> None:
+    """Every listener should be notified after save and save_many."""
+    first, second = RecordingListener(), RecordingListener()
+    repo = ListeningEventRepository(NullRepository(), [first, second])
+
+    assert await repo.save(event("a"), returning=False) == "saved"
+    await repo.save_many([event("b"), event("c")])
+
+    assert first.calls == [["a"], ["b", "c"]]
+    assert second.calls == first.calls
+
+
+@pytest.mark.asyncio
+async def test_listeners_ignore_failed_writes() -> None:
+    """A failed write should reach no listener."""
+    listener = RecordingListener()
+    repo = ListeningEventRepository(NullRepository(fail=True), [listener])
+
+    with pytest.raises(RuntimeError):
+        await repo.save_many([event("a")])
+    with pytest.raises(RuntimeError):
+        await repo.save(event("b"))
+
+    assert listener.calls == []
+
+
+@pytest.mark.asyncio
+async def test_listeners_skip_duplicates() -> None:
+    """Events the repository skipped as duplicates should reach no listener."""
+    listener = RecordingListener()
+    repo = ListeningEventRepository(NullRepository(), [listener])
+
+    assert await repo.save(event("dup")) is None
+    assert await repo.save_many([event("a"), event("dup"), event("b")]) == [True, False, True]
+    assert await repo.save_many([event("dup")]) == [False]
+
+    assert listener.calls == [["a", "b"]]
@@ -0,0 +1,55 @@
+"""Tests for event_stats use case."""
+
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from src.application.event_stats import event_stats_uc
+from src.application.ports.rollup_repository import RollupBucket, RollupQuery, RollupRepository
+
+BASE = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+class StaticRollupRepository(RollupRepository):
+    """Rollup repository returning the first buckets of a fixed list."""
+
+    def __init__(self, count: int) -> None:
+        self.buckets = [
+            RollupBucket(
+                "minute", "msg", BASE + timedelta(minutes=i), count=i + 1, total_payload_bytes=1
+            )
+            for i in range(count)
+        ]
+        self.queries: list[RollupQuery] = []
+
+    async def add(self, buckets: Sequence[RollupBucket]) -> None:
+        """Not used by these tests."""
+
+    async def list_buckets(self, query: RollupQuery) -> list[RollupBucket]:
+        """Record the query and return up to query.limit buckets."""
+        self.queries.append(query)
+        return self.buckets[: query.limit]
+
+
+@pytest.mark.asyncio
+async def test_event_stats_uc_flags_truncation() -> None:
+    """More matching buckets than the limit should be reported as truncated."""
+    repo = StaticRollupRepository(count=3)
+
+    stats = await event_stats_uc(RollupQuery(resolution="minute", limit=2), repo)
+
+    assert [b.count for b in stats.buckets] == [1, 2]
+    assert stats.truncated is True
+    assert repo.queries[0].limit == 3
+
+
+@pytest.mark.asyncio
+async def test_event_stats_uc_complete_result() -> None:
+    """A result within the limit should not be truncated."""
+    stats = await event_stats_uc(
+        RollupQuery(resolution="minute", limit=5), StaticRollupRepository(count=3)
+    )
+
+    assert len(stats.buckets) == 3
+    assert stats.truncated is False
@@ -0,0 +1,139 @@
+"""Tests for the group-commit stage."""
+
+import asyncio
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager
+
+import pytest
+
+from src.application.group_commit import GroupCommitEventRepository, GroupCommitter
+from src.application.ports.event_repository import EventRepository
+from src.core.event import DomainEvent
+
+
+class RecordingRepository(EventRepository):
+    """Repository recording every committed batch."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.batches: list[list[DomainEvent]] = []
+        self._fail = fail
+
+    async def save(self, event: DomainEvent, *, returning: bool = True) -> bool | None:
+        """Save a single event."""
+        (inserted,) = await self.save_many([event])
+        return True if inserted else None
+
+    async def save_many(self, events: Sequence[DomainEvent]) -> list[bool]:
+        """Record the batch (or fail); events keyed "dup" count as skipped."""
+        if self._fail:
+            raise RuntimeError("DB down")
+        self.batches.append(list(events))
+        return [event.idempotency_key != "dup" for event in events]
+
+
+def make_factory(repo: RecordingRepository):  # type: ignore[no-untyped-def]
+    @asynccontextmanager
+    async def factory() -> AsyncIterator[EventRepository]:
+        yield repo
+
+    return factory
+
+
+def make_events(count: int) -> list[DomainEvent]:
+    return [DomainEvent.create(event_type="msg", event_payload=str(i)) for i in range(count)]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_submits_share_one_commit() -> None:
+    """Writes arriving within the linger window should be flushed together."""
+    repo = RecordingRepository()
+    async with GroupCommitter(make_factory(repo), linger_seconds=0.05, max_batch_size=100) as gc:
+        await asyncio.gather(*(gc.submit([event]) for event in make_events(5)))
+
+    assert len(repo.batches) == 1
+    assert len(repo.batches[0]) == 5
+
+
+@pytest.mark.asyncio
+async def test_full_batch_flushes_without_waiting_for_linger() -> None:
+    """Reaching max_batch_size should flush before the linger window ends."""
+    repo = RecordingRepository()
+    async with GroupCommitter(make_factory(repo), linger_seconds=10, max_batch_size=3) as gc:
+        await asyncio.wait_for(
+            asyncio.gather(*(gc.submit([event]) for event in make_events(6))),
+            timeout=1,
+        )
+
+    assert [len(batch) for batch in repo.batches] == [3, 3]
+
+
+@pytest.mark.asyncio
+async def test_submit_keeps_multi_event_writes_atomic() -> None:
+    """Events submitted together should never be split across commits."""
+    repo = RecordingRepository()
+    async with GroupCommitter(make_factory(repo), linger_seconds=0.01, max_batch_size=3) as gc:
+        await asyncio.gather(gc.submit(make_events(2)), gc.submit(make_events(2)))
+
+    assert [len(batch) for batch in repo.batches] == [2, 2]
+
+
+@pytest.mark.asyncio
+async def test_failed_commit_propagates_to_every_caller() -> None:
+    """Every caller in a failed batch should receive the repository error."""
+    repo = RecordingRepository(fail=True)
+    async with GroupCommitter(make_factory(repo), linger_seconds=0.01, max_batch_size=10) as gc:
+        results = await asyncio.gather(
+            *(gc.submit([event]) for event in make_events(3)), return_exceptions=True
+        )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_drain_flushes_pending_and_rejects_new_writes() -> None:
+    """Draining should commit pending writes and then refuse new ones."""
+    repo = RecordingRepository()
+    gc = GroupCommitter(make_factory(repo), linger_seconds=10, max_batch_size=100)
+    await gc.__aenter__()
+
+    pending = asyncio.create_task(gc.submit(make_events(1)))
+    await asyncio.sleep(0)
+    await asyncio.wait_for(gc.__aexit__(None, None, None), timeout=1)
+
+    await pending
+    assert len(repo.batches) == 1
+    with pytest.raises(RuntimeError, match="closed"):
+        await gc.submit(make_events(1))
+
+
+@pytest.mark.asyncio
+async def test_group_commit_event_repository_delegates() -> None:
+    """GroupCommitEventRepository should route save and save_many to the stage."""
+    repo = RecordingRepository()
+    async with GroupCommitter(make_factory(repo), linger_seconds=0, max_batch_size=10) as gc:
+        adapter = GroupCommitEventRepository(gc)
+        assert await adapter.save(make_events(1)[0]) is True
+        assert await adapter.save_many(make_events(2)) == [True, True]
+        assert await adapter.save_many([]) == []
+
+    assert sum(len(batch) for batch in repo.batches) == 3
+
+
+@pytest.mark.asyncio
+async def test_each_caller_gets_its_own_insert_flags() -> None:
+    """Flags from a shared commit should be split back per caller."""
+    repo = RecordingRepository()
+
+    def event(key: str) -> DomainEvent:
+        return DomainEvent.create(event_type="msg", event_payload="x", idempotency_key=key)
+
+    async with GroupCommitter(make_factory(repo), linger_seconds=0.05, max_batch_size=100) as gc:
+        adapter = GroupCommitEventRepository(gc)
+        results = await asyncio.gather(
+            gc.submit([event("a"), event("dup")]),
+            adapter.save(event("dup")),
+            gc.submit([event("b")]),
+        )
+
+    assert len(repo.batches) == 1
+    assert results == [[True, False], None, [True]]
@@ -0,0 +1,139 @@
+"""Tests for the background database health monitor."""
+
+import asyncio
+
+import pytest
+
+from src.application.health import HealthMonitor
+from src.application.ports.db_provider import PoolUsage
+
+
+class FakeDatabase:
+    """Ping and pool usage under the test's control."""
+
+    def __init__(self) -> None:
+        self.pings = 0
+        self.error: Exception | None = None
+        self.delay = 0.0
+        self.pool: PoolUsage | None = PoolUsage(checked_out=0, capacity=4)
+
+    async def ping(self) -> None:
+        self.pings += 1
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+
+    def pool_usage(self) -> PoolUsage | None:
+        return self.pool
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_monitor(
+    database: FakeDatabase, clock: FakeClock | None = None, **overrides: float
+) -> HealthMonitor:
+    options = {
+        "interval_seconds": 60.0,
+        "timeout_seconds": 0.05,
+        "saturation_seconds": 10.0,
+        **overrides,
+    }
+    return HealthMonitor(
+        database.ping,
+        database.pool_usage,
+        clock=clock or FakeClock(),
+        **options,  # type: ignore[arg-type]
+    )
+
+
+@pytest.mark.asyncio
+async def test_monitor_follows_database_reachability() -> None:
+    """A failed or timed-out ping makes the service not ready until a ping succeeds."""
+    database = FakeDatabase()
+    monitor = make_monitor(database)
+
+    up = await monitor.check_once()
+    database.error = ConnectionRefusedError("connection refused")
+    down = await monitor.check_once()
+    database.error, database.delay = None, 1.0
+    timed_out = await monitor.check_once()
+    database.delay = 0.0
+    recovered = await monitor.check_once()
+
+    assert (up.ready, up.database_up, up.last_error) == (True, True, None)
+    assert (down.ready, down.database_up, down.last_error) == (False, False, "connection refused")
+    assert (timed_out.ready, timed_out.last_error) == (False, "TimeoutError")
+    assert recovered.ready and recovered.last_error is None
+    assert recovered.checked_at is not None
+    assert recovered.pool == PoolUsage(checked_out=0, capacity=4)
+
+
+@pytest.mark.asyncio
+async def test_monitor_fails_readiness_when_pool_stays_saturated() -> None:
+    """The pool must be saturated at every check for saturation_seconds; no ping meanwhile."""
+    database = FakeDatabase()
+    clock = FakeClock()
+    monitor = make_monitor(database, clock)
+    await monitor.check_once()
+
+    database.pool = PoolUsage(checked_out=4, capacity=4, waiting=7)
+    clock.now = 100.0
+    saturated = await monitor.check_once()
+    clock.now = 110.0
+    still_saturated = await monitor.check_once()
+    database.pool = PoolUsage(checked_out=1, capacity=4)
+    clock.now = 111.0
+    drained = await monitor.check_once()
+
+    assert (saturated.ready, saturated.saturated_seconds) == (True, 0.0)
+    assert (still_saturated.ready, still_saturated.saturated_seconds) == (False, 10.0)
+    assert still_saturated.database_up is True
+    assert drained.ready and drained.saturated_seconds == 0.0
+    assert database.pings == 2
+
+
+@pytest.mark.asyncio
+async def test_monitor_without_pool_or_bound_is_never_saturated() -> None:
+    """Providers without a pool, or with an unbounded one, are never saturated."""
+    database = FakeDatabase()
+    clock = FakeClock()
+    monitor = make_monitor(database, clock, saturation_seconds=0.0)
+
+    database.pool = None
+    without_pool = await monitor.check_once()
+    database.pool = PoolUsage(checked_out=500, capacity=None)
+    clock.now = 100.0
+    unbounded = await monitor.check_once()
+    database.pool = PoolUsage(checked_out=4, capacity=4)
+    bounded = await monitor.check_once()
+
+    assert without_pool.ready and without_pool.pool is None
+    assert unbounded.ready and unbounded.saturated_seconds == 0.0
+    assert not bounded.ready
+
+
+@pytest.mark.asyncio
+async def test_monitor_checks_on_enter_and_on_interval() -> None:
+    """Entering runs a check right away, then the schedule runs until exit."""
+    database = FakeDatabase()
+    monitor = make_monitor(database, interval_seconds=0.01)
+
+    assert monitor.status.checked_at is None
+    async with monitor:
+        assert database.pings == 1
+        assert monitor.status.ready
+        for _ in range(100):
+            if database.pings >= 3:
+                break
+            await asyncio.sleep(0.01)
+        assert database.pings >= 3
+    pings = database.pings
+    await asyncio.sleep(0.03)
+
+    assert database.pings == pings
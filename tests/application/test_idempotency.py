@@ -0,0 +1,66 @@
+"""Tests for the idempotency key cache."""
+
+from datetime import UTC, datetime
+
+from src.application.idempotency import IdempotencyCache
+from src.core.event import DomainEvent
+
+AT = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+def keyed(*keys: str | None) -> list[DomainEvent]:
+    return [DomainEvent("msg", "x", AT, idempotency_key=key) for key in keys]
+
+
+def test_cache_remembers_committed_keys() -> None:
+    """Recorded keys should be seen; unkeyed events should be ignored."""
+    cache = IdempotencyCache(max_keys=10, ttl_seconds=60)
+
+    cache.record(keyed("k1", None, "k2"))
+
+    assert cache.seen("k1")
+    assert cache.seen("k2")
+    assert not cache.seen("k3")
+
+
+def test_cache_expires_keys() -> None:
+    """Keys should be forgotten once their TTL has passed."""
+    clock = FakeClock()
+    cache = IdempotencyCache(max_keys=10, ttl_seconds=60, clock=clock)
+    cache.record(keyed("k1"))
+
+    clock.now = 59.9
+    assert cache.seen("k1")
+    clock.now = 60.0
+    assert not cache.seen("k1")
+    assert not cache.seen("k1")
+
+
+def test_cache_evicts_least_recently_recorded_keys() -> None:
+    """Beyond max_keys, the keys recorded longest ago should be dropped."""
+    clock = FakeClock()
+    cache = IdempotencyCache(max_keys=2, ttl_seconds=60, clock=clock)
+
+    cache.record(keyed("k1", "k2"))
+    clock.now = 10
+    cache.record(keyed("k1"))
+    cache.record(keyed("k3"))
+
+    assert cache.seen("k1")
+    assert not cache.seen("k2")
+    assert cache.seen("k3")
+
+    # Re-recording refreshes the TTL
+    clock.now = 65
+    assert cache.seen("k1")
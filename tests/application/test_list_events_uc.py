@@ -0,0 +1,59 @@
+"""Tests for list_events use case."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from src.application.list_events import list_events_uc
+from src.application.ports.event_query_repository import (
+    EventKey,
+    EventQuery,
+    EventQueryRepository,
+    EventRecord,
+)
+
+BASE = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+class StaticQueryRepository(EventQueryRepository):
+    """Query repository returning the first rows of a fixed list."""
+
+    def __init__(self, count: int) -> None:
+        self.records = [
+            EventRecord(
+                id=i + 1,
+                event_type="msg",
+                event_payload=str(i),
+                created_at=BASE + timedelta(seconds=i),
+            )
+            for i in range(count)
+        ]
+        self.queries: list[EventQuery] = []
+
+    async def list_events(self, query: EventQuery) -> list[EventRecord]:
+        """Record the query and return up to query.limit records."""
+        self.queries.append(query)
+        return self.records[: query.limit]
+
+
+@pytest.mark.asyncio
+async def test_list_events_uc_returns_next_key_when_more_rows_exist() -> None:
+    """A full page should point at its last item."""
+    repo = StaticQueryRepository(count=5)
+
+    page = await list_events_uc(EventQuery(limit=3, event_type="msg"), repo)
+
+    assert [item.id for item in page.items] == [1, 2, 3]
+    assert page.next_key == EventKey(created_at=BASE + timedelta(seconds=2), id=3)
+    assert repo.queries == [EventQuery(limit=4, event_type="msg")]
+
+
+@pytest.mark.asyncio
+async def test_list_events_uc_last_page_has_no_next_key() -> None:
+    """A page holding the remaining rows should end pagination."""
+    repo = StaticQueryRepository(count=3)
+
+    page = await list_events_uc(EventQuery(limit=3), repo)
+
+    assert len(page.items) == 3
+    assert page.next_key is None
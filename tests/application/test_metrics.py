@@ -0,0 +1,94 @@
+"""Tests for the in-process metrics registry."""
+
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.application.metrics import (
+    Counter,
+    Gauge,
+    Histogram,
+    MeasuredEventRepository,
+    MetricsRegistry,
+    Snapshot,
+    merge_snapshots,
+    render_prometheus,
+)
+from src.core.event import DomainEvent
+
+
+def make_registry() -> tuple[MetricsRegistry, Counter, Histogram]:
+    registry = MetricsRegistry()
+    counter = registry.register(Counter("errors_total", "Errors.", ["kind"]))
+    histogram = registry.register(Histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0)))
+    registry.register(Gauge("in_use", "In use.", lambda: {(): 3.0}))
+    return registry, counter, histogram
+
+
+def test_render_prometheus_text_format() -> None:
+    """Counters, gauges and cumulative histogram buckets should render as exposition text."""
+    registry, counter, histogram = make_registry()
+    counter.labels('bad "x"').inc()
+    counter.labels("timeout").inc(2)
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value)
+
+    text = render_prometheus(registry.snapshot())
+
+    assert text.splitlines() == [
+        "# HELP errors_total Errors.",
+        "# TYPE errors_total counter",
+        'errors_total{kind="bad \\"x\\""} 1',
+        'errors_total{kind="timeout"} 2',
+        "# HELP in_use In use.",
+        "# TYPE in_use gauge",
+        "in_use 3",
+        "# HELP latency_seconds Latency.",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{le="0.1"} 2',
+        'latency_seconds_bucket{le="1"} 3',
+        'latency_seconds_bucket{le="+Inf"} 4',
+        "latency_seconds_sum 3.65",
+        "latency_seconds_count 4",
+    ]
+
+
+def test_merge_snapshots_sums_workers() -> None:
+    """Snapshots of several workers should add up sample by sample."""
+    first, counter, histogram = make_registry()
+    counter.labels("timeout").inc()
+    histogram.observe(0.5)
+    second, other_counter, other_histogram = make_registry()
+    other_counter.labels("timeout").inc(4)
+    other_counter.labels("integrity").inc()
+    other_histogram.observe(0.5)
+
+    # Snapshots travel between workers as JSON
+    published = Snapshot(json.loads(json.dumps(second.snapshot().families)))
+    merged = merge_snapshots([first.snapshot(), published, first.snapshot(gauges=False)])
+
+    assert sorted(merged.families["errors_total"]["samples"]) == [
+        [["integrity"], 1.0],
+        [["timeout"], 6.0],
+    ]
+    assert merged.families["latency_seconds"]["samples"] == [[[], [0, 3, 0], 1.5]]
+    assert merged.families["in_use"]["samples"] == [[[], 6.0]]
+
+
+@pytest.mark.asyncio
+async def test_measured_repository_times_writes() -> None:
+    """Both write paths should be timed, including failed ones."""
+    inner = AsyncMock()
+    repo = MeasuredEventRepository(inner)
+    event = DomainEvent.create("msg", "hello")
+    saves = repo._save.counts[:]
+
+    assert await repo.save(event, returning=False) is inner.save.return_value
+    inner.save_many.side_effect = TimeoutError
+    with pytest.raises(TimeoutError):
+        await repo.save_many([event])
+
+    inner.save.assert_awaited_once_with(event, returning=False)
+    assert sum(repo._save.counts) == sum(saves) + 1
+    assert sum(repo._save_many.counts) >= 1
@@ -0,0 +1,133 @@
+"""Tests for the recent events buffer and use case."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from src.application.ports.event_query_repository import (
+    EventQuery,
+    EventQueryRepository,
+    EventRecord,
+)
+from src.application.recent_events import RecentEventsBuffer, recent_events_uc
+from src.core.event import DomainEvent
+
+BASE = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+class StaticQueryRepository(EventQueryRepository):
+    """Query repository returning one fixed record."""
+
+    def __init__(self) -> None:
+        self.queries: list[EventQuery] = []
+
+    async def list_events(self, query: EventQuery) -> list[EventRecord]:
+        """Record the query and return a single record."""
+        self.queries.append(query)
+        return [EventRecord(id=7, event_type="msg", event_payload="from db", created_at=BASE)]
+
+
+def events(event_type: str, count: int, start: int = 0) -> list[DomainEvent]:
+    return [
+        DomainEvent(
+            event_type=event_type,
+            event_payload=f"{event_type}-{i}",
+            created_at=BASE + timedelta(seconds=i),
+        )
+        for i in range(start, start + count)
+    ]
+
+
+def payloads(items: list[DomainEvent] | None) -> list[str]:
+    assert items is not None
+    return [item.event_payload for item in items]
+
+
+def test_buffer_keeps_newest_events_per_type() -> None:
+    """Each type should keep only its newest max_per_type events, newest first."""
+    buffer = RecentEventsBuffer(max_per_type=3, max_bytes=1 << 20)
+
+    buffer.record(events("a", 5))
+    buffer.record(events("b", 1))
+
+    assert payloads(buffer.recent("a", 10)) == ["a-4", "a-3", "a-2"]
+    assert payloads(buffer.recent("a", 2)) == ["a-4", "a-3"]
+    assert payloads(buffer.recent("b", 10)) == ["b-0"]
+    assert buffer.recent("missing", 10) is None
+    assert buffer.usage().events == 4
+    assert buffer.usage().types == 2
+
+
+def test_buffer_evicts_least_recently_written_type() -> None:
+    """Going over the cap should drop the type written longest ago."""
+    probe = RecentEventsBuffer(max_per_type=10, max_bytes=1 << 20)
+    probe.record(events("a", 2))
+    two_events_of_a_type = probe.usage().bytes
+
+    buffer = RecentEventsBuffer(max_per_type=10, max_bytes=2 * two_events_of_a_type)
+    buffer.record(events("a", 2))
+    buffer.record(events("b", 2))
+    buffer.record(events("a", 1, start=2))  # "a" becomes the most recently written type
+    buffer.record(events("c", 2))
+
+    assert buffer.recent("b", 10) is None
+    assert payloads(buffer.recent("c", 10)) == ["c-1", "c-0"]
+    usage = buffer.usage()
+    assert usage.evicted_types >= 1
+    assert usage.bytes <= usage.max_bytes
+
+
+def test_buffer_trims_single_type_over_cap() -> None:
+    """A lone type bigger than the cap should keep only its newest events."""
+    probe = RecentEventsBuffer(max_per_type=10, max_bytes=1 << 20)
+    probe.record(events("a", 3))
+
+    buffer = RecentEventsBuffer(max_per_type=10, max_bytes=probe.usage().bytes)
+    buffer.record(events("a", 5))
+
+    assert payloads(buffer.recent("a", 10)) == ["a-4", "a-3", "a-2"]
+    assert buffer.usage().events == 3
+
+    tiny = RecentEventsBuffer(max_per_type=10, max_bytes=0)
+    tiny.record(events("a", 1))
+    assert (tiny.usage().types, tiny.usage().events, tiny.usage().bytes) == (0, 0, 0)
+
+
+def test_buffer_usage_returns_to_zero() -> None:
+    """Accounting should stay consistent through ring overwrites and evictions."""
+    buffer = RecentEventsBuffer(max_per_type=2, max_bytes=1 << 20)
+    buffer.record(events("a", 5) + events("b", 5))
+    used = buffer.usage().bytes
+
+    fresh = RecentEventsBuffer(max_per_type=2, max_bytes=1 << 20)
+    fresh.record(events("a", 2, start=3) + events("b", 2, start=3))
+
+    assert used == fresh.usage().bytes
+
+
+@pytest.mark.asyncio
+async def test_recent_events_uc_serves_from_memory() -> None:
+    """Buffered types should not touch the database."""
+    buffer = RecentEventsBuffer(max_per_type=5, max_bytes=1 << 20)
+    buffer.record(events("msg", 2))
+    repo = StaticQueryRepository()
+
+    recent = await recent_events_uc("msg", 10, buffer, repo)
+
+    assert recent.source == "memory"
+    assert payloads(recent.items) == ["msg-1", "msg-0"]
+    assert repo.queries == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("enabled", [True, False])
+async def test_recent_events_uc_falls_back_to_database(enabled: bool) -> None:
+    """Unbuffered types (or a disabled buffer) should be read newest first from the DB."""
+    buffer = RecentEventsBuffer(max_per_type=5, max_bytes=1 << 20) if enabled else None
+    repo = StaticQueryRepository()
+
+    recent = await recent_events_uc("msg", 10, buffer, repo)
+
+    assert recent.source == "database"
+    assert payloads(recent.items) == ["from db"]
+    assert repo.queries == [EventQuery(limit=10, event_type="msg", order="desc")]
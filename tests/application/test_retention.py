@@ -0,0 +1,175 @@
+"""Tests for the batched retention job."""
+
+import asyncio
+import time
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from src.application.ports.event_query_repository import EventKey
+from src.application.ports.retention_repository import ExpiredBatch, RetentionRepository
+from src.application.retention import RetentionJob
+
+NOW = datetime(2025, 6, 1, tzinfo=UTC)
+
+
+class InMemoryRetentionRepository(RetentionRepository):
+    """Retention repository over a list of (id, type, created_at) rows."""
+
+    def __init__(self, rows: Sequence[tuple[str, datetime]] = (), failures: int = 0) -> None:
+        self.rows = [(i, event_type, at) for i, (event_type, at) in enumerate(rows, start=1)]
+        self.calls: list[tuple[str | None, tuple[str, ...], EventKey | None]] = []
+        self._failures = failures
+
+    async def delete_expired(
+        self,
+        older_than: datetime,
+        limit: int,
+        *,
+        event_type: str | None = None,
+        exclude_types: Sequence[str] = (),
+        after: EventKey | None = None,
+    ) -> ExpiredBatch:
+        """Delete matching rows in (created_at, id) order (or fail)."""
+        self.calls.append((event_type, tuple(exclude_types), after))
+        if self._failures:
+            self._failures -= 1
+            raise RuntimeError("DB down")
+        expired = sorted(
+            (row for row in self.rows if row[2] < older_than),
+            key=lambda row: (row[2], row[0]),
+        )
+        expired = [
+            row
+            for row in expired
+            if (event_type is None or row[1] == event_type)
+            and row[1] not in exclude_types
+            and (after is None or (row[2], row[0]) > (after.created_at, after.id))
+        ][:limit]
+        for row in expired:
+            self.rows.remove(row)
+        if not expired:
+            return ExpiredBatch(deleted=0, last_key=None)
+        return ExpiredBatch(
+            deleted=len(expired), last_key=EventKey(created_at=expired[-1][2], id=expired[-1][0])
+        )
+
+
+def make_job(repo: RetentionRepository, **overrides: object) -> RetentionJob:
+    options: dict[str, object] = {
+        "default_max_age": timedelta(days=30),
+        "max_age_by_type": {},
+        "batch_size": 10,
+        "batch_pause_seconds": 0,
+        "max_rows_per_second": 0,
+        "interval_seconds": 3600,
+    }
+    options.update(overrides)
+    return RetentionJob(repo, **options)  # type: ignore[arg-type]
+
+
+def days_ago(days: float) -> datetime:
+    return NOW - timedelta(days=days)
+
+
+@pytest.mark.asyncio
+async def test_run_once_deletes_expired_in_batches() -> None:
+    """Expired events should go in keyset-ordered batches; recent ones stay."""
+    repo = InMemoryRetentionRepository([("msg", days_ago(40))] * 25 + [("msg", days_ago(1))] * 3)
+    job = make_job(repo)
+
+    assert await job.run_once(now=NOW) == 25
+
+    assert len(repo.rows) == 3
+    assert [call[2] is None for call in repo.calls] == [True, False, False]
+    progress = job.progress
+    assert (progress.runs, progress.batches, progress.deleted) == (1, 3, 25)
+    assert progress.deleted_by_type == {"*": 25}
+    assert progress.running is False
+    assert progress.last_run_started_at == NOW
+    assert progress.last_error is None
+
+
+@pytest.mark.asyncio
+async def test_run_once_applies_per_type_ages() -> None:
+    """Per-type ages should override the default, and None keeps a type forever."""
+    repo = InMemoryRetentionRepository(
+        [
+            ("audit", days_ago(40)),
+            ("audit", days_ago(400)),
+            ("heartbeat", days_ago(2)),
+            ("keep", days_ago(1000)),
+            ("msg", days_ago(40)),
+        ]
+    )
+    job = make_job(
+        repo,
+        max_age_by_type={
+            "audit": timedelta(days=365),
+            "heartbeat": timedelta(days=1),
+            "keep": None,
+        },
+    )
+
+    assert await job.run_once(now=NOW) == 3
+
+    assert sorted(row[1] for row in repo.rows) == ["audit", "keep"]
+    assert job.progress.deleted_by_type == {"audit": 1, "heartbeat": 1, "*": 1}
+    assert repo.calls[-1][:2] == (None, ("audit", "heartbeat", "keep"))
+
+
+@pytest.mark.asyncio
+async def test_run_once_throttles_between_batches() -> None:
+    """Batches should be spaced to stay under the rows-per-second cap."""
+    repo = InMemoryRetentionRepository([("msg", days_ago(40))] * 30)
+    job = make_job(repo, max_rows_per_second=400)
+
+    started = time.monotonic()
+    await job.run_once(now=NOW)
+
+    # Three full batches of 10 at 400 rows/s: 25 ms after each
+    assert time.monotonic() - started >= 0.07
+    assert repo.rows == []
+
+
+@pytest.mark.asyncio
+async def test_run_once_records_failures() -> None:
+    """A failing batch should end the pass and be reported, not raised."""
+    repo = InMemoryRetentionRepository([("msg", days_ago(40))], failures=1)
+    job = make_job(repo)
+
+    assert await job.run_once(now=NOW) == 0
+    assert job.progress.last_error == "DB down"
+    assert job.progress.runs == 1
+
+    assert await job.run_once(now=NOW) == 1
+    assert job.progress.last_error is None
+
+
+@pytest.mark.asyncio
+async def test_job_runs_on_start_and_stops_promptly() -> None:
+    """Entering should start a pass; exiting should interrupt the throttle pause."""
+    repo = InMemoryRetentionRepository([("msg", datetime(2000, 1, 1, tzinfo=UTC))] * 50)
+    job = make_job(repo, batch_pause_seconds=60)
+
+    started = time.monotonic()
+    async with job:
+        while not repo.calls:
+            await asyncio.sleep(0)
+        assert job.progress.running is True
+
+    assert time.monotonic() - started < 5
+    assert len(repo.rows) == 40
+    assert job.progress.runs == 1
+
+
+@pytest.mark.asyncio
+async def test_job_without_rules_does_nothing() -> None:
+    """A job with no maximum age should not start a worker."""
+    repo = InMemoryRetentionRepository([("msg", days_ago(40))])
+
+    async with make_job(repo, default_max_age=None, max_age_by_type={"msg": None}):
+        await asyncio.sleep(0)
+
+    assert repo.calls == []
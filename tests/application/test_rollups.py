@@ -0,0 +1,107 @@
+"""Tests for incremental rollup aggregation."""
+
+import asyncio
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from src.application.ports.rollup_repository import RollupBucket, RollupQuery, RollupRepository
+from src.application.rollups import RollupAggregator, bucket_start
+from src.core.event import DomainEvent
+
+AT = datetime(2025, 1, 1, 12, 34, 56, 789, tzinfo=UTC)
+
+
+class RecordingRollupRepository(RollupRepository):
+    """Rollup repository recording each add call (optionally failing once)."""
+
+    def __init__(self, failures: int = 0) -> None:
+        self.calls: list[list[RollupBucket]] = []
+        self._failures = failures
+
+    async def add(self, buckets: Sequence[RollupBucket]) -> None:
+        """Record the buckets (or fail)."""
+        if self._failures:
+            self._failures -= 1
+            raise RuntimeError("DB down")
+        self.calls.append(list(buckets))
+
+    async def list_buckets(self, query: RollupQuery) -> list[RollupBucket]:
+        """Not used by these tests."""
+        return []
+
+
+def event_at(created_at: datetime, event_type: str = "msg", payload: str = "abc") -> DomainEvent:
+    return DomainEvent(event_type=event_type, event_payload=payload, created_at=created_at)
+
+
+def totals(buckets: Sequence[RollupBucket]) -> dict[tuple[str, str, datetime], tuple[int, int]]:
+    return {
+        (b.resolution, b.event_type, b.bucket_start): (b.count, b.total_payload_bytes)
+        for b in buckets
+    }
+
+
+def test_bucket_start_floors_to_resolution() -> None:
+    """Timestamps should be floored to the start of their minute or hour."""
+    assert bucket_start(AT, "minute") == datetime(2025, 1, 1, 12, 34, tzinfo=UTC)
+    assert bucket_start(AT, "hour") == datetime(2025, 1, 1, 12, tzinfo=UTC)
+    assert bucket_start(AT.replace(tzinfo=None), "hour") == datetime(2025, 1, 1, 12, tzinfo=UTC)
+
+
+@pytest.mark.asyncio
+async def test_flush_aggregates_events_per_bucket() -> None:
+    """Events should be summed per (resolution, type, bucket) in a single add."""
+    repo = RecordingRollupRepository()
+    aggregator = RollupAggregator(repo, flush_interval_seconds=60)
+    aggregator.record(
+        [
+            event_at(AT),
+            event_at(AT + timedelta(seconds=2), payload="é"),
+            event_at(AT + timedelta(minutes=1)),
+            event_at(AT, event_type="other"),
+        ]
+    )
+
+    await aggregator.flush()
+    await aggregator.flush()  # nothing left: no second call
+
+    minute = datetime(2025, 1, 1, 12, 34, tzinfo=UTC)
+    hour = datetime(2025, 1, 1, 12, tzinfo=UTC)
+    assert len(repo.calls) == 1
+    assert totals(repo.calls[0]) == {
+        ("minute", "msg", minute): (2, 5),
+        ("minute", "msg", minute + timedelta(minutes=1)): (1, 3),
+        ("minute", "other", minute): (1, 3),
+        ("hour", "msg", hour): (3, 8),
+        ("hour", "other", hour): (1, 3),
+    }
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_counters() -> None:
+    """Counters from a failed flush should be merged into the next one."""
+    repo = RecordingRollupRepository(failures=1)
+    aggregator = RollupAggregator(repo, flush_interval_seconds=60)
+
+    aggregator.record([event_at(AT)])
+    await aggregator.flush()
+    aggregator.record([event_at(AT)])
+    await aggregator.flush()
+
+    assert len(repo.calls) == 1
+    assert totals(repo.calls[0])[("minute", "msg", bucket_start(AT, "minute"))] == (2, 6)
+
+
+@pytest.mark.asyncio
+async def test_aggregator_flushes_periodically_and_on_exit() -> None:
+    """The background task should flush on its interval; exit flushes the rest."""
+    repo = RecordingRollupRepository()
+    async with RollupAggregator(repo, flush_interval_seconds=0.01) as aggregator:
+        aggregator.record([event_at(AT)])
+        await asyncio.sleep(0.05)
+        assert len(repo.calls) == 1
+        aggregator.record([event_at(AT)])
+
+    assert len(repo.calls) == 2
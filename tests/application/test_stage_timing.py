@@ -0,0 +1,73 @@
+"""Tests for per-request stage timing."""
+
+import asyncio
+
+import pytest
+
+from src.application.stage_timing import (
+    StageTimings,
+    current_timings,
+    record_stage,
+    stage,
+    start_request_timing,
+    stop_request_timing,
+)
+
+
+def test_stage_outside_request_is_shared_noop() -> None:
+    """Test nothing is recorded or allocated when no request is timed."""
+    assert current_timings() is None
+    assert stage("insert") is stage("commit")
+    with stage("insert"):
+        pass
+    record_stage("connect", 1.0)
+    assert current_timings() is None
+
+
+def test_stages_are_recorded_in_order_and_accumulate() -> None:
+    """Test stages keep first-run order and repeated stages add up."""
+    timings, token = start_request_timing()
+    try:
+        with stage("validate"):
+            pass
+        record_stage("create", 0.25)
+        record_stage("create", 0.5)
+        assert current_timings() is timings
+    finally:
+        stop_request_timing(token)
+
+    assert list(timings.stages) == ["validate", "create"]
+    assert timings.stages["create"] == 0.75
+    assert timings.stages["validate"] >= 0
+    assert current_timings() is None
+
+
+def test_stage_records_time_when_block_raises() -> None:
+    """Test a failing stage is still timed."""
+    timings, token = start_request_timing()
+    try:
+        with pytest.raises(ValueError), stage("commit"):
+            raise ValueError("boom")
+    finally:
+        stop_request_timing(token)
+
+    assert "commit" in timings.stages
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_are_timed_separately() -> None:
+    """Test each task records into its own request's timings."""
+
+    async def request(name: str) -> StageTimings:
+        timings, token = start_request_timing()
+        try:
+            await asyncio.sleep(0)
+            record_stage(name, 1.0)
+        finally:
+            stop_request_timing(token)
+        return timings
+
+    first, second = await asyncio.gather(request("insert"), request("commit"))
+
+    assert first.stages == {"insert": 1.0}
+    assert second.stages == {"commit": 1.0}
@@ -5,7 +5,12 @@ from datetime import UTC, datetime, timedelta
 
 import pytest
 
-from src.core.event import MAX_EVENT_PAYLOAD_LENGTH, MAX_EVENT_TYPE_LENGTH, DomainEvent
+from src.core.event import (
+    MAX_EVENT_PAYLOAD_LENGTH,
+    MAX_EVENT_TYPE_LENGTH,
+    MAX_IDEMPOTENCY_KEY_LENGTH,
+    DomainEvent,
+)
 from src.core.exceptions import DomainValidationError
 
 
@@ -81,3 +86,19 @@ def test_domain_event_is_frozen() -> None:
     event = DomainEvent.create(event_type="message", event_payload="hello")
     with pytest.raises(FrozenInstanceError):
         event.event_type = "modified"
+
+
+def test_domain_event_create_idempotency_key() -> None:
+    """DomainEvent.create should strip the idempotency key and default it to None."""
+    assert DomainEvent.create("message", "hello").idempotency_key is None
+    assert DomainEvent.create("message", "hello", idempotency_key=" k1 ").idempotency_key == "k1"
+
+
+@pytest.mark.parametrize(
+    ("key", "message"),
+    [("  ", "cannot be empty"), ("k" * (MAX_IDEMPOTENCY_KEY_LENGTH + 1), "exceeds")],
+)
+def test_domain_event_create_rejects_invalid_idempotency_key(key: str, message: str) -> None:
+    """DomainEvent.create should reject blank or oversized idempotency keys."""
+    with pytest.raises(DomainValidationError, match=message):
+        DomainEvent.create(event_type="message", event_payload="hello", idempotency_key=key)
@@ -4,7 +4,26 @@ from unittest.mock import patch
 
 import pytest
 
-from src.infrastructure.config.settings import load_params
+from src.infrastructure.config.settings import (
+    AdmissionSettings,
+    AppSettings,
+    DatabaseSettings,
+    FastIngestSettings,
+    HealthSettings,
+    IdempotencySettings,
+    LoggingSettings,
+    MetricsSettings,
+    RequestTimingSettings,
+    RetentionSettings,
+    ServerSettings,
+    SpoolSettings,
+    load_app_settings,
+    load_database_settings,
+    load_logging_settings,
+    load_params,
+    load_server_settings,
+    split_pool_budget,
+)
 
 
 def test_load_params_defaults() -> None:
@@ -34,3 +53,394 @@ def test_load_params_invalid_postgres() -> None:
         pytest.raises(RuntimeError, match="postgresql\\+asyncpg"),
     ):
         load_params()
+
+
+def test_load_app_settings_defaults() -> None:
+    """Test load_app_settings keeps optional components disabled by default."""
+    with patch.dict("os.environ", {}, clear=True):
+        assert load_app_settings() == AppSettings()
+
+
+def test_load_app_settings_group_commit() -> None:
+    """Test load_app_settings reads group-commit settings."""
+    with patch.dict(
+        "os.environ",
+        {
+            "GROUP_COMMIT_ENABLED": "true",
+            "GROUP_COMMIT_LINGER_MS": "5",
+            "GROUP_COMMIT_MAX_BATCH": "50",
+        },
+        clear=True,
+    ):
+        settings = load_app_settings()
+
+    assert settings.group_commit.enabled is True
+    assert settings.group_commit.linger_ms == 5.0
+    assert settings.group_commit.max_batch_size == 50
+
+
+def test_load_app_settings_rollups() -> None:
+    """Test load_app_settings reads the rollup variables."""
+    with patch.dict(
+        "os.environ", {"ROLLUPS_ENABLED": "yes", "ROLLUPS_FLUSH_MS": "250"}, clear=True
+    ):
+        settings = load_app_settings()
+
+    assert settings.rollups.enabled is True
+    assert settings.rollups.flush_interval_ms == 250.0
+
+
+def test_load_app_settings_recent_events() -> None:
+    """Test load_app_settings reads the recent events buffer variables."""
+    env = {
+        "RECENT_EVENTS_ENABLED": "true",
+        "RECENT_EVENTS_PER_TYPE": "10",
+        "RECENT_EVENTS_MAX_BYTES": "4096",
+    }
+    with patch.dict("os.environ", env, clear=True):
+        settings = load_app_settings()
+
+    assert settings.recent_events.enabled is True
+    assert settings.recent_events.max_per_type == 10
+    assert settings.recent_events.max_bytes == 4096
+
+
+def test_load_app_settings_retention() -> None:
+    """Test load_app_settings reads the retention variables."""
+    env = {
+        "RETENTION_ENABLED": "true",
+        "RETENTION_MAX_AGE_DAYS": "30",
+        "RETENTION_MAX_AGE_DAYS_BY_TYPE": " audit=365, heartbeat=0.5 ,",
+        "RETENTION_BATCH_SIZE": "100",
+        "RETENTION_BATCH_PAUSE_MS": "10",
+        "RETENTION_MAX_ROWS_PER_SECOND": "0",
+        "RETENTION_INTERVAL_SECONDS": "60",
+    }
+    with patch.dict("os.environ", env, clear=True):
+        settings = load_app_settings()
+
+    assert settings.retention == RetentionSettings(
+        enabled=True,
+        default_max_age_days=30.0,
+        max_age_days_by_type={"audit": 365.0, "heartbeat": 0.5},
+        batch_size=100,
+        batch_pause_ms=10.0,
+        max_rows_per_second=0.0,
+        interval_seconds=60.0,
+    )
+
+
+def test_load_app_settings_idempotency() -> None:
+    """Test load_app_settings reads the idempotency cache variables."""
+    env = {
+        "IDEMPOTENCY_CACHE_ENABLED": "1",
+        "IDEMPOTENCY_CACHE_MAX_KEYS": "500",
+        "IDEMPOTENCY_CACHE_TTL_SECONDS": "30",
+    }
+    with patch.dict("os.environ", env, clear=True):
+        settings = load_app_settings()
+
+    assert settings.idempotency == IdempotencySettings(
+        cache_enabled=True, cache_max_keys=500, cache_ttl_seconds=30.0
+    )
+
+
+def test_load_app_settings_admission() -> None:
+    """Test load_app_settings reads the admission control variables."""
+    env = {
+        "ADMISSION_ENABLED": "true",
+        "ADMISSION_INITIAL_LIMIT": "32",
+        "ADMISSION_MIN_LIMIT": "2",
+        "ADMISSION_MAX_LIMIT": "128",
+        "ADMISSION_TARGET_LATENCY_MS": "25",
+    }
+    with patch.dict("os.environ", env, clear=True):
+        settings = load_app_settings()
+
+    assert settings.admission == AdmissionSettings(
+        enabled=True, initial_limit=32, min_limit=2, max_limit=128, target_latency_ms=25.0
+    )
+
+
+def test_load_app_settings_spool() -> None:
+    """Test load_app_settings reads the spool variables."""
+    env = {
+        "SPOOL_ENABLED": "true",
+        "SPOOL_DIR": "/var/spool/consumer",
+        "SPOOL_SEGMENT_BYTES": "1048576",
+        "SPOOL_FSYNC_INTERVAL_MS": "5",
+        "SPOOL_REPLAY_BATCH": "250",
+        "SPOOL_RETRY_INTERVAL_SECONDS": "0.5",
+    }
+    with patch.dict("os.environ", env, clear=True):
+        settings = load_app_settings()
+
+    assert settings.spool == SpoolSettings(
+        enabled=True,
+        directory="/var/spool/consumer",
+        segment_bytes=1048576,
+        fsync_interval_ms=5.0,
+        replay_batch_size=250,
+        retry_interval_seconds=0.5,
+    )
+
+
+def test_load_app_settings_metrics() -> None:
+    """Test load_app_settings reads the metrics variables."""
+    env = {
+        "METRICS_ENABLED": "1",
+        "METRICS_MULTIPROCESS_DIR": "/tmp/metrics",
+        "METRICS_WRITE_INTERVAL_SECONDS": "2",
+    }
+    with patch.dict("os.environ", env, clear=True):
+        settings = load_app_settings()
+
+    assert settings.metrics == MetricsSettings(
+        enabled=True, multiprocess_dir="/tmp/metrics", write_interval_seconds=2.0
+    )
+
+
+def test_load_app_settings_request_timing() -> None:
+    """Test load_app_settings reads the request timing variables."""
+    env = {
+        "REQUEST_TIMING_ENABLED": "true",
+        "REQUEST_TIMING_HEADER": "false",
+        "SLOW_REQUEST_MS": "250",
+    }
+    with patch.dict("os.environ", env, clear=True):
+        settings = load_app_settings()
+
+    assert settings.request_timing == RequestTimingSettings(
+        enabled=True, server_timing_header=False, slow_request_ms=250.0
+    )
+
+
+def test_load_app_settings_fast_ingest() -> None:
+    """Test load_app_settings reads FAST_INGEST_ENABLED."""
+    with patch.dict("os.environ", {"FAST_INGEST_ENABLED": "true"}, clear=True):
+        settings = load_app_settings()
+
+    assert settings.fast_ingest == FastIngestSettings(enabled=True)
+
+
+def test_load_app_settings_health() -> None:
+    """Test load_app_settings reads the health check variables."""
+    env = {
+        "HEALTH_CHECK_ENABLED": "true",
+        "HEALTH_CHECK_INTERVAL_SECONDS": "1",
+        "HEALTH_CHECK_TIMEOUT_SECONDS": "0.5",
+        "HEALTH_POOL_SATURATION_SECONDS": "30",
+    }
+    with patch.dict("os.environ", env, clear=True):
+        settings = load_app_settings()
+
+    assert settings.health == HealthSettings(
+        enabled=True, interval_seconds=1.0, timeout_seconds=0.5, saturation_seconds=30.0
+    )
+
+
+@pytest.mark.parametrize("raw", ["audit", "=3", "audit=soon"])
+def test_load_app_settings_invalid_retention_by_type(raw: str) -> None:
+    """Test malformed per-type maximum ages are rejected."""
+    with (
+        patch.dict("os.environ", {"RETENTION_MAX_AGE_DAYS_BY_TYPE": raw}, clear=True),
+        pytest.raises(RuntimeError, match="RETENTION_MAX_AGE_DAYS_BY_TYPE"),
+    ):
+        load_app_settings()
+
+
+def test_load_database_settings() -> None:
+    """Test load_database_settings defaults to the ORM repository."""
+    with patch.dict("os.environ", {}, clear=True):
+        assert load_database_settings() == DatabaseSettings()
+    with patch.dict("os.environ", {"EVENT_REPOSITORY": "Core"}, clear=True):
+        assert load_database_settings().repository == "core"
+    with patch.dict("os.environ", {"DB_SCHEMA_FINGERPRINT": "false"}, clear=True):
+        assert load_database_settings().schema_fingerprint is False
+
+
+def test_load_database_settings_sqlite() -> None:
+    """Test load_database_settings reads the SQLite tuning variables."""
+    env = {
+        "SQLITE_MMAP_SIZE": "0",
+        "SQLITE_CACHE_SIZE": "-2000",
+        "SQLITE_BUSY_TIMEOUT_MS": "100",
+        "SQLITE_WRITER_LINGER_MS": "0.5",
+        "SQLITE_WRITER_MAX_BATCH": "10",
+    }
+    with patch.dict("os.environ", env, clear=True):
+        settings = load_database_settings()
+
+    assert settings.sqlite_mmap_size == 0
+    assert settings.sqlite_cache_size == -2000
+    assert settings.sqlite_busy_timeout_ms == 100
+    assert settings.sqlite_writer_linger_ms == 0.5
+    assert settings.sqlite_writer_max_batch == 10
+
+
+def test_load_database_settings_partitioning() -> None:
+    """Test load_database_settings reads the partitioning variables."""
+    env = {
+        "EVENTS_PARTITIONED": "true",
+        "EVENTS_PARTITION_INTERVAL": "Month",
+        "EVENTS_PARTITION_PREMAKE": "3",
+        "EVENTS_PARTITION_RETENTION_DAYS": "90",
+        "EVENTS_PARTITION_CHECK_SECONDS": "60",
+    }
+    with patch.dict("os.environ", env, clear=True):
+        settings = load_database_settings()
+
+    assert settings.partitioning is True
+    assert settings.partition_interval == "month"
+    assert settings.partition_premake == 3
+    assert settings.partition_retention_days == 90
+    assert settings.partition_check_seconds == 60.0
+
+
+def test_load_database_settings_memory_backend() -> None:
+    """Test load_database_settings reads the memory backend variables."""
+    env = {
+        "DB_BACKEND": "Memory",
+        "MEMORY_CAPACITY": "5000",
+        "MEMORY_SNAPSHOT_PATH": "/var/lib/consumer/events.snapshot",
+        "MEMORY_SNAPSHOT_INTERVAL_SECONDS": "30",
+    }
+    with patch.dict("os.environ", env, clear=True):
+        settings = load_database_settings()
+
+    assert settings.backend == "memory"
+    assert settings.memory_capacity == 5000
+    assert settings.memory_snapshot_path == "/var/lib/consumer/events.snapshot"
+    assert settings.memory_snapshot_interval_seconds == 30.0
+
+
+def test_load_database_settings_invalid_backend() -> None:
+    """Test load_database_settings rejects unknown backends."""
+    with (
+        patch.dict("os.environ", {"DB_BACKEND": "redis"}, clear=True),
+        pytest.raises(RuntimeError, match="DB_BACKEND"),
+    ):
+        load_database_settings()
+
+
+def test_load_database_settings_invalid_partition_interval() -> None:
+    """Test load_database_settings rejects unknown partition intervals."""
+    with (
+        patch.dict("os.environ", {"EVENTS_PARTITION_INTERVAL": "week"}, clear=True),
+        pytest.raises(RuntimeError, match="EVENTS_PARTITION_INTERVAL"),
+    ):
+        load_database_settings()
+
+
+def test_load_database_settings_invalid_repository() -> None:
+    """Test load_database_settings rejects unknown repository kinds."""
+    with (
+        patch.dict("os.environ", {"EVENT_REPOSITORY": "mongo"}, clear=True),
+        pytest.raises(RuntimeError, match="EVENT_REPOSITORY"),
+    ):
+        load_database_settings()
+
+
+def test_load_server_settings() -> None:
+    """Test load_server_settings defaults to one worker and reads the variables."""
+    with patch.dict("os.environ", {}, clear=True):
+        assert load_server_settings() == ServerSettings()
+
+    env = {
+        "SERVER_WORKERS": "4",
+        "SERVER_LOOP": "uvloop",
+        "SERVER_HTTP": "HTTPTOOLS",
+        "DB_MAX_CONNECTIONS": "90",
+        "SERVER_SHUTDOWN_TIMEOUT_SECONDS": "10",
+    }
+    with patch.dict("os.environ", env, clear=True):
+        assert load_server_settings() == ServerSettings(
+            workers=4,
+            loop="uvloop",
+            http="httptools",
+            db_max_connections=90,
+            graceful_shutdown_seconds=10,
+        )
+
+
+@pytest.mark.parametrize(
+    ("name", "value"),
+    [("SERVER_WORKERS", "0"), ("SERVER_LOOP", "trio"), ("SERVER_HTTP", "h2")],
+)
+def test_load_server_settings_invalid(name: str, value: str) -> None:
+    """Test load_server_settings rejects unsupported values."""
+    with patch.dict("os.environ", {name: value}, clear=True), pytest.raises(
+        RuntimeError, match=name
+    ):
+        load_server_settings()
+
+
+@pytest.mark.parametrize(
+    ("workers", "budget", "expected"),
+    [
+        (1, 0, (20, 10, 4)),
+        (4, 0, (20, 10, 4)),
+        (4, 100, (20, 5, 4)),
+        (4, 40, (10, 0, 4)),
+        (8, 20, (2, 0, 2)),
+    ],
+)
+def test_split_pool_budget(workers: int, budget: int, expected: tuple[int, int, int]) -> None:
+    """Test every worker's pool plus overflow fits its share of the budget."""
+    settings = split_pool_budget(DatabaseSettings(), workers, budget)
+
+    assert (settings.pool_size, settings.max_overflow, settings.pool_min_size) == expected
+    if budget:
+        assert workers * (settings.pool_size + settings.max_overflow) <= budget
+
+
+@pytest.mark.parametrize(
+    ("pool_size", "max_overflow", "expected"),
+    [(0, 10, (25, 0)), (5, -1, (5, 20)), (0, -1, (25, 0)), (-3, 2, (25, 0))],
+)
+def test_split_pool_budget_bounds_unlimited_pools(
+    pool_size: int, max_overflow: int, expected: tuple[int, int]
+) -> None:
+    """Test DB_POOL_SIZE=0 and DB_MAX_OVERFLOW=-1 (unlimited) are capped to the share."""
+    settings = split_pool_budget(
+        DatabaseSettings(pool_size=pool_size, max_overflow=max_overflow), 4, 100
+    )
+
+    assert (settings.pool_size, settings.max_overflow) == expected
+
+
+def test_split_pool_budget_too_small() -> None:
+    """Test a budget below one connection per worker is rejected."""
+    with pytest.raises(RuntimeError, match="DB_MAX_CONNECTIONS"):
+        split_pool_budget(DatabaseSettings(), workers=8, max_connections=4)
+
+
+def test_load_logging_settings() -> None:
+    """Test load_logging_settings reads the LOG_* variables."""
+    env = {
+        "LOG_LEVEL": "debug",
+        "LOG_FORMAT": "JSON",
+        "LOG_QUEUE_SIZE": "500",
+        "LOG_EVENT_RATE": "2.5",
+        "LOG_ACCESS": "true",
+    }
+    with patch.dict("os.environ", env, clear=True):
+        settings = load_logging_settings()
+
+    assert settings == LoggingSettings(
+        level="DEBUG", format="json", queue_size=500, event_rate=2.5, access_log=True
+    )
+    with patch.dict("os.environ", {}, clear=True):
+        assert load_logging_settings() == LoggingSettings()
+
+
+@pytest.mark.parametrize(
+    ("name", "value"),
+    [("LOG_LEVEL", "verbose"), ("LOG_FORMAT", "xml"), ("LOG_QUEUE_SIZE", "0")],
+)
+def test_load_logging_settings_invalid(name: str, value: str) -> None:
+    """Test unsupported logging settings are rejected."""
+    with patch.dict("os.environ", {name: value}, clear=True), pytest.raises(
+        RuntimeError, match=name
+    ):
+        load_logging_settings()
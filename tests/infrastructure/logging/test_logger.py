@@ -0,0 +1,142 @@
+import json
+import logging
+import queue
+import sys
+from collections.abc import Callable, Iterator
+
+import pytest
+
+from src.infrastructure.config.settings import LoggingSettings
+from src.infrastructure.logging.logger import (
+    EventLogSampler,
+    JsonFormatter,
+    NonBlockingQueueHandler,
+    configure_logs,
+    shutdown_logs,
+)
+
+
+def make_record(
+    msg: str = "Event created: type=%s", event_type: str | None = "a"
+) -> logging.LogRecord:
+    record = logging.LogRecord("src.test", logging.INFO, __file__, 1, msg, (event_type,), None)
+    if event_type is not None:
+        record.event_type = event_type
+    return record
+
+
+class FakeClock:
+    """Monotonic clock advanced by hand."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_sampler_limits_each_event_type() -> None:
+    """Test each event type gets its own rate, and suppressed records are counted."""
+    clock = FakeClock()
+    sampler = EventLogSampler(rate=2, clock=clock)
+
+    passed_a = [sampler.filter(make_record(event_type="a")) for _ in range(5)]
+    passed_b = [sampler.filter(make_record(event_type="b")) for _ in range(3)]
+    clock.now = 0.5
+    resumed = make_record(event_type="a")
+
+    assert passed_a == [True, True, False, False, False]
+    assert passed_b == [True, True, False]
+    assert sampler.filter(resumed)
+    assert resumed.suppressed == 3
+    assert not sampler.filter(make_record(event_type="a"))
+
+
+def test_sampler_passes_other_records() -> None:
+    """Test records without an event type, or with sampling off, always pass."""
+    limited = EventLogSampler(rate=1, clock=FakeClock())
+    unlimited = EventLogSampler(rate=0, clock=FakeClock())
+
+    assert all(limited.filter(make_record(event_type=None)) for _ in range(10))
+    assert all(unlimited.filter(make_record()) for _ in range(10))
+    assert [limited.filter(make_record("Other: type=%s")) for _ in range(2)] == [True, False]
+
+
+def test_queue_handler_drops_when_full_and_reports() -> None:
+    """Test a full queue drops records without blocking, then reports the count."""
+    records: queue.Queue[logging.LogRecord] = queue.Queue(2)
+    handler = NonBlockingQueueHandler(records)
+
+    for _ in range(5):
+        handler.handle(make_record())
+    queued = [records.get_nowait(), records.get_nowait()]
+    handler.handle(make_record())
+
+    assert handler.dropped == 0
+    report = records.get_nowait()
+    assert report.getMessage() == "Log queue full: dropped=3"
+    assert records.get_nowait().msg == "Event created: type=%s"
+    # Queued as is: the writer thread formats the message
+    assert queued[0].args == ("a",)
+
+
+def test_json_formatter() -> None:
+    """Test records are formatted as one JSON object with their extra fields."""
+    record = make_record()
+    record.suppressed = 4
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record.exc_info = sys.exc_info()
+
+    entry = json.loads(JsonFormatter().format(record))
+
+    assert entry["level"] == "INFO"
+    assert entry["logger"] == "src.test"
+    assert entry["message"] == "Event created: type=a"
+    assert (entry["event_type"], entry["suppressed"]) == ("a", 4)
+    assert "ValueError: boom" in entry["exception"]
+    assert entry["time"].endswith("+00:00")
+
+
+@pytest.fixture
+def stderr(capsys: pytest.CaptureFixture[str]) -> Iterator[Callable[[], str]]:
+    """Capture configured logging output, restoring the logger levels afterwards."""
+    names = ["", "src", "uvicorn", "uvicorn.access", "uvicorn.error"]
+    levels = {name: logging.getLogger(name).level for name in names}
+    yield lambda: capsys.readouterr().err
+    shutdown_logs()
+    for name, level in levels.items():
+        logging.getLogger(name).setLevel(level)
+
+
+@pytest.mark.parametrize("log_format", ["text", "json"])
+def test_configure_logs_writes_through_queue(stderr: Callable[[], str], log_format: str) -> None:
+    """Test configured logging samples per-event records and writes them in the background."""
+    configure_logs(LoggingSettings(level="DEBUG", format=log_format, event_rate=1))
+    configure_logs(LoggingSettings(level="ERROR"))
+    logger = logging.getLogger("src.test")
+
+    for _ in range(3):
+        logger.info("Event created: type=%s", "a", extra={"event_type": "a"})
+    logger.debug("Debug message")
+    logging.getLogger("uvicorn.access").info("GET / 200")
+    shutdown_logs()
+
+    lines = stderr().splitlines()
+    assert len(lines) == 2
+    assert "Event created: type=a" in lines[0]
+    assert "Debug message" in lines[1]
+    if log_format == "json":
+        assert json.loads(lines[0])["event_type"] == "a"
+    assert logging.getLogger("src").level == logging.DEBUG
+
+
+def test_configure_logs_access_log(stderr: Callable[[], str]) -> None:
+    """Test the access log is only written when enabled."""
+    configure_logs(LoggingSettings(access_log=True))
+    logging.getLogger("uvicorn.access").info("GET / 200")
+    shutdown_logs()
+    shutdown_logs()
+
+    assert "GET / 200" in stderr()
@@ -0,0 +1 @@
+"""Tests for the in-memory persistence adapters."""
@@ -0,0 +1,133 @@
+"""Tests for the in-memory database provider and its repositories."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import httpx
+import pytest
+
+from src.application.ports.event_query_repository import EventQuery
+from src.application.ports.rollup_repository import RollupBucket, RollupQuery
+from src.core.event import DomainEvent
+from src.infrastructure.config.settings import DatabaseSettings
+from src.infrastructure.memory.db_provider import MemoryDbProvider
+from src.presentation.fastapi.server import create_app
+
+
+@pytest.mark.asyncio
+async def test_repositories_share_the_store() -> None:
+    """Events written through event_repository() should be readable and expirable."""
+    provider = MemoryDbProvider(DatabaseSettings(memory_capacity=100))
+    async with provider:
+        async with provider.event_repository() as repo:
+            record = await repo.save(DomainEvent.create("msg", "hello"))
+            await repo.save_many([DomainEvent.create("msg", "world")])
+
+        page = await provider.event_query_repository().list_events(EventQuery(limit=10))
+        expired = await provider.retention_repository().delete_expired(
+            datetime.now(UTC) + timedelta(seconds=1), 10
+        )
+
+    assert record is not None
+    assert [r.event_payload for r in page] == ["world", "hello"]
+    assert expired.deleted == 2
+    assert len(provider.store) == 0
+
+
+@pytest.mark.asyncio
+async def test_rollups_add_up_and_filter() -> None:
+    """Rollup deltas for the same bucket should be summed and listed in order."""
+    rollups = MemoryDbProvider().rollup_repository()
+    hour = datetime(2024, 1, 1, 10, tzinfo=UTC)
+    await rollups.add(
+        [
+            RollupBucket("minute", "b", hour, 1, 10),
+            RollupBucket("minute", "a", hour, 2, 20),
+            RollupBucket("minute", "a", hour, 3, 30),
+            RollupBucket("minute", "a", hour + timedelta(minutes=1), 1, 1),
+            RollupBucket("hour", "a", hour, 6, 60),
+        ]
+    )
+
+    buckets = await rollups.list_buckets(RollupQuery(resolution="minute", limit=2))
+
+    assert buckets == [
+        RollupBucket("minute", "a", hour, 5, 50),
+        RollupBucket("minute", "b", hour, 1, 10),
+    ]
+    filtered = await rollups.list_buckets(
+        RollupQuery(resolution="minute", limit=10, event_type="a", since=hour.replace(minute=1))
+    )
+    assert [b.count for b in filtered] == [1]
+
+
+@pytest.mark.asyncio
+async def test_snapshot_survives_restart(tmp_path: Path) -> None:
+    """Events should be saved on shutdown and loaded on the next startup."""
+    settings = DatabaseSettings(memory_snapshot_path=str(tmp_path / "events.snapshot"))
+    async with MemoryDbProvider(settings) as provider, provider.event_repository() as repo:
+        await repo.save(DomainEvent.create("msg", "persisted"))
+
+    async with MemoryDbProvider(settings) as provider:
+        page = await provider.event_query_repository().list_events(EventQuery(limit=10))
+
+    assert [r.event_payload for r in page] == ["persisted"]
+
+
+@pytest.mark.asyncio
+async def test_periodic_snapshots(tmp_path: Path) -> None:
+    """With an interval, snapshots should be written while running."""
+    path = tmp_path / "events.snapshot"
+    settings = DatabaseSettings(
+        memory_snapshot_path=str(path), memory_snapshot_interval_seconds=0.01
+    )
+    async with MemoryDbProvider(settings) as provider:
+        async with provider.event_repository() as repo:
+            await repo.save(DomainEvent.create("msg", "hello"))
+        for _ in range(100):
+            if path.exists():
+                break
+            await asyncio.sleep(0.01)
+        assert path.exists()
+
+
+def test_provider_has_no_sessions() -> None:
+    """Calling the provider for a SQL session should fail clearly."""
+    with pytest.raises(RuntimeError, match="no SQL sessions"):
+        MemoryDbProvider()()
+
+
+@pytest.mark.asyncio
+async def test_provider_is_always_reachable() -> None:
+    """The store is in process: the ping succeeds and there is no pool."""
+    provider = MemoryDbProvider()
+
+    await provider.ping()
+    assert provider.pool_usage() is None
+
+
+@pytest.mark.asyncio
+async def test_app_runs_on_memory_backend() -> None:
+    """The whole app should serve writes and reads without a database."""
+    app = create_app(db_provider=MemoryDbProvider())
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            created = await client.post(
+                "/event", json={"event_type": "message", "event_payload": "hello"}
+            )
+            batch = await client.post(
+                "/event/batch",
+                json=[{"event_type": "message", "event_payload": f"item {i}"} for i in range(3)],
+            )
+            page = await client.get("/events", params={"order": "asc"})
+
+    assert (created.status_code, batch.status_code, page.status_code) == (201, 200, 200)
+    assert [e["event_payload"] for e in page.json()["items"]] == [
+        "hello",
+        "item 0",
+        "item 1",
+        "item 2",
+    ]
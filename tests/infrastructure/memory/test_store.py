@@ -0,0 +1,147 @@
+"""Tests for the columnar in-memory event store."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from src.application.ports.event_query_repository import EventKey, EventQuery
+from src.core.event import DomainEvent
+from src.infrastructure.memory.store import ColumnarEventStore
+
+START = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def make_event(
+    index: int, event_type: str = "msg", idempotency_key: str | None = None
+) -> DomainEvent:
+    return DomainEvent(
+        event_type=event_type,
+        event_payload=f"payload {index} é",
+        created_at=START + timedelta(seconds=index),
+        idempotency_key=idempotency_key,
+    )
+
+
+def test_append_assigns_ids_and_round_trips_columns() -> None:
+    """Stored events should read back exactly, with increasing ids."""
+    store = ColumnarEventStore(capacity=10, chunk_size=4)
+    records = [store.append(make_event(i, event_type=f"t{i % 2}")) for i in range(6)]
+
+    assert [r.id for r in records if r is not None] == [1, 2, 3, 4, 5, 6]
+    page = store.select(EventQuery(limit=10, order="asc"))
+    assert page == records
+    assert page[5].event_payload == "payload 5 é"
+    assert page[5].created_at == START + timedelta(seconds=5)
+    assert len(store) == 6
+
+
+def test_duplicate_idempotency_keys_are_skipped() -> None:
+    """An event whose key is stored should be skipped, as ON CONFLICT DO NOTHING does."""
+    store = ColumnarEventStore(capacity=10)
+
+    assert store.append(make_event(0, idempotency_key="k")) is not None
+    assert store.append(make_event(1, idempotency_key="k")) is None
+    assert store.extend([make_event(2, idempotency_key="k"), make_event(3)]) == [False, True]
+
+    assert len(store) == 2
+
+
+def test_full_store_evicts_oldest_chunk() -> None:
+    """Appending beyond capacity should drop the oldest chunk and its keys."""
+    store = ColumnarEventStore(capacity=4, chunk_size=2)
+    store.append(make_event(0, idempotency_key="first"))
+    for i in range(1, 5):
+        store.append(make_event(i))
+
+    assert len(store) == 3
+    assert store.evicted == 2
+    assert [r.id for r in store.select(EventQuery(limit=10, order="asc"))] == [3, 4, 5]
+    # The evicted key can be stored again
+    assert store.append(make_event(5, idempotency_key="first")) is not None
+
+
+@pytest.mark.parametrize("order", ["asc", "desc"])
+def test_keyset_pages_cover_every_event_once(order: str) -> None:
+    """Paging with `after` should visit every matching event once, in order."""
+    store = ColumnarEventStore(capacity=100, chunk_size=8)
+    # Equal timestamps exercise the id tie-break
+    for i in range(25):
+        store.append(make_event(i // 2))
+
+    seen: list[int] = []
+    after = None
+    while page := store.select(EventQuery(limit=7, order=order, after=after)):  # type: ignore[arg-type]
+        seen.extend(r.id for r in page)
+        after = EventKey(created_at=page[-1].created_at, id=page[-1].id)
+
+    expected = list(range(1, 26))
+    assert seen == (expected if order == "asc" else expected[::-1])
+
+
+def test_select_filters_by_type_and_time_range() -> None:
+    """Type, since (inclusive) and until (exclusive) filters should apply."""
+    store = ColumnarEventStore(capacity=100)
+    for i in range(10):
+        store.append(make_event(i, event_type="a" if i % 2 else "b"))
+
+    page = store.select(
+        EventQuery(
+            limit=10,
+            event_type="a",
+            since=START + timedelta(seconds=3),
+            until=START + timedelta(seconds=7),
+            order="asc",
+        )
+    )
+
+    assert [r.event_payload for r in page] == ["payload 3 é", "payload 5 é"]
+    assert store.select(EventQuery(limit=10, event_type="missing")) == []
+
+
+def test_delete_expired_in_batches() -> None:
+    """Expired events should be deleted oldest first, batch after batch."""
+    store = ColumnarEventStore(capacity=100, chunk_size=3)
+    for i in range(10):
+        store.append(make_event(i, event_type="keep" if i == 1 else "msg", idempotency_key=f"k{i}"))
+
+    older_than = START + timedelta(seconds=8)
+    first = store.delete_expired(older_than, 4, exclude_types=["keep"])
+    second = store.delete_expired(older_than, 4, exclude_types=["keep"], after=first.last_key)
+    third = store.delete_expired(older_than, 4, exclude_types=["keep"], after=second.last_key)
+
+    assert (first.deleted, second.deleted, third.deleted) == (4, 3, 0)
+    assert second.last_key == EventKey(created_at=START + timedelta(seconds=7), id=8)
+    remaining = store.select(EventQuery(limit=10, order="asc"))
+    assert [r.id for r in remaining] == [2, 9, 10]
+    # Deleted keys can be stored again
+    assert store.append(make_event(11, idempotency_key="k0")) is not None
+
+
+def test_snapshot_round_trip() -> None:
+    """load() should restore what dump() saved, including ids, keys and tombstones."""
+    store = ColumnarEventStore(capacity=100, chunk_size=4)
+    for i in range(6):
+        store.append(make_event(i, event_type=f"t{i % 3}", idempotency_key=f"k{i}"))
+    store.delete_expired(START + timedelta(seconds=1), 10)
+
+    restored = ColumnarEventStore(capacity=100, chunk_size=4)
+    restored.load(store.dump())
+
+    query = EventQuery(limit=10, order="asc")
+    assert restored.select(query) == store.select(query)
+    assert len(restored) == 5
+    assert restored.append(make_event(6, idempotency_key="k1")) is None
+    assert restored.append(make_event(7)) is not None
+    assert restored.select(EventQuery(limit=1))[0].id == 7
+
+
+def test_load_rejects_other_data() -> None:
+    """load() should refuse data that is not a snapshot."""
+    with pytest.raises(ValueError, match="snapshot"):
+        ColumnarEventStore(capacity=10).load(b"not a snapshot")
+
+
+def test_invalid_capacity() -> None:
+    """A store without room should be refused."""
+    with pytest.raises(ValueError):
+        ColumnarEventStore(capacity=0)
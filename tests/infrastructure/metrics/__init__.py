@@ -0,0 +1 @@
+"""Tests for sharing metrics between workers."""
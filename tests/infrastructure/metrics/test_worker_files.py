@@ -0,0 +1,43 @@
+"""Tests for the per-worker metrics files."""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from src.application.metrics import Counter, Gauge, MetricsRegistry, Snapshot, merge_snapshots
+from src.infrastructure.metrics.worker_files import WorkerMetricsFiles
+
+
+def make_registry(errors: float) -> MetricsRegistry:
+    registry = MetricsRegistry()
+    registry.register(Counter("errors_total", "Errors.")).inc(errors)
+    registry.register(Gauge("in_use", "In use.", lambda: {(): 1.0}))
+    return registry
+
+
+@pytest.mark.asyncio
+async def test_collect_merges_other_workers(tmp_path: Path) -> None:
+    """A scrape should add the other workers' published values to the live ones."""
+    other = make_registry(5)
+    (tmp_path / "worker-1.json").write_text(json.dumps(other.snapshot().families))
+    (tmp_path / "worker-2.json").write_text("{not json")
+
+    async with WorkerMetricsFiles(make_registry(2), tmp_path, interval_seconds=60) as files:
+        merged = await files.collect()
+
+    assert merged.families["errors_total"]["samples"] == [[[], 7.0]]
+    assert merged.families["in_use"]["samples"] == [[[], 2.0]]
+
+
+@pytest.mark.asyncio
+async def test_exit_publishes_final_snapshot_without_gauges(tmp_path: Path) -> None:
+    """An exiting worker should keep its counters in the totals but drop its gauges."""
+    async with WorkerMetricsFiles(make_registry(3), tmp_path, interval_seconds=60):
+        pass
+
+    published = json.loads((tmp_path / f"worker-{os.getpid()}.json").read_text())
+    merged = merge_snapshots([Snapshot(published)])
+    assert merged.families["errors_total"]["samples"] == [[[], 3.0]]
+    assert "in_use" not in merged.families
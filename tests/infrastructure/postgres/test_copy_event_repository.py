@@ -0,0 +1,113 @@
+"""Tests for the COPY-based bulk event repository."""
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.core.event import DomainEvent
+from src.infrastructure.postgres.copy_event_repository import COPY_COLUMNS, CopyEventRepository
+from src.infrastructure.postgres.models.event import Base
+from src.infrastructure.postgres.models.event import Event as DBEvent
+
+
+def make_events(count: int) -> list[DomainEvent]:
+    return [DomainEvent.create(event_type="msg", event_payload=str(i)) for i in range(count)]
+
+
+class FakeAsyncpgConnection:
+    """Stand-in for asyncpg.Connection recording COPY calls."""
+
+    def __init__(self) -> None:
+        self.copied: list[tuple[object, ...]] = []
+        self.table: str | None = None
+        self.columns: tuple[str, ...] = ()
+        self.in_transaction = False
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        self.in_transaction = True
+        yield
+        self.in_transaction = False
+
+    async def copy_records_to_table(
+        self, table: str, *, records: Any, columns: tuple[str, ...]
+    ) -> None:
+        assert self.in_transaction
+        self.table = table
+        self.columns = columns
+        self.copied.extend([record async for record in records])
+
+
+def make_asyncpg_engine(driver_conn: FakeAsyncpgConnection) -> MagicMock:
+    raw = MagicMock()
+    raw.driver_connection = driver_conn
+
+    conn = MagicMock()
+    conn.dialect.driver = "asyncpg"
+
+    async def get_raw_connection() -> MagicMock:
+        return raw
+
+    conn.get_raw_connection = get_raw_connection
+
+    @asynccontextmanager
+    async def connect() -> AsyncIterator[MagicMock]:
+        yield conn
+
+    engine = MagicMock()
+    engine.connect = connect
+    return engine
+
+
+@pytest.mark.asyncio
+async def test_copy_event_repository_uses_binary_copy_on_asyncpg() -> None:
+    """On asyncpg, events should be streamed with copy_records_to_table."""
+    driver_conn = FakeAsyncpgConnection()
+    repo = CopyEventRepository(make_asyncpg_engine(driver_conn))
+    events = make_events(3)
+
+    await repo.save_many(events)
+
+    assert driver_conn.table == "events"
+    assert driver_conn.columns == COPY_COLUMNS
+    assert driver_conn.copied == [
+        (e.event_type, e.event_payload, e.created_at, e.idempotency_key) for e in events
+    ]
+
+
+@pytest.mark.asyncio
+async def test_copy_event_repository_streams_async_iterables() -> None:
+    """copy_events should accept async iterables and report the row count."""
+    driver_conn = FakeAsyncpgConnection()
+    repo = CopyEventRepository(make_asyncpg_engine(driver_conn))
+
+    async def stream() -> AsyncIterator[DomainEvent]:
+        for event in make_events(4):
+            yield event
+
+    assert await repo.copy_events(stream()) == 4
+    assert len(driver_conn.copied) == 4
+
+
+@pytest.mark.asyncio
+async def test_copy_event_repository_falls_back_to_executemany_on_sqlite() -> None:
+    """On SQLite, events should be written with chunked executemany."""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    repo = CopyEventRepository(engine, chunk_size=2)
+
+    assert await repo.copy_events(make_events(5)) == 5
+    await repo.save(make_events(1)[0])
+    await repo.save_many([])
+
+    async with engine.connect() as conn:
+        count = await conn.scalar(select(func.count()).select_from(DBEvent))
+    await engine.dispose()
+
+    assert count == 6
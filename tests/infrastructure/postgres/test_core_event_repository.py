@@ -0,0 +1,134 @@
+"""Tests for the ORM-free Core event repository."""
+
+from collections.abc import AsyncIterator
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from src.core.event import DomainEvent
+from src.infrastructure.postgres.core_event_repository import CoreEventRepository
+from src.infrastructure.postgres.models.event import Base, events_table
+
+
+@pytest.fixture
+async def engine() -> AsyncIterator[AsyncEngine]:
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+async def count_rows(engine: AsyncEngine) -> int:
+    async with engine.connect() as conn:
+        return int(await conn.scalar(select(func.count()).select_from(events_table)) or 0)
+
+
+@pytest.mark.asyncio
+async def test_core_repository_save_returning(engine: AsyncEngine) -> None:
+    """save should return the generated id and created_at."""
+    repo = CoreEventRepository(engine)
+
+    row = await repo.save(DomainEvent.create(event_type="msg", event_payload="hi"))
+
+    assert row is not None
+    assert row.id == 1
+    assert row.created_at is not None
+    assert await count_rows(engine) == 1
+
+
+@pytest.mark.asyncio
+async def test_core_repository_save_without_returning(engine: AsyncEngine) -> None:
+    """save should only report the insert when the row is not needed."""
+    repo = CoreEventRepository(engine)
+
+    row = await repo.save(DomainEvent.create(event_type="msg", event_payload="hi"), returning=False)
+
+    assert row is True
+    assert await count_rows(engine) == 1
+
+
+@pytest.mark.asyncio
+async def test_core_repository_save_many(engine: AsyncEngine) -> None:
+    """save_many should insert every event in one transaction."""
+    repo = CoreEventRepository(engine)
+    events = [DomainEvent.create(event_type="msg", event_payload=str(i)) for i in range(10)]
+
+    assert await repo.save_many(events) == [True] * 10
+    assert await repo.save_many([]) == []
+
+    assert await count_rows(engine) == 10
+
+
+@pytest.mark.asyncio
+async def test_core_repository_save_many_is_atomic(engine: AsyncEngine) -> None:
+    """A failing save_many should not persist any event."""
+    repo = CoreEventRepository(engine)
+    events = [DomainEvent.create(event_type="msg", event_payload=str(i)) for i in range(3)]
+
+    async with engine.begin() as conn:
+        await conn.exec_driver_sql(
+            "CREATE TRIGGER reject_two BEFORE INSERT ON events WHEN NEW.message = '2' "
+            "BEGIN SELECT RAISE(ABORT, 'constraint failed'); END"
+        )
+
+    with pytest.raises(IntegrityError):
+        await repo.save_many(events)
+    with pytest.raises(IntegrityError):
+        await repo.save(events[2])
+
+    assert await count_rows(engine) == 0
+
+
+@pytest.mark.asyncio
+async def test_core_repository_propagates_other_errors() -> None:
+    """Errors other than constraint violations should propagate."""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    repo = CoreEventRepository(engine)
+
+    with pytest.raises(Exception, match="no such table"):
+        await repo.save(DomainEvent.create(event_type="msg", event_payload="hi"))
+    with pytest.raises(Exception, match="no such table"):
+        await repo.save_many([DomainEvent.create(event_type="msg", event_payload="hi")])
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_core_repository_skips_duplicate_idempotency_keys(engine: AsyncEngine) -> None:
+    """Events whose idempotency key is already stored should be skipped, not rejected."""
+    repo = CoreEventRepository(engine)
+
+    def event(payload: str, key: str | None) -> DomainEvent:
+        return DomainEvent.create(event_type="msg", event_payload=payload, idempotency_key=key)
+
+    assert await repo.save(event("1", "k1")) is not None
+    assert await repo.save(event("retry", "k1")) is None
+    assert await repo.save(event("retry", "k1"), returning=False) is None
+    await repo.save(event("2", None))
+    inserted = await repo.save_many(
+        [event("retry", "k1"), event("3", "k2"), event("4", "k2"), event("5", None)]
+    )
+
+    assert inserted == [False, True, False, True]
+
+    async with engine.connect() as conn:
+        rows = (
+            await conn.execute(select(events_table.c.message, events_table.c.idempotency_key))
+        ).all()
+    assert sorted(rows, key=lambda row: row[0]) == [
+        ("1", "k1"),
+        ("2", None),
+        ("3", "k2"),
+        ("5", None),
+    ]
+
+
+def test_core_repository_uses_the_engine_dialect(engine: AsyncEngine) -> None:
+    """SQLite engines should get SQLite's ON CONFLICT construct."""
+    repo = CoreEventRepository(engine)
+
+    assert isinstance(repo._inserts.single, sqlite.Insert)
+    assert isinstance(repo._inserts.many, sqlite.Insert)
@@ -1,32 +1,36 @@
 """Tests for infrastructure layer: database and ORM."""
 
 from datetime import UTC
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from sqlalchemy import event, text
 
+from src.application.stage_timing import start_request_timing, stop_request_timing
 from src.core.event import DomainEvent
 from src.core.exceptions import DomainValidationError
+from src.infrastructure.config.settings import DatabaseSettings
+from src.infrastructure.postgres.core_event_repository import CoreEventRepository
 from src.infrastructure.postgres.db_provider import SqlAlchemyDbProvider
+from src.infrastructure.postgres.event_query_repository import SqlEventQueryRepository
 from src.infrastructure.postgres.event_repository import PostgresEventRepository
+from src.infrastructure.postgres.partitions import PartitionManager
 
 
 @pytest.mark.asyncio
 async def test_db_provider_lifecycle() -> None:
     """Test SqlAlchemyDbProvider startup, session creation, and shutdown."""
     with (
-        patch("src.infrastructure.postgres.db_provider.create_async_engine") as mock_create,
-        patch("src.infrastructure.postgres.db_provider.async_sessionmaker") as mock_sm,
+        patch("src.infrastructure.postgres.db.create_async_engine") as mock_create,
+        patch("src.infrastructure.postgres.db.async_sessionmaker") as mock_sm,
+        patch("src.infrastructure.postgres.db_provider.warm_pool", new=AsyncMock()) as mock_warm,
+        patch(
+            "src.infrastructure.postgres.db_provider.init_db_tables", new=AsyncMock()
+        ) as mock_init,
     ):
-        mock_conn = MagicMock()
-        mock_begin = MagicMock()
-        mock_begin.__aenter__ = AsyncMock(return_value=mock_conn)
-        mock_begin.__aexit__ = AsyncMock(return_value=None)
-
         mock_engine = MagicMock()
-        mock_engine.begin.return_value = mock_begin
         mock_engine.dispose = AsyncMock()
-        mock_conn.run_sync = AsyncMock()
         mock_create.return_value = mock_engine
         mock_sm.return_value = MagicMock(return_value=MagicMock())
 
@@ -34,15 +38,37 @@ async def test_db_provider_lifecycle() -> None:
 
         result = await provider.__aenter__()
         assert result is provider
-        assert mock_engine.begin.called
+        mock_init.assert_awaited_once_with(mock_engine, check_fingerprint=True)
+        mock_warm.assert_awaited_once_with(mock_engine, DatabaseSettings().pool_min_size)
 
         session = provider()
         assert session is not None
 
+        session.close = AsyncMock()
+        async with provider.event_repository() as repo:
+            assert isinstance(repo, PostgresEventRepository)
+            assert repo._session is session
+        session.close.assert_awaited_once()
+
         await provider.__aexit__(None, None, None)
         mock_engine.dispose.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_db_provider_core_repository() -> None:
+    """Test SqlAlchemyDbProvider yields the shared Core repository when configured."""
+    provider = SqlAlchemyDbProvider(
+        "sqlite+aiosqlite://", settings=DatabaseSettings(repository="core")
+    )
+    async with provider:
+        async with provider.event_repository() as first:
+            assert isinstance(first, CoreEventRepository)
+        async with provider.event_repository() as second:
+            assert second is first
+        assert provider.engine is not None
+        assert isinstance(provider.event_query_repository(), SqlEventQueryRepository)
+
+
 def test_create_engine_and_session_maker() -> None:
     """Test engine and session maker creation."""
     with patch("src.infrastructure.postgres.db.create_async_engine") as mock_create:
@@ -52,39 +78,130 @@ def test_create_engine_and_session_maker() -> None:
         mock_create.return_value = mock_engine
 
         engine, session_maker = create_engine_and_session_maker(
-            "postgresql+asyncpg://localhost/test"
+            "postgresql+asyncpg://localhost/test",
+            DatabaseSettings(pool_size=7, max_overflow=3, pool_recycle=60, pool_timeout=2.5),
         )
 
         assert engine is mock_engine
         assert session_maker is not None
+        kwargs = mock_create.call_args.kwargs
+        assert kwargs["pool_size"] == 7
+        assert kwargs["max_overflow"] == 3
+        assert kwargs["pool_recycle"] == 60
+        assert kwargs["pool_timeout"] == 2.5
+        assert kwargs["pool_pre_ping"] is True
+
+
+def test_create_engine_and_session_maker_in_memory_sqlite() -> None:
+    """Test in-memory SQLite engines are created without pool sizing."""
+    from src.infrastructure.postgres.db import create_engine_and_session_maker
+
+    engine, _ = create_engine_and_session_maker("sqlite+aiosqlite://")
+
+    assert not hasattr(engine.pool, "size")
 
 
 @pytest.mark.asyncio
-async def test_init_db_tables() -> None:
-    """Test database table initialization."""
-    from src.infrastructure.postgres.db import init_db_tables
+async def test_warm_pool_opens_and_prepares_connections(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test warm_pool leaves checked-in connections and writes nothing."""
+    from src.infrastructure.postgres.db import (
+        create_engine_and_session_maker,
+        init_db_tables,
+        warm_pool,
+    )
+
+    engine, _ = create_engine_and_session_maker(
+        f"sqlite+aiosqlite:///{tmp_path / 'warm.db'}", DatabaseSettings(pool_size=3)
+    )
+    await init_db_tables(engine)
+
+    await warm_pool(engine, connections=10)
+
+    assert "could not prepare" not in caplog.text
+    assert engine.pool.checkedin() == 3
+    async with engine.connect() as conn:
+        assert await conn.scalar(text("SELECT COUNT(*) FROM events")) == 0
+    await engine.dispose()
 
-    mock_conn = MagicMock()
-    mock_begin = MagicMock()
-    mock_begin.__aenter__ = AsyncMock(return_value=mock_conn)
-    mock_begin.__aexit__ = AsyncMock(return_value=None)
 
-    mock_engine = MagicMock()
-    mock_engine.begin.return_value = mock_begin
-    mock_conn.run_sync = AsyncMock()
+@pytest.mark.asyncio
+async def test_warm_pool_prepares_the_repositories_insert(tmp_path: Path) -> None:
+    """Test warm_pool runs the exact INSERT both repositories send for POST /event."""
+    from src.infrastructure.postgres.db import (
+        create_engine_and_session_maker,
+        init_db_tables,
+        warm_pool,
+    )
+
+    engine, session_maker = create_engine_and_session_maker(
+        f"sqlite+aiosqlite:///{tmp_path / 'warm.db'}", DatabaseSettings(pool_size=1)
+    )
+    await init_db_tables(engine)
+    statements: list[str] = []
+
+    def record(conn: object, cursor: object, statement: str, *args: object) -> None:
+        if statement.startswith("INSERT"):
+            statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    await warm_pool(engine, connections=1)
+    item = DomainEvent.create(event_type="msg", event_payload="hi", idempotency_key="k1")
+    await CoreEventRepository(engine).save(item, returning=False)
+    async with session_maker() as session:
+        await PostgresEventRepository(session).save(item, returning=False)
+    await engine.dispose()
+
+    assert len(statements) == 3
+    assert "ON CONFLICT DO NOTHING RETURNING" in statements[0]
+    assert statements[1] == statements[0]
+    assert statements[2] == statements[0]
+
+
+@pytest.mark.asyncio
+async def test_warm_pool_tolerates_failures() -> None:
+    """Test warm_pool logs and continues when connections cannot be opened."""
+    from src.infrastructure.postgres.db import warm_pool
+
+    engine = MagicMock()
+    engine.pool.size.return_value = 2
+    engine.connect = AsyncMock(side_effect=OSError("connection refused"))
 
-    await init_db_tables(mock_engine)
+    await warm_pool(engine, connections=2)
+    await warm_pool(engine, connections=0)
+
+    assert engine.connect.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_init_db_tables_skips_current_schema(tmp_path: Path) -> None:
+    """Test tables are created once, then skipped while the fingerprint matches."""
+    from src.infrastructure.postgres.db import create_engine_and_session_maker, init_db_tables
 
-    assert mock_conn.run_sync.called
+    engine, _ = create_engine_and_session_maker(f"sqlite+aiosqlite:///{tmp_path / 'schema.db'}")
+
+    created = await init_db_tables(engine)
+    skipped = await init_db_tables(engine)
+    forced = await init_db_tables(engine, check_fingerprint=False)
+
+    assert (created, skipped, forced) == (True, False, True)
+    async with engine.connect() as conn:
+        assert await conn.scalar(text("SELECT COUNT(*) FROM events")) == 0
+        assert await conn.scalar(text("SELECT COUNT(*) FROM schema_fingerprint")) == 1
+    await engine.dispose()
 
 
 class FakeSession:
     def __init__(self):
-        self.added = []
+        self.executed = []
         self.committed = False
 
-    def add(self, obj):
-        self.added.append(obj)
+    def get_bind(self):
+        return MagicMock(**{"dialect.name": "postgresql"})
+
+    async def scalar(self, statement):
+        self.executed.append(statement)
 
     async def commit(self):
         self.committed = True
@@ -105,7 +222,7 @@ async def test_postgres_event_repository() -> None:
 
     await repo.save(event)
 
-    assert len(session.added) == 1 and session.committed
+    assert len(session.executed) == 1 and session.committed
 
 
 def test_domain_event() -> None:
@@ -127,3 +244,81 @@ def test_domain_event() -> None:
 
     with pytest.raises(DomainValidationError):
         DomainEvent.create(event_type="x" * 101, event_payload="p")
+
+
+def test_db_provider_partitioning_is_postgres_only() -> None:
+    """Partition management should only be set up for PostgreSQL engines."""
+    settings = DatabaseSettings(partitioning=True)
+
+    postgres = SqlAlchemyDbProvider("postgresql+asyncpg://user:pw@localhost/db", settings)
+    sqlite = SqlAlchemyDbProvider("sqlite+aiosqlite://", settings)
+
+    assert isinstance(postgres._partitions, PartitionManager)
+    assert sqlite._partitions is None
+
+
+def test_db_provider_skips_partitions_without_maintenance() -> None:
+    """Workers that do not hold the maintenance lock should leave partitions alone."""
+    settings = DatabaseSettings(partitioning=True, partition_maintenance=False)
+
+    provider = SqlAlchemyDbProvider("postgresql+asyncpg://user:pw@localhost/db", settings)
+
+    assert provider._partitions is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("repository", "stages"),
+    [
+        ("orm", ["session", "connect", "insert", "commit"]),
+        ("core", ["connect", "insert", "commit"]),
+    ],
+)
+async def test_db_provider_times_repository_stages(
+    tmp_path: Path, repository: str, stages: list[str]
+) -> None:
+    """Ingest through either repository should time the connection checkout."""
+    provider = SqlAlchemyDbProvider(
+        f"sqlite+aiosqlite:///{tmp_path / 'stages.db'}",
+        DatabaseSettings(repository=repository, pool_min_size=0),
+    )
+    async with provider:
+        timings, token = start_request_timing()
+        try:
+            async with provider.event_repository() as repo:
+                await repo.save(DomainEvent.create("msg", "hi"), returning=False)
+        finally:
+            stop_request_timing(token)
+
+    assert list(timings.stages) == stages
+
+
+@pytest.mark.asyncio
+async def test_queue_pool_reports_metrics(tmp_path: Path) -> None:
+    """Test the pool records checkout time and exposes its usage as gauges."""
+    from src.application.metrics import REGISTRY
+    from src.infrastructure.postgres.db import (
+        POOL_CHECKOUT_SECONDS,
+        InstrumentedQueuePool,
+        create_engine_and_session_maker,
+    )
+
+    def gauge(name: str) -> float:
+        samples = REGISTRY.snapshot().families[name]["samples"]
+        return float(samples[0][1]) if samples else 0.0
+
+    # Pools of other tests' engines may still be alive
+    size, checked_out = gauge("db_pool_size"), gauge("db_pool_checked_out")
+    engine, _ = create_engine_and_session_maker(
+        f"sqlite+aiosqlite:///{tmp_path / 'metrics.db'}", DatabaseSettings(pool_size=2)
+    )
+    assert isinstance(engine.pool, InstrumentedQueuePool)
+    checkouts = sum(POOL_CHECKOUT_SECONDS.labels().counts)
+
+    async with engine.connect():
+        assert gauge("db_pool_size") == size + 2
+        assert gauge("db_pool_checked_out") == checked_out + 1
+        assert gauge("db_pool_overflow") >= 0
+
+    assert sum(POOL_CHECKOUT_SECONDS.labels().counts) == checkouts + 1
+    await engine.dispose()
@@ -0,0 +1,108 @@
+"""Tests for the keyset-paginated event query repository."""
+
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from src.application.list_events import list_events_uc
+from src.application.ports.event_query_repository import EventKey, EventQuery, SortOrder
+from src.infrastructure.postgres.event_query_repository import (
+    SqlEventQueryRepository,
+    build_page_query,
+)
+from src.infrastructure.postgres.models.event import Base, events_table
+
+BASE = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+@pytest.fixture
+async def engine() -> AsyncIterator[AsyncEngine]:
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        # Two types interleaved; every other pair shares a timestamp to exercise id tie-breaks
+        await conn.execute(
+            insert(events_table),
+            [
+                {
+                    "type": "even" if i % 2 == 0 else "odd",
+                    "message": str(i),
+                    "created_at": BASE + timedelta(seconds=i // 2),
+                }
+                for i in range(20)
+            ],
+        )
+    yield engine
+    await engine.dispose()
+
+
+async def read_all(repo: SqlEventQueryRepository, query: EventQuery) -> list[int]:
+    ids: list[int] = []
+    after: EventKey | None = None
+    while True:
+        page = await list_events_uc(EventQuery(**{**query.__dict__, "after": after}), repo)
+        ids.extend(item.id for item in page.items)
+        if page.next_key is None:
+            return ids
+        after = page.next_key
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("order", ["asc", "desc"])
+async def test_pages_cover_every_event_once(engine: AsyncEngine, order: SortOrder) -> None:
+    """Walking the cursor should return each event once, in (created_at, id) order."""
+    repo = SqlEventQueryRepository(engine)
+
+    ids = await read_all(repo, EventQuery(limit=3, order=order))
+
+    expected = list(range(1, 21))
+    assert ids == (expected if order == "asc" else expected[::-1])
+
+
+@pytest.mark.asyncio
+async def test_filters_by_type_and_time_range(engine: AsyncEngine) -> None:
+    """Type and [since, until) filters should narrow the results."""
+    repo = SqlEventQueryRepository(engine)
+    query = EventQuery(
+        limit=2,
+        event_type="odd",
+        since=BASE + timedelta(seconds=2),
+        until=(BASE + timedelta(seconds=5)).replace(tzinfo=None),
+        order="asc",
+    )
+
+    ids = await read_all(repo, query)
+
+    # Odd ids are the "even" type (1-based); seconds 2..4 hold events 5-10
+    assert ids == [6, 8, 10]
+
+
+@pytest.mark.asyncio
+async def test_records_are_timezone_aware(engine: AsyncEngine) -> None:
+    """Timestamps should come back as UTC-aware datetimes."""
+    records = await SqlEventQueryRepository(engine).list_events(EventQuery(limit=1, order="asc"))
+
+    assert records[0].created_at == BASE
+    assert records[0].created_at.tzinfo is UTC
+    assert records[0].event_payload == "0"
+
+
+@pytest.mark.asyncio
+async def test_page_query_seeks_on_type_created_at_index(engine: AsyncEngine) -> None:
+    """Deep pages should seek via the composite index instead of skipping rows."""
+    after = EventKey(created_at=BASE + timedelta(seconds=5), id=11)
+    stmt = build_page_query(EventQuery(limit=10, event_type="even", after=after))
+    compiled = stmt.compile(engine.sync_engine, compile_kwargs={"literal_binds": True})
+
+    async with engine.connect() as conn:
+        plan = " ".join(
+            str(row[-1]) for row in await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}")
+        )
+
+    assert "OFFSET" not in str(stmt.compile(dialect=postgresql.dialect())).upper()
+    assert "idx_type_created_at" in plan
+    assert "TEMP B-TREE" not in plan
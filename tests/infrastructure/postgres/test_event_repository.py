@@ -1,9 +1,24 @@
 """Tests for PostgreSQL event repository."""
 
+from types import SimpleNamespace
+
 import pytest
+from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
 from src.core.event import DomainEvent
 from src.infrastructure.postgres.event_repository import PostgresEventRepository
+from src.infrastructure.postgres.models.event import Base
+from src.infrastructure.postgres.models.event import Event as DBEvent
+
+
+class FakeResult:
+    """Result of a fake executemany that returns no rows."""
+
+    def scalars(self) -> list[object]:
+        """Return the (empty) first column."""
+        return []
 
 
 class FakeSession:
@@ -12,20 +27,34 @@ class FakeSession:
     Simulates SQLAlchemy AsyncSession behavior without database.
     """
 
-    def __init__(self, fail_on_commit: bool = False, fail_on_refresh: bool = False) -> None:
+    def __init__(
+        self,
+        fail_on_commit: bool = False,
+        fail_on_refresh: bool = False,
+        dialect_name: str = "postgresql",
+    ) -> None:
         """Initialize fake session with optional failure modes.
 
         Args:
             fail_on_commit: If True, raise error on commit().
             fail_on_refresh: If True, raise error on refresh().
+            dialect_name: Dialect of the engine the session is bound to.
         """
+        self.dialect_name = dialect_name
         self.added = []
+        self.executed = []
+        self.params = []
         self.committed = False
         self.refreshed = []
         self.rolled_back = False
+        self.returned = object()
         self._fail_on_commit = fail_on_commit
         self._fail_on_refresh = fail_on_refresh
 
+    def get_bind(self) -> SimpleNamespace:
+        """Return a stand-in for the bound engine."""
+        return SimpleNamespace(dialect=SimpleNamespace(name=self.dialect_name))
+
     def add(self, obj: object) -> None:
         """Add object to session.
 
@@ -34,6 +63,28 @@ class FakeSession:
         """
         self.added.append(obj)
 
+    async def execute(self, statement: object, params: object = None) -> FakeResult:
+        """Record an executed statement.
+
+        Args:
+            statement: Statement to execute.
+            params: Bound parameters (list for executemany).
+        """
+        self.executed.append(statement)
+        self.params.append(params)
+        return FakeResult()
+
+    async def scalar(self, statement: object, params: object = None) -> object:
+        """Record an executed statement and return its single result.
+
+        Args:
+            statement: Statement to execute.
+            params: Bound parameters.
+        """
+        self.executed.append(statement)
+        self.params.append(params)
+        return self.returned
+
     async def commit(self) -> None:
         """Commit transaction (may fail based on initialization).
 
@@ -64,7 +115,7 @@ class FakeSession:
 
 @pytest.mark.asyncio
 async def test_postgres_event_repository_save_success() -> None:
-    """Repository should commit event and refresh the object."""
+    """Repository should insert with RETURNING and commit without a refresh."""
     session = FakeSession()
     repo = PostgresEventRepository(session)
 
@@ -72,9 +123,50 @@ async def test_postgres_event_repository_save_success() -> None:
     db_obj = await repo.save(event)
 
     # Verify session interactions
-    assert len(session.added) == 1
+    assert db_obj is session.returned
+    assert len(session.executed) == 1
+    assert "RETURNING" in str(session.executed[0])
     assert session.committed is True
-    assert db_obj in session.refreshed
+    assert session.refreshed == []
+    assert session.added == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("dialect_name", "insert_type"),
+    [("postgresql", postgresql.Insert), ("sqlite", sqlite.Insert)],
+)
+async def test_postgres_event_repository_uses_the_session_dialect(
+    dialect_name: str, insert_type: type
+) -> None:
+    """Every insert should be built with the bound dialect's ON CONFLICT construct."""
+    session = FakeSession(dialect_name=dialect_name)
+    repo = PostgresEventRepository(session)
+    event = DomainEvent.create(event_type="msg", event_payload="hi")
+
+    await repo.save(event)
+    await repo.save(event, returning=False)
+    await repo.save_many([event])
+
+    assert all(isinstance(statement, insert_type) for statement in session.executed)
+
+
+@pytest.mark.asyncio
+async def test_postgres_event_repository_save_without_returning() -> None:
+    """Repository should only return the id when the row is not needed."""
+    session = FakeSession()
+    repo = PostgresEventRepository(session)
+
+    event = DomainEvent.create(event_type="msg", event_payload="hi")
+    db_obj = await repo.save(event, returning=False)
+
+    assert db_obj is True
+    assert len(session.executed) == 1
+    assert [column.name for column in session.executed[0]._returning] == ["id"]
+    assert session.committed is True
+
+    session.returned = None
+    assert await repo.save(event, returning=False) is None
 
 
 @pytest.mark.asyncio
@@ -92,14 +184,101 @@ async def test_postgres_event_repository_rollback_on_commit_failure() -> None:
 
 
 @pytest.mark.asyncio
-async def test_postgres_event_repository_rollback_on_refresh_failure() -> None:
-    """Repository should rollback on refresh error."""
-    session = FakeSession(fail_on_refresh=True)
-    repo = PostgresEventRepository(session)
+async def test_postgres_event_repository_save_returning_sqlite() -> None:
+    """save should return database-assigned values from a real SQLite database."""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
 
     event = DomainEvent.create(event_type="msg", event_payload="hi")
+    async with session_maker() as session:
+        db_obj = await PostgresEventRepository(session).save(event)
+    await engine.dispose()
+
+    assert db_obj is not None
+    assert db_obj.id == 1
+    assert db_obj.message == "hi"
+
+
+@pytest.mark.asyncio
+async def test_postgres_event_repository_save_many_single_commit() -> None:
+    """save_many should execute one bulk INSERT and commit once."""
+    session = FakeSession()
+    repo = PostgresEventRepository(session)
+    events = [DomainEvent.create(event_type="msg", event_payload=str(i)) for i in range(3)]
+
+    assert await repo.save_many(events) == [True, True, True]
+
+    assert len(session.executed) == 1
+    assert [row["message"] for row in session.params[0]] == ["0", "1", "2"]
+    assert session.committed is True
+    assert session.added == []
+
+
+@pytest.mark.asyncio
+async def test_postgres_event_repository_save_many_empty_is_noop() -> None:
+    """save_many should not touch the session for an empty batch."""
+    session = FakeSession()
+    repo = PostgresEventRepository(session)
+
+    await repo.save_many([])
+
+    assert session.executed == []
+    assert session.committed is False
+
+
+@pytest.mark.asyncio
+async def test_postgres_event_repository_save_many_rollback_on_failure() -> None:
+    """save_many should rollback when the commit fails."""
+    session = FakeSession(fail_on_commit=True)
+    repo = PostgresEventRepository(session)
 
     with pytest.raises(RuntimeError):
-        await repo.save(event)
+        await repo.save_many([DomainEvent.create(event_type="msg", event_payload="hi")])
 
     assert session.rolled_back is True
+
+
+@pytest.mark.asyncio
+async def test_postgres_event_repository_save_many_sqlite() -> None:
+    """save_many should insert every row against a real SQLite database."""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+
+    events = [DomainEvent.create(event_type="msg", event_payload=str(i)) for i in range(2500)]
+    async with session_maker() as session:
+        await PostgresEventRepository(session).save_many(events)
+
+    async with session_maker() as session:
+        count = await session.scalar(select(func.count()).select_from(DBEvent))
+    await engine.dispose()
+
+    assert count == 2500
+
+
+@pytest.mark.asyncio
+async def test_postgres_event_repository_skips_duplicate_idempotency_keys() -> None:
+    """Events whose idempotency key is already stored should be skipped, not rejected."""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+
+    def event(payload: str) -> DomainEvent:
+        return DomainEvent.create(event_type="msg", event_payload=payload, idempotency_key="k1")
+
+    async with session_maker() as session:
+        repo = PostgresEventRepository(session)
+        first = await repo.save(event("1"))
+        retry = await repo.save(event("retry"))
+        skipped = await repo.save_many([event("retry"), event("retry")])
+        messages = (await session.scalars(select(DBEvent.message))).all()
+    await engine.dispose()
+
+    assert first is not None
+    assert retry is None
+    assert skipped == [False, False]
+    assert messages == ["1"]
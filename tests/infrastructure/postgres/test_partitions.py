@@ -0,0 +1,204 @@
+"""Tests for the events table partition manager."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.infrastructure.config.settings import DatabaseSettings
+from src.infrastructure.postgres.partitions import (
+    PartitionManager,
+    next_partition_start,
+    partition_name,
+    partition_start,
+)
+
+NOW = datetime(2025, 12, 30, 15, 45, tzinfo=UTC)
+
+
+class FakeConnection:
+    """Connection recording DDL and answering the catalog queries."""
+
+    def __init__(
+        self, kind: str | None, partitions: list[str], fail_on: str | None, claims_keys: bool
+    ) -> None:
+        self.kind = kind
+        self.partitions = partitions
+        self.fail_on = fail_on
+        self.claims_keys = claims_keys
+        self.statements: list[str] = []
+
+    async def scalar(self, statement: Any, params: dict[str, str]) -> object:
+        if "trigger" in params:
+            return 1 if self.claims_keys else None
+        return self.kind
+
+    async def execute(self, statement: Any, params: dict[str, str]) -> Any:
+        result = MagicMock()
+        result.scalars.return_value = list(self.partitions)
+        return result
+
+    async def exec_driver_sql(self, sql: str) -> None:
+        if self.fail_on is not None and self.fail_on in sql:
+            raise RuntimeError("default partition contains rows")
+        self.statements.append(sql)
+
+    @asynccontextmanager
+    async def begin_nested(self) -> AsyncIterator[None]:
+        yield
+
+
+class FakeEngine:
+    """Engine handing out a single FakeConnection."""
+
+    def __init__(
+        self,
+        kind: str | None = "p",
+        partitions: list[str] | None = None,
+        fail_on: str | None = None,
+        claims_keys: bool = True,
+    ) -> None:
+        self.conn = FakeConnection(kind, partitions or [], fail_on, claims_keys)
+
+    @asynccontextmanager
+    async def begin(self) -> AsyncIterator[FakeConnection]:
+        yield self.conn
+
+
+def make_manager(engine: FakeEngine, **settings: Any) -> PartitionManager:
+    return PartitionManager(engine, DatabaseSettings(partitioning=True, **settings))  # type: ignore[arg-type]
+
+
+def test_partition_ranges() -> None:
+    """Partitions should be aligned on UTC days or months and named after their start."""
+    day = partition_start(NOW, "day")
+    month = partition_start(NOW.replace(tzinfo=None), "month")
+
+    assert day == datetime(2025, 12, 30, tzinfo=UTC)
+    assert next_partition_start(day, "day") == datetime(2025, 12, 31, tzinfo=UTC)
+    assert month == datetime(2025, 12, 1, tzinfo=UTC)
+    assert next_partition_start(month, "month") == datetime(2026, 1, 1, tzinfo=UTC)
+    assert next_partition_start(datetime(2025, 1, 1, tzinfo=UTC), "month").month == 2
+    assert partition_name(day, "day") == "events_p20251230"
+    assert partition_name(month, "month") == "events_p202512"
+
+
+@pytest.mark.asyncio
+async def test_prepare_creates_partitioned_parent() -> None:
+    """A missing events table should be created partitioned with a default partition."""
+    engine = FakeEngine(kind=None, claims_keys=False)
+
+    assert await make_manager(engine).prepare() is True
+
+    ddl = " ".join(engine.conn.statements)
+    assert "PARTITION BY RANGE (created_at)" in ddl
+    assert "PRIMARY KEY (id, created_at)" in ddl
+    assert "idx_type_created_at ON events (type, created_at)" in ddl
+    assert "UNIQUE INDEX IF NOT EXISTS uq_events_idempotency_key_created_at" in ddl
+    assert "events_default PARTITION OF events DEFAULT" in ddl
+    assert "idempotency_key VARCHAR(255) PRIMARY KEY" in ddl
+    assert "BEFORE INSERT ON events FOR EACH ROW" in ddl
+
+
+@pytest.mark.asyncio
+async def test_prepare_claims_keys_of_earlier_partitioned_tables() -> None:
+    """A partitioned table without the key trigger should get it, with its keys copied."""
+    engine = FakeEngine(kind="p", claims_keys=False)
+
+    assert await make_manager(engine).prepare() is True
+
+    assert not any("PARTITION BY" in sql for sql in engine.conn.statements)
+    assert any(
+        sql.startswith("INSERT INTO events_idempotency_keys") for sql in engine.conn.statements
+    )
+    assert engine.conn.statements[-1].startswith("CREATE TRIGGER events_claim_idempotency_key")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("kind", "managed"), [("p", True), ("r", False)])
+async def test_prepare_leaves_existing_table(kind: str, managed: bool) -> None:
+    """An existing table should never be recreated; a plain one is not managed."""
+    engine = FakeEngine(kind=kind)
+
+    assert await make_manager(engine).prepare() is managed
+    assert engine.conn.statements == []
+
+
+@pytest.mark.asyncio
+async def test_maintain_premakes_missing_partitions() -> None:
+    """Partitions from now to premake intervals ahead should be created once."""
+    engine = FakeEngine(partitions=["events_default", "events_p20251230"])
+
+    await make_manager(engine, partition_premake=2).maintain(NOW)
+
+    assert engine.conn.statements == [
+        "CREATE TABLE IF NOT EXISTS events_p20251231 PARTITION OF events FOR VALUES "
+        "FROM ('2025-12-31T00:00:00+00:00') TO ('2026-01-01T00:00:00+00:00')",
+        "CREATE TABLE IF NOT EXISTS events_p20260101 PARTITION OF events FOR VALUES "
+        "FROM ('2026-01-01T00:00:00+00:00') TO ('2026-01-02T00:00:00+00:00')",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_maintain_drops_expired_partitions() -> None:
+    """Partitions entirely older than the retention should be detached and dropped."""
+    engine = FakeEngine(
+        partitions=["events_default", "events_p202509", "events_p202510", "events_p202511"]
+    )
+
+    await make_manager(
+        engine, partition_interval="month", partition_premake=0, partition_retention_days=40
+    ).maintain(NOW)
+
+    # Cutoff is 2025-11-20: only September and October have ended before it
+    assert [sql for sql in engine.conn.statements if "CREATE" not in sql] == [
+        "ALTER TABLE events DETACH PARTITION events_p202509",
+        "DROP TABLE events_p202509",
+        "ALTER TABLE events DETACH PARTITION events_p202510",
+        "DROP TABLE events_p202510",
+        "DELETE FROM events_idempotency_keys WHERE created_at < '2025-11-01T00:00:00+00:00'",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_maintain_keeps_going_when_a_partition_fails() -> None:
+    """A partition that cannot be created should not block the others."""
+    engine = FakeEngine(fail_on="events_p20251230")
+
+    await make_manager(engine, partition_premake=1).maintain(NOW)
+
+    assert len(engine.conn.statements) == 1
+    assert "events_p20251231" in engine.conn.statements[0]
+
+
+@pytest.mark.asyncio
+async def test_manager_lifecycle() -> None:
+    """Entering should prepare and maintain; exiting should stop the schedule."""
+    engine = FakeEngine(kind=None)
+
+    async with make_manager(engine, partition_premake=0, partition_check_seconds=0.01) as manager:
+        assert manager._worker is not None
+        engine.conn.partitions = []  # periodic runs re-create what is missing
+        await asyncio.sleep(0.05)
+
+    assert manager._worker is None
+    assert sum("PARTITION OF events FOR VALUES" in sql for sql in engine.conn.statements) > 1
+
+    plain = FakeEngine(kind="r")
+    async with make_manager(plain) as manager:
+        assert manager._worker is None
+
+
+@pytest.mark.asyncio
+async def test_maintain_logs_failures() -> None:
+    """A failing catalog query should be logged, not raised."""
+    engine = FakeEngine()
+    engine.conn.execute = MagicMock(side_effect=RuntimeError("connection lost"))  # type: ignore[method-assign]
+
+    await make_manager(engine).maintain(NOW)
+
+    assert engine.conn.statements == []
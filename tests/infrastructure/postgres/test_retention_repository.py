@@ -0,0 +1,76 @@
+"""Tests for the retention repository."""
+
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from src.application.ports.event_query_repository import EventKey
+from src.infrastructure.postgres.models.event import Base, events_table
+from src.infrastructure.postgres.retention_repository import SqlRetentionRepository
+
+BASE = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+@pytest.fixture
+async def engine() -> AsyncIterator[AsyncEngine]:
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(
+            insert(events_table),
+            [
+                {"type": "msg" if i % 2 else "audit", "message": "x", "created_at": at}
+                for i, at in enumerate(BASE + timedelta(hours=h) for h in (0, 0, 1, 2, 3, 48))
+            ],
+        )
+    yield engine
+    await engine.dispose()
+
+
+async def remaining(engine: AsyncEngine) -> list[int]:
+    async with engine.connect() as conn:
+        return list((await conn.execute(select(events_table.c.id))).scalars())
+
+
+@pytest.mark.asyncio
+async def test_delete_expired_in_keyset_batches(engine: AsyncEngine) -> None:
+    """Batches should delete oldest first and resume after the last key."""
+    repo = SqlRetentionRepository(engine)
+    cutoff = BASE + timedelta(days=1)
+
+    first = await repo.delete_expired(cutoff, 2)
+    assert first.deleted == 2
+    assert first.last_key == EventKey(created_at=BASE, id=2)
+
+    second = await repo.delete_expired(cutoff, 2, after=first.last_key)
+    assert second.deleted == 2
+    assert second.last_key == EventKey(created_at=BASE + timedelta(hours=2), id=4)
+
+    third = await repo.delete_expired(cutoff, 2, after=second.last_key)
+    assert (third.deleted, third.last_key) == (1, EventKey(BASE + timedelta(hours=3), 5))
+
+    assert (await repo.delete_expired(cutoff, 2)).deleted == 0
+    assert await remaining(engine) == [6]
+
+
+@pytest.mark.asyncio
+async def test_delete_expired_filters_types(engine: AsyncEngine) -> None:
+    """Type filters should restrict or exclude what is deleted."""
+    repo = SqlRetentionRepository(engine)
+    cutoff = BASE + timedelta(days=1)
+
+    batch = await repo.delete_expired(cutoff, 10, event_type="msg")
+    assert batch.deleted == 2
+    assert await remaining(engine) == [1, 3, 5, 6]
+
+    batch = await repo.delete_expired(cutoff, 10, exclude_types=["audit"])
+    assert batch.deleted == 0
+    assert batch.last_key is None
+
+    naive_cutoff = cutoff.replace(tzinfo=None)
+    batch = await repo.delete_expired(naive_cutoff, 10, exclude_types=["msg"])
+    assert batch.deleted == 3
+    assert await remaining(engine) == [6]
@@ -0,0 +1,89 @@
+"""Tests for the rollup repository."""
+
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from src.application.ports.rollup_repository import RollupBucket, RollupQuery
+from src.infrastructure.postgres.models.event import Base
+from src.infrastructure.postgres.rollup_repository import SqlRollupRepository, _build_upsert
+
+BASE = datetime(2025, 1, 1, 12, tzinfo=UTC)
+
+
+@pytest.fixture
+async def engine() -> AsyncIterator[AsyncEngine]:
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+def bucket(minute: int, count: int, event_type: str = "msg") -> RollupBucket:
+    return RollupBucket(
+        resolution="minute",
+        event_type=event_type,
+        bucket_start=BASE + timedelta(minutes=minute),
+        count=count,
+        total_payload_bytes=count * 10,
+    )
+
+
+@pytest.mark.asyncio
+async def test_add_upserts_counters(engine: AsyncEngine) -> None:
+    """Adding to an existing bucket should increment it, not replace it."""
+    repo = SqlRollupRepository(engine)
+
+    await repo.add([bucket(0, 2), bucket(1, 1)])
+    await repo.add([bucket(0, 3)])
+    await repo.add([])
+
+    buckets = await repo.list_buckets(RollupQuery(resolution="minute", limit=10))
+    assert [(b.bucket_start, b.count, b.total_payload_bytes) for b in buckets] == [
+        (BASE, 5, 50),
+        (BASE + timedelta(minutes=1), 1, 10),
+    ]
+    assert buckets[0].bucket_start.tzinfo is UTC
+
+
+@pytest.mark.asyncio
+async def test_list_buckets_filters(engine: AsyncEngine) -> None:
+    """Type, resolution, range and limit should narrow the buckets."""
+    repo = SqlRollupRepository(engine)
+    await repo.add([bucket(m, 1) for m in range(5)] + [bucket(2, 7, event_type="other")])
+    await repo.add([RollupBucket("hour", "msg", BASE, count=5, total_payload_bytes=50)])
+
+    filtered = await repo.list_buckets(
+        RollupQuery(
+            resolution="minute",
+            limit=2,
+            event_type="msg",
+            since=BASE + timedelta(minutes=1),
+            until=(BASE + timedelta(minutes=4)).replace(tzinfo=None),
+        )
+    )
+    hours = await repo.list_buckets(RollupQuery(resolution="hour", limit=10))
+    all_types = await repo.list_buckets(
+        RollupQuery(resolution="minute", limit=10, since=BASE + timedelta(minutes=2))
+    )
+
+    assert [b.bucket_start.minute for b in filtered] == [1, 2]
+    assert [(b.event_type, b.count) for b in hours] == [("msg", 5)]
+    assert [(b.bucket_start.minute, b.event_type) for b in all_types] == [
+        (2, "msg"),
+        (2, "other"),
+        (3, "msg"),
+        (4, "msg"),
+    ]
+
+
+def test_postgres_upsert_adds_to_existing_row() -> None:
+    """The PostgreSQL statement should increment counters on conflict."""
+    sql = str(_build_upsert("postgresql").compile(dialect=postgresql.dialect()))
+
+    assert "ON CONFLICT (resolution, type, bucket_start) DO UPDATE" in sql
+    assert "count = (event_rollups.count + excluded.count)" in sql
@@ -0,0 +1,121 @@
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, String, Table, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.core.event import DomainEvent
+from src.infrastructure.config.settings import DatabaseSettings
+from src.infrastructure.postgres.models.event import Base
+from src.infrastructure.postgres.schema import (
+    migrate_schema,
+    read_schema_fingerprint,
+    schema_fingerprint,
+    write_schema_fingerprint,
+)
+from src.infrastructure.sqlite.db_provider import SqliteDbProvider
+
+
+def make_metadata(type_length: int = 100, indexed: bool = False) -> MetaData:
+    metadata = MetaData()
+    Table(
+        "things",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("type", String(type_length), index=indexed),
+    )
+    return metadata
+
+
+def test_schema_fingerprint_tracks_ddl() -> None:
+    """Test the fingerprint is stable, and changes with columns, indexes and dialect."""
+    dialect = sqlite.dialect()
+    base = schema_fingerprint(make_metadata(), dialect)
+
+    assert base == schema_fingerprint(make_metadata(), dialect)
+    assert base != schema_fingerprint(make_metadata(type_length=200), dialect)
+    assert base != schema_fingerprint(make_metadata(indexed=True), dialect)
+    assert base != schema_fingerprint(make_metadata(), postgresql.dialect())
+    assert len(schema_fingerprint(Base.metadata, dialect)) == 64
+
+
+@pytest.mark.asyncio
+async def test_read_and_write_schema_fingerprint(tmp_path: Path) -> None:
+    """Test no fingerprint is read before one is written, then the latest one is."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'schema.db'}")
+
+    missing = await read_schema_fingerprint(engine)
+    for fingerprint in ("a" * 64, "b" * 64):
+        async with engine.begin() as conn:
+            await write_schema_fingerprint(conn, fingerprint)
+
+    assert missing is None
+    assert await read_schema_fingerprint(engine) == "b" * 64
+    async with engine.connect() as conn:
+        assert await conn.scalar(text("SELECT COUNT(*) FROM schema_fingerprint")) == 1
+    await engine.dispose()
+
+
+BASELINE_EVENTS_DDL = (
+    "CREATE TABLE events ("
+    " id INTEGER NOT NULL PRIMARY KEY,"
+    " type VARCHAR(100) NOT NULL,"
+    " message VARCHAR(1000) NOT NULL,"
+    " created_at DATETIME DEFAULT (CURRENT_TIMESTAMP) NOT NULL)",
+    "CREATE INDEX ix_events_type ON events (type)",
+    "CREATE INDEX ix_events_created_at ON events (created_at)",
+    "CREATE INDEX idx_type_created_at ON events (type, created_at)",
+    "INSERT INTO events (type, message) VALUES ('legacy', 'before the upgrade')",
+)
+
+
+@pytest.mark.asyncio
+async def test_provider_upgrades_baseline_schema(tmp_path: Path) -> None:
+    """A database created before idempotency keys is migrated and accepts keyed writes."""
+    url = f"sqlite+aiosqlite:///{tmp_path / 'events.db'}"
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        for statement in BASELINE_EVENTS_DDL:
+            await conn.execute(text(statement))
+    await engine.dispose()
+
+    settings = DatabaseSettings(pool_min_size=0, sqlite_writer_linger_ms=0)
+    async with SqliteDbProvider(url, settings) as provider:
+        for _ in range(2):
+            async with provider.event_repository() as repo:
+                await repo.save(
+                    DomainEvent.create(
+                        event_type="msg", event_payload="retried", idempotency_key="k-1"
+                    )
+                )
+        async with provider.engine.connect() as conn:
+            rows = (await conn.execute(text("SELECT type, idempotency_key FROM events"))).all()
+            applied = await conn.run_sync(migrate_schema)
+
+    assert sorted(rows, key=str) == [("legacy", None), ("msg", "k-1")]
+    assert applied == []
+
+
+def test_migrate_schema_makes_partitioned_key_unique(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A partitioned table's key index is replaced by one unique with created_at."""
+    inspector = MagicMock()
+    inspector.get_columns.return_value = [{"name": "id"}, {"name": "idempotency_key"}]
+    inspector.get_indexes.return_value = [{"name": "ix_events_idempotency_key"}]
+    monkeypatch.setattr("src.infrastructure.postgres.schema.inspect", lambda conn: inspector)
+    conn = MagicMock()
+    conn.dialect.name = "postgresql"
+    conn.scalar.return_value = "p"
+
+    applied = migrate_schema(conn)
+
+    assert applied == [
+        "created index uq_events_idempotency_key_created_at",
+        "dropped index ix_events_idempotency_key",
+    ]
+    assert [str(call.args[0]) for call in conn.execute.call_args_list] == [
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_events_idempotency_key_created_at"
+        " ON events (idempotency_key, created_at)",
+        "DROP INDEX IF EXISTS ix_events_idempotency_key",
+    ]
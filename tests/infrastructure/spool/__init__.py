@@ -0,0 +1 @@
+"""Tests for the local event spool."""
@@ -0,0 +1,144 @@
+"""Tests for the spool segment log."""
+
+import asyncio
+from pathlib import Path
+from typing import Any, BinaryIO
+
+import pytest
+
+from src.infrastructure.spool import log as log_module
+from src.infrastructure.spool.log import SpoolLog, SpoolPosition
+
+
+def make_log(directory: Path, segment_bytes: int = 1024) -> SpoolLog:
+    return SpoolLog(directory, segment_bytes=segment_bytes, fsync_interval_seconds=0)
+
+
+@pytest.mark.asyncio
+async def test_append_and_read_round_trip(tmp_path: Path) -> None:
+    """Records should come back in order with their positions."""
+    async with make_log(tmp_path) as log:
+        assert not log.has_backlog()
+        await log.append([b"a", b"bb"])
+        end = await log.append([b"ccc"])
+
+        records, position = await log.read(log.checkpoint, 10)
+
+    assert [payload for _, payload in records] == [b"a", b"bb", b"ccc"]
+    assert records[1][0] == SpoolPosition(0, 9)
+    assert position == end == SpoolPosition(0, 30)
+
+
+@pytest.mark.asyncio
+async def test_read_stops_at_max_records(tmp_path: Path) -> None:
+    """A partial read should resume at the first record not returned."""
+    async with make_log(tmp_path) as log:
+        await log.append([b"a", b"b", b"c"])
+
+        first, position = await log.read(log.checkpoint, 2)
+        rest, end = await log.read(position, 2)
+
+    assert [payload for _, payload in first] == [b"a", b"b"]
+    assert [payload for _, payload in rest] == [b"c"]
+    assert end == log.end
+
+
+@pytest.mark.asyncio
+async def test_read_only_decodes_the_records_returned(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A read from the middle of a segment should neither rescan its start nor read to its end."""
+    spans: list[tuple[int, int]] = []
+    scan = log_module._scan
+
+    def recording_scan(file: BinaryIO, start: int, limit: int, max_records: int) -> Any:
+        result = scan(file, start, limit, max_records)
+        spans.append((start, file.tell()))
+        return result
+
+    async with make_log(tmp_path, segment_bytes=1 << 20) as log:
+        await log.append([bytes(100)] * 1000)
+        monkeypatch.setattr(log_module, "_scan", recording_scan)
+
+        records, position = await log.read(SpoolPosition(0, 108 * 500), 2)
+
+    assert [offset for offset, _ in records] == [SpoolPosition(0, 54000), SpoolPosition(0, 54108)]
+    assert position == SpoolPosition(0, 54216)
+    assert spans == [(54000, 54216)]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_appends_share_fsyncs(tmp_path: Path) -> None:
+    """Appends waiting together should be covered by a single fsync."""
+    log = SpoolLog(tmp_path, segment_bytes=1024, fsync_interval_seconds=0.01)
+    async with log:
+        syncs = 0
+        fsync = log._fsync
+
+        def counting_fsync(*args: object) -> None:
+            nonlocal syncs
+            syncs += 1
+            fsync(*args)  # type: ignore[arg-type]
+
+        log._fsync = counting_fsync  # type: ignore[method-assign]
+        await asyncio.gather(*(log.append([bytes([i])]) for i in range(20)))
+
+        assert syncs == 1
+
+
+@pytest.mark.asyncio
+async def test_commit_checkpoints_and_drops_segments(tmp_path: Path) -> None:
+    """Committed positions should survive a reopen; consumed segments are deleted."""
+    async with make_log(tmp_path, segment_bytes=64) as log:
+        for i in range(6):
+            await log.append([bytes([i]) * 20])
+        assert len(list(tmp_path.glob("*.seg"))) == 3
+
+        records, position = await log.read(log.checkpoint, 4)
+        await log.commit(position)
+
+    assert len(list(tmp_path.glob("*.seg"))) == 1
+    async with make_log(tmp_path, segment_bytes=64) as log:
+        assert log.checkpoint == position
+        rest, _ = await log.read(log.checkpoint, 10)
+        await log.commit(log.end)
+        assert not log.has_backlog()
+
+    assert [payload[0] for _, payload in records + rest] == [0, 1, 2, 3, 4, 5]
+
+
+@pytest.mark.asyncio
+async def test_torn_tail_is_truncated_on_open(tmp_path: Path) -> None:
+    """A half-written record left by a crash should be dropped."""
+    async with make_log(tmp_path) as log:
+        end = await log.append([b"complete"])
+        spool_id = log.spool_id
+    with (tmp_path / f"{0:020d}.seg").open("ab") as file:
+        file.write(b"\x00\x00\x00\x10torn")
+
+    async with make_log(tmp_path) as log:
+        assert log.end == end
+        assert log.spool_id == spool_id
+        records, _ = await log.read(log.checkpoint, 10)
+        await log.append([b"next"])
+        records += (await log.read(end, 10))[0]
+
+    assert [payload for _, payload in records] == [b"complete", b"next"]
+
+
+@pytest.mark.asyncio
+async def test_each_process_takes_its_own_directory(tmp_path: Path) -> None:
+    """Logs sharing a directory take one worker slot each, and fail when none is free."""
+    logs = [SpoolLog(tmp_path, 1024, 0, worker_slots=2) for _ in range(3)]
+
+    async with logs[0], logs[1]:
+        directories = [log.directory for log in logs[:2]]
+        ids = {log.spool_id for log in logs[:2]}
+        with pytest.raises(RuntimeError, match="locked by other processes"):
+            await logs[2].__aenter__()
+    async with logs[2]:
+        reopened = logs[2].directory
+
+    assert directories == [tmp_path, tmp_path / "worker-1"]
+    assert len(ids) == 2
+    assert reopened == tmp_path
@@ -0,0 +1,71 @@
+"""Tests for the spooling event repository."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+from src.core.event import DomainEvent
+from src.infrastructure.spool.repository import SpoolingEventRepository
+
+EVENT = DomainEvent.create("msg", "hello")
+
+
+def make_repo(active: bool = False) -> tuple[SpoolingEventRepository, AsyncMock, MagicMock]:
+    inner = AsyncMock()
+    spool = MagicMock(active=active, append=AsyncMock())
+    return SpoolingEventRepository(inner, spool), inner, spool
+
+
+@pytest.mark.asyncio
+async def test_healthy_writes_go_to_the_database() -> None:
+    """Without a backlog, writes should reach the inner repository only."""
+    repo, inner, spool = make_repo()
+
+    assert await repo.save(EVENT, returning=False) is inner.save.return_value
+    await repo.save_many([EVENT])
+
+    inner.save.assert_awaited_once_with(EVENT, returning=False)
+    inner.save_many.assert_awaited_once_with([EVENT])
+    spool.append.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "error",
+    [TimeoutError(), ConnectionRefusedError(), OperationalError("INSERT", {}, Exception("down"))],
+)
+async def test_unavailable_database_spools_writes(error: Exception) -> None:
+    """Connection failures and timeouts should spool the events instead."""
+    repo, inner, spool = make_repo()
+    inner.save.side_effect = error
+    inner.save_many.side_effect = error
+
+    assert await repo.save(EVENT) is True
+    assert await repo.save_many([EVENT, EVENT]) == [True, True]
+
+    assert [call.args[0] for call in spool.append.await_args_list] == [(EVENT,), [EVENT, EVENT]]
+
+
+@pytest.mark.asyncio
+async def test_backlog_spools_without_trying_the_database() -> None:
+    """While replay is pending, new writes should queue behind the backlog."""
+    repo, inner, spool = make_repo(active=True)
+
+    await repo.save(EVENT)
+    await repo.save_many([EVENT])
+
+    inner.save.assert_not_called()
+    inner.save_many.assert_not_called()
+    assert spool.append.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_write_errors_are_not_spooled() -> None:
+    """Errors about the write itself should reach the caller."""
+    repo, inner, spool = make_repo()
+    inner.save.side_effect = IntegrityError("INSERT", {}, Exception("duplicate"))
+
+    with pytest.raises(IntegrityError):
+        await repo.save(EVENT)
+    spool.append.assert_not_called()
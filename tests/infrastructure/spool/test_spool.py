@@ -0,0 +1,123 @@
+"""Tests for the event spool and its replayer."""
+
+import asyncio
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from src.application.ports.event_repository import EventRepository
+from src.core.event import DomainEvent
+from src.infrastructure.spool.log import SpoolLog
+from src.infrastructure.spool.spool import EventSpool
+
+AT = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+class KeyedRepo(EventRepository):
+    """Repository that skips events whose idempotency key it already holds."""
+
+    def __init__(self, failures: int = 0) -> None:
+        self.events: dict[str, DomainEvent] = {}
+        self.batches: list[int] = []
+        self.failures = failures
+
+    async def save(self, event: DomainEvent, *, returning: bool = True) -> object:
+        (inserted,) = await self.save_many([event])
+        return True if inserted else None
+
+    async def save_many(self, events: Sequence[DomainEvent]) -> list[bool]:
+        if self.failures:
+            self.failures -= 1
+            raise OSError("connection refused")
+        self.batches.append(len(events))
+        inserted = []
+        for event in events:
+            assert event.idempotency_key is not None
+            inserted.append(event.idempotency_key not in self.events)
+            self.events.setdefault(event.idempotency_key, event)
+        return inserted
+
+
+def make_spool(directory: Path, repo: KeyedRepo, batch_size: int = 100) -> EventSpool:
+    @asynccontextmanager
+    async def factory() -> AsyncIterator[EventRepository]:
+        yield repo
+
+    return EventSpool(
+        SpoolLog(directory, segment_bytes=4096, fsync_interval_seconds=0),
+        repository_factory=factory,
+        replay_batch_size=batch_size,
+        retry_interval_seconds=0.01,
+    )
+
+
+def event(i: int, key: str | None = None) -> DomainEvent:
+    return DomainEvent("msg", f"payload {i}", AT, key)
+
+
+async def wait_drained(spool: EventSpool) -> None:
+    async with asyncio.timeout(5):
+        while spool.active:
+            await asyncio.sleep(0.001)
+
+
+@pytest.mark.asyncio
+async def test_spooled_events_are_replayed_in_batches(tmp_path: Path) -> None:
+    """The replayer should drain the backlog in bulk, keeping fields and order."""
+    repo = KeyedRepo()
+    spool = make_spool(tmp_path, repo, batch_size=2)
+
+    # Open only the log so the test drives the replay itself
+    async with spool._log:
+        await spool.append([event(0, "client-key"), event(1), event(2)])
+        assert spool.active
+        assert await spool.replay_once() == 2
+        assert await spool.replay_once() == 1
+        assert not spool.active
+
+    assert repo.batches == [2, 1]
+    replayed = list(repo.events.values())
+    assert [e.event_payload for e in replayed] == ["payload 0", "payload 1", "payload 2"]
+    assert replayed[0].idempotency_key == "client-key"
+    assert replayed[1].idempotency_key.startswith("spool:")
+    assert replayed[2].created_at == AT
+    assert (spool.spooled, spool.replayed) == (3, 3)
+
+
+@pytest.mark.asyncio
+async def test_replayer_retries_until_the_database_recovers(tmp_path: Path) -> None:
+    """Failed replays should keep the checkpoint and be retried."""
+    repo = KeyedRepo(failures=3)
+
+    async with make_spool(tmp_path, repo) as spool:
+        await spool.append([event(i) for i in range(5)])
+        await wait_drained(spool)
+
+    assert repo.failures == 0
+    assert len(repo.events) == 5
+
+
+@pytest.mark.asyncio
+async def test_backlog_survives_restart_without_duplicates(tmp_path: Path) -> None:
+    """A batch committed but not checkpointed should be skipped on its second replay."""
+    repo = KeyedRepo(failures=1000)
+    async with make_spool(tmp_path, repo) as spool:
+        await spool.append([event(i) for i in range(3)])
+
+    # Commit the batch without recording the checkpoint, as if the process died
+    repo.failures = 0
+    log = SpoolLog(tmp_path, segment_bytes=4096, fsync_interval_seconds=0)
+    async with log:
+        records, _ = await log.read(log.checkpoint, 10)
+    spool = make_spool(tmp_path, repo)
+    spool._log._id = log.spool_id
+    await repo.save_many([spool._decode(position, payload) for position, payload in records])
+
+    async with make_spool(tmp_path, repo) as spool:
+        await wait_drained(spool)
+
+    assert repo.batches == [3, 3]
+    assert len(repo.events) == 3
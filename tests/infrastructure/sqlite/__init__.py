@@ -0,0 +1 @@
+"""Tests for SQLite persistence."""
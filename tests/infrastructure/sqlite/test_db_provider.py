@@ -0,0 +1,140 @@
+"""Tests for the SQLite database provider."""
+
+import asyncio
+import logging
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy import func, select, text
+
+from src.application.group_commit import GroupCommitEventRepository
+from src.application.ports.db_provider import PoolUsage
+from src.application.ports.rollup_repository import RollupBucket, RollupQuery
+from src.core.event import DomainEvent
+from src.infrastructure.config.settings import DatabaseSettings
+from src.infrastructure.postgres.models.event import events_table
+from src.infrastructure.sqlite.db_provider import SqliteDbProvider
+
+
+def make_provider(tmp_path: Path, **overrides: object) -> SqliteDbProvider:
+    options: dict[str, object] = {"pool_min_size": 1, "sqlite_writer_linger_ms": 20, **overrides}
+    settings = DatabaseSettings(**options)  # type: ignore[arg-type]
+    return SqliteDbProvider(f"sqlite+aiosqlite:///{tmp_path / 'events.db'}", settings)
+
+
+@pytest.mark.asyncio
+async def test_sqlite_provider_configures_pragmas(tmp_path: Path) -> None:
+    """Every pooled connection should run with WAL and the tuned pragmas."""
+    provider = make_provider(tmp_path, sqlite_cache_size=-2000)
+    async with provider, provider() as session:
+        assert await session.scalar(text("PRAGMA journal_mode")) == "wal"
+        assert await session.scalar(text("PRAGMA synchronous")) == 1  # NORMAL
+        assert await session.scalar(text("PRAGMA cache_size")) == -2000
+        assert await session.scalar(text("PRAGMA busy_timeout")) == 5000
+
+
+@pytest.mark.asyncio
+async def test_sqlite_provider_batches_concurrent_writes(tmp_path: Path) -> None:
+    """Concurrent writes should be committed by the single writer in batches."""
+    async with make_provider(tmp_path) as provider:
+
+        async def write(i: int) -> None:
+            async with provider.event_repository() as repo:
+                assert isinstance(repo, GroupCommitEventRepository)
+                await repo.save(DomainEvent.create(event_type="msg", event_payload=str(i)))
+
+        await asyncio.gather(*(write(i) for i in range(50)))
+
+        async with provider() as session:
+            count = await session.scalar(select(func.count()).select_from(events_table))
+    assert count == 50
+
+
+@pytest.mark.asyncio
+async def test_sqlite_provider_serializes_rollup_and_retention_writes(tmp_path: Path) -> None:
+    """Rollup upserts and retention deletes should share the writer with event writes."""
+    start = datetime(2025, 1, 1, tzinfo=UTC)
+    async with make_provider(tmp_path, sqlite_busy_timeout_ms=0, pool_size=8) as provider:
+        rollups, retention = provider.rollup_repository(), provider.retention_repository()
+
+        async def write_events(i: int) -> None:
+            async with provider.event_repository() as repo:
+                await repo.save_many(
+                    [DomainEvent.create(event_type="msg", event_payload=str(i))] * 20
+                )
+
+        async def add_rollup(i: int) -> None:
+            bucket_start = start + timedelta(minutes=i % 5)
+            await rollups.add([RollupBucket("minute", "msg", bucket_start, 1, 5)])
+
+        async def delete_expired() -> None:
+            await retention.delete_expired(datetime.now(UTC) - timedelta(days=1), 100)
+
+        await asyncio.gather(
+            *(write_events(i) for i in range(20)),
+            *(add_rollup(i) for i in range(40)),
+            *(delete_expired() for _ in range(20)),
+        )
+
+        buckets = await rollups.list_buckets(RollupQuery(resolution="minute", limit=100))
+        async with provider() as session:
+            count = await session.scalar(select(func.count()).select_from(events_table))
+    assert count == 400
+    assert sum(bucket.count for bucket in buckets) == 40
+
+
+def test_sqlite_provider_warns_about_unsupported_repository(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """EVENT_REPOSITORY=core should be reported as ignored, since the writer uses the ORM."""
+    with caplog.at_level(logging.WARNING):
+        make_provider(tmp_path, repository="core")
+
+    assert "EVENT_REPOSITORY=core is not supported on SQLite" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_sqlite_provider_drains_writer_on_exit(tmp_path: Path) -> None:
+    """Pending writes should be committed before the provider shuts down."""
+    provider = make_provider(tmp_path, sqlite_writer_linger_ms=10_000)
+    async with provider, provider.event_repository() as repo:
+        pending = asyncio.create_task(
+            repo.save_many(
+                [DomainEvent.create(event_type="msg", event_payload=str(i)) for i in range(3)]
+            )
+        )
+        await asyncio.sleep(0.01)
+    await pending
+
+    async with make_provider(tmp_path) as reopened, reopened() as session:
+        count = await session.scalar(select(func.count()).select_from(events_table))
+    assert count == 3
+
+
+@pytest.mark.asyncio
+async def test_sqlite_provider_writer_requires_running_provider(tmp_path: Path) -> None:
+    """The writer repository should refuse use before startup."""
+    provider = make_provider(tmp_path)
+    with pytest.raises(RuntimeError, match="not running"):
+        async with provider._writer_repository():
+            pass
+    with pytest.raises(RuntimeError, match="not running"):
+        async with provider._writer_transaction():
+            pass
+
+
+@pytest.mark.asyncio
+async def test_sqlite_provider_reports_pool_usage(tmp_path: Path) -> None:
+    """The writer holds one connection; a session taking the other saturates the pool."""
+    async with make_provider(tmp_path, pool_size=2, max_overflow=0) as provider:
+        await provider.ping()
+        idle = provider.pool_usage()
+        async with provider() as session:
+            await session.execute(text("SELECT 1"))
+            busy = provider.pool_usage()
+
+    assert idle == PoolUsage(checked_out=1, capacity=2, waiting=0)
+    assert busy == PoolUsage(checked_out=2, capacity=2, waiting=0)
+    assert busy.saturated and not idle.saturated
+    assert make_provider(tmp_path, max_overflow=-1).pool_usage() == PoolUsage(0, None)
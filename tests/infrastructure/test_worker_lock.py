@@ -0,0 +1,30 @@
+"""Tests for the worker lock."""
+
+from pathlib import Path
+
+from src.infrastructure.worker_lock import WorkerLock, maintenance_lock_path
+
+
+def test_worker_lock_is_held_by_one_holder(tmp_path: Path) -> None:
+    """A second holder should only get the lock once the first releases it."""
+    path = tmp_path / "maintenance.lock"
+    first, second = WorkerLock(path), WorkerLock(path)
+
+    assert first.acquire()
+    assert first.acquire()
+    assert not second.acquire()
+    assert not second.held
+
+    first.release()
+
+    assert not first.held
+    assert second.acquire()
+    second.release()
+
+
+def test_maintenance_lock_path_depends_on_the_database() -> None:
+    """Workers of different databases should not compete for the same lock."""
+    uri = "postgresql+asyncpg://user:pw@localhost/db"
+
+    assert maintenance_lock_path(uri) == maintenance_lock_path(uri)
+    assert maintenance_lock_path(uri) != maintenance_lock_path("sqlite+aiosqlite:///events.db")
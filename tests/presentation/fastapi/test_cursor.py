@@ -0,0 +1,38 @@
+"""Tests for opaque pagination cursors."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from src.application.ports.event_query_repository import EventKey
+from src.presentation.fastapi.cursor import InvalidCursorError, decode_cursor, encode_cursor
+
+KEY = EventKey(created_at=datetime(2025, 1, 1, 12, 30, 0, 123456, tzinfo=UTC), id=42)
+
+
+def test_cursor_round_trip() -> None:
+    """A cursor should decode back to its key for the same query."""
+    cursor = encode_cursor(KEY, "user_joined", "desc")
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor, "user_joined", "desc") == KEY
+    assert decode_cursor(encode_cursor(KEY, None, "asc"), None, "asc") == KEY
+
+
+@pytest.mark.parametrize(
+    ("event_type", "order"),
+    [("other", "desc"), (None, "desc"), ("user_joined", "asc")],
+)
+def test_cursor_rejects_different_query(event_type: str | None, order: str) -> None:
+    """A cursor should not be accepted for another type filter or order."""
+    cursor = encode_cursor(KEY, "user_joined", "desc")
+
+    with pytest.raises(InvalidCursorError, match="does not match"):
+        decode_cursor(cursor, event_type, order)  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("cursor", ["not base64!", "bm90IGpzb24", "W10", "eyJjIjoieCIsImkiOjF9"])
+def test_cursor_rejects_malformed(cursor: str) -> None:
+    """Garbage, non-JSON, non-object and incomplete cursors should be rejected."""
+    with pytest.raises(InvalidCursorError, match="Malformed"):
+        decode_cursor(cursor, None, "desc")
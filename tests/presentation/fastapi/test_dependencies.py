@@ -1,13 +1,29 @@
 """Fixed dependency tests - aligned with actual implementation."""
 
-from contextlib import suppress
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.application.admission import AdmissionController, AdmittedEventRepository
+from src.application.event_listeners import ListeningEventRepository
+from src.application.group_commit import GroupCommitEventRepository
+from src.application.metrics import MeasuredEventRepository
 from src.infrastructure.postgres.event_repository import PostgresEventRepository
-from src.presentation.fastapi.dependencies import get_db_session, get_event_repository
+from src.infrastructure.spool.repository import SpoolingEventRepository
+from src.presentation.fastapi.dependencies import (
+    admission_guard,
+    get_db_session,
+    get_event_query_repository,
+    get_event_repository,
+    get_metrics_files,
+    get_recent_events_buffer,
+    get_retention_job,
+    get_rollup_repository,
+)
 
 
 @pytest.mark.asyncio
@@ -32,11 +48,191 @@ async def test_get_db_session_dependency() -> None:
     mock_session.close.assert_called_once()
 
 
-def test_get_event_repository_dependency() -> None:
-    """Test get_event_repository returns PostgresEventRepository instance."""
-    mock_session = MagicMock(spec=AsyncSession)
+@pytest.mark.asyncio
+async def test_get_event_repository_dependency() -> None:
+    """Test get_event_repository yields the provider's repository."""
+    repo = PostgresEventRepository(MagicMock(spec=AsyncSession))
+    exited = []
+
+    @asynccontextmanager
+    async def event_repository() -> AsyncIterator[PostgresEventRepository]:
+        yield repo
+        exited.append(True)
+
+    mock_request = MagicMock()
+    mock_request.app.state.group_commit = None
+    mock_request.app.state.rollups = None
+    mock_request.app.state.recent_events = None
+    mock_request.app.state.idempotency = None
+    mock_request.app.state.spool = None
+    mock_request.app.state.metrics_enabled = False
+    mock_request.app.state.db_provider.event_repository = event_repository
+
+    gen = get_event_repository(mock_request, None)
+    assert await anext(gen) is repo
+
+    with suppress(StopAsyncIteration):
+        await gen.__anext__()
+
+    assert exited == [True]
+
+
+@pytest.mark.asyncio
+async def test_get_event_repository_uses_group_commit() -> None:
+    """Test get_event_repository routes writes through the group-commit stage."""
+    mock_request = MagicMock()
+    mock_request.app.state.rollups = None
+    mock_request.app.state.recent_events = None
+    mock_request.app.state.idempotency = None
+    mock_request.app.state.spool = None
+    mock_request.app.state.metrics_enabled = False
+
+    gen = get_event_repository(mock_request, None)
+    repo = await anext(gen)
+
+    assert isinstance(repo, GroupCommitEventRepository)
+    assert repo._committer is mock_request.app.state.group_commit
+    mock_request.app.state.db_provider.event_repository.assert_not_called()
+
+
+def test_get_event_query_repository_dependency() -> None:
+    """Test get_event_query_repository returns the provider's query repository."""
+    mock_request = MagicMock()
+    provider = mock_request.app.state.db_provider
+
+    assert get_event_query_repository(mock_request) is provider.event_query_repository.return_value
+
+
+@pytest.mark.asyncio
+async def test_get_event_repository_notifies_listeners() -> None:
+    """Test get_event_repository passes commits to the enabled listeners."""
+    mock_request = MagicMock()
+    state = mock_request.app.state
+    state.spool = None
+    state.metrics_enabled = False
+
+    gen = get_event_repository(mock_request, None)
+    repo = await anext(gen)
+
+    assert isinstance(repo, ListeningEventRepository)
+    assert repo._listeners == (state.rollups, state.recent_events, state.idempotency)
+    assert isinstance(repo._inner, GroupCommitEventRepository)
+
+
+@pytest.mark.asyncio
+async def test_get_event_repository_falls_back_to_spool() -> None:
+    """Test get_event_repository wraps writes in the spool when it is enabled."""
+    mock_request = MagicMock()
+    state = mock_request.app.state
+    state.rollups = state.recent_events = state.idempotency = None
+    state.metrics_enabled = False
+
+    gen = get_event_repository(mock_request, None)
+    repo = await anext(gen)
+
+    assert isinstance(repo, SpoolingEventRepository)
+    assert repo._spool is state.spool
+    assert isinstance(repo._inner, GroupCommitEventRepository)
+    with suppress(StopAsyncIteration):
+        await anext(gen)
+
+
+@pytest.mark.asyncio
+async def test_get_event_repository_measures_writes() -> None:
+    """Test get_event_repository times writes when metrics are enabled."""
+    mock_request = MagicMock()
+    state = mock_request.app.state
+    state.rollups = state.recent_events = state.idempotency = state.spool = None
+    state.metrics_enabled = True
+
+    gen = get_event_repository(mock_request, None)
+    repo = await anext(gen)
+
+    assert isinstance(repo, MeasuredEventRepository)
+    assert isinstance(repo._inner, GroupCommitEventRepository)
+
+
+@pytest.mark.asyncio
+async def test_get_event_repository_feeds_admission_control() -> None:
+    """Test get_event_repository reports write latencies to the admitting controller."""
+    mock_request = MagicMock()
+    state = mock_request.app.state
+    state.rollups = state.recent_events = state.idempotency = state.spool = None
+    state.metrics_enabled = False
+    controller = AdmissionController(
+        initial_limit=1, min_limit=1, max_limit=1, target_latency_seconds=1
+    )
+
+    gen = get_event_repository(mock_request, controller)
+    repo = await anext(gen)
+
+    assert isinstance(repo, AdmittedEventRepository)
+    assert isinstance(repo._inner, GroupCommitEventRepository)
+
+
+def test_get_rollup_repository_dependency() -> None:
+    """Test get_rollup_repository returns the provider's rollup repository."""
+    mock_request = MagicMock()
+    provider = mock_request.app.state.db_provider
+
+    assert get_rollup_repository(mock_request) is provider.rollup_repository.return_value
+
+
+def test_get_recent_events_buffer_dependency() -> None:
+    """Test get_recent_events_buffer returns the buffer from app state."""
+    mock_request = MagicMock()
+    mock_request.app.state.recent_events = None
+    mock_request.app.state.idempotency = None
+
+    assert get_recent_events_buffer(mock_request) is None
+
 
-    repo = get_event_repository(session=mock_session)
+def test_get_retention_job_dependency() -> None:
+    """Test get_retention_job returns the job from app state."""
+    mock_request = MagicMock()
+    mock_request.app.state.retention = None
+
+    assert get_retention_job(mock_request) is None
+
+
+def test_get_metrics_files_dependency() -> None:
+    """Test get_metrics_files returns the per-worker files from app state."""
+    mock_request = MagicMock()
+    mock_request.app.state.metrics_files = None
+
+    assert get_metrics_files(mock_request) is None
+
+
+@pytest.mark.asyncio
+async def test_admission_guard_admits_and_releases() -> None:
+    """Test admission_guard holds a slot for the request's duration and yields the controller."""
+    controller = AdmissionController(
+        initial_limit=1, min_limit=1, max_limit=1, target_latency_seconds=1
+    )
+    mock_request = MagicMock()
+    mock_request.app.state.admission = controller
+
+    gen = admission_guard(mock_request)
+    assert await anext(gen) is controller
+    assert controller.in_flight == 1
+
+    with pytest.raises(HTTPException) as exc:
+        await anext(admission_guard(mock_request))
+    assert exc.value.status_code == 503
+    assert exc.value.headers == {"Retry-After": "1"}
+
+    with pytest.raises(StopAsyncIteration):
+        await anext(gen)
+    assert controller.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_admission_guard_disabled() -> None:
+    """Test admission_guard does nothing when admission control is disabled."""
+    mock_request = MagicMock()
+    mock_request.app.state.admission = None
 
-    assert isinstance(repo, PostgresEventRepository)
-    assert repo._session is mock_session
+    gen = admission_guard(mock_request)
+    assert await anext(gen) is None
+    with pytest.raises(StopAsyncIteration):
+        await anext(gen)
@@ -1,37 +1,59 @@
 """Tests for event creation HTTP endpoints."""
 
+import json
+from collections.abc import Sequence
+
 import httpx
 import pytest
 from fastapi import FastAPI
 from sqlalchemy.exc import IntegrityError
 
+from src.application.idempotency import IdempotencyCache
 from src.application.ports.event_repository import EventRepository
 from src.core.event import DomainEvent
-from src.presentation.fastapi.dependencies import get_event_repository
+from src.presentation.fastapi.dependencies import (
+    get_event_repository,
+    get_idempotency_cache,
+)
 from src.presentation.fastapi.models.event import (
+    MAX_EVENT_BATCH_SIZE,
     MAX_EVENT_PAYLOAD_LENGTH,
     MAX_EVENT_TYPE_LENGTH,
 )
-from src.presentation.fastapi.routes.event_routes import event_router
+from src.presentation.fastapi.routes.event_routes import event_router, fast_event_router
 from src.presentation.fastapi.routes.health_routes import health_router
 
 
 class DummyRepo(EventRepository):
-    """Repository that stores events in memory."""
+    """Repository that stores events in memory, skipping stored idempotency keys."""
 
     def __init__(self) -> None:
         self.saved: list[DomainEvent] = []
 
-    async def save(self, event: DomainEvent) -> DomainEvent:
+    async def save(self, event: DomainEvent, *, returning: bool = True) -> DomainEvent | None:
         """Save event to memory."""
-        self.saved.append(event)
-        return event
+        (inserted,) = await self.save_many([event])
+        return event if inserted else None
+
+    async def save_many(self, events: Sequence[DomainEvent]) -> list[bool]:
+        """Save events to memory."""
+        inserted = []
+        for event in events:
+            keys = {saved.idempotency_key for saved in self.saved}
+            inserted.append(event.idempotency_key is None or event.idempotency_key not in keys)
+            if inserted[-1]:
+                self.saved.append(event)
+        return inserted
 
 
 class FailingRepo(EventRepository):
     """Repository that always raises RuntimeError."""
 
-    async def save(self, event: DomainEvent) -> None:
+    async def save(self, event: DomainEvent, *, returning: bool = True) -> None:
+        """Raise error on save attempt."""
+        raise RuntimeError("DB down")
+
+    async def save_many(self, events: Sequence[DomainEvent]) -> list[bool]:
         """Raise error on save attempt."""
         raise RuntimeError("DB down")
 
@@ -39,7 +61,7 @@ class FailingRepo(EventRepository):
 class IntegrityConstraintRepo(EventRepository):
     """Repository that simulates database constraint violation."""
 
-    async def save(self, event: DomainEvent) -> None:
+    async def save(self, event: DomainEvent, *, returning: bool = True) -> None:
         """Raise IntegrityError to simulate constraint violation."""
         raise IntegrityError(
             statement="INSERT INTO events...",
@@ -48,20 +70,27 @@ class IntegrityConstraintRepo(EventRepository):
         )
 
 
-def create_test_app(repo: EventRepository) -> httpx.AsyncClient:
+def create_test_app(
+    repo: EventRepository, cache: IdempotencyCache | None = None, *, fast: bool = False
+) -> httpx.AsyncClient:
     """Create FastAPI test app with injected repository.
 
     Args:
         repo: Repository implementation to inject.
+        cache: Idempotency cache to inject (disabled when None).
+        fast: Serve POST /event with the fast ingest route.
 
     Returns:
         AsyncClient configured for testing.
     """
     app = FastAPI()
+    if fast:
+        app.include_router(fast_event_router)
     app.include_router(event_router)
 
     # Override dependency injection
     app.dependency_overrides[get_event_repository] = lambda: repo
+    app.dependency_overrides[get_idempotency_cache] = lambda: cache
 
     transport = httpx.ASGITransport(app=app)
     return httpx.AsyncClient(transport=transport, base_url="http://test")
@@ -87,6 +116,70 @@ async def test_create_event_route_success() -> None:
     assert saved.event_payload == "hello"
 
 
+@pytest.mark.anyio
+async def test_create_event_route_replays_cached_duplicates() -> None:
+    """POST /event should answer a retry with a cached key without saving."""
+    repo = DummyRepo()
+    cache = IdempotencyCache(max_keys=10, ttl_seconds=60)
+    payload = {"event_type": "message", "event_payload": "hello"}
+
+    async with create_test_app(repo, cache) as client:
+        first = await client.post("/event", json=payload, headers={"Idempotency-Key": "k1"})
+        cache.record(repo.saved)
+        retry = await client.post("/event", json=payload, headers={"Idempotency-Key": "k1"})
+        by_field = await client.post("/event", json={**payload, "idempotency_key": "k1"})
+        other = await client.post("/event", json={**payload, "idempotency_key": "k2"})
+
+    assert [r.status_code for r in (first, retry, by_field, other)] == [201] * 4
+    assert retry.json() == {"status": "created"}
+    assert "Idempotent-Replayed" not in first.headers
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert by_field.headers["Idempotent-Replayed"] == "true"
+    assert [e.idempotency_key for e in repo.saved] == ["k1", "k2"]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("fast", [False, True])
+async def test_create_event_route_replays_stored_duplicates(fast: bool) -> None:
+    """POST /event should flag a retry the database skipped as a replay."""
+    repo = DummyRepo()
+    payload = {"event_type": "message", "event_payload": "hello"}
+
+    async with create_test_app(repo, fast=fast) as client:
+        first = await client.post("/event", json=payload, headers={"Idempotency-Key": "k1"})
+        retry = await client.post("/event", json=payload, headers={"Idempotency-Key": "k1"})
+
+    assert [r.status_code for r in (first, retry)] == [201, 201]
+    assert "Idempotent-Replayed" not in first.headers
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert len(repo.saved) == 1
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("headers", "extra"),
+    [
+        ({"Idempotency-Key": "k1"}, {"idempotency_key": "k2"}),
+        ({"Idempotency-Key": "k" * 256}, {}),
+        ({}, {"idempotency_key": ""}),
+    ],
+)
+async def test_create_event_route_rejects_invalid_idempotency_keys(
+    headers: dict[str, str], extra: dict[str, str]
+) -> None:
+    """POST /event should reject conflicting, oversized or empty keys."""
+    repo = DummyRepo()
+    async with create_test_app(repo) as client:
+        resp = await client.post(
+            "/event",
+            json={"event_type": "message", "event_payload": "hello", **extra},
+            headers=headers,
+        )
+
+    assert resp.status_code == 422
+    assert repo.saved == []
+
+
 @pytest.mark.anyio
 async def test_create_event_route_validation_error_empty_type() -> None:
     """POST /event should reject empty event_type with 422."""
@@ -154,7 +247,11 @@ async def test_create_event_route_extra_fields_rejected() -> None:
 
 @pytest.mark.anyio
 async def test_create_event_route_integrity_error() -> None:
-    """POST /event should return 409 on constraint violation."""
+    """POST /event should treat a constraint violation as an unexpected error.
+
+    Duplicate idempotency keys are skipped, not raised, so any IntegrityError
+    that still reaches the route is a server-side problem.
+    """
     repo = IntegrityConstraintRepo()
     async with create_test_app(repo) as client:
         payload = {
@@ -164,9 +261,8 @@ async def test_create_event_route_integrity_error() -> None:
 
         resp = await client.post("/event", json=payload)
 
-    assert resp.status_code == 409
-    body = resp.json()
-    assert "constraint" in body["detail"].lower()
+    assert resp.status_code == 500
+    assert resp.json() == {"detail": "Internal server error"}
 
 
 @pytest.mark.anyio
@@ -215,6 +311,201 @@ async def test_create_event_route_oversized_payload() -> None:
     assert resp.status_code == 422
 
 
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "body",
+    [
+        b'{"event_type": "message", "event_payload": "hello"}',
+        b'{"event_type": "message", "event_payload": "hello", "idempotency_key": "k1"}',
+        b'{"event_type": "message"}',
+        b'{"event_type": "message", "event_payload": "hello", "extra_field": 1}',
+        b'{"event_type": 1, "event_payload": "hello"}',
+        b'{"event_type": "   ", "event_payload": "hello"}',
+        json.dumps(
+            {"event_type": "x" * (MAX_EVENT_TYPE_LENGTH + 1), "event_payload": "a"}
+        ).encode(),
+        json.dumps(
+            {"event_type": "a", "event_payload": "x" * (MAX_EVENT_PAYLOAD_LENGTH + 1)}
+        ).encode(),
+        b'["message", "hello"]',
+        b'{"event_type": "message",',
+    ],
+)
+async def test_create_event_fast_route_matches_regular_route(body: bytes) -> None:
+    """The fast POST /event should answer as the regular route does."""
+    responses = []
+    for fast in (False, True):
+        repo = DummyRepo()
+        async with create_test_app(repo, fast=fast) as client:
+            resp = await client.post(
+                "/event", content=body, headers={"Content-Type": "application/json"}
+            )
+        responses.append((resp, repo.saved))
+
+    (regular, regular_saved), (fast_resp, fast_saved) = responses
+    assert fast_resp.status_code == regular.status_code
+    assert fast_resp.headers["content-type"] == regular.headers["content-type"]
+    assert [(e.event_type, e.event_payload, e.idempotency_key) for e in fast_saved] == [
+        (e.event_type, e.event_payload, e.idempotency_key) for e in regular_saved
+    ]
+    detail = regular.json().get("detail")
+    if isinstance(detail, list):
+        # Validation errors at the same locations (JSON errors are reported at
+        # the body, not at a character offset; types and messages may differ)
+        assert [e["loc"] for e in fast_resp.json()["detail"]] == [
+            e["loc"][:1] if e["type"] == "json_invalid" else e["loc"] for e in detail
+        ]
+    else:
+        assert fast_resp.content == regular.content
+
+
+@pytest.mark.anyio
+async def test_create_event_fast_route_replays_and_maps_errors() -> None:
+    """The fast POST /event should replay cached keys and map repository errors."""
+    cache = IdempotencyCache(max_keys=10, ttl_seconds=60)
+    repo = DummyRepo()
+    payload = {"event_type": "message", "event_payload": "hello"}
+
+    async with create_test_app(repo, cache, fast=True) as client:
+        first = await client.post("/event", json=payload, headers={"Idempotency-Key": "k1"})
+        cache.record(repo.saved)
+        retry = await client.post("/event", json=payload, headers={"Idempotency-Key": "k1"})
+        conflict = await client.post(
+            "/event", json={**payload, "idempotency_key": "k2"}, headers={"Idempotency-Key": "k1"}
+        )
+    async with create_test_app(IntegrityConstraintRepo(), fast=True) as client:
+        integrity = await client.post("/event", json=payload)
+    async with create_test_app(FailingRepo(), fast=True) as client:
+        failing = await client.post("/event", json=payload)
+
+    assert (first.status_code, retry.status_code) == (201, 201)
+    assert "Idempotent-Replayed" not in first.headers
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert retry.json() == {"status": "created"}
+    assert conflict.status_code == 422
+    assert [e.idempotency_key for e in repo.saved] == ["k1"]
+    assert integrity.status_code == 500
+    assert failing.json() == {"detail": "Internal server error"}
+
+
+@pytest.mark.anyio
+async def test_create_events_batch_route_success() -> None:
+    """POST /event/batch should persist every valid event."""
+    repo = DummyRepo()
+    async with create_test_app(repo) as client:
+        payload = [
+            {"event_type": "message", "event_payload": "hello"},
+            {"event_type": "message", "event_payload": "world", "idempotency_key": "k1"},
+        ]
+
+        resp = await client.post("/event/batch", json=payload)
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["accepted"] == 2
+    assert body["rejected"] == 0
+    assert [r["status"] for r in body["results"]] == ["created", "created"]
+    assert [e.event_payload for e in repo.saved] == ["hello", "world"]
+    assert [e.idempotency_key for e in repo.saved] == [None, "k1"]
+
+
+@pytest.mark.anyio
+async def test_create_events_batch_route_reports_duplicates() -> None:
+    """Items the database skipped should be reported as duplicates, not created."""
+    repo = DummyRepo()
+    item = {"event_type": "message", "event_payload": "hello", "idempotency_key": "k1"}
+    async with create_test_app(repo) as client:
+        resp = await client.post(
+            "/event/batch", json=[item, item, {**item, "idempotency_key": "k2"}]
+        )
+
+    body = resp.json()
+    assert (body["accepted"], body["duplicates"], body["rejected"]) == (2, 1, 0)
+    assert [r["status"] for r in body["results"]] == ["created", "duplicate", "created"]
+
+
+@pytest.mark.anyio
+async def test_create_events_batch_route_partial_rejection() -> None:
+    """POST /event/batch should report invalid items and persist the rest."""
+    repo = DummyRepo()
+    async with create_test_app(repo) as client:
+        payload = [
+            {"event_type": "   ", "event_payload": "hello"},
+            {"event_type": "message", "event_payload": "world"},
+        ]
+
+        resp = await client.post("/event/batch", json=payload)
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["accepted"] == 1
+    assert body["rejected"] == 1
+    assert body["results"][0] == {
+        "index": 0,
+        "status": "rejected",
+        "detail": "Event type cannot be empty",
+    }
+    assert [e.event_payload for e in repo.saved] == ["world"]
+
+
+@pytest.mark.anyio
+async def test_create_events_batch_route_rejects_invalid_items_individually() -> None:
+    """POST /event/batch should reject items failing field validation, not the batch."""
+    repo = DummyRepo()
+    async with create_test_app(repo) as client:
+        payload = [
+            {"event_type": "message", "event_payload": "hello"},
+            {"event_type": "message"},
+            {"event_type": "message", "event_payload": "x" * 1001},
+            {"event_type": "message", "event_payload": "world", "extra": 1},
+            {"event_type": "message", "event_payload": "again"},
+        ]
+
+        resp = await client.post("/event/batch", json=payload)
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert (body["accepted"], body["rejected"]) == (2, 3)
+    assert [r["status"] for r in body["results"]] == [
+        "created",
+        "rejected",
+        "rejected",
+        "rejected",
+        "created",
+    ]
+    assert body["results"][1]["detail"] == "event_payload: Field required"
+    assert body["results"][2]["detail"].startswith("event_payload: String should have at most")
+    assert body["results"][3]["detail"] == "extra: Extra inputs are not permitted"
+    assert [e.event_payload for e in repo.saved] == ["hello", "again"]
+
+
+@pytest.mark.anyio
+async def test_create_events_batch_route_rejects_empty_and_oversized() -> None:
+    """POST /event/batch should reject empty and oversized batches with 422."""
+    repo = DummyRepo()
+    item = {"event_type": "message", "event_payload": "hello"}
+    async with create_test_app(repo) as client:
+        empty = await client.post("/event/batch", json=[])
+        oversized = await client.post("/event/batch", json=[item] * (MAX_EVENT_BATCH_SIZE + 1))
+
+    assert empty.status_code == 422
+    assert oversized.status_code == 422
+    assert repo.saved == []
+
+
+@pytest.mark.anyio
+async def test_create_events_batch_route_internal_error() -> None:
+    """POST /event/batch should return 500 on unexpected errors."""
+    repo = FailingRepo()
+    async with create_test_app(repo) as client:
+        resp = await client.post(
+            "/event/batch", json=[{"event_type": "message", "event_payload": "hello"}]
+        )
+
+    assert resp.status_code == 500
+    assert resp.json() == {"detail": "Internal server error"}
+
+
 @pytest.mark.anyio
 async def test_health_check_endpoint() -> None:
     """GET /health should return 200 with healthy status."""
@@ -0,0 +1,510 @@
+"""Tests for event collection HTTP endpoints."""
+
+import json
+from collections.abc import AsyncIterator, Sequence
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from src.application.ports.event_query_repository import (
+    EventQuery,
+    EventQueryRepository,
+    EventRecord,
+)
+from src.application.ports.event_repository import EventRepository
+from src.application.ports.retention_repository import ExpiredBatch
+from src.application.ports.rollup_repository import RollupBucket, RollupQuery, RollupRepository
+from src.application.recent_events import RecentEventsBuffer
+from src.application.retention import RetentionJob
+from src.core.event import DomainEvent
+from src.presentation.fastapi.dependencies import (
+    get_event_query_repository,
+    get_event_repository,
+    get_recent_events_buffer,
+    get_retention_job,
+    get_rollup_repository,
+)
+from src.presentation.fastapi.models.event import MAX_NDJSON_LINE_BYTES
+from src.presentation.fastapi.routes.events_routes import events_router
+
+
+class BatchRecordingRepo(EventRepository):
+    """Repository recording every save_many batch."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.batches: list[list[DomainEvent]] = []
+        self._fail = fail
+
+    async def save(self, event: DomainEvent, *, returning: bool = True) -> bool | None:
+        """Save a single event."""
+        (inserted,) = await self.save_many([event])
+        return True if inserted else None
+
+    async def save_many(self, events: Sequence[DomainEvent]) -> list[bool]:
+        """Record the batch (or fail); events with an already seen key are skipped."""
+        if self._fail:
+            raise TimeoutError("pool timeout")
+        self.batches.append(list(events))
+        keys = [e.idempotency_key for batch in self.batches[:-1] for e in batch]
+        inserted = []
+        for event in events:
+            inserted.append(event.idempotency_key is None or event.idempotency_key not in keys)
+            keys.append(event.idempotency_key)
+        return inserted
+
+
+class StaticQueryRepo(EventQueryRepository):
+    """Query repository serving a fixed, pre-sorted list of records."""
+
+    def __init__(self, count: int = 0, fail: bool = False) -> None:
+        base = datetime(2025, 1, 1, tzinfo=UTC)
+        self.records = [
+            EventRecord(
+                id=i + 1,
+                event_type="msg",
+                event_payload=str(i),
+                created_at=base + timedelta(seconds=i),
+            )
+            for i in range(count)
+        ]
+        self.queries: list[EventQuery] = []
+        self._fail = fail
+
+    async def list_events(self, query: EventQuery) -> list[EventRecord]:
+        """Return records after query.after (or fail)."""
+        if self._fail:
+            raise TimeoutError("pool timeout")
+        self.queries.append(query)
+        start = query.after.id if query.after is not None else 0
+        return self.records[start : start + query.limit]
+
+
+class StaticRollupRepo(RollupRepository):
+    """Rollup repository serving a fixed list of minute buckets."""
+
+    def __init__(self, count: int = 0, fail: bool = False) -> None:
+        base = datetime(2025, 1, 1, tzinfo=UTC)
+        self.buckets = [
+            RollupBucket("minute", "msg", base + timedelta(minutes=i), 10, 100)
+            for i in range(count)
+        ]
+        self.queries: list[RollupQuery] = []
+        self._fail = fail
+
+    async def add(self, buckets: Sequence[RollupBucket]) -> None:
+        """Not used by the routes."""
+
+    async def list_buckets(self, query: RollupQuery) -> list[RollupBucket]:
+        """Return up to query.limit buckets (or fail)."""
+        if self._fail:
+            raise TimeoutError("pool timeout")
+        self.queries.append(query)
+        return self.buckets[: query.limit]
+
+
+def create_test_client(
+    repo: EventRepository,
+    query_repo: EventQueryRepository | None = None,
+    rollup_repo: RollupRepository | None = None,
+    buffer: RecentEventsBuffer | None = None,
+    retention: RetentionJob | None = None,
+) -> httpx.AsyncClient:
+    app = FastAPI()
+    app.include_router(events_router)
+    app.dependency_overrides[get_event_repository] = lambda: repo
+    app.dependency_overrides[get_event_query_repository] = lambda: query_repo or StaticQueryRepo()
+    app.dependency_overrides[get_rollup_repository] = lambda: rollup_repo or StaticRollupRepo()
+    app.dependency_overrides[get_recent_events_buffer] = lambda: buffer
+    app.dependency_overrides[get_retention_job] = lambda: retention
+    transport = httpx.ASGITransport(app=app)
+    return httpx.AsyncClient(transport=transport, base_url="http://test")
+
+
+def ndjson(*items: object) -> bytes:
+    return b"".join(json.dumps(item).encode() + b"\n" for item in items)
+
+
+@pytest.mark.anyio
+async def test_stream_events_accepts_valid_lines() -> None:
+    """POST /events/stream should persist every valid line."""
+    repo = BatchRecordingRepo()
+    body = ndjson(
+        {"event_type": "message", "event_payload": "one"},
+        {"event_type": "message", "event_payload": "two", "idempotency_key": "k2"},
+    )
+
+    async with create_test_client(repo) as client:
+        resp = await client.post("/events/stream", content=body)
+
+    assert resp.status_code == 200
+    assert resp.json() == {
+        "accepted": 2,
+        "duplicates": 0,
+        "rejected": 0,
+        "rejects": [],
+        "rejects_truncated": False,
+    }
+    assert [e.event_payload for batch in repo.batches for e in batch] == ["one", "two"]
+    assert [e.idempotency_key for batch in repo.batches for e in batch] == [None, "k2"]
+
+
+@pytest.mark.anyio
+async def test_stream_events_counts_duplicates_apart() -> None:
+    """Lines skipped as already stored should not count as accepted."""
+    repo = BatchRecordingRepo()
+    line = {"event_type": "message", "event_payload": "one", "idempotency_key": "k1"}
+
+    with patch("src.presentation.fastapi.routes.events_routes.STREAM_CHUNK_SIZE", 1):
+        async with create_test_client(repo) as client:
+            resp = await client.post("/events/stream", content=ndjson(line, line, line))
+
+    assert resp.json()["accepted"] == 1
+    assert resp.json()["duplicates"] == 2
+
+
+@pytest.mark.anyio
+async def test_stream_events_reports_rejected_line_numbers() -> None:
+    """Invalid lines should be rejected with their line numbers."""
+    repo = BatchRecordingRepo()
+    body = (
+        ndjson({"event_type": "message", "event_payload": "ok"})
+        + b"not json\n"
+        + b"\n"
+        + ndjson(
+            {"event_type": "   ", "event_payload": "x"},
+            {"event_type": "message", "event_payload": "x", "extra": 1},
+        )
+        + b"x" * (MAX_NDJSON_LINE_BYTES + 1)
+    )
+
+    async with create_test_client(repo) as client:
+        resp = await client.post("/events/stream", content=body)
+
+    assert resp.status_code == 200
+    result = resp.json()
+    assert result["accepted"] == 1
+    assert result["rejected"] == 4
+    # Parse errors are reported immediately, domain errors when the chunk is flushed
+    assert [r["line"] for r in result["rejects"]] == [2, 5, 6, 4]
+    details = {r["line"]: r["detail"] for r in result["rejects"]}
+    assert details[4] == "Event type cannot be empty"
+    assert details[5].startswith("extra")
+    assert "exceeds" in details[6]
+
+
+@pytest.mark.anyio
+async def test_stream_events_flushes_in_bounded_chunks() -> None:
+    """Events should be persisted in chunks of STREAM_CHUNK_SIZE."""
+    repo = BatchRecordingRepo()
+
+    async def body() -> AsyncIterator[bytes]:
+        for i in range(5):
+            yield ndjson({"event_type": "message", "event_payload": str(i)})
+
+    with patch("src.presentation.fastapi.routes.events_routes.STREAM_CHUNK_SIZE", 2):
+        async with create_test_client(repo) as client:
+            resp = await client.post("/events/stream", content=body())
+
+    assert resp.json()["accepted"] == 5
+    assert [len(batch) for batch in repo.batches] == [2, 2, 1]
+
+
+@pytest.mark.anyio
+async def test_stream_events_truncates_reject_list() -> None:
+    """Only the first MAX_REPORTED_REJECTS rejects should be listed."""
+    repo = BatchRecordingRepo()
+
+    with patch("src.presentation.fastapi.routes.events_routes.MAX_REPORTED_REJECTS", 2):
+        async with create_test_client(repo) as client:
+            resp = await client.post("/events/stream", content=b"bad\n" * 5)
+
+    result = resp.json()
+    assert result["rejected"] == 5
+    assert [r["line"] for r in result["rejects"]] == [1, 2]
+    assert result["rejects_truncated"] is True
+
+
+@pytest.mark.anyio
+async def test_stream_events_database_timeout() -> None:
+    """POST /events/stream should return 503 on database timeouts."""
+    repo = BatchRecordingRepo(fail=True)
+
+    async with create_test_client(repo) as client:
+        resp = await client.post(
+            "/events/stream", content=ndjson({"event_type": "message", "event_payload": "x"})
+        )
+
+    assert resp.status_code == 503
+
+
+@pytest.mark.anyio
+async def test_list_events_follows_cursor() -> None:
+    """GET /events should page through results with next_cursor."""
+    query_repo = StaticQueryRepo(count=3)
+
+    async with create_test_client(BatchRecordingRepo(), query_repo) as client:
+        first = await client.get("/events", params={"type": "msg", "limit": 2, "order": "asc"})
+        cursor = first.json()["next_cursor"]
+        second = await client.get(
+            "/events", params={"type": "msg", "limit": 2, "order": "asc", "cursor": cursor}
+        )
+
+    assert first.status_code == 200
+    assert [item["id"] for item in first.json()["items"]] == [1, 2]
+    assert first.json()["items"][0] == {
+        "id": 1,
+        "event_type": "msg",
+        "event_payload": "0",
+        "created_at": "2025-01-01T00:00:00Z",
+    }
+    assert second.status_code == 200
+    assert [item["id"] for item in second.json()["items"]] == [3]
+    assert second.json()["next_cursor"] is None
+    assert query_repo.queries[1].after is not None
+    assert query_repo.queries[1].after.id == 2
+
+
+@pytest.mark.anyio
+async def test_list_events_passes_filters() -> None:
+    """GET /events should forward type, time range, order and limit."""
+    query_repo = StaticQueryRepo()
+
+    async with create_test_client(BatchRecordingRepo(), query_repo) as client:
+        resp = await client.get(
+            "/events",
+            params={"since": "2025-01-01T00:00:00Z", "until": "2025-01-02T00:00:00"},
+        )
+
+    assert resp.status_code == 200
+    assert resp.json() == {"items": [], "next_cursor": None}
+    query = query_repo.queries[0]
+    assert query.event_type is None
+    assert query.since == datetime(2025, 1, 1, tzinfo=UTC)
+    assert query.until == datetime(2025, 1, 2)
+    assert query.order == "desc"
+    assert query.limit == 101  # default page size plus the look-ahead row
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "params",
+    [{"limit": 0}, {"limit": 1001}, {"order": "sideways"}, {"type": ""}, {"since": "yesterday"}],
+)
+async def test_list_events_rejects_invalid_parameters(params: dict[str, object]) -> None:
+    """GET /events should validate query parameters."""
+    async with create_test_client(BatchRecordingRepo()) as client:
+        resp = await client.get("/events", params=params)
+
+    assert resp.status_code == 422
+
+
+@pytest.mark.anyio
+async def test_list_events_rejects_foreign_cursor() -> None:
+    """A cursor issued for another type filter should be refused with 400."""
+    async with create_test_client(BatchRecordingRepo(), StaticQueryRepo(count=3)) as client:
+        first = await client.get("/events", params={"type": "msg", "limit": 1})
+        resp = await client.get(
+            "/events", params={"type": "other", "cursor": first.json()["next_cursor"]}
+        )
+        garbage = await client.get("/events", params={"cursor": "%%%"})
+
+    assert resp.status_code == 400
+    assert resp.json()["detail"] == "Cursor does not match the query filters"
+    assert garbage.status_code == 400
+
+
+@pytest.mark.anyio
+async def test_list_events_timeout_returns_503() -> None:
+    """Database timeouts while reading should map to 503."""
+    async with create_test_client(BatchRecordingRepo(), StaticQueryRepo(fail=True)) as client:
+        resp = await client.get("/events")
+
+    assert resp.status_code == 503
+
+
+@pytest.mark.anyio
+async def test_list_events_unexpected_error_returns_500() -> None:
+    """Unexpected errors while reading should map to 500."""
+    query_repo = StaticQueryRepo()
+
+    with patch(
+        "src.presentation.fastapi.routes.events_routes.list_events_uc",
+        side_effect=RuntimeError("boom"),
+    ):
+        async with create_test_client(BatchRecordingRepo(), query_repo) as client:
+            resp = await client.get("/events")
+
+    assert resp.status_code == 500
+
+
+@pytest.mark.anyio
+async def test_event_stats_returns_buckets() -> None:
+    """GET /events/stats should serve rollup buckets and forward the filters."""
+    rollup_repo = StaticRollupRepo(count=3)
+
+    async with create_test_client(BatchRecordingRepo(), rollup_repo=rollup_repo) as client:
+        resp = await client.get(
+            "/events/stats",
+            params={
+                "type": "msg",
+                "resolution": "hour",
+                "since": "2025-01-01T00:00:00Z",
+                "limit": 2,
+            },
+        )
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["resolution"] == "hour"
+    assert body["truncated"] is True
+    assert body["buckets"][0] == {
+        "event_type": "msg",
+        "bucket_start": "2025-01-01T00:00:00Z",
+        "count": 10,
+        "total_payload_bytes": 100,
+    }
+    query = rollup_repo.queries[0]
+    assert (query.resolution, query.event_type, query.limit) == ("hour", "msg", 3)
+    assert query.since == datetime(2025, 1, 1, tzinfo=UTC)
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("params", [{"resolution": "day"}, {"limit": 0}, {"limit": 10_001}])
+async def test_event_stats_rejects_invalid_parameters(params: dict[str, object]) -> None:
+    """GET /events/stats should validate query parameters."""
+    async with create_test_client(BatchRecordingRepo()) as client:
+        resp = await client.get("/events/stats", params=params)
+
+    assert resp.status_code == 422
+
+
+@pytest.mark.anyio
+async def test_event_stats_timeout_returns_503() -> None:
+    """Database timeouts while reading rollups should map to 503."""
+    async with create_test_client(
+        BatchRecordingRepo(), rollup_repo=StaticRollupRepo(fail=True)
+    ) as client:
+        resp = await client.get("/events/stats")
+
+    assert resp.status_code == 503
+
+
+@pytest.mark.anyio
+async def test_event_stats_unexpected_error_returns_500() -> None:
+    """Unexpected errors while reading rollups should map to 500."""
+    with patch(
+        "src.presentation.fastapi.routes.events_routes.event_stats_uc",
+        side_effect=RuntimeError("boom"),
+    ):
+        async with create_test_client(BatchRecordingRepo()) as client:
+            resp = await client.get("/events/stats")
+
+    assert resp.status_code == 500
+
+
+@pytest.mark.anyio
+async def test_recent_events_from_memory() -> None:
+    """GET /events/recent should serve buffered types without the database."""
+    buffer = RecentEventsBuffer(max_per_type=10, max_bytes=1 << 20)
+    buffer.record([DomainEvent.create(event_type="msg", event_payload=str(i)) for i in range(3)])
+    query_repo = StaticQueryRepo(count=3)
+
+    async with create_test_client(BatchRecordingRepo(), query_repo, buffer=buffer) as client:
+        resp = await client.get("/events/recent", params={"type": "msg", "limit": 2})
+        memory = await client.get("/events/recent/memory")
+
+    assert resp.status_code == 200
+    assert resp.json()["source"] == "memory"
+    assert [item["event_payload"] for item in resp.json()["items"]] == ["2", "1"]
+    assert query_repo.queries == []
+    usage = memory.json()
+    assert (usage["enabled"], usage["types"], usage["events"]) == (True, 1, 3)
+    assert 0 < usage["bytes"] <= usage["max_bytes"]
+
+
+@pytest.mark.anyio
+async def test_recent_events_falls_back_to_database() -> None:
+    """GET /events/recent should read from the database when nothing is buffered."""
+    query_repo = StaticQueryRepo(count=3)
+
+    async with create_test_client(BatchRecordingRepo(), query_repo) as client:
+        resp = await client.get("/events/recent", params={"type": "msg"})
+        memory = await client.get("/events/recent/memory")
+
+    assert resp.status_code == 200
+    assert resp.json()["source"] == "database"
+    assert len(resp.json()["items"]) == 3
+    assert query_repo.queries[0].order == "desc"
+    assert memory.json() == {
+        "enabled": False,
+        "types": 0,
+        "events": 0,
+        "bytes": 0,
+        "max_bytes": 0,
+        "evicted_types": 0,
+    }
+
+
+@pytest.mark.anyio
+async def test_retention_progress() -> None:
+    """GET /events/retention should report the job's counters."""
+    repo = AsyncMock()
+    repo.delete_expired.return_value = ExpiredBatch(deleted=3, last_key=None)
+    job = RetentionJob(
+        repo,
+        default_max_age=timedelta(days=30),
+        max_age_by_type={},
+        batch_size=10,
+        batch_pause_seconds=0,
+        max_rows_per_second=0,
+        interval_seconds=60,
+    )
+    await job.run_once(now=datetime(2025, 1, 1, tzinfo=UTC))
+
+    async with create_test_client(BatchRecordingRepo(), retention=job) as client:
+        resp = await client.get("/events/retention")
+    async with create_test_client(BatchRecordingRepo()) as client:
+        disabled = await client.get("/events/retention")
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert (body["enabled"], body["runs"], body["batches"], body["deleted"]) == (True, 1, 1, 3)
+    assert body["deleted_by_type"] == {"*": 3}
+    assert body["last_run_started_at"] == "2025-01-01T00:00:00Z"
+    assert disabled.json()["enabled"] is False
+    assert disabled.json()["deleted"] == 0
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("params", [{}, {"type": ""}, {"type": "msg", "limit": 1001}])
+async def test_recent_events_rejects_invalid_parameters(params: dict[str, object]) -> None:
+    """GET /events/recent should require a type and bound the limit."""
+    async with create_test_client(BatchRecordingRepo()) as client:
+        resp = await client.get("/events/recent", params=params)
+
+    assert resp.status_code == 422
+
+
+@pytest.mark.anyio
+async def test_recent_events_timeout_returns_503() -> None:
+    """Database timeouts in the fallback should map to 503."""
+    async with create_test_client(BatchRecordingRepo(), StaticQueryRepo(fail=True)) as client:
+        resp = await client.get("/events/recent", params={"type": "msg"})
+
+    assert resp.status_code == 503
+
+
+@pytest.mark.anyio
+async def test_recent_events_unexpected_error_returns_500() -> None:
+    """Unexpected errors should map to 500."""
+    with patch(
+        "src.presentation.fastapi.routes.events_routes.recent_events_uc",
+        side_effect=RuntimeError("boom"),
+    ):
+        async with create_test_client(BatchRecordingRepo()) as client:
+            resp = await client.get("/events/recent", params={"type": "msg"})
+
+    assert resp.status_code == 500
@@ -0,0 +1,44 @@
+"""Tests for incremental NDJSON line splitting."""
+
+from collections.abc import AsyncIterator
+
+import pytest
+
+from src.presentation.fastapi.ndjson import iter_ndjson_lines
+
+
+async def chunked(*chunks: bytes) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+async def collect(*chunks: bytes, max_line_bytes: int = 100) -> list[tuple[int, bytes | None]]:
+    return [item async for item in iter_ndjson_lines(chunked(*chunks), max_line_bytes)]
+
+
+@pytest.mark.asyncio
+async def test_lines_split_across_chunks() -> None:
+    """Lines spanning several chunks should be reassembled."""
+    assert await collect(b'{"a"', b":1}\n{", b'"b":2}\r\n') == [
+        (1, b'{"a":1}'),
+        (2, b'{"b":2}'),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_trailing_line_without_newline() -> None:
+    """A final line without newline should still be yielded."""
+    assert await collect(b"one\n\ntwo") == [(1, b"one"), (2, b""), (3, b"two")]
+
+
+@pytest.mark.asyncio
+async def test_overlong_lines_reported_as_none() -> None:
+    """Lines over the limit should be dropped and reported as None."""
+    lines = await collect(b"x" * 6, b"xxxx\nok\n", b"y" * 11, max_line_bytes=5)
+    assert lines == [(1, None), (2, b"ok"), (3, None)]
+
+
+@pytest.mark.asyncio
+async def test_overlong_line_within_single_chunk() -> None:
+    """An overlong line inside one chunk should be reported as None."""
+    assert await collect(b"xxxxxx\nok", max_line_bytes=5) == [(1, None), (2, b"ok")]
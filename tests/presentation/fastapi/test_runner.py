@@ -0,0 +1,24 @@
+from typing import Any
+
+import pytest
+
+from src.application.ports.http_server import HttpServer
+from src.presentation.fastapi.runner import start_fast_api_server
+
+
+def test_start_fast_api_server_runs_app_factory(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The server should be started from the factory import string, with the given settings."""
+    calls: list[tuple[Any, dict[str, Any]]] = []
+    monkeypatch.setattr("uvicorn.run", lambda app, **kwargs: calls.append((app, kwargs)))
+
+    start_fast_api_server(
+        HttpServer(port=9000, workers=2, loop="asyncio", graceful_shutdown_seconds=5),
+        app_factory="src.main:create_application",
+    )
+
+    [(app, kwargs)] = calls
+    assert app == "src.main:create_application"
+    assert kwargs["factory"] is True
+    assert (kwargs["port"], kwargs["workers"], kwargs["loop"]) == (9000, 2, "asyncio")
+    assert kwargs["timeout_graceful_shutdown"] == 5
+    assert kwargs["log_config"] is None
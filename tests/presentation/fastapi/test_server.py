@@ -1,10 +1,36 @@
+import asyncio
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager
+from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import httpx
 import pytest
 
-from src.application.ports.db_provider import DbProvider
+from src.application.group_commit import GroupCommitter
+from src.application.ports.db_provider import DbProvider, PoolUsage
+from src.application.ports.event_repository import EventRepository
+from src.application.ports.retention_repository import ExpiredBatch
+from src.application.ports.rollup_repository import RollupBucket, RollupQuery, RollupRepository
+from src.application.retention import RetentionJob
+from src.application.rollups import RollupAggregator
+from src.core.event import DomainEvent
+from src.infrastructure.config.settings import (
+    AdmissionSettings,
+    AppSettings,
+    FastIngestSettings,
+    GroupCommitSettings,
+    HealthSettings,
+    IdempotencySettings,
+    MetricsSettings,
+    RecentEventsSettings,
+    RequestTimingSettings,
+    RetentionSettings,
+    RollupSettings,
+    SpoolSettings,
+)
+from src.infrastructure.spool.spool import EventSpool
 from src.presentation.fastapi.server import create_app
 
 
@@ -46,3 +72,455 @@ async def test_app_lifespan_and_routes(mock_db_provider: Any) -> None:
 
     # Verify context manager was exited
     mock_db_provider.__aexit__.assert_called_once()
+
+
+class RecordingRepo(EventRepository):
+    """Repository recording every committed batch."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[DomainEvent]] = []
+
+    async def save(self, event: DomainEvent, *, returning: bool = True) -> bool:
+        """Save a single event."""
+        self.batches.append([event])
+        return True
+
+    async def save_many(self, events: Sequence[DomainEvent]) -> list[bool]:
+        """Save events as one batch."""
+        self.batches.append(list(events))
+        return [True] * len(events)
+
+
+@pytest.mark.asyncio
+async def test_app_lifespan_with_group_commit(mock_db_provider: Any) -> None:
+    """Test the group-commit stage is started, used by routes and drained."""
+    repo = RecordingRepo()
+
+    @asynccontextmanager
+    async def event_repository() -> AsyncIterator[EventRepository]:
+        yield repo
+
+    mock_db_provider.event_repository = event_repository
+    settings = AppSettings(group_commit=GroupCommitSettings(enabled=True, linger_ms=1))
+    app = create_app(db_provider=mock_db_provider, settings=settings)
+
+    async with app.router.lifespan_context(app):
+        assert isinstance(app.state.group_commit, GroupCommitter)
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            resp = await client.post(
+                "/event", json={"event_type": "message", "event_payload": "hello"}
+            )
+            assert resp.status_code == 201
+
+    assert [e.event_payload for batch in repo.batches for e in batch] == ["hello"]
+    with pytest.raises(RuntimeError, match="closed"):
+        await app.state.group_commit.submit(repo.batches[0])
+
+
+class RecordingRollupRepo(RollupRepository):
+    """Rollup repository recording every flushed bucket."""
+
+    def __init__(self) -> None:
+        self.buckets: list[RollupBucket] = []
+
+    async def add(self, buckets: Sequence[RollupBucket]) -> None:
+        """Record the buckets."""
+        self.buckets.extend(buckets)
+
+    async def list_buckets(self, query: RollupQuery) -> list[RollupBucket]:
+        """Return recorded buckets of the requested resolution."""
+        return [b for b in self.buckets if b.resolution == query.resolution]
+
+
+@pytest.mark.asyncio
+async def test_app_lifespan_with_rollups(mock_db_provider: Any) -> None:
+    """Test committed events are counted and flushed to rollups on shutdown."""
+    repo = RecordingRepo()
+    rollup_repo = RecordingRollupRepo()
+
+    @asynccontextmanager
+    async def event_repository() -> AsyncIterator[EventRepository]:
+        yield repo
+
+    mock_db_provider.event_repository = event_repository
+    mock_db_provider.rollup_repository = MagicMock(return_value=rollup_repo)
+    settings = AppSettings(
+        group_commit=GroupCommitSettings(enabled=True, linger_ms=1),
+        rollups=RollupSettings(enabled=True, flush_interval_ms=60_000),
+    )
+    app = create_app(db_provider=mock_db_provider, settings=settings)
+
+    async with app.router.lifespan_context(app):
+        assert isinstance(app.state.rollups, RollupAggregator)
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            resp = await client.post(
+                "/event/batch",
+                json=[
+                    {"event_type": "message", "event_payload": "hello"},
+                    {"event_type": "message", "event_payload": "héllo"},
+                ],
+            )
+            assert resp.status_code == 200
+        assert rollup_repo.buckets == []
+
+    assert sorted((b.resolution, b.count, b.total_payload_bytes) for b in rollup_repo.buckets) == [
+        ("hour", 2, 11),
+        ("minute", 2, 11),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_app_lifespan_with_recent_events(mock_db_provider: Any) -> None:
+    """Test committed events are served from the recent events buffer."""
+    repo = RecordingRepo()
+
+    @asynccontextmanager
+    async def event_repository() -> AsyncIterator[EventRepository]:
+        yield repo
+
+    mock_db_provider.event_repository = event_repository
+    mock_db_provider.event_query_repository = MagicMock()
+    settings = AppSettings(recent_events=RecentEventsSettings(enabled=True, max_per_type=5))
+    app = create_app(db_provider=mock_db_provider, settings=settings)
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            await client.post("/event", json={"event_type": "message", "event_payload": "one"})
+            await client.post("/event", json={"event_type": "message", "event_payload": "two"})
+            resp = await client.get("/events/recent", params={"type": "message"})
+            memory = await client.get("/events/recent/memory")
+
+    assert resp.status_code == 200
+    assert resp.json()["source"] == "memory"
+    assert [item["event_payload"] for item in resp.json()["items"]] == ["two", "one"]
+    assert memory.json()["enabled"] is True
+    assert memory.json()["events"] == 2
+    mock_db_provider.event_query_repository.return_value.list_events.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_app_lifespan_with_retention(mock_db_provider: Any) -> None:
+    """Test the retention job runs during the lifespan and reports progress."""
+    retention_repo = AsyncMock()
+    retention_repo.delete_expired.return_value = ExpiredBatch(deleted=0, last_key=None)
+    mock_db_provider.retention_repository = MagicMock(return_value=retention_repo)
+    settings = AppSettings(
+        retention=RetentionSettings(
+            enabled=True, default_max_age_days=30, max_age_days_by_type={"audit": 365, "ping": 0}
+        )
+    )
+    app = create_app(db_provider=mock_db_provider, settings=settings)
+
+    async with app.router.lifespan_context(app):
+        assert isinstance(app.state.retention, RetentionJob)
+        while app.state.retention.progress.runs == 0:
+            await asyncio.sleep(0)
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            resp = await client.get("/events/retention")
+
+    assert resp.json()["enabled"] is True
+    assert resp.json()["runs"] == 1
+    calls = retention_repo.delete_expired.await_args_list
+    assert [call.kwargs["event_type"] for call in calls] == ["audit", None]
+    assert calls[1].kwargs["exclude_types"] == ("audit", "ping")
+
+
+@pytest.mark.asyncio
+async def test_app_lifespan_with_idempotency_cache(mock_db_provider: Any) -> None:
+    """Test retries of committed events are replayed from the idempotency cache."""
+    repo = RecordingRepo()
+
+    @asynccontextmanager
+    async def event_repository() -> AsyncIterator[EventRepository]:
+        yield repo
+
+    mock_db_provider.event_repository = event_repository
+    settings = AppSettings(idempotency=IdempotencySettings(cache_enabled=True))
+    app = create_app(db_provider=mock_db_provider, settings=settings)
+    event = {"event_type": "message", "event_payload": "hello"}
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            first = await client.post("/event", json=event, headers={"Idempotency-Key": "k1"})
+            retry = await client.post("/event", json=event, headers={"Idempotency-Key": "k1"})
+
+    assert (first.status_code, retry.status_code) == (201, 201)
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert [e.idempotency_key for batch in repo.batches for e in batch] == ["k1"]
+
+
+class BlockingRepo(RecordingRepo):
+    """Repository whose saves wait until released."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.entered = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def save(self, event: DomainEvent, *, returning: bool = True) -> bool:
+        """Wait for the release, then save."""
+        self.entered.set()
+        await self.release.wait()
+        return await super().save(event, returning=returning)
+
+
+@pytest.mark.asyncio
+async def test_app_lifespan_with_admission_control(mock_db_provider: Any) -> None:
+    """Test writes beyond the in-flight limit are shed with 503 and Retry-After."""
+    repo = BlockingRepo()
+
+    @asynccontextmanager
+    async def event_repository() -> AsyncIterator[EventRepository]:
+        yield repo
+
+    mock_db_provider.event_repository = event_repository
+    settings = AppSettings(
+        admission=AdmissionSettings(enabled=True, initial_limit=1, min_limit=1, max_limit=1)
+    )
+    app = create_app(db_provider=mock_db_provider, settings=settings)
+    event = {"event_type": "message", "event_payload": "hello"}
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            first = asyncio.create_task(client.post("/event", json=event))
+            await repo.entered.wait()
+            shed = await client.post("/event", json=event)
+            read = await client.get("/events/retention")
+            repo.release.set()
+            admitted = await first
+            after = await client.post("/event", json=event)
+
+    assert shed.status_code == 503
+    assert shed.headers["Retry-After"] == "1"
+    assert read.status_code == 200  # reads are not admission-controlled
+    assert (admitted.status_code, after.status_code) == (201, 201)
+    assert app.state.admission.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_app_lifespan_with_spool(mock_db_provider: Any, tmp_path: Path) -> None:
+    """Test writes are spooled while the database is down and replayed afterwards."""
+    repo = RecordingRepo()
+    down = AsyncMock(side_effect=ConnectionRefusedError("database is down"))
+    repo.save = down  # type: ignore[method-assign]
+    repo.save_many = down  # type: ignore[method-assign]
+
+    @asynccontextmanager
+    async def event_repository() -> AsyncIterator[EventRepository]:
+        yield repo
+
+    mock_db_provider.event_repository = event_repository
+    settings = AppSettings(
+        spool=SpoolSettings(enabled=True, directory=str(tmp_path), retry_interval_seconds=0.01)
+    )
+    app = create_app(db_provider=mock_db_provider, settings=settings)
+
+    async with app.router.lifespan_context(app):
+        spool = app.state.spool
+        assert isinstance(spool, EventSpool)
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            resp = await client.post(
+                "/event", json={"event_type": "message", "event_payload": "hello"}
+            )
+            assert resp.status_code == 201
+            assert spool.active
+
+            del repo.save, repo.save_many
+            async with asyncio.timeout(5):
+                while spool.active:
+                    await asyncio.sleep(0.005)
+
+    assert [e.event_payload for batch in repo.batches for e in batch] == ["hello"]
+    assert list(tmp_path.glob("*.seg"))
+
+
+@pytest.mark.asyncio
+async def test_app_serves_metrics(mock_db_provider: Any, tmp_path: Path) -> None:
+    """Test /metrics reports request latency, write time and handled errors."""
+    repo = RecordingRepo()
+
+    @asynccontextmanager
+    async def event_repository() -> AsyncIterator[EventRepository]:
+        yield repo
+
+    mock_db_provider.event_repository = event_repository
+    settings = AppSettings(
+        metrics=MetricsSettings(enabled=True, multiprocess_dir=str(tmp_path / "metrics"))
+    )
+    app = create_app(db_provider=mock_db_provider, settings=settings)
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            created = await client.post(
+                "/event", json={"event_type": "message", "event_payload": "hello"}
+            )
+            rejected = await client.post(
+                "/event", json={"event_type": "message", "event_payload": "   "}
+            )
+            await client.get("/no-such-route")
+            resp = await client.get("/metrics")
+
+    assert (created.status_code, rejected.status_code) == (201, 422)
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+    lines = resp.text.splitlines()
+    assert any(
+        line.startswith(
+            'http_request_duration_seconds_count{method="POST",route="/event",status="201"}'
+        )
+        for line in lines
+    )
+    assert any('route="unmatched",status="404"' in line for line in lines)
+    assert any(
+        line.startswith('event_route_errors_total{route="create_event",error="validation"}')
+        for line in lines
+    )
+    assert any(
+        line.startswith('repository_write_seconds_count{operation="save"}') for line in lines
+    )
+    assert any(line.startswith("event_validation_seconds_count") for line in lines)
+    assert list((tmp_path / "metrics").glob("worker-*.json"))
+
+
+@pytest.mark.asyncio
+async def test_app_without_metrics_has_no_endpoint(mock_db_provider: Any) -> None:
+    """Test /metrics is not served while metrics are disabled."""
+    app = create_app(db_provider=mock_db_provider)
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            resp = await client.get("/metrics")
+
+    assert resp.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_app_reports_request_stages(
+    mock_db_provider: Any, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test timed requests get a Server-Timing header and slow ones are logged."""
+    repo = RecordingRepo()
+
+    @asynccontextmanager
+    async def event_repository() -> AsyncIterator[EventRepository]:
+        yield repo
+
+    mock_db_provider.event_repository = event_repository
+    settings = AppSettings(request_timing=RequestTimingSettings(enabled=True, slow_request_ms=0))
+    app = create_app(db_provider=mock_db_provider, settings=settings)
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            with caplog.at_level("WARNING", logger="src.presentation.fastapi.stage_timing"):
+                resp = await client.post(
+                    "/event", json={"event_type": "message", "event_payload": "hello"}
+                )
+
+    assert resp.status_code == 201
+    stages = [entry.split(";")[0] for entry in resp.headers["server-timing"].split(", ")]
+    assert stages == ["receive", "parse", "validate", "create", "serialize", "total"]
+    assert "Slow request: method=POST, path=/event, status=201" in caplog.text
+    assert "stages=receive:" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_app_without_request_timing_has_no_header(mock_db_provider: Any) -> None:
+    """Test no Server-Timing header is sent while request timing is disabled."""
+    app = create_app(db_provider=mock_db_provider)
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            resp = await client.get("/health")
+
+    assert "server-timing" not in resp.headers
+
+
+@pytest.mark.asyncio
+async def test_app_with_fast_ingest(mock_db_provider: Any) -> None:
+    """Test the fast ingest path serves POST /event and keeps the documented contract."""
+    repo = RecordingRepo()
+
+    @asynccontextmanager
+    async def event_repository() -> AsyncIterator[EventRepository]:
+        yield repo
+
+    mock_db_provider.event_repository = event_repository
+    settings = AppSettings(
+        fast_ingest=FastIngestSettings(enabled=True),
+        request_timing=RequestTimingSettings(enabled=True),
+    )
+    app = create_app(db_provider=mock_db_provider, settings=settings)
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            resp = await client.post(
+                "/event", json={"event_type": "message", "event_payload": "hello"}
+            )
+            schema = (await client.get("/openapi.json")).json()
+
+    assert (resp.status_code, resp.json()) == (201, {"status": "created"})
+    stages = [entry.split(";")[0] for entry in resp.headers["server-timing"].split(", ")]
+    assert stages == ["receive", "validate", "create", "serialize", "total"]
+    assert [e.event_payload for batch in repo.batches for e in batch] == ["hello"]
+    operation = schema["paths"]["/event"]["post"]
+    assert operation["operationId"] == "create_event_route_event_post"
+
+
+@pytest.mark.asyncio
+async def test_app_probes_without_health_checks(mock_db_provider: Any) -> None:
+    """Without background checks, the service is alive and always ready."""
+    app = create_app(db_provider=mock_db_provider)
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            live = await client.get("/health/live")
+            ready = await client.get("/health/ready")
+
+    assert (live.status_code, live.json()) == (200, {"status": "alive"})
+    assert ready.status_code == 200
+    assert ready.json()["ready"] is True
+    assert ready.json()["checked"] is False
+    mock_db_provider.ping.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_app_readiness_follows_health_checks(mock_db_provider: Any) -> None:
+    """Readiness answers from the latest background check, 503 once the database is down."""
+    mock_db_provider.pool_usage = MagicMock(return_value=PoolUsage(checked_out=3, capacity=30))
+    settings = AppSettings(health=HealthSettings(enabled=True, interval_seconds=3600))
+    app = create_app(db_provider=mock_db_provider, settings=settings)
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            ready = await client.get("/health/ready")
+            mock_db_provider.ping.side_effect = ConnectionRefusedError("connection refused")
+            await app.state.health.check_once()
+            not_ready = await client.get("/health/ready")
+            live = await client.get("/health/live")
+
+    assert ready.status_code == 200
+    assert ready.json()["database_up"] is True
+    assert (ready.json()["pool_checked_out"], ready.json()["pool_capacity"]) == (3, 30)
+    assert not_ready.status_code == 503
+    assert not_ready.json()["ready"] is False
+    assert not_ready.json()["last_error"] == "connection refused"
+    assert live.status_code == 200
+    assert mock_db_provider.ping.await_count == 2
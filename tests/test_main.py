@@ -1,24 +1,161 @@
+import sqlite3
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
+from fastapi import FastAPI
 
 import src.main as main
+from src.infrastructure.config.settings import AppSettings, DatabaseSettings, LoggingSettings
+from src.infrastructure.memory.db_provider import MemoryDbProvider
 from src.infrastructure.postgres.db_provider import SqlAlchemyDbProvider
+from src.infrastructure.sqlite.db_provider import SqliteDbProvider
 
 
-def test_main_starts_server_with_db_provider(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Main should load params and start server with SqlAlchemyDbProvider."""
-    called: dict[str, object] = {}
+@pytest.fixture(autouse=True)
+def maintenance_lock(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    """Keep the workers' maintenance lock file out of the shared temporary directory."""
+    path = tmp_path / "maintenance.lock"
+    monkeypatch.setattr("src.main.maintenance_lock_path", lambda database_uri: path)
+    return path
+
+
+@pytest.fixture(autouse=True)
+def logging_settings(monkeypatch: pytest.MonkeyPatch) -> list[LoggingSettings]:
+    """Record configure_logs calls instead of reconfiguring the test process's logging."""
+    configured: list[LoggingSettings] = []
+    monkeypatch.setattr("src.main.configure_logs", configured.append)
+    return configured
 
-    def fake_load_params() -> tuple[str, int]:
-        return ("sqlite+aiosqlite:///./events.db", 8000)
 
-    def fake_start_fast_api_server(params, db_provider) -> None:
+def test_main_starts_server_with_app_factory(
+    monkeypatch: pytest.MonkeyPatch, logging_settings: list[LoggingSettings], tmp_path: Path
+) -> None:
+    """Main should configure logging and prepare the schema, then start the workers."""
+    called: dict[str, object] = {}
+    database = tmp_path / "events.db"
+
+    def fake_start_fast_api_server(params, app_factory) -> None:
         called["params"] = params
-        called["db_provider"] = db_provider
+        called["app_factory"] = app_factory
+        with sqlite3.connect(database) as conn:
+            called["tables"] = {name for (name,) in conn.execute("SELECT name FROM sqlite_master")}
 
-    monkeypatch.setattr("src.main.load_params", fake_load_params)
+    monkeypatch.setenv("SERVER_WORKERS", "4")
+    monkeypatch.setenv("SERVER_LOOP", "asyncio")
+    monkeypatch.setenv("LOG_FORMAT", "json")
+    monkeypatch.setattr("src.main.load_params", lambda: (f"sqlite+aiosqlite:///{database}", 8000))
     monkeypatch.setattr("src.main.start_fast_api_server", fake_start_fast_api_server)
 
     main.main()
 
     assert called["params"].port == 8000
-    assert isinstance(called["db_provider"], SqlAlchemyDbProvider)
+    assert called["params"].workers == 4
+    assert called["params"].loop == "asyncio"
+    assert called["app_factory"] == "src.main:create_application"
+    assert {"events", "schema_fingerprint"} <= called["tables"]  # type: ignore[operator]
+    assert [settings.format for settings in logging_settings] == ["json"]
+
+
+def test_main_clears_metrics_files(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Main should delete metrics files left by the previous server's workers."""
+    stale = tmp_path / "worker-1.json"
+    stale.write_text("{}")
+    monkeypatch.setenv("METRICS_ENABLED", "true")
+    monkeypatch.setenv("METRICS_MULTIPROCESS_DIR", str(tmp_path))
+    monkeypatch.setattr("src.main.load_params", lambda: ("sqlite+aiosqlite:///./events.db", 8000))
+    monkeypatch.setattr("src.main.start_fast_api_server", lambda params, app_factory: None)
+
+    main.main()
+
+    assert not stale.exists()
+
+
+def test_main_module_does_not_import_app() -> None:
+    """The server process should not load FastAPI nor the database drivers."""
+    loaded = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, src.main; "
+            "print(sorted({'fastapi', 'sqlalchemy', 'aiosqlite', 'asyncpg'} & set(sys.modules)))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert loaded.stdout.strip() == "[]"
+
+
+def test_create_db_provider_selects_backend() -> None:
+    """The provider should follow DB_BACKEND, then the database URL."""
+    sqlite = main.create_db_provider("sqlite+aiosqlite:///./events.db", DatabaseSettings())
+    memory = main.create_db_provider(
+        "sqlite+aiosqlite:///./events.db", DatabaseSettings(backend="memory")
+    )
+
+    assert isinstance(sqlite, SqliteDbProvider)
+    assert isinstance(sqlite, SqlAlchemyDbProvider)
+    assert isinstance(memory, MemoryDbProvider)
+
+
+def test_create_application_splits_pool_budget(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Each worker's app should get its share of DB_MAX_CONNECTIONS."""
+    created: dict[str, DatabaseSettings] = {}
+
+    def fake_create_db_provider(database_uri: str, settings: DatabaseSettings) -> object:
+        created["settings"] = settings
+        return MemoryDbProvider(settings)
+
+    monkeypatch.setenv("SERVER_WORKERS", "4")
+    monkeypatch.setenv("DB_MAX_CONNECTIONS", "40")
+    monkeypatch.setattr("src.main.create_db_provider", fake_create_db_provider)
+
+    app = main.create_application()
+
+    assert isinstance(app, FastAPI)
+    assert created["settings"].pool_size == 10
+    assert created["settings"].max_overflow == 0
+
+
+def test_create_application_gives_workers_spool_slots(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Each worker's spool should be able to take its own directory."""
+    created: list[AppSettings] = []
+    monkeypatch.setenv("SERVER_WORKERS", "3")
+    monkeypatch.setattr("src.main.create_db_provider", lambda uri, settings: MemoryDbProvider())
+    monkeypatch.setattr(
+        "src.presentation.fastapi.server.create_app",
+        lambda db_provider, settings: created.append(settings) or FastAPI(),
+    )
+
+    main.create_application()
+
+    assert [settings.spool.worker_slots for settings in created] == [3]
+
+
+def test_create_application_runs_maintenance_in_one_worker(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Only the worker holding the maintenance lock should run retention and partitions."""
+    created: list[tuple[DatabaseSettings, AppSettings]] = []
+    monkeypatch.setenv("SERVER_WORKERS", "2")
+    monkeypatch.setenv("RETENTION_ENABLED", "true")
+    monkeypatch.setattr(
+        "src.main.create_db_provider", lambda uri, settings: created.append((settings, None))
+    )
+    monkeypatch.setattr(
+        "src.presentation.fastapi.server.create_app",
+        lambda db_provider, settings: created.append((None, settings)) or FastAPI(),
+    )
+
+    first = main.create_application()
+    second = main.create_application()
+
+    assert [db.partition_maintenance for db, _ in created[0::2]] == [True, False]
+    assert [app.retention.enabled for _, app in created[1::2]] == [True, False]
+    assert first.state.maintenance_lock.held
+    assert not second.state.maintenance_lock.held
+    first.state.maintenance_lock.release()
+    assert main.create_application().state.maintenance_lock.held